@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark commit classification on a synthetic history.
+
+This script measures, without Git access:
+- PatternExtractor.detect_patterns (message, file and diff patterns)
+- DecisionExtractor.analyze_commit_for_decision
+- MemoryExtractor commit analysis (decision patterns, categories, tags)
+
+The history mixes small commits with a few multi-MB diffs, generated from
+a fixed seed so runs are comparable.
+
+Usage:
+    python benchmark_commit_patterns.py
+    python benchmark_commit_patterns.py --commits 50000 --large-every 200
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from clauxton.analysis.decision_extractor import DecisionExtractor  # noqa: E402
+from clauxton.analysis.git_analyzer import CommitInfo  # noqa: E402
+from clauxton.analysis.pattern_extractor import PatternExtractor  # noqa: E402
+from clauxton.semantic.memory_extractor import MemoryExtractor  # noqa: E402
+
+SUBJECTS = [
+    "feat(api): add {x} endpoint with JWT authentication",
+    "fix: resolve crash in {x} when cache is empty (#{n})",
+    "refactor: restructure {x} module for readability",
+    "docs: update README and migration guide for {x}",
+    "test: add integration tests for {x}",
+    "perf: optimize {x} query performance",
+    "chore: bump dependencies",
+    "Migrate {x} from MySQL to PostgreSQL",
+    "Switch to Redis for session storage in {x}",
+    "Adopt repository pattern for {x} persistence",
+    "Limit maximum upload size in {x}",
+    "Standardize naming convention in {x}",
+    "Update {x}",
+    "Merge branch 'feature/{x}'",
+]
+
+NAMES = ["auth", "billing", "search", "users", "orders", "ui", "reports", "sync"]
+
+PATHS = [
+    "src/{x}/api/handlers.py",
+    "src/{x}/api/routes.py",
+    "src/{x}/models.py",
+    "src/{x}/service.py",
+    "web/components/{X}Panel.tsx",
+    "web/styles/{x}.scss",
+    "migrations/0042_{x}_schema.sql",
+    "tests/test_{x}.py",
+    "docs/{x}.md",
+    "config/settings.py",
+    "requirements.txt",
+    "docs/adr/0007-{x}-decision.md",
+]
+
+DIFF_LINES = [
+    "+import logging",
+    "+from typing import Optional",
+    "+class {X}Service:",
+    "+    def handle_{x}(self, request):",
+    "+        # Validate the request first",
+    "+function render{X}(props) {{",
+    "-    return None",
+    " context line for {x}",
+    "+        value = compute(request)",
+    "-        legacy_{x}()",
+]
+
+
+def build_history(count: int, large_every: int, seed: int = 7) -> List[CommitInfo]:
+    """Create synthetic commits (every large_every-th has a ~2MB diff)."""
+    rng = random.Random(seed)
+    commits = []
+    for i in range(count):
+        name = rng.choice(NAMES)
+        subject = rng.choice(SUBJECTS).format(x=name, n=rng.randint(1, 999))
+        body = "\n\nLonger explanation of the change." if rng.random() < 0.3 else ""
+        files = [
+            rng.choice(PATHS).format(x=rng.choice(NAMES), X=name.title())
+            for _ in range(rng.randint(1, 25))
+        ]
+        lines = 40000 if large_every and i % large_every == 0 else rng.randint(5, 300)
+        diff = "\n".join(
+            rng.choice(DIFF_LINES).format(x=name, X=name.title()) for _ in range(lines)
+        )
+        commits.append(
+            CommitInfo(
+                sha=f"{i:040x}",
+                message=subject + body,
+                author="Bench",
+                date=datetime(2025, 1, 1),
+                files=files,
+                diff=diff,
+                stats={
+                    "insertions": lines // 2,
+                    "deletions": lines // 4,
+                    "files_changed": len(files),
+                },
+            )
+        )
+    return commits
+
+
+def run(name: str, analyze: Callable[[CommitInfo], object], commits: List[CommitInfo]) -> None:
+    """Time one analysis over all commits."""
+    start = time.perf_counter()
+    for commit in commits:
+        analyze(commit)
+    duration = time.perf_counter() - start
+    print(
+        f"{name:<34} {duration:8.2f}s  {len(commits) / duration:10.0f} commits/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--commits", type=int, default=20000)
+    parser.add_argument("--large-every", type=int, default=500)
+    args = parser.parse_args()
+
+    commits = build_history(args.commits, args.large_every)
+    diff_mb = sum(len(c.diff) for c in commits) / 1e6
+    print(f"Synthetic history: {len(commits)} commits, {diff_mb:.0f} MB of diffs\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+        (project / ".clauxton").mkdir()
+
+        patterns = PatternExtractor()
+        decisions = DecisionExtractor(project)
+        decisions.pattern_extractor = PatternExtractor()
+        memories = MemoryExtractor(project)
+
+        run("PatternExtractor.detect_patterns", patterns.detect_patterns, commits)
+        run("DecisionExtractor.analyze_commit", decisions.analyze_commit_for_decision, commits)
+        run("MemoryExtractor commit analysis", memories._analyze_commit, commits)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Persistent per-commit analysis cache.
+
+Commits are immutable, so their analysis (changed files, line stats, the
+patch unless it is larger than MAX_CACHED_DIFF, detected patterns) only
+has to be computed once.
+CommitCache keeps one record per commit SHA in a JSON Lines file per
+analyzer version:
+- put() appends a line with the fields computed so far; records of the
+  same SHA are merged on load, later fields winning
+- Only small fields are kept in memory; patch text ("diff") stays in the
+  file and is read by offset in get(), so memory does not grow with the
+  patches of a long history
+- The file is rewritten without superseded lines once they outnumber the
+  records
+- A new ANALYZER_VERSION starts a new file and removes the old ones, so
+  records from older analysis code are never read
+
+Storage format:
+    .clauxton/cache/
+        .gitignore                 # "*": caches are never committed
+        commits/
+            v2.jsonl               # {"sha": ..., <fields>} per line
+
+Example:
+    >>> cache = CommitCache(Path(".clauxton/cache/commits"))
+    >>> cache.put("4f2a...", {"files": ["auth.py"], "stats": {...}})
+    >>> cache.get("4f2a...")["files"]
+    ['auth.py']
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when commit analysis output changes, to ignore older records
+ANALYZER_VERSION = 2
+
+# Largest patch text cached per commit (larger patches are diffed again)
+MAX_CACHED_DIFF = 64 * 1024
+
+# Fields read from the file on demand instead of being kept in memory
+LARGE_FIELDS = ("diff",)
+
+
+class CommitCache:
+    """
+    On-disk analysis records by commit SHA.
+
+    Records are loaded on first access. Write errors are logged and the
+    cache keeps working in memory, without the large fields of records
+    that could not be written. Safe to share between threads.
+
+    Attributes:
+        directory: Cache directory (.clauxton/cache/commits)
+        version: Analyzer version of the records
+    """
+
+    def __init__(self, directory: Path, version: int = ANALYZER_VERSION) -> None:
+        """
+        Initialize cache (does not read any file).
+
+        Args:
+            directory: Cache directory
+            version: Analyzer version of the records
+        """
+        self.directory = directory
+        self.version = version
+        self._records: Optional[Dict[str, Dict[str, Any]]] = None
+        # SHA -> large field -> byte offset of the line holding it
+        self._offsets: Dict[str, Dict[str, int]] = {}
+        self._lines = 0
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"v{self.version}.jsonl"
+
+    def get(self, sha: str, large_fields: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get the record of a commit.
+
+        Args:
+            sha: Full commit SHA
+            large_fields: Whether to read LARGE_FIELDS from the file
+
+        Returns:
+            Record fields, or None if the commit is not cached
+        """
+        with self._lock:
+            record = self._load().get(sha)
+            if record is None:
+                return None
+            record = dict(record)
+            if not large_fields:
+                return record
+            for field, offset in self._offsets.get(sha, {}).items():
+                value = self._read_field(sha, field, offset)
+                if value is not None:
+                    record[field] = value
+            return record
+
+    def has(self, sha: str, field: Optional[str] = None) -> bool:
+        """
+        Check whether a commit is cached, without reading large fields.
+
+        Args:
+            sha: Full commit SHA
+            field: Field the record must have (None = any record)
+        """
+        with self._lock:
+            record = self._load().get(sha)
+            if record is None:
+                return False
+            return field is None or field in record or field in self._offsets.get(sha, {})
+
+    def put(self, sha: str, fields: Dict[str, Any]) -> None:
+        """
+        Add fields to the record of a commit.
+
+        Args:
+            sha: Full commit SHA
+            fields: JSON-serializable fields, merged over the existing record
+        """
+        with self._lock:
+            records = self._load()
+            records.setdefault(sha, {}).update(_small_fields(fields))
+            try:
+                if not self.path.exists():
+                    self._create()
+                with open(self.path, "ab") as f:
+                    offset = f.tell()
+                    f.write(_dumps({"sha": sha, **fields}))
+                self._set_offsets(sha, fields, offset)
+                self._lines += 1
+                if self._lines > 2 * len(records) + 100:
+                    self._compact(records)
+            except OSError as e:
+                logger.warning(f"Cannot write commit cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read and merge the records (called with the lock held)."""
+        if self._records is not None:
+            return self._records
+
+        records: Dict[str, Dict[str, Any]] = {}
+        self._offsets = {}
+        lines = 0
+        try:
+            with open(self.path, "rb") as f:
+                offset = 0
+                for line in f:
+                    lines += 1
+                    line_offset, offset = offset, offset + len(line)
+                    try:
+                        fields = json.loads(line)
+                        sha = fields.pop("sha")
+                    except (ValueError, KeyError, AttributeError):
+                        # Line torn by a crash or a concurrent writer
+                        continue
+                    records.setdefault(sha, {}).update(_small_fields(fields))
+                    self._set_offsets(sha, fields, line_offset)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Cannot read commit cache {self.path}: {e}")
+
+        self._records = records
+        self._lines = lines
+        return records
+
+    def _set_offsets(self, sha: str, fields: Dict[str, Any], offset: int) -> None:
+        """Remember the line holding the large fields of a record."""
+        for field in LARGE_FIELDS:
+            if field in fields:
+                self._offsets.setdefault(sha, {})[field] = offset
+
+    def _read_field(self, sha: str, field: str, offset: int) -> Any:
+        """Read a large field from its line, or None if the line is not usable."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                fields = json.loads(f.readline())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot read {field} of {sha} from commit cache: {e}")
+            return None
+        if not isinstance(fields, dict) or fields.get("sha") != sha:
+            # Appended concurrently by another process at a different offset
+            return None
+        return fields.get(field)
+
+    def _create(self) -> None:
+        """Create the directory, ignore it in Git and drop older versions."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        gitignore = self.directory.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n", encoding="utf-8")
+        for old in self.directory.glob("v*.jsonl"):
+            if old != self.path:
+                old.unlink(missing_ok=True)
+
+    def _compact(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Rewrite the file with one line per record (large fields streamed over)."""
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        offsets: Dict[str, Dict[str, int]] = {}
+        with open(temp_path, "wb") as f:
+            for sha, fields in records.items():
+                line_fields = dict(fields)
+                for field, offset in self._offsets.get(sha, {}).items():
+                    value = self._read_field(sha, field, offset)
+                    if value is not None:
+                        line_fields[field] = value
+                offset = f.tell()
+                f.write(_dumps({"sha": sha, **line_fields}))
+                for field in LARGE_FIELDS:
+                    if field in line_fields:
+                        offsets.setdefault(sha, {})[field] = offset
+        os.replace(temp_path, self.path)
+        self._offsets = offsets
+        self._lines = len(records)
+
+
+def _small_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of a record kept in memory."""
+    return {key: value for key, value in fields.items() if key not in LARGE_FIELDS}
+
+
+def _dumps(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as one compact JSON line."""
+    return (json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
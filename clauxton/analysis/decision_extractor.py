@@ -9,9 +9,14 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from clauxton.analysis.git_analyzer import CommitInfo, GitAnalyzer
+from clauxton.analysis.parallel import map_commits
+from clauxton.analysis.pattern_bank import PatternBank, keywords
 from clauxton.analysis.pattern_extractor import PatternExtractor
 from clauxton.core.knowledge_base import KnowledgeBase
 
+# Per-process DecisionExtractor used by pool workers (built on first task)
+_worker_extractor: Optional["DecisionExtractor"] = None
+
 
 class DecisionCandidate:
     """Candidate for Knowledge Base entry."""
@@ -90,6 +95,32 @@ class DecisionExtractor:
         ".config", "tsconfig.json", "webpack.config.js",
     ]
 
+    # Decision signals in the message
+    MESSAGE_SIGNALS = PatternBank(
+        {"decision_keyword": keywords(DECISION_KEYWORDS)}, flags=re.IGNORECASE
+    )
+
+    # Decision signals in changed file paths
+    FILE_SIGNALS = PatternBank(
+        {
+            "dependency": keywords(DEPENDENCY_FILES),
+            "config": keywords(CONFIG_FILES),
+            "adr": ["(?i)adr", "(?i)decision"],
+        }
+    )
+
+    # Decision categories, in precedence order
+    DECISION_CATEGORIES = PatternBank(
+        {
+            "constraint": keywords(CONSTRAINT_KEYWORDS),
+            "convention": keywords(CONVENTION_KEYWORDS),
+            # Before architecture to avoid being masked
+            "pattern": keywords(["pattern", "approach"]),
+            "architecture": keywords(ARCHITECTURE_KEYWORDS),
+        },
+        flags=re.IGNORECASE,
+    )
+
     def __init__(self, project_root: Path):
         """
         Initialize DecisionExtractor.
@@ -99,13 +130,14 @@ class DecisionExtractor:
         """
         self.project_root = project_root
         self.git_analyzer = GitAnalyzer(project_root)
-        self.pattern_extractor = PatternExtractor()
+        self.pattern_extractor = PatternExtractor(cache=self.git_analyzer.cache)
         self.kb = KnowledgeBase(project_root)
 
     def extract_decisions(
         self,
         since_days: int = 30,
         max_candidates: int = 10,
+        workers: Optional[int] = None,
     ) -> List[DecisionCandidate]:
         """
         Extract decision candidates from recent commits.
@@ -113,18 +145,25 @@ class DecisionExtractor:
         Args:
             since_days: Number of days to analyze
             max_candidates: Maximum number of candidates
+            workers: Number of analysis processes (None/1 = in-process,
+                0 = CPU count); results are the same in any mode
 
         Returns:
             List of DecisionCandidate objects
         """
-        # Get recent commits
-        commits = self.git_analyzer.get_recent_commits(since_days=since_days)
+        # Get recent commits (decisions use message, files and stats only)
+        commits = self.git_analyzer.get_recent_commits(
+            since_days=since_days, include_patch=False
+        )
 
-        candidates = []
-        for commit in commits:
-            candidate = self.analyze_commit_for_decision(commit)
-            if candidate:
-                candidates.append(candidate)
+        results = map_commits(
+            self.analyze_commit_for_decision,
+            _analyze_chunk,
+            self.project_root,
+            commits,
+            workers,
+        )
+        candidates = [candidate for candidate in results if candidate]
 
         # Filter duplicates
         candidates = self.filter_duplicates(candidates)
@@ -147,29 +186,15 @@ class DecisionExtractor:
         Returns:
             DecisionCandidate or None
         """
-        message = commit_info.message
-        files = commit_info.files
-
         # Check for decision keywords in message
-        has_decision_keyword = any(
-            keyword in message.lower() for keyword in self.DECISION_KEYWORDS
-        )
-
-        # Check for dependency changes
-        has_dependency_change = any(
-            dep_file in " ".join(files) for dep_file in self.DEPENDENCY_FILES
-        )
+        has_decision_keyword = self.MESSAGE_SIGNALS.search(commit_info.message)
 
-        # Check for config changes
-        has_config_change = any(
-            config_file in " ".join(files) for config_file in self.CONFIG_FILES
-        )
-
-        # Check for ADR (Architecture Decision Records)
-        has_adr = any(
-            "adr" in file.lower() or "decision" in file.lower()
-            for file in files
-        )
+        # Check for dependency and config changes, and ADRs (Architecture
+        # Decision Records)
+        file_signals = self.FILE_SIGNALS.scan(" ".join(commit_info.files))
+        has_dependency_change = "dependency" in file_signals
+        has_config_change = "config" in file_signals
+        has_adr = "adr" in file_signals
 
         # Check impact
         patterns = self.pattern_extractor.detect_patterns(commit_info)
@@ -240,26 +265,10 @@ class DecisionExtractor:
         Returns:
             Category string
         """
-        message = commit_info.message.lower()
-
-        # Check for constraint keywords
-        if any(keyword in message for keyword in self.CONSTRAINT_KEYWORDS):
-            return "constraint"
-
-        # Check for convention keywords
-        if any(keyword in message for keyword in self.CONVENTION_KEYWORDS):
-            return "convention"
-
-        # Check for pattern keywords (before architecture to avoid being masked)
-        if "pattern" in message or "approach" in message:
-            return "pattern"
-
-        # Check for architecture keywords
-        if any(keyword in message for keyword in self.ARCHITECTURE_KEYWORDS):
-            return "architecture"
+        category = self.DECISION_CATEGORIES.first(commit_info.message)
 
         # Default to decision
-        return "decision"
+        return category or "decision"
 
     def generate_title(
         self,
@@ -452,3 +461,28 @@ class DecisionExtractor:
                 added_ids.append(entry_id)
 
         return added_ids
+
+
+def _analyze_chunk(
+    project_root: str, commits: List[CommitInfo]
+) -> List[Optional[DecisionCandidate]]:
+    """
+    Analyze a chunk of commits for decisions.
+
+    Module-level so it can run in a ProcessPoolExecutor worker; each worker
+    process builds one DecisionExtractor on first use.
+
+    Args:
+        project_root: Project root directory
+        commits: Commits to analyze
+
+    Returns:
+        DecisionCandidate or None per commit
+    """
+    global _worker_extractor
+
+    if _worker_extractor is None:
+        _worker_extractor = DecisionExtractor(Path(project_root))
+        # Only the parent process writes the commit cache
+        _worker_extractor.pattern_extractor.cache = None
+    return [_worker_extractor.analyze_commit_for_decision(commit) for commit in commits]
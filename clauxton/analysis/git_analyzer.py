@@ -2,18 +2,44 @@
 Git commit analyzer for Clauxton.
 
 This module analyzes Git commit history to extract patterns, decisions, and insights.
+
+Two backends read the history:
+- "gitpython" (default): GitPython commits, one diff per commit
+- "log": one streamed `git log --numstat [-p]` process parsed into
+  CommitInfo objects (see GitAnalyzer.iter_commits()), for long histories
 """
 
+import re
+import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from clauxton.analysis.commit_cache import MAX_CACHED_DIFF, CommitCache
 
 try:
-    from git import Commit, InvalidGitRepositoryError, Repo
+    from git import NULL_TREE, Commit, InvalidGitRepositoryError, Repo
 except ImportError:
     Repo = None  # type: ignore
     Commit = None  # type: ignore
     InvalidGitRepositoryError = Exception  # type: ignore
+    NULL_TREE = None  # type: ignore
+
+BACKENDS = ("gitpython", "log")
+
+# git log header: \x1e<sha>\x1f<author>\x1f<commit time>\x1f<message>\x1d
+_LOG_FORMAT = "%x1e%H%x1f%an%x1f%ct%x1f%B%x1d"
+
+_NUMSTAT_LINE = re.compile(r"^(\d+|-)\t(\d+|-)\t(.*)$")
+
+# Renamed paths in numstat: "old => new" or "dir/{old => new}/file"
+_RENAME_BRACES = re.compile(r"^(.*)\{(.*) => (.*)\}(.*)$")
+
+# Escapes in C-quoted paths: octal bytes or a single character
+_C_ESCAPE = re.compile(r"\\([0-7]{1,3}|.)", re.DOTALL)
+_C_ESCAPE_BYTES = {
+    "a": b"\a", "b": b"\b", "t": b"\t", "n": b"\n", "v": b"\v", "f": b"\f", "r": b"\r",
+}
 
 
 class GitAnalyzerError(Exception):
@@ -59,25 +85,62 @@ class CommitInfo:
             "stats": self.stats,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CommitInfo":
+        """Create from a dictionary made by to_dict() ("diff" may be missing)."""
+        return cls(
+            sha=data["sha"],
+            message=data["message"],
+            author=data["author"],
+            date=datetime.fromisoformat(data["date"]),
+            files=data["files"],
+            diff=data.get("diff", ""),
+            stats=data["stats"],
+        )
+
 
 class GitAnalyzer:
     """
     Git commit analyzer.
 
     Analyzes Git commit history to extract patterns and insights.
+
+    Commit analyses are cached by SHA under .clauxton/cache/commits/ (see
+    CommitCache), so only commits not analyzed before are diffed. Patches
+    longer than MAX_CACHED_DIFF characters are not cached (the record is
+    marked "diff_truncated") and are diffed again when needed.
+
+    With backend="log", get_recent_commits() reads all commits from one
+    `git log` process (see iter_commits()) instead of diffing each one.
+
+    Attributes:
+        project_root: Project root directory
+        repo: GitPython Repo
+        cache: Commit analysis cache, or None if disabled
+        backend: "gitpython" or "log"
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(
+        self, project_root: Path, use_cache: bool = True, backend: str = "gitpython"
+    ):
         """
         Initialize GitAnalyzer.
 
         Args:
             project_root: Path to project root directory
+            use_cache: Whether to cache commit analyses on disk
+            backend: History backend of get_recent_commits() ("gitpython"
+                or "log")
 
         Raises:
             NotAGitRepositoryError: If project is not a Git repository
             ImportError: If GitPython is not installed
+            ValueError: If backend is unknown
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {list(BACKENDS)})")
+        self.backend = backend
+
         if Repo is None:
             raise ImportError(
                 "GitPython is required for commit analysis. "
@@ -93,11 +156,18 @@ class GitAnalyzer:
                 "Initialize with 'git init' first."
             )
 
+        self.cache: Optional[CommitCache] = (
+            CommitCache(Path(project_root) / ".clauxton" / "cache" / "commits")
+            if use_cache
+            else None
+        )
+
     def get_recent_commits(
         self,
         since_days: int = 7,
         max_count: Optional[int] = None,
         branch: Optional[str] = None,
+        include_patch: bool = True,
     ) -> List[CommitInfo]:
         """
         Get recent commits.
@@ -106,10 +176,22 @@ class GitAnalyzer:
             since_days: Number of days to look back (default: 7)
             max_count: Maximum number of commits to return
             branch: Branch name (default: current branch)
+            include_patch: If False, skip patch text (CommitInfo.diff is
+                empty); files and stats are still filled, from numstat
 
         Returns:
             List of CommitInfo objects
         """
+        if self.backend == "log":
+            return list(
+                self.iter_commits(
+                    since_days=since_days,
+                    max_count=max_count,
+                    branch=branch,
+                    include_patch=include_patch,
+                )
+            )
+
         since_date = datetime.now() - timedelta(days=since_days)
 
         # Get commits
@@ -119,19 +201,93 @@ class GitAnalyzer:
             max_count=max_count,
         )
 
-        commit_infos = []
-        for commit in commits_iter:
-            info = self.analyze_commit(commit.hexsha)
-            commit_infos.append(info)
+        return [self._commit_info(commit, include_patch) for commit in commits_iter]
+
+    def iter_commits(
+        self,
+        since_days: Optional[int] = None,
+        max_count: Optional[int] = None,
+        branch: Optional[str] = None,
+        include_patch: bool = True,
+    ) -> Iterator[CommitInfo]:
+        """
+        Stream commits from one `git log --numstat` process.
+
+        Commits are parsed as git prints them, newest first, so memory use
+        does not grow with the history length. Files and stats come from
+        numstat (merges are diffed against their first parent); the patch
+        text matches the "gitpython" backend. Commits not cached yet are
+        added to the cache. Closing the generator early stops git.
 
-        return commit_infos
+        Args:
+            since_days: Number of days to look back (None: whole history)
+            max_count: Maximum number of commits
+            branch: Branch name (default: current branch)
+            include_patch: If False, skip patch text (CommitInfo.diff is
+                empty), which makes git much faster
 
-    def analyze_commit(self, commit_sha: str) -> CommitInfo:
+        Yields:
+            CommitInfo objects
+
+        Raises:
+            GitAnalyzerError: If git log fails
+        """
+        args = [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "log",
+            f"--format={_LOG_FORMAT}",
+            "--numstat",
+            "-M",
+            "--diff-merges=first-parent",
+            "--no-color",
+            "--no-ext-diff",
+            "--no-textconv",
+        ]
+        if include_patch:
+            args.append("-p")
+        if since_days is not None:
+            since_date = datetime.now() - timedelta(days=since_days)
+            args.append(f"--since={since_date.isoformat(timespec='seconds')}")
+        if max_count is not None:
+            args.append(f"--max-count={max_count}")
+        args.append(branch or "HEAD")
+        args.append("--")
+
+        process = subprocess.Popen(
+            args,
+            cwd=str(self.repo.working_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            assert process.stdout is not None
+            for info in parse_git_log(_decoded_lines(process.stdout), include_patch):
+                if self.cache is not None and not self._is_cached(info.sha, include_patch):
+                    self._cache_commit(info, include_patch)
+                yield info
+
+            assert process.stderr is not None
+            error = process.stderr.read().decode("utf-8", errors="ignore").strip()
+            if process.wait() != 0:
+                raise GitAnalyzerError(f"git log failed: {error}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            for stream in (process.stdout, process.stderr):
+                if stream is not None:
+                    stream.close()
+
+    def analyze_commit(self, commit_sha: str, include_patch: bool = True) -> CommitInfo:
         """
         Analyze a specific commit.
 
         Args:
             commit_sha: Commit SHA hash
+            include_patch: If False, skip patch text (CommitInfo.diff is
+                empty); files and stats are still filled, from numstat
 
         Returns:
             CommitInfo object
@@ -144,33 +300,7 @@ class GitAnalyzer:
         except Exception as e:
             raise GitAnalyzerError(f"Commit {commit_sha} not found: {e}")
 
-        # Get modified files
-        files = self.get_modified_files(commit_sha)
-
-        # Get diff
-        diff = self.get_commit_diff(commit_sha)
-
-        # Get stats
-        stats = self.get_commit_stats(commit_sha)
-
-        # Handle message (str or bytes)
-        message = commit.message
-        if isinstance(message, bytes):
-            message = message.decode("utf-8", errors="ignore")
-        message = message.strip()
-
-        # Handle author name (may be None)
-        author_name = commit.author.name if commit.author.name else "Unknown"
-
-        return CommitInfo(
-            sha=commit.hexsha,
-            message=message,
-            author=author_name,
-            date=datetime.fromtimestamp(commit.committed_date),
-            files=files,
-            diff=diff,
-            stats=stats,
-        )
+        return self._commit_info(commit, include_patch)
 
     def get_commit_diff(self, commit_sha: str) -> str:
         """
@@ -182,27 +312,8 @@ class GitAnalyzer:
         Returns:
             Diff as string
         """
-        commit = self.repo.commit(commit_sha)
-
-        # Get diff with parent (or empty tree for first commit)
-        if commit.parents:
-            parent = commit.parents[0]
-            diff = commit.diff(parent, create_patch=True)
-        else:
-            # First commit - diff against empty tree
-            diff = commit.diff(None, create_patch=True)
-
-        # Convert to string
-        diff_str = ""
-        for diff_item in diff:
-            if diff_item.diff:
-                diff_content = diff_item.diff
-                if isinstance(diff_content, bytes):
-                    diff_str += diff_content.decode("utf-8", errors="ignore")
-                else:
-                    diff_str += diff_content
-
-        return diff_str
+        _, diff, _ = self._diff_commit(self.repo.commit(commit_sha), include_patch=True)
+        return diff
 
     def get_modified_files(self, commit_sha: str) -> List[str]:
         """
@@ -212,26 +323,9 @@ class GitAnalyzer:
             commit_sha: Commit SHA hash
 
         Returns:
-            List of file paths
+            List of file paths (new path for renamed files)
         """
-        commit = self.repo.commit(commit_sha)
-
-        files = []
-        if commit.parents:
-            parent = commit.parents[0]
-            diff = commit.diff(parent)
-        else:
-            diff = commit.diff(None)
-
-        for diff_item in diff:
-            # Handle renamed files
-            if diff_item.renamed_file and diff_item.rename_to:
-                files.append(diff_item.rename_to)
-            elif diff_item.a_path:
-                files.append(diff_item.a_path)
-            elif diff_item.b_path:
-                files.append(diff_item.b_path)
-
+        files, _, _ = self._diff_commit(self.repo.commit(commit_sha), include_patch=False)
         return files
 
     def get_commit_stats(self, commit_sha: str) -> Dict[str, int]:
@@ -244,38 +338,163 @@ class GitAnalyzer:
         Returns:
             Dictionary with stats: insertions, deletions, files_changed
         """
-        commit = self.repo.commit(commit_sha)
+        _, _, stats = self._diff_commit(self.repo.commit(commit_sha), include_patch=False)
+        return stats
+
+    def _commit_info(self, commit: Any, include_patch: bool) -> CommitInfo:
+        """Get CommitInfo from the cache, or build it from one diff of the commit."""
+        if self.cache is not None:
+            record = self.cache.get(commit.hexsha, large_fields=include_patch)
+            # Records without "diff" were analyzed without the patch, or it was too long
+            if record is not None and (not include_patch or "diff" in record):
+                info = CommitInfo.from_dict({"sha": commit.hexsha, **record})
+                if not include_patch:
+                    info.diff = ""
+                return info
+
+        files, diff, stats = self._diff_commit(commit, include_patch)
+
+        # Handle message (str or bytes)
+        message = commit.message
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", errors="ignore")
+        message = message.strip()
+
+        # Handle author name (may be None)
+        author_name = commit.author.name if commit.author.name else "Unknown"
+
+        info = CommitInfo(
+            sha=commit.hexsha,
+            message=message,
+            author=author_name,
+            date=datetime.fromtimestamp(commit.committed_date),
+            files=files,
+            diff=diff,
+            stats=stats,
+        )
+
+        if self.cache is not None and not self._is_cached(info.sha, include_patch):
+            self._cache_commit(info, include_patch)
+
+        return info
+
+    def _is_cached(self, sha: str, include_patch: bool) -> bool:
+        """Check whether caching the analysis of a commit would add nothing."""
+        assert self.cache is not None
+        if not include_patch:
+            return self.cache.has(sha)
+        return self.cache.has(sha, "diff") or self.cache.has(sha, "diff_truncated")
+
+    def _cache_commit(self, info: CommitInfo, include_patch: bool) -> None:
+        """Store a CommitInfo in the cache ("diff" only if computed and not too long)."""
+        assert self.cache is not None
+        record = info.to_dict()
+        del record["sha"]
+        if not include_patch:
+            del record["diff"]
+        elif len(info.diff) > MAX_CACHED_DIFF:
+            # A cut patch would differ from a fresh diff: diff again on use
+            del record["diff"]
+            record["diff_truncated"] = True
+        self.cache.put(info.sha, record)
+
+    def _diff_commit(
+        self, commit: Any, include_patch: bool
+    ) -> Tuple[List[str], str, Dict[str, int]]:
+        """
+        Diff a commit against its first parent (or the empty tree) once.
+
+        With include_patch, files, patch text and line counts all come from
+        one patch diff; without it, from one `git diff-tree --numstat` call,
+        which does not produce patch bodies.
+
+        Args:
+            commit: GitPython Commit
+            include_patch: Whether to produce the patch text
+
+        Returns:
+            (files, patch text, stats) where stats has insertions,
+            deletions and files_changed
+        """
+        if not include_patch:
+            return self._numstat(commit)
+
+        # Diff from parent to commit, so "+" lines are the commit's additions
+        if commit.parents:
+            diff_index = commit.parents[0].diff(commit, create_patch=True)
+        else:
+            diff_index = commit.diff(NULL_TREE, create_patch=True)
 
+        files: List[str] = []
+        patches: List[str] = []
         insertions = 0
         deletions = 0
-        files_changed = 0
+        for diff_item in diff_index:
+            path = diff_item.b_path or diff_item.a_path
+            if path:
+                files.append(path)
+
+            diff_content = diff_item.diff
+            if not diff_content:
+                continue
+            if isinstance(diff_content, bytes):
+                diff_content = diff_content.decode("utf-8", errors="ignore")
+            patches.append(diff_content)
+            for line in diff_content.split("\n"):
+                if line.startswith("+") and not line.startswith("+++"):
+                    insertions += 1
+                elif line.startswith("-") and not line.startswith("---"):
+                    deletions += 1
+
+        return (
+            files,
+            "".join(patches),
+            {
+                "insertions": insertions,
+                "deletions": deletions,
+                "files_changed": len(diff_index),
+            },
+        )
 
+    def _numstat(self, commit: Any) -> Tuple[List[str], str, Dict[str, int]]:
+        """File names and line counts of a commit from `git diff-tree --numstat`."""
         if commit.parents:
-            parent = commit.parents[0]
-            diff = commit.diff(parent, create_patch=True)
+            revisions = [commit.parents[0].hexsha, commit.hexsha]
         else:
-            diff = commit.diff(None, create_patch=True)
-
-        for diff_item in diff:
-            files_changed += 1
-            # Parse diff stats
-            if hasattr(diff_item, 'diff') and diff_item.diff:
-                diff_content = diff_item.diff
-                if isinstance(diff_content, bytes):
-                    diff_str = diff_content.decode("utf-8", errors="ignore")
-                else:
-                    diff_str = diff_content
-                for line in diff_str.split("\n"):
-                    if line.startswith("+") and not line.startswith("+++"):
-                        insertions += 1
-                    elif line.startswith("-") and not line.startswith("---"):
-                        deletions += 1
+            revisions = ["--root", commit.hexsha]
+        output = self.repo.git.diff_tree(
+            "-r", "-M", "--numstat", "-z", "--no-commit-id", *revisions
+        )
 
-        return {
-            "insertions": insertions,
-            "deletions": deletions,
-            "files_changed": files_changed,
-        }
+        # -z records: "<added>\t<deleted>\t<path>\0", or for renames
+        # "<added>\t<deleted>\t\0<old path>\0<new path>\0"; binary files use "-"
+        files: List[str] = []
+        insertions = 0
+        deletions = 0
+        fields = output.split("\0")
+        position = 0
+        while position < len(fields):
+            record = fields[position]
+            position += 1
+            if not record.strip():
+                continue
+            added, deleted, path = record.split("\t", 2)
+            if not path:
+                path = fields[position + 1]
+                position += 2
+            files.append(path)
+            insertions += int(added) if added.isdigit() else 0
+            deletions += int(deleted) if deleted.isdigit() else 0
+
+        return (
+            files,
+            "",
+            {
+                "insertions": insertions,
+                "deletions": deletions,
+                "files_changed": len(files),
+            },
+        )
 
     def get_commit_count(
         self,
@@ -315,3 +534,132 @@ class GitAnalyzer:
             Branch name
         """
         return str(self.repo.active_branch.name)
+
+
+def parse_git_log(lines: Iterable[str], include_patch: bool = True) -> Iterator[CommitInfo]:
+    """
+    Parse `git log --numstat [-p]` output in the format of iter_commits().
+
+    Args:
+        lines: Output lines (with or without line endings)
+        include_patch: Whether to keep patch hunks in CommitInfo.diff
+
+    Yields:
+        One CommitInfo per commit, as soon as its output ends
+    """
+    header: Optional[List[str]] = None
+    commit: Optional[Dict[str, Any]] = None
+    in_hunks = False
+
+    for line in lines:
+        line = line.rstrip("\n")
+
+        if header is not None:
+            # Messages span lines up to the \x1d terminator
+            header.append(line)
+            if line.endswith("\x1d"):
+                commit = _log_header("\n".join(header))
+                header = None
+            continue
+
+        if line.startswith("\x1e"):
+            if commit is not None:
+                yield _log_commit_info(commit)
+            commit = None
+            in_hunks = False
+            header = [line]
+            if line.endswith("\x1d"):
+                commit = _log_header(line)
+                header = None
+            continue
+
+        if commit is None or not line:
+            continue
+
+        # Patch: keep hunks ("@@" onwards) and binary notes, like GitPython diffs
+        if line.startswith("diff --git "):
+            in_hunks = False
+            continue
+        if in_hunks or line.startswith("@@"):
+            in_hunks = True
+            if include_patch:
+                commit["patch"].append(line + "\n")
+            continue
+        if line.startswith("Binary files "):
+            if include_patch:
+                commit["patch"].append(line + "\n")
+            continue
+
+        match = _NUMSTAT_LINE.match(line)
+        if match:
+            added, deleted, path = match.groups()
+            commit["files"].append(_numstat_path(path))
+            commit["insertions"] += int(added) if added.isdigit() else 0
+            commit["deletions"] += int(deleted) if deleted.isdigit() else 0
+
+    if commit is not None:
+        yield _log_commit_info(commit)
+
+
+def _log_header(text: str) -> Dict[str, Any]:
+    """Start a commit from its \x1e...\x1d header."""
+    sha, author, timestamp, message = text[1:-1].split("\x1f", 3)
+    return {
+        "sha": sha,
+        "author": author or "Unknown",
+        "date": datetime.fromtimestamp(int(timestamp)),
+        "message": message.strip(),
+        "files": [],
+        "insertions": 0,
+        "deletions": 0,
+        "patch": [],
+    }
+
+
+def _log_commit_info(commit: Dict[str, Any]) -> CommitInfo:
+    return CommitInfo(
+        sha=commit["sha"],
+        message=commit["message"],
+        author=commit["author"],
+        date=commit["date"],
+        files=commit["files"],
+        diff="".join(commit["patch"]),
+        stats={
+            "insertions": commit["insertions"],
+            "deletions": commit["deletions"],
+            "files_changed": len(commit["files"]),
+        },
+    )
+
+
+def _numstat_path(path: str) -> str:
+    """New path of a numstat entry (unquoted, renames resolved)."""
+    if path.startswith('"') and path.endswith('"'):
+        # C-style quoting of paths with control characters or quotes
+        path = _unquote_c(path[1:-1])
+    if " => " not in path:
+        return path
+    match = _RENAME_BRACES.match(path)
+    if match:
+        prefix, _, new, suffix = match.groups()
+        return (prefix + new + suffix).replace("//", "/")
+    return path.split(" => ", 1)[1]
+
+
+def _unquote_c(quoted: str) -> str:
+    """Undo git's C-style path quoting (octal escapes are UTF-8 bytes)."""
+    data = bytearray()
+    for i, part in enumerate(_C_ESCAPE.split(quoted)):
+        if i % 2 == 0:
+            data += part.encode("utf-8")
+        elif part[0] in "01234567":
+            data.append(int(part, 8) & 0xFF)
+        else:
+            data += _C_ESCAPE_BYTES.get(part, part.encode("utf-8"))
+    return data.decode("utf-8", errors="ignore")
+
+
+def _decoded_lines(stream: IO[bytes]) -> Iterator[str]:
+    """Decode output lines one at a time (split on "\\n" only)."""
+    for raw in stream:
+        yield raw.decode("utf-8", errors="ignore")
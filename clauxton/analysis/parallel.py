@@ -0,0 +1,74 @@
+"""
+Parallel per-commit analysis.
+
+Decision and memory extraction analyze each commit independently (message
+regexes, file classification, tag extraction), so long histories can be
+split across worker processes. map_commits() sends commits to a process
+pool in chunks and returns the results in commit order, so the output is
+the same as analyzing them one after another.
+
+Workers are module-level functions taking (project root, chunk of
+CommitInfo) that build their own per-process analyzer on first use, like
+the symbol extraction workers of RepositoryMap.
+"""
+
+import logging
+import os
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, List, Optional, TypeVar
+
+from clauxton.analysis.git_analyzer import CommitInfo
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of commits per worker task
+COMMIT_CHUNK_SIZE = 256
+
+R = TypeVar("R")
+
+
+def map_commits(
+    analyze: Callable[[CommitInfo], R],
+    worker: Callable[[str, List[CommitInfo]], List[R]],
+    project_root: Path,
+    commits: List[CommitInfo],
+    workers: Optional[int],
+) -> List[R]:
+    """
+    Analyze commits in-process or in a process pool, keeping commit order.
+
+    If the pool cannot be used (e.g. process creation not permitted), the
+    commits without results are analyzed in-process.
+
+    Args:
+        analyze: In-process analysis of one commit
+        worker: Module-level function analyzing a chunk in a worker process
+        project_root: Project root passed to worker
+        commits: Commits to analyze
+        workers: Number of worker processes (None/1 = in-process, 0 = CPU count)
+
+    Returns:
+        One result per commit, in the order of commits
+    """
+    if workers is not None and workers <= 0:
+        workers = os.cpu_count() or 1
+
+    results: List[R] = []
+    if workers and workers > 1 and len(commits) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunk_size = max(1, min(COMMIT_CHUNK_SIZE, len(commits) // (workers * 4)))
+        chunks = [commits[i:i + chunk_size] for i in range(0, len(commits), chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                # map() yields chunks in submission order
+                for chunk_results in pool.map(worker, repeat(str(project_root)), chunks):
+                    results.extend(chunk_results)
+            return results
+        except (OSError, RuntimeError) as e:
+            # e.g. BrokenProcessPool, or process creation not permitted
+            logger.warning(f"Parallel commit analysis failed ({e}), continuing in-process")
+
+    results.extend(analyze(commit) for commit in commits[len(results):])
+    return results
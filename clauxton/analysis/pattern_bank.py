@@ -0,0 +1,250 @@
+"""
+Precompiled classification rules for commit messages, paths and diffs.
+
+Commit classification checks dozens of keywords and regexes per text,
+some of them over multi-MB diffs. A PatternBank compiles labelled rules
+once and classifies a text in a single call:
+- Each rule (or top-level "|" branch of a rule) gets a literal anchor:
+  its leading literal text, e.g. "class" for r"\\bclass\\s+\\w+"
+- Anchors are located with str.find() (on a lowercased copy of the text
+  for case-insensitive rules, made once per call) and the rule's regex is
+  only tried at those positions; rules that are plain keywords need no
+  regex at all
+- A label is done at its first verified match, and first() stops at the
+  first label found in priority order
+
+Anchoring matters because the re module only skips ahead quickly for a
+pattern that starts with a literal; a leading \\b, a character class or an
+alternation of many rules makes it try every pattern at every position.
+
+Example:
+    >>> bank = PatternBank(
+    ...     {"bugfix": keywords(["fix", "bug"]), "feature": keywords(["add"])},
+    ...     flags=re.IGNORECASE,
+    ... )
+    >>> bank.scan("Fix crash and add retry")
+    {'bugfix': 'Fix', 'feature': 'add'}
+    >>> bank.first("Fix crash and add retry")
+    'bugfix'
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Characters with a special meaning in a regex (outside character classes)
+_SPECIAL = set(".^$*+?{}[]|()\\")
+
+
+def keywords(words: Iterable[str]) -> List[str]:
+    """Rules matching literal keywords anywhere in a text."""
+    return [re.escape(word) for word in words]
+
+
+class _Rule(NamedTuple):
+    """One compiled branch of a rule."""
+
+    pattern: "re.Pattern[str]"
+    anchor: str  # Leading literal text ("" if none), lowercased if ignore_case
+    ignore_case: bool
+    literal: bool  # The whole branch is the anchor
+
+
+class PatternBank:
+    """
+    Labelled regex rules checked together.
+
+    Attributes:
+        labels: Labels in rule order (the priority order of first())
+        flags: Regex flags of all rules
+    """
+
+    def __init__(self, rules: Mapping[str, Sequence[str]], flags: int = 0) -> None:
+        """
+        Compile rules.
+
+        Args:
+            rules: Regex sources per label, in priority order. A leading
+                inline flag like "(?i)" only applies to its own rule
+            flags: Regex flags of all rules
+
+        Raises:
+            ValueError: If a label has no rules
+            re.error: If a rule is not a valid regex
+        """
+        self.labels = list(rules)
+        self.flags = flags
+        self._rules: List[Tuple[str, List[_Rule]]] = []
+        for label, sources in rules.items():
+            if not sources:
+                raise ValueError(f"Label {label!r} has no rules")
+            self._rules.append(
+                (label, [rule for source in sources for rule in _compile(source, flags)])
+            )
+        self._needs_lowered = any(
+            rule.ignore_case and rule.anchor for _, branches in self._rules for rule in branches
+        )
+
+    def scan(self, text: str) -> Dict[str, str]:
+        """
+        Find every label with a matching rule.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Matched text (evidence) per found label, in label order; the
+            evidence is the first match of the label's first matching rule
+        """
+        lowered = self._lowered(text)
+        found: Dict[str, str] = {}
+        for label, branches in self._rules:
+            evidence = self._match_label(branches, text, lowered)
+            if evidence is not None:
+                found[label] = evidence
+        return found
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        Get the found label that comes first in rule order.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Label, or None if no rule matches
+        """
+        lowered = self._lowered(text)
+        for label, branches in self._rules:
+            if self._match_label(branches, text, lowered) is not None:
+                return label
+        return None
+
+    def search(self, text: str) -> bool:
+        """Check whether any rule matches the text."""
+        return self.first(text) is not None
+
+    def _lowered(self, text: str) -> Optional[str]:
+        """Lowercased text for anchors of case-insensitive rules, if usable."""
+        if not self._needs_lowered:
+            return None
+        lowered = text.lower()
+        # Anchor positions are only valid if lowercasing keeps the length
+        return lowered if len(lowered) == len(text) else None
+
+    @staticmethod
+    def _match_label(branches: List[_Rule], text: str, lowered: Optional[str]) -> Optional[str]:
+        """Evidence of the first matching branch of a label, or None."""
+        for rule in branches:
+            if not rule.anchor or (rule.ignore_case and lowered is None):
+                match = rule.pattern.search(text)
+                if match is not None:
+                    return match.group(0)
+                continue
+
+            haystack = lowered if rule.ignore_case and lowered is not None else text
+            position = haystack.find(rule.anchor)
+            while position != -1:
+                if rule.literal:
+                    return text[position:position + len(rule.anchor)]
+                match = rule.pattern.match(text, position)
+                if match is not None:
+                    return match.group(0)
+                position = haystack.find(rule.anchor, position + 1)
+        return None
+
+
+def _compile(source: str, flags: int) -> List[_Rule]:
+    """Compile the top-level branches of a rule with their anchors."""
+    inline = re.match(r"\(\?([aiLmsux]+)\)", source)
+    inline_flags = inline.group(1) if inline else ""
+    if inline:
+        source = source[inline.end():]
+
+    ignore_case = bool(flags & re.IGNORECASE) or "i" in inline_flags
+    rules = []
+    for branch in _branches(source):
+        scoped = f"(?{inline_flags}:{branch})" if inline_flags else branch
+        if flags & re.VERBOSE or "x" in inline_flags:
+            anchor, literal = "", False
+        else:
+            anchor, literal = _anchor(branch)
+        rules.append(
+            _Rule(
+                pattern=re.compile(scoped, flags),
+                anchor=anchor.lower() if ignore_case else anchor,
+                ignore_case=ignore_case,
+                literal=literal,
+            )
+        )
+    return rules
+
+
+def _branches(source: str) -> List[str]:
+    """Split a regex at its top-level "|"."""
+    branches = []
+    depth = 0
+    in_class = False
+    start = 0
+    position = 0
+    while position < len(source):
+        char = source[position]
+        if char == "\\":
+            position += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # "]" right after "[" or "[^" is a literal
+            if source[position + 1:position + 2] == "^":
+                position += 1
+            if source[position + 1:position + 2] == "]":
+                position += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(source[start:position])
+            start = position + 1
+        position += 1
+    branches.append(source[start:])
+    return branches
+
+
+def _anchor(branch: str) -> Tuple[str, bool]:
+    """
+    Leading literal text every match of a branch starts with.
+
+    Returns:
+        (anchor, whether the whole branch is that literal)
+    """
+    position = 0
+    plain = True
+    if branch.startswith("^"):
+        position = 1
+        plain = False
+    while branch.startswith("\\b", position):
+        position += 2
+        plain = False
+
+    chars: List[str] = []
+    while position < len(branch):
+        char = branch[position]
+        if char == "\\":
+            escaped = branch[position + 1:position + 2]
+            if not escaped or escaped.isalnum():
+                break  # \s, \w, \d, \1, ...
+            token, end = escaped, position + 2
+        elif char in _SPECIAL:
+            break
+        else:
+            token, end = char, position + 1
+
+        if branch[end:end + 1] in ("*", "?", "{"):
+            # Optional or repeated character: the anchor ends before it
+            break
+        chars.append(token)
+        position = end
+
+    return "".join(chars), plain and position == len(branch)
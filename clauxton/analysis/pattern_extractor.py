@@ -5,9 +5,11 @@ Extracts patterns, keywords, and categories from commit messages and diffs.
 """
 
 import re
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
+from clauxton.analysis.commit_cache import CommitCache
 from clauxton.analysis.git_analyzer import CommitInfo
+from clauxton.analysis.pattern_bank import PatternBank, keywords
 
 
 class PatternExtractor:
@@ -15,6 +17,10 @@ class PatternExtractor:
     Pattern extractor for commits.
 
     Extracts patterns, keywords, and categories from commits.
+
+    Attributes:
+        cache: Commit cache for detect_patterns() results (e.g.
+            GitAnalyzer.cache), or None
     """
 
     # Conventional Commits prefixes
@@ -58,9 +64,57 @@ class PatternExtractor:
         "example", "comment", "docstring",
     ]
 
-    def __init__(self) -> None:
-        """Initialize PatternExtractor."""
-        pass
+    # Message categories, in precedence order
+    MESSAGE_CATEGORIES = PatternBank(
+        {
+            "bugfix": keywords(BUGFIX_KEYWORDS),
+            "feature": keywords(FEATURE_KEYWORDS),
+            "refactor": keywords(REFACTOR_KEYWORDS),
+            "test": keywords(TEST_KEYWORDS),
+            "docs": keywords(DOCS_KEYWORDS),
+        },
+        flags=re.IGNORECASE,
+    )
+
+    # File path categories, when the message has none
+    FILE_CATEGORIES = PatternBank(
+        {
+            "test": keywords(["test", "spec"]),
+            "docs": keywords(["readme", "docs", ".md"]),
+        },
+        flags=re.IGNORECASE,
+    )
+
+    # Special file kinds (extract_from_files())
+    FILE_KINDS = PatternBank(
+        {
+            "test_files": keywords(["test", "spec"]),
+            "doc_files": keywords(["readme", "doc", "md"]),
+            "config_files": keywords(["config", "settings", ".env"]),
+        },
+        flags=re.IGNORECASE,
+    )
+
+    # Code patterns in diffs (extract_from_diff())
+    DIFF_PATTERNS = PatternBank(
+        {
+            "imports": keywords(["import ", "from "]),
+            "class_def": [r"\bclass\s+\w+"],
+            "python_def": [r"\bdef\s+\w+\("],
+            "javascript_function": [r"\bfunction\s+\w+\("],
+            "comments": [r"#.*$|//.*$|/\*.*\*/"],
+        },
+        flags=re.MULTILINE,
+    )
+
+    def __init__(self, cache: Optional[CommitCache] = None) -> None:
+        """
+        Initialize PatternExtractor.
+
+        Args:
+            cache: Commit cache to reuse detect_patterns() results from
+        """
+        self.cache = cache
 
     def detect_patterns(self, commit_info: CommitInfo) -> Dict[str, Any]:
         """
@@ -72,6 +126,20 @@ class PatternExtractor:
         Returns:
             Dictionary with detected patterns
         """
+        # Patterns of a CommitInfo without patch text lack diff_patterns
+        key = "patterns" if commit_info.diff else "patterns_without_diff"
+        if self.cache is not None:
+            record = self.cache.get(commit_info.sha, large_fields=False)
+            if record is not None and key in record:
+                return dict(record[key])
+
+        patterns = self._detect_patterns(commit_info)
+        if self.cache is not None:
+            self.cache.put(commit_info.sha, {key: patterns})
+        return patterns
+
+    def _detect_patterns(self, commit_info: CommitInfo) -> Dict[str, Any]:
+        """Detect all patterns in a commit (uncached)."""
         message_patterns = self.extract_from_message(commit_info.message)
         file_patterns = self.extract_from_files(commit_info.files)
         diff_patterns = self.extract_from_diff(commit_info.diff)
@@ -177,14 +245,9 @@ class PatternExtractor:
                 directory = file.split("/")[0]
                 directories_set.add(directory)
 
-            # Detect special file types
-            file_lower = file.lower()
-            if any(keyword in file_lower for keyword in ["test", "spec"]):
-                patterns["test_files"] = True
-            if any(keyword in file_lower for keyword in ["readme", "doc", "md"]):
-                patterns["doc_files"] = True
-            if any(keyword in file_lower for keyword in ["config", "settings", ".env"]):
-                patterns["config_files"] = True
+        # Detect special file types (one scan over all paths)
+        for kind in self.FILE_KINDS.scan("\n".join(files)):
+            patterns[kind] = True
 
         # Convert sets to lists for JSON serialization
         patterns["file_types"] = list(file_types_set)
@@ -217,23 +280,24 @@ class PatternExtractor:
             patterns["language_hints"] = []
             return patterns
 
-        # Detect language patterns
-        if "import " in diff or "from " in diff:
+        # Detect language patterns (one scan over the diff)
+        found = self.DIFF_PATTERNS.scan(diff)
+        if "imports" in found:
             patterns["has_imports"] = True
             language_hints_set.add("python")
 
-        if re.search(r"\bclass\s+\w+", diff):
+        if "class_def" in found:
             patterns["has_class_def"] = True
 
-        if re.search(r"\bdef\s+\w+\(", diff):
+        if "python_def" in found:
             patterns["has_function_def"] = True
             language_hints_set.add("python")
 
-        if re.search(r"\bfunction\s+\w+\(", diff):
+        if "javascript_function" in found:
             patterns["has_function_def"] = True
             language_hints_set.add("javascript")
 
-        if re.search(r"#.*$|//.*$|/\*.*\*/", diff, re.MULTILINE):
+        if "comments" in found:
             patterns["has_comments"] = True
 
         # Convert sets to lists
@@ -258,32 +322,13 @@ class PatternExtractor:
             if message.startswith(f"{prefix}:") or message.startswith(f"{prefix}("):
                 return category
 
-        # Keyword-based detection
-        if any(keyword in message for keyword in self.BUGFIX_KEYWORDS):
-            return "bugfix"
-
-        if any(keyword in message for keyword in self.FEATURE_KEYWORDS):
-            return "feature"
-
-        if any(keyword in message for keyword in self.REFACTOR_KEYWORDS):
-            return "refactor"
-
-        if any(keyword in message for keyword in self.TEST_KEYWORDS):
-            return "test"
-
-        if any(keyword in message for keyword in self.DOCS_KEYWORDS):
-            return "docs"
-
-        # File-based detection
-        files_str = " ".join(commit_info.files).lower()
-        if "test" in files_str or "spec" in files_str:
-            return "test"
-
-        if "readme" in files_str or "docs" in files_str or ".md" in files_str:
-            return "docs"
+        # Keyword-based, then file-based detection
+        detected = self.MESSAGE_CATEGORIES.first(message) or self.FILE_CATEGORIES.first(
+            " ".join(commit_info.files)
+        )
 
         # Default
-        return "chore"
+        return detected or "chore"
 
     def extract_keywords(self, text: str) -> List[str]:
         """
@@ -60,7 +60,7 @@ class TaskSuggester:
         """
         self.project_root = project_root
         self.git_analyzer = GitAnalyzer(project_root)
-        self.pattern_extractor = PatternExtractor()
+        self.pattern_extractor = PatternExtractor(cache=self.git_analyzer.cache)
         self.task_manager = TaskManager(project_root)
 
     def suggest_tasks(
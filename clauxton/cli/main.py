@@ -160,7 +160,7 @@ def status() -> None:
             else:
                 time_ago = "unknown"
 
-            total_symbols = sum(len(syms) for syms in repo_map.symbols_data.values())
+            total_symbols = repo_map.symbol_count
 
             click.echo(click.style("🗺️  Repository Map:", fg="green", bold=True))
             click.echo(f"  ✓ Indexed: {stats['total_files']} files, {total_symbols} symbols")
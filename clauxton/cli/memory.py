@@ -136,14 +136,25 @@ def add(
     type=click.Choice(["knowledge", "decision", "code", "task", "pattern"]),
     help="Filter by type (can be used multiple times)",
 )
+@click.option("--category", help="Filter by category")
+@click.option(
+    "--tag", "tag_filter", multiple=True, help="Filter by tag (can be used multiple times)"
+)
 @click.option("--limit", default=10, help="Maximum results")
-def search(query: str, type_filter: tuple[str, ...], limit: int) -> None:
+def search(
+    query: str,
+    type_filter: tuple[str, ...],
+    category: Optional[str],
+    tag_filter: tuple[str, ...],
+    limit: int,
+) -> None:
     """
     Search memories.
 
     Examples:
         clauxton memory search "authentication"
         clauxton memory search "API" --type knowledge --type decision
+        clauxton memory search "API" --category architecture --tag rest
     """
     project_root = Path.cwd()
 
@@ -154,7 +165,13 @@ def search(query: str, type_filter: tuple[str, ...], limit: int) -> None:
 
     mem = Memory(project_root)
 
-    results = mem.search(query, type_filter=list(type_filter) or None, limit=limit)
+    results = mem.search(
+        query,
+        type_filter=list(type_filter) or None,
+        limit=limit,
+        category_filter=category,
+        tag_filter=list(tag_filter) or None,
+    )
 
     if not results:
         click.echo(click.style("\nNo memories found", fg="yellow"))
@@ -547,7 +564,17 @@ def _display_memory_preview(
 @click.option("--commit", help="Extract from specific commit SHA")
 @click.option("--auto-add", is_flag=True, help="Automatically add extracted memories")
 @click.option("--preview/--no-preview", default=True, help="Preview before adding")
-def extract_memories(since: str, commit: Optional[str], auto_add: bool, preview: bool) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Parallel commit analysis processes (0 = one per CPU)",
+)
+def extract_memories(
+    since: str, commit: Optional[str], auto_add: bool, preview: bool, jobs: int
+) -> None:
     """
     Extract memories from Git commits.
 
@@ -555,6 +582,7 @@ def extract_memories(since: str, commit: Optional[str], auto_add: bool, preview:
         clauxton memory extract --since 7d
         clauxton memory extract --commit abc123
         clauxton memory extract --since 30d --auto-add
+        clauxton memory extract --since 1y --jobs 0
     """
     from clauxton.semantic.memory_extractor import MemoryExtractor, MemoryExtractorError
 
@@ -586,7 +614,9 @@ def extract_memories(since: str, commit: Optional[str], auto_add: bool, preview:
                 raise click.Abort()
 
             click.echo(f"Extracting from last {since_days} days...")
-            memories = extractor.extract_from_recent_commits(since_days=since_days, auto_add=False)
+            memories = extractor.extract_from_recent_commits(
+                since_days=since_days, auto_add=False, workers=jobs
+            )
 
     except MemoryExtractorError as e:
         click.echo(click.style(f"Extraction error: {e}", fg="red"), err=True)
@@ -31,7 +31,15 @@ def repo_group() -> None:
     is_flag=True,
     help="Perform incremental indexing (only changed files)",
 )
-def index_command(path: str, incremental: bool) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Parallel symbol extraction processes (0 = one per CPU)",
+)
+def index_command(path: str, incremental: bool, jobs: int) -> None:
     """
     Index codebase for fast symbol search.
 
@@ -41,6 +49,7 @@ def index_command(path: str, incremental: bool) -> None:
     Example:
         clauxton repo index
         clauxton repo index --path /path/to/project
+        clauxton repo index --jobs 4
     """
     try:
         project_path = Path(path)
@@ -84,7 +93,8 @@ def index_command(path: str, incremental: bool) -> None:
 
             result = repo_map.index(
                 incremental=incremental,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                workers=jobs,
             )
 
         # Display results
@@ -262,7 +272,6 @@ def status_command(path: str) -> None:
 
         # Load index data
         index = repo_map.index_data
-        symbols = repo_map.symbols_data
 
         # Display status
         console.print("[blue]Repository Index Status[/blue]\n")
@@ -287,7 +296,7 @@ def status_command(path: str) -> None:
                 console.print(f"  {language}: {count}")
 
         # Symbol count
-        total_symbols = sum(len(syms) for syms in symbols.values())
+        total_symbols = repo_map.symbol_count
         console.print("\n[cyan]Symbols:[/cyan]")
         console.print(f"  Total: {total_symbols}")
 
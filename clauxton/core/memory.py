@@ -9,7 +9,7 @@ This module provides the unified Memory System that consolidates:
 Key Features:
 - Unified MemoryEntry model with type discrimination
 - CRUD operations with validation
-- TF-IDF relevance search
+- BM25 relevance search (incremental, persisted index)
 - Relationship management between memories
 - Atomic storage with backups
 
@@ -31,24 +31,17 @@ Example:
     'MEM-20260127-001'
 """
 
+import hashlib
+import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 from clauxton.core.models import DuplicateError, ValidationError
 
-# Optional TF-IDF search (falls back to simple search if scikit-learn not available)
-try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    TfidfVectorizer = None
-    cosine_similarity = None
-
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # Memory Entry Model
@@ -215,130 +208,161 @@ class MemoryEntry(BaseModel):
 
 class MemorySearchEngine:
     """
-    TF-IDF based search engine for Memory entries.
+    BM25 search engine for Memory entries.
 
-    Internal class used by Memory for relevance-based search.
+    Internal class used by Memory for relevance-based search. Backed by an
+    incremental InvertedIndex, so add/update/delete only touch the postings
+    of the changed entry. When ``index_dir`` is given the index is persisted
+    there and reused (mmapped) by the next Memory instance.
     """
 
-    def __init__(self, entries: List[MemoryEntry]) -> None:
+    def __init__(
+        self, entries: List[MemoryEntry], index_dir: Optional[Path] = None
+    ) -> None:
         """
         Initialize search engine with entries.
 
+        Loads the persisted index from ``index_dir`` if present and brings it
+        in sync with ``entries``; otherwise indexes ``entries`` from scratch.
+
         Args:
             entries: List of Memory entries to index
+            index_dir: Directory to persist the index to (default: in-memory)
+        """
+        from clauxton.core.memory_index import InvertedIndex
 
-        Raises:
-            ImportError: If scikit-learn is not installed
+        self.index_dir = index_dir
+        self._entries: Dict[str, MemoryEntry] = {}
+        self.index = (InvertedIndex.load(index_dir) if index_dir else None) or InvertedIndex(
+            index_dir=index_dir
+        )
+        self.sync(entries)
+
+    @property
+    def entries(self) -> List[MemoryEntry]:
+        """Indexed entries."""
+        return list(self._entries.values())
+
+    @staticmethod
+    def _document(entry: MemoryEntry) -> str:
+        """Text indexed for an entry: title, content, tags, category."""
+        return f"{entry.title} {entry.content} {' '.join(entry.tags or [])} {entry.category}"
+
+    @staticmethod
+    def _facets(entry: MemoryEntry) -> List[str]:
+        """Filterable attributes of an entry: type, category, tags."""
+        return [
+            f"type:{entry.type}",
+            f"category:{entry.category}",
+            *(f"tag:{tag}" for tag in entry.tags or []),
+        ]
+
+    @classmethod
+    def _fingerprint(cls, entry: MemoryEntry) -> str:
+        """Content fingerprint used to detect changed entries."""
+        payload = "\0".join([cls._document(entry), *cls._facets(entry)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def sync(self, entries: List[MemoryEntry]) -> None:
         """
-        if not SKLEARN_AVAILABLE:
-            raise ImportError(
-                "scikit-learn is required for TF-IDF search. "
-                "Install with: pip install scikit-learn"
-            )
+        Bring the index in line with entries, re-indexing only changes.
 
-        self.entries = entries
-        self.vectorizer = TfidfVectorizer(
-            stop_words="english",
-            max_features=1000,
-            ngram_range=(1, 2),  # Unigrams and bigrams
-            min_df=1,  # Minimum document frequency
-            lowercase=True,
+        Args:
+            entries: Current list of Memory entries
+        """
+        self._entries = {entry.id: entry for entry in entries}
+        indexed = self.index.fingerprints()
+
+        changed = False
+        for doc_id in indexed.keys() - self._entries.keys():
+            self.index.remove(doc_id)
+            changed = True
+        for entry in entries:
+            fingerprint = self._fingerprint(entry)
+            if indexed.get(entry.id) != fingerprint:
+                self.index.add(
+                    entry.id, self._document(entry), fingerprint, self._facets(entry)
+                )
+                changed = True
+
+        if self.index_dir is not None and (
+            changed or not (self.index_dir / "meta.json").exists()
+        ):
+            self._persist(force=not (self.index_dir / "meta.json").exists())
+
+    def add(self, entry: MemoryEntry) -> None:
+        """
+        Index a new or updated entry.
+
+        Args:
+            entry: Memory entry to (re)index
+        """
+        self._entries[entry.id] = entry
+        self.index.add(
+            entry.id, self._document(entry), self._fingerprint(entry), self._facets(entry)
         )
-        self.tfidf_matrix = None
-        self._build_index()
+        self._persist()
 
-    def _build_index(self) -> None:
-        """Build TF-IDF index from entries."""
-        if not self.entries:
-            self.tfidf_matrix = None
-            return
+    def remove(self, memory_id: str) -> None:
+        """
+        Remove an entry from the index.
 
-        # Create corpus: combine title, content, tags, category
-        corpus = [
-            f"{entry.title} {entry.content} {' '.join(entry.tags or [])} {entry.category}"
-            for entry in self.entries
-        ]
+        Args:
+            memory_id: Memory ID to remove
+        """
+        self._entries.pop(memory_id, None)
+        self.index.remove(memory_id)
+        self._persist()
 
+    def _persist(self, force: bool = False) -> None:
+        """Merge and rewrite the base segment once the delta has drifted."""
+        if self.index_dir is None or not (force or self.index.needs_merge()):
+            return
         try:
-            self.tfidf_matrix = self.vectorizer.fit_transform(corpus)
-        except ValueError:
-            # Empty vocabulary (e.g., all stop words)
-            self.tfidf_matrix = None
+            self.index.save(self.index_dir)
+        except OSError:
+            # Persisted index is an optimization; the journal still applies
+            pass
 
     def search(
         self,
         query: str,
         type_filter: Optional[List[str]] = None,
         limit: int = 10,
+        category_filter: Optional[str] = None,
+        tag_filter: Optional[List[str]] = None,
     ) -> List[tuple[MemoryEntry, float]]:
         """
         Search for entries matching query.
 
+        Filters are applied as facet masks inside the index, so filtered
+        queries share the full-corpus vocabulary and statistics.
+
         Args:
             query: Search query string
             type_filter: Optional memory type filter (e.g., ["knowledge", "decision"])
             limit: Maximum number of results
+            category_filter: Optional category filter (e.g., "architecture")
+            tag_filter: Optional tag filter (any match, e.g., ["api", "rest"])
 
         Returns:
             List of (entry, relevance_score) tuples, sorted by relevance
         """
-        if not self.entries or self.tfidf_matrix is None:
+        if not self._entries or not query.strip():
             return []
 
-        if not query.strip():
-            return []
-
-        # Filter by type first
+        filters: List[List[str]] = []
         if type_filter:
-            filtered_entries = [e for e in self.entries if e.type in type_filter]
-            if not filtered_entries:
-                return []
-
-            # Rebuild index for filtered entries
-            temp_engine = MemorySearchEngine.__new__(MemorySearchEngine)
-            temp_engine.entries = filtered_entries
-            temp_engine.vectorizer = TfidfVectorizer(
-                stop_words="english",
-                max_features=1000,
-                ngram_range=(1, 2),
-                min_df=1,
-                lowercase=True,
-            )
-            temp_engine.tfidf_matrix = None
-            temp_engine._build_index()
-
-            if temp_engine.tfidf_matrix is None:
-                return []
-
-            # Transform query and calculate similarity
-            try:
-                query_vec = temp_engine.vectorizer.transform([query])
-                scores = cosine_similarity(query_vec, temp_engine.tfidf_matrix)[0]
-            except ValueError:
-                return []
-
-            # Sort by score descending
-            indices = scores.argsort()[-limit:][::-1]
-            return [
-                (filtered_entries[i], float(scores[i]))
-                for i in indices
-                if scores[i] > 0
-            ]
-        else:
-            # No type filter
-            try:
-                query_vec = self.vectorizer.transform([query])
-                scores = cosine_similarity(query_vec, self.tfidf_matrix)[0]
-            except ValueError:
-                return []
+            filters.append([f"type:{t}" for t in type_filter])
+        if category_filter:
+            filters.append([f"category:{category_filter}"])
+        if tag_filter:
+            filters.append([f"tag:{tag}" for tag in tag_filter])
 
-            # Sort by score descending
-            indices = scores.argsort()[-limit:][::-1]
-            return [
-                (self.entries[i], float(scores[i]))
-                for i in indices
-                if scores[i] > 0
-            ]
+        return [
+            (self._entries[doc_id], score)
+            for doc_id, score in self.index.search(query, limit=limit, filters=filters)
+        ]
 
 
 # ============================================================================
@@ -396,6 +420,29 @@ class Memory:
         self._search_engine: Optional[MemorySearchEngine] = None
         self._rebuild_search_index()
 
+        # Called with the memory ID after each add, update and delete
+        self._listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a callback for memory changes.
+
+        The callback receives the ID of each added, updated or deleted
+        memory after it is saved. It runs in the caller's thread, so it
+        should only queue work (e.g. IndexingService.on_memory_change).
+        Adding a registered callback again has no effect.
+
+        Args:
+            listener: Callable taking a memory ID
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str], None]) -> None:
+        """Unregister a callback added by add_listener() (no-op if absent)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
     def add(self, entry: MemoryEntry) -> str:
         """
         Add memory entry.
@@ -435,7 +482,8 @@ class Memory:
 
         # Save entry
         self.store.save(entry)
-        self._rebuild_search_index()
+        self._index_entry(entry)
+        self._notify(entry.id)
 
         return entry.id
 
@@ -466,17 +514,21 @@ class Memory:
         query: str,
         type_filter: Optional[List[str]] = None,
         limit: int = 10,
+        category_filter: Optional[str] = None,
+        tag_filter: Optional[List[str]] = None,
     ) -> List[MemoryEntry]:
         """
-        Search memories with TF-IDF relevance ranking.
+        Search memories with BM25 relevance ranking.
 
-        Uses TF-IDF algorithm for relevance-based search if scikit-learn is available.
-        Falls back to simple keyword matching if not.
+        Uses the incremental BM25 index. Falls back to simple keyword
+        matching if the index could not be built.
 
         Args:
             query: Search query (keywords)
             type_filter: Filter by types (e.g., ["knowledge", "decision"])
             limit: Maximum results to return
+            category_filter: Filter by category (e.g., "architecture")
+            tag_filter: Filter by tags (any match, e.g., ["api", "rest"])
 
         Returns:
             List of matching MemoryEntry objects (sorted by relevance)
@@ -488,27 +540,37 @@ class Memory:
             API Design Pattern
             REST API Guidelines
         """
-        # Use TF-IDF search if available
-        if SKLEARN_AVAILABLE and self._search_engine is not None:
-            results = self._search_engine.search(query, type_filter=type_filter, limit=limit)
+        # Use BM25 search if available
+        if self._search_engine is not None:
+            results = self._search_engine.search(
+                query,
+                type_filter=type_filter,
+                limit=limit,
+                category_filter=category_filter,
+                tag_filter=tag_filter,
+            )
             return [entry for entry, _ in results]
 
         # Fallback to simple keyword search
-        return self._simple_search(query, type_filter, limit)
+        return self._simple_search(query, type_filter, limit, category_filter, tag_filter)
 
     def _simple_search(
         self,
         query: str,
         type_filter: Optional[List[str]] = None,
         limit: int = 10,
+        category_filter: Optional[str] = None,
+        tag_filter: Optional[List[str]] = None,
     ) -> List[MemoryEntry]:
         """
-        Simple keyword-based search (fallback when TF-IDF unavailable).
+        Simple keyword-based search (fallback when the index is unavailable).
 
         Args:
             query: Search query
             type_filter: Optional type filter
             limit: Maximum results
+            category_filter: Optional category filter
+            tag_filter: Optional tag filter (any match)
 
         Returns:
             List of matching MemoryEntry objects
@@ -525,6 +587,10 @@ class Memory:
             # Skip if type filter doesn't match
             if type_filter and entry.type not in type_filter:
                 continue
+            if category_filter and entry.category != category_filter:
+                continue
+            if tag_filter and not any(tag in entry.tags for tag in tag_filter):
+                continue
 
             # Calculate relevance score
             score = 0.0
@@ -600,7 +666,8 @@ class Memory:
         # Delete old entry and save updated one
         self.store.delete(memory_id)
         self.store.save(updated_entry)
-        self._rebuild_search_index()
+        self._index_entry(updated_entry)
+        self._notify(memory_id)
 
         return True
 
@@ -621,7 +688,9 @@ class Memory:
         """
         result = self.store.delete(memory_id)
         if result:
-            self._rebuild_search_index()
+            if self._search_engine is not None:
+                self._search_engine.remove(memory_id)
+            self._notify(memory_id)
         return result
 
     def find_related(self, memory_id: str, limit: int = 5) -> List[MemoryEntry]:
@@ -749,17 +818,36 @@ class Memory:
 
         return f"MEM-{today}-{next_num:03d}"
 
-    def _rebuild_search_index(self) -> None:
-        """Rebuild TF-IDF search index after data changes."""
-        if not SKLEARN_AVAILABLE:
+    def _notify(self, memory_id: str) -> None:
+        """Call change listeners; a failing listener does not fail the change."""
+        for listener in list(self._listeners):
+            try:
+                listener(memory_id)
+            except Exception as e:
+                logger.warning(f"Memory listener failed for {memory_id}: {e}")
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Update the search index for one added or updated entry."""
+        if self._search_engine is None:
+            self._rebuild_search_index()
             return
+        try:
+            self._search_engine.add(entry)
+        except Exception:
+            self._rebuild_search_index()
+
+    def _rebuild_search_index(self) -> None:
+        """
+        Load the persisted search index and sync it with stored entries.
 
+        Only entries whose content changed since the index was persisted are
+        re-indexed.
+        """
         entries = self.store.load_all()
-        if entries:
-            try:
-                self._search_engine = MemorySearchEngine(entries)
-            except Exception:
-                # If search engine fails to initialize, fall back to simple search
-                self._search_engine = None
-        else:
+        try:
+            self._search_engine = MemorySearchEngine(
+                entries, index_dir=self.clauxton_dir / "memory_index"
+            )
+        except Exception:
+            # If search engine fails to initialize, fall back to simple search
             self._search_engine = None
@@ -0,0 +1,578 @@
+"""
+Incremental BM25 inverted index for Memory search.
+
+Replaces full TF-IDF refits with an index whose cost per mutation depends
+only on the changed entry:
+- Base segment: immutable CSR postings (term -> doc slots, term freqs)
+  persisted as .npy files and memory-mapped on load
+- Delta: in-memory postings for entries added since the last merge
+- Tombstones: removed/replaced base slots are masked out at query time
+- Journal: every add/remove is appended to delta.jsonl so a fresh
+  process replays it on top of the mmapped base instead of re-tokenizing
+- Facets: per-facet slot bitmaps (e.g. "type:decision", "tag:api") so
+  filtered queries mask postings instead of re-indexing a subset
+
+Once the delta and tombstones drift past a fraction of the live corpus,
+they are merged into a new base segment.
+
+Storage format:
+    .clauxton/memory_index/
+        meta.json             # Terms, doc table, facets, BM25 parameters
+        postings_docs.npy     # int32 doc slots (CSR data)
+        postings_tfs.npy      # float32 term frequencies (CSR data)
+        delta.jsonl           # Mutations since the base was written
+
+Example:
+    >>> index = InvertedIndex()
+    >>> index.add("MEM-20260127-001", "API design with REST", facets=["type:knowledge"])
+    >>> index.search("rest api", limit=5, filters=[["type:knowledge"]])
+    [('MEM-20260127-001', 1.23)]
+"""
+
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Same stop words as the previous TfidfVectorizer(stop_words="english")
+try:
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+except ImportError:
+    ENGLISH_STOP_WORDS = frozenset()
+
+INDEX_VERSION = 2
+
+# Same token rule as scikit-learn's default token_pattern
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# Merge delta into base once (delta docs + tombstones) exceeds
+# max(MERGE_MIN_DOCS, MERGE_RATIO * live docs)
+MERGE_MIN_DOCS = 64
+MERGE_RATIO = 0.25
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms (unigrams and bigrams).
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms (lowercased, stop words removed)
+
+    Example:
+        >>> tokenize("Use the REST API")
+        ['use', 'rest', 'api', 'use rest', 'rest api']
+    """
+    words = [
+        word
+        for word in TOKEN_PATTERN.findall(text.lower())
+        if word not in ENGLISH_STOP_WORDS
+    ]
+    bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return words + bigrams
+
+
+class InvertedIndex:
+    """
+    BM25 inverted index with incremental add/remove and mmapped persistence.
+
+    Documents are identified by string IDs and stored in integer slots.
+    Replacing a document tombstones its old slot and assigns a new one.
+    Each document may carry facets ("field:value" strings) that queries can
+    filter on without touching the postings of non-matching documents.
+
+    Attributes:
+        k1: BM25 term frequency saturation
+        b: BM25 length normalization
+        index_dir: Directory the index is persisted to (None = in-memory only)
+    """
+
+    def __init__(
+        self, k1: float = 1.5, b: float = 0.75, index_dir: Optional[Path] = None
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation (default: 1.5)
+            b: BM25 length normalization (default: 0.75)
+            index_dir: Directory to journal mutations to (default: None)
+        """
+        self.k1 = k1
+        self.b = b
+        self.index_dir = index_dir
+
+        # Document table (slot -> id / fingerprint, id -> slot)
+        self._doc_ids: List[Optional[str]] = []
+        self._fingerprints: List[Optional[str]] = []
+        self._slots: Dict[str, int] = {}
+        self._doc_len = np.zeros(16, dtype=np.float32)
+        self._live = np.zeros(16, dtype=bool)
+        self._total_len = 0.0
+        self._n_live = 0
+
+        # Base segment (CSR)
+        self._base_terms: Dict[str, Tuple[int, int]] = {}
+        self._base_docs: np.ndarray = np.zeros(0, dtype=np.int32)
+        self._base_tfs: np.ndarray = np.zeros(0, dtype=np.float32)
+        self._base_slots = 0
+        self._tombstones = 0
+
+        # Delta segment (term -> slot -> tf) and slot -> terms for removal
+        self._delta: Dict[str, Dict[int, int]] = {}
+        self._delta_terms: Dict[int, List[str]] = {}
+
+        # Facet -> slot bitmap (same capacity as _live)
+        self._facets: Dict[str, np.ndarray] = {}
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        doc_id: str,
+        text: str,
+        fingerprint: Optional[str] = None,
+        facets: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Add or replace a document.
+
+        Args:
+            doc_id: Document ID
+            text: Text to index
+            fingerprint: Content fingerprint used by callers to detect changes
+            facets: Filterable "field:value" attributes (e.g. "type:decision")
+        """
+        term_freqs = dict(Counter(tokenize(text)))
+        facet_list = sorted(set(facets or []))
+        self._add_postings(doc_id, term_freqs, fingerprint, facet_list)
+        self._journal(
+            {"op": "add", "id": doc_id, "fp": fingerprint, "tf": term_freqs, "fc": facet_list}
+        )
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document.
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            True if removed, False if not indexed
+        """
+        if not self._remove_postings(doc_id):
+            return False
+        self._journal({"op": "remove", "id": doc_id})
+        return True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return number of live documents."""
+        return self._n_live
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Return True if doc_id is indexed."""
+        return doc_id in self._slots
+
+    def fingerprints(self) -> Dict[str, Optional[str]]:
+        """
+        Get fingerprints of all live documents.
+
+        Returns:
+            Mapping of document ID to fingerprint
+        """
+        return {doc_id: self._fingerprints[slot] for doc_id, slot in self._slots.items()}
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        filters: Optional[Sequence[Iterable[str]]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a query with BM25.
+
+        Args:
+            query: Search query
+            limit: Maximum results (None = all matches)
+            filters: Facet groups; a document must carry at least one facet
+                of every group (e.g. [["type:knowledge", "type:decision"],
+                ["tag:api"]])
+
+        Returns:
+            List of (doc_id, score) tuples with score > 0, best first
+        """
+        scores = self._score(query, self._filter_mask(filters))
+        if scores is None:
+            return []
+        return self._top_k(scores, limit)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def needs_merge(self) -> bool:
+        """Return True once delta and tombstones drift past the merge threshold."""
+        drift = len(self._delta_terms) + self._tombstones
+        return drift > max(MERGE_MIN_DOCS, MERGE_RATIO * self._n_live)
+
+    def merge(self) -> None:
+        """Fold delta postings and tombstones into a new compact base segment."""
+        remap = np.full(len(self._doc_ids), -1, dtype=np.int64)
+        live_slots = [slot for slot, doc_id in enumerate(self._doc_ids) if doc_id is not None]
+        remap[live_slots] = np.arange(len(live_slots))
+
+        gathered: Dict[str, Tuple[List[np.ndarray], List[np.ndarray]]] = {}
+        for term, (start, end) in self._base_terms.items():
+            docs = np.asarray(self._base_docs[start:end])
+            keep = remap[docs] >= 0
+            if keep.any():
+                gathered[term] = (
+                    [remap[docs[keep]]],
+                    [np.asarray(self._base_tfs[start:end])[keep]],
+                )
+        for term, postings in self._delta.items():
+            docs = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+            tfs = np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+            doc_parts, tf_parts = gathered.setdefault(term, ([], []))
+            doc_parts.append(remap[docs])
+            tf_parts.append(tfs)
+
+        base_terms: Dict[str, Tuple[int, int]] = {}
+        doc_chunks: List[np.ndarray] = []
+        tf_chunks: List[np.ndarray] = []
+        offset = 0
+        for term in sorted(gathered):
+            doc_parts, tf_parts = gathered[term]
+            docs = np.concatenate(doc_parts)
+            tfs = np.concatenate(tf_parts)
+            order = np.argsort(docs, kind="stable")
+            doc_chunks.append(docs[order].astype(np.int32))
+            tf_chunks.append(tfs[order].astype(np.float32))
+            base_terms[term] = (offset, offset + len(docs))
+            offset += len(docs)
+
+        facets: Dict[str, np.ndarray] = {}
+        for facet, bitmap in self._facets.items():
+            kept = remap[np.flatnonzero(bitmap[: len(remap)])]
+            kept = kept[kept >= 0]
+            if len(kept):
+                facets[facet] = kept
+
+        doc_len = self._doc_len[live_slots].copy()
+        self._doc_ids = [self._doc_ids[slot] for slot in live_slots]
+        self._fingerprints = [self._fingerprints[slot] for slot in live_slots]
+        self._slots = {doc_id: i for i, doc_id in enumerate(self._doc_ids) if doc_id}
+        self._doc_len = np.zeros(max(16, len(live_slots)), dtype=np.float32)
+        self._doc_len[: len(live_slots)] = doc_len
+        self._live = np.zeros(len(self._doc_len), dtype=bool)
+        self._live[: len(live_slots)] = True
+        self._facets = {}
+        for facet, slots in facets.items():
+            self._facets[facet] = np.zeros(len(self._doc_len), dtype=bool)
+            self._facets[facet][slots] = True
+        self._base_terms = base_terms
+        self._base_docs = (
+            np.concatenate(doc_chunks) if doc_chunks else np.zeros(0, dtype=np.int32)
+        )
+        self._base_tfs = (
+            np.concatenate(tf_chunks) if tf_chunks else np.zeros(0, dtype=np.float32)
+        )
+        self._base_slots = len(live_slots)
+        self._tombstones = 0
+        self._delta = {}
+        self._delta_terms = {}
+
+    def save(self, index_dir: Optional[Path] = None) -> None:
+        """
+        Merge and write the base segment, then truncate the journal.
+
+        Args:
+            index_dir: Target directory (default: self.index_dir)
+        """
+        target = index_dir or self.index_dir
+        if target is None:
+            raise ValueError("No index directory to save to")
+        target.mkdir(parents=True, exist_ok=True)
+        self.index_dir = target
+
+        self.merge()
+        self._atomic_save_array(target / "postings_docs.npy", self._base_docs)
+        self._atomic_save_array(target / "postings_tfs.npy", self._base_tfs)
+        meta = {
+            "version": INDEX_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "n_postings": int(len(self._base_docs)),
+            "docs": self._doc_ids,
+            "fingerprints": self._fingerprints,
+            "doc_len": [int(n) for n in self._doc_len[: self._base_slots]],
+            "terms": self._base_terms,
+            "facets": {
+                facet: [int(slot) for slot in np.flatnonzero(bitmap)]
+                for facet, bitmap in self._facets.items()
+            },
+        }
+        meta_path = target / "meta.json"
+        temp_path = meta_path.with_suffix(".json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, separators=(",", ":"))
+        temp_path.replace(meta_path)
+
+        journal_path = target / "delta.jsonl"
+        if journal_path.exists():
+            journal_path.write_bytes(b"")
+
+    @classmethod
+    def load(cls, index_dir: Path) -> Optional["InvertedIndex"]:
+        """
+        Load a persisted index (base mmapped, journal replayed).
+
+        Args:
+            index_dir: Directory written by save()
+
+        Returns:
+            InvertedIndex, or None if missing, outdated or inconsistent
+        """
+        meta_path = index_dir / "meta.json"
+        if not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != INDEX_VERSION:
+                return None
+            base_docs = np.load(index_dir / "postings_docs.npy", mmap_mode="r")
+            base_tfs = np.load(index_dir / "postings_tfs.npy", mmap_mode="r")
+            if len(base_docs) != meta["n_postings"] or len(base_tfs) != meta["n_postings"]:
+                return None
+
+            index = cls(k1=meta["k1"], b=meta["b"])
+            n_docs = len(meta["docs"])
+            index._doc_ids = list(meta["docs"])
+            index._fingerprints = list(meta["fingerprints"])
+            index._slots = {doc_id: i for i, doc_id in enumerate(meta["docs"])}
+            index._doc_len = np.zeros(max(16, n_docs), dtype=np.float32)
+            index._doc_len[:n_docs] = meta["doc_len"]
+            index._live = np.zeros(len(index._doc_len), dtype=bool)
+            index._live[:n_docs] = True
+            index._total_len = float(sum(meta["doc_len"]))
+            index._n_live = n_docs
+            index._base_terms = {term: (span[0], span[1]) for term, span in meta["terms"].items()}
+            for facet, slots in meta["facets"].items():
+                index._facets[facet] = np.zeros(len(index._doc_len), dtype=bool)
+                index._facets[facet][slots] = True
+            index._base_docs = base_docs
+            index._base_tfs = base_tfs
+            index._base_slots = n_docs
+            index._replay_journal(index_dir / "delta.jsonl")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        index.index_dir = index_dir
+        return index
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _add_postings(
+        self,
+        doc_id: str,
+        term_freqs: Dict[str, int],
+        fingerprint: Optional[str],
+        facets: Sequence[str] = (),
+    ) -> None:
+        """Assign a new slot for doc_id and add its postings to the delta."""
+        self._remove_postings(doc_id)
+
+        slot = len(self._doc_ids)
+        self._doc_ids.append(doc_id)
+        self._fingerprints.append(fingerprint)
+        self._slots[doc_id] = slot
+        if slot >= len(self._doc_len):
+            self._grow(len(self._doc_len) * 2)
+
+        length = float(sum(term_freqs.values()))
+        self._doc_len[slot] = length
+        self._live[slot] = True
+        self._total_len += length
+        self._n_live += 1
+
+        for term, tf in term_freqs.items():
+            self._delta.setdefault(term, {})[slot] = tf
+        self._delta_terms[slot] = list(term_freqs)
+
+        for facet in facets:
+            bitmap = self._facets.get(facet)
+            if bitmap is None:
+                bitmap = self._facets[facet] = np.zeros(len(self._live), dtype=bool)
+            bitmap[slot] = True
+
+    def _grow(self, capacity: int) -> None:
+        """Resize per-slot arrays (doc lengths, live mask, facet bitmaps)."""
+        self._doc_len = np.resize(self._doc_len, capacity)
+
+        def resized(bitmap: np.ndarray) -> np.ndarray:
+            grown = np.zeros(capacity, dtype=bool)
+            grown[: len(bitmap)] = bitmap
+            return grown
+
+        self._live = resized(self._live)
+        self._facets = {facet: resized(bitmap) for facet, bitmap in self._facets.items()}
+
+    def _remove_postings(self, doc_id: str) -> bool:
+        """Tombstone doc_id's slot and drop its delta postings."""
+        slot = self._slots.pop(doc_id, None)
+        if slot is None:
+            return False
+
+        self._live[slot] = False
+        self._total_len -= float(self._doc_len[slot])
+        self._n_live -= 1
+        self._doc_ids[slot] = None
+        self._fingerprints[slot] = None
+
+        if slot < self._base_slots:
+            self._tombstones += 1
+        for term in self._delta_terms.pop(slot, []):
+            postings = self._delta.get(term)
+            if postings is not None:
+                postings.pop(slot, None)
+                if not postings:
+                    del self._delta[term]
+        return True
+
+    def _filter_mask(self, filters: Optional[Sequence[Iterable[str]]]) -> np.ndarray:
+        """Combine facet groups into a slot mask (OR within, AND across groups)."""
+        mask = self._live.copy()
+        for group in filters or []:
+            group_mask = np.zeros(len(mask), dtype=bool)
+            for facet in group:
+                bitmap = self._facets.get(facet)
+                if bitmap is not None:
+                    group_mask |= bitmap
+            mask &= group_mask
+        return mask
+
+    def _score(self, query: str, mask: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Compute BM25 scores for slots in mask (None if nothing can match).
+
+        IDF and average length come from the whole live corpus, so filtered
+        and unfiltered queries rank with the same statistics.
+        """
+        if self._n_live == 0 or not query.strip():
+            return None
+        n_slots = len(self._doc_ids)
+        live = self._live[:n_slots]
+        selected = mask[:n_slots]
+        if not selected.any():
+            return None
+        terms = set(tokenize(query))
+        if not terms:
+            return None
+
+        scores = np.zeros(n_slots, dtype=np.float64)
+        avgdl = self._total_len / self._n_live if self._n_live else 1.0
+        avgdl = avgdl or 1.0
+
+        for term in terms:
+            doc_parts: List[np.ndarray] = []
+            tf_parts: List[np.ndarray] = []
+            span = self._base_terms.get(term)
+            if span is not None:
+                docs = np.asarray(self._base_docs[span[0]:span[1]], dtype=np.int64)
+                keep = live[docs]
+                doc_parts.append(docs[keep])
+                tf_parts.append(np.asarray(self._base_tfs[span[0]:span[1]])[keep])
+            postings = self._delta.get(term)
+            if postings:
+                doc_parts.append(
+                    np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+                )
+                tf_parts.append(
+                    np.fromiter(postings.values(), dtype=np.float32, count=len(postings))
+                )
+            if not doc_parts:
+                continue
+
+            docs = np.concatenate(doc_parts)
+            df = len(docs)
+            keep = selected[docs]
+            if not keep.any():
+                continue
+            docs = docs[keep]
+            tfs = np.concatenate(tf_parts)[keep].astype(np.float64)
+            idf = np.log(1.0 + (self._n_live - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * self._doc_len[docs] / avgdl)
+            scores[docs] += idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+
+        return scores
+
+    def _top_k(self, scores: np.ndarray, limit: Optional[int]) -> List[Tuple[str, float]]:
+        """Select the best-scoring slots (ties broken by insertion order)."""
+        candidates = np.flatnonzero(scores > 0)
+        if limit is not None:
+            if limit <= 0:
+                return []
+            if len(candidates) > limit:
+                kth = len(candidates) - limit
+                part = np.argpartition(scores[candidates], kth)[kth:]
+                threshold = scores[candidates[part]].min()
+                candidates = candidates[scores[candidates] >= threshold]
+
+        order = np.lexsort((candidates, -scores[candidates]))
+        ranked = candidates[order]
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self._doc_ids[slot], float(scores[slot])) for slot in ranked]  # type: ignore[misc]
+
+    def _journal(self, record: Dict[str, Any]) -> None:
+        """Append a mutation to delta.jsonl (derived data, so no fsync)."""
+        if self.index_dir is None:
+            return
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.index_dir / "delta.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        except OSError:
+            # Journal is an optimization; sync() repairs the index on next load
+            pass
+
+    def _replay_journal(self, journal_path: Path) -> None:
+        """Re-apply journaled mutations without re-journaling them."""
+        if not journal_path.exists():
+            return
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("op") == "add":
+                    self._add_postings(
+                        record["id"], record["tf"], record.get("fp"), record.get("fc", [])
+                    )
+                elif record.get("op") == "remove":
+                    self._remove_postings(record["id"])
+
+    @staticmethod
+    def _atomic_save_array(path: Path, array: np.ndarray) -> None:
+        """Write a .npy file via temp file + rename."""
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(temp_path, path)
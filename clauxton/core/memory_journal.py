@@ -0,0 +1,202 @@
+"""
+Append-only journal for Memory mutations.
+
+Used by MemoryStore in "wal" storage mode. Every mutation is appended as a
+single JSON line and fsync'd before the call returns, so a write costs
+O(entry) instead of rewriting the whole memories.yml. Readers replay the
+journal on top of the last YAML snapshot; compaction folds the journal
+back into the snapshot and truncates it.
+
+Journal format (JSON Lines):
+    {"op": "put", "entry": {...}}
+    {"op": "delete", "id": "MEM-20260127-001"}
+
+A crash in the middle of an append leaves at most one torn trailing line,
+which is ignored on replay.
+
+Example:
+    >>> journal = MemoryJournal(Path(".clauxton/memories.wal"))
+    >>> journal.append_put(entry.model_dump(mode="json"))
+    >>> records = journal.read_records()
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from clauxton.utils.file_utils import set_secure_permissions
+
+# POSIX advisory locking (unavailable on Windows; thread lock still applies)
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - platform specific
+    FCNTL_AVAILABLE = False
+    fcntl = None  # type: ignore[assignment]
+
+
+class MemoryJournal:
+    """
+    Fsync'd append-only journal of memory mutations.
+
+    Attributes:
+        journal_file: Path to the journal (e.g., .clauxton/memories.wal)
+        lock_file: Path to the advisory lock file shared by all processes
+    """
+
+    def __init__(self, journal_file: Path) -> None:
+        """
+        Initialize MemoryJournal.
+
+        Args:
+            journal_file: Path to the journal file (created on first append)
+        """
+        self.journal_file = journal_file
+        self.lock_file = journal_file.with_suffix(journal_file.suffix + ".lock")
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Hold the journal lock (in-process and, on POSIX, cross-process).
+
+        Replay and compaction run under this lock so a reader never sees a
+        snapshot that was written after the journal it is replaying. The
+        lock is re-entrant within a thread.
+        """
+        with self._thread_lock:
+            if not FCNTL_AVAILABLE or self._lock_depth > 0:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            with open(self.lock_file, "a") as lock_fh:
+                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                    fcntl.flock(lock_fh.fileno(), fcntl.LOCK_UN)
+
+    def append_put(self, entry_data: Dict[str, Any]) -> None:
+        """
+        Append an insert-or-replace record.
+
+        Args:
+            entry_data: JSON-serializable entry dict (must contain "id")
+        """
+        self._append({"op": "put", "entry": entry_data})
+
+    def append_delete(self, memory_id: str) -> None:
+        """
+        Append a delete record.
+
+        Args:
+            memory_id: Memory ID to delete
+        """
+        self._append({"op": "delete", "id": memory_id})
+
+    def read_records(self) -> List[Dict[str, Any]]:
+        """
+        Read all complete records in append order.
+
+        Lines that are not valid JSON (torn writes from a crash) are skipped.
+
+        Returns:
+            List of journal records
+        """
+        if not self.journal_file.exists():
+            return []
+
+        records: List[Dict[str, Any]] = []
+        with open(self.journal_file, "rb") as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write from a crash
+                    continue
+                if isinstance(record, dict) and record.get("op") in ("put", "delete"):
+                    records.append(record)
+        return records
+
+    def size(self) -> int:
+        """Return journal size in bytes (0 if missing)."""
+        try:
+            return self.journal_file.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def truncate(self) -> None:
+        """Discard all journal records (after they were folded into a snapshot)."""
+        if self.journal_file.exists():
+            with open(self.journal_file, "wb") as f:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record and fsync it."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self.locked():
+            is_new = not self.journal_file.exists()
+            with open(self.journal_file, "a+b") as f:
+                # Terminate a torn trailing line so this record stays parseable
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = "\n" + line
+                f.write(line.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            if is_new:
+                set_secure_permissions(self.journal_file)
+
+
+def apply_records(
+    entries_data: List[Dict[str, Any]], records: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Replay journal records over snapshot entry dicts.
+
+    Replay is idempotent: re-applying records already folded into the
+    snapshot yields the same result, so a crash between writing the
+    snapshot and truncating the journal is harmless.
+
+    Args:
+        entries_data: Entry dicts from the snapshot (in order)
+        records: Journal records (in append order)
+
+    Returns:
+        New list of entry dicts
+    """
+    result: List[Optional[Dict[str, Any]]] = list(entries_data)
+    positions: Dict[str, int] = {
+        data["id"]: i for i, data in enumerate(entries_data) if "id" in data
+    }
+
+    for record in records:
+        if record["op"] == "put":
+            data = record["entry"]
+            existing = positions.get(data["id"])
+            if existing is not None:
+                result[existing] = data
+            else:
+                positions[data["id"]] = len(result)
+                result.append(data)
+        else:
+            removed = positions.pop(record["id"], None)
+            if removed is not None:
+                result[removed] = None  # Tombstone, dropped below
+
+    return [data for data in result if data is not None]
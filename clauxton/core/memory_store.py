@@ -7,14 +7,23 @@ Provides persistent storage for Memory entries with:
 - Automatic backups before modifications
 - In-memory caching for performance
 - Fast lookup index
+- Optional write-ahead log mode for large stores
 
 Storage format:
     .clauxton/
         memories.yml          # All memory entries (YAML list)
         memories.index        # Fast lookup index (JSON)
+        memories.wal          # Append-only journal ("wal" mode only)
         backups/
             memories_YYYYMMDD_HHMMSS.yml
 
+Storage modes:
+    - "yaml" (default): every mutation rewrites memories.yml with backups.
+    - "wal": mutations are appended to memories.wal and fsync'd; readers
+      replay the journal over memories.yml, and compaction folds the
+      journal into memories.yml once it grows past a threshold. Enable
+      with ``memory_storage: wal`` in .clauxton/config.yml.
+
 Example:
     >>> store = MemoryStore(Path("."))
     >>> entries = store.load_all()
@@ -23,14 +32,21 @@ Example:
 """
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from clauxton.core.memory import MemoryEntry
+from clauxton.core.memory_journal import MemoryJournal, apply_records
 from clauxton.utils.file_utils import ensure_clauxton_dir, set_secure_permissions
 from clauxton.utils.yaml_utils import read_yaml, write_yaml
 
+StorageMode = Literal["yaml", "wal"]
+
+# Journal records before a background compaction is triggered ("wal" mode)
+DEFAULT_COMPACTION_THRESHOLD = 500
+
 
 class MemoryStore:
     """
@@ -42,6 +58,7 @@ class MemoryStore:
     Storage Structure:
         - memories.yml: Main storage file (YAML)
         - memories.index: Fast lookup index (JSON)
+        - memories.wal: Append-only journal ("wal" mode only)
         - backups/: Timestamped backups
 
     Attributes:
@@ -50,6 +67,9 @@ class MemoryStore:
         memories_file: Path to memories.yml
         index_file: Path to memories.index
         backup_dir: Path to backups directory
+        journal_file: Path to memories.wal
+        storage_mode: "yaml" or "wal"
+        compaction_threshold: Journal records that trigger compaction ("wal")
         _cache: In-memory cache of entries
         _index: In-memory index for fast lookup
 
@@ -61,16 +81,26 @@ class MemoryStore:
         >>> success = store.delete("MEM-20260127-001")
     """
 
-    def __init__(self, project_root: Path | str) -> None:
+    def __init__(
+        self,
+        project_root: Path | str,
+        storage_mode: Optional[StorageMode] = None,
+        compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD,
+    ) -> None:
         """
         Initialize MemoryStore.
 
         Args:
             project_root: Project root directory (Path or str)
+            storage_mode: "yaml" or "wal" (default: ``memory_storage`` from
+                .clauxton/config.yml, falling back to "yaml")
+            compaction_threshold: Journal records before background
+                compaction in "wal" mode (default: 500)
 
         Example:
             >>> store = MemoryStore(Path("."))
             >>> store = MemoryStore(".")  # str also works
+            >>> store = MemoryStore(".", storage_mode="wal")
         """
         self.project_root: Path = (
             Path(project_root) if isinstance(project_root, str) else project_root
@@ -79,10 +109,20 @@ class MemoryStore:
         self.memories_file = self.clauxton_dir / "memories.yml"
         self.index_file = self.clauxton_dir / "memories.index"
         self.backup_dir = self.clauxton_dir / "backups"
+        self.journal_file = self.clauxton_dir / "memories.wal"
+
+        self.storage_mode: StorageMode = storage_mode or self._configured_storage_mode()
+        self.compaction_threshold = compaction_threshold
+        self._journal = MemoryJournal(self.journal_file)
+        self._journal_records = 0
+        self._compaction_thread: Optional[threading.Thread] = None
 
         # In-memory cache
         self._cache: Optional[List[MemoryEntry]] = None
         self._index: Optional[Dict[str, int]] = None  # memory_id -> index in list
+        # File state the cache was built from: (mtime_ns, size) of memories.yml
+        # in "yaml" mode, (snapshot mtime_ns, journal size) in "wal" mode
+        self._cache_signature: Optional[Tuple[int, int]] = None
 
         # Ensure files exist
         self._ensure_files_exist()
@@ -101,34 +141,25 @@ class MemoryStore:
             >>> len(entries)
             42
         """
-        if self._cache is not None:
+        if self.storage_mode == "wal":
+            return self._load_all_wal()
+
+        # Reuse cache unless another writer replaced memories.yml
+        signature = self._snapshot_signature()
+        if self._cache is not None and self._cache_signature == signature:
             return self._cache
 
         # Read from disk
         data = read_yaml(self.memories_file)
+        self._cache_signature = signature
 
         if not data or "memories" not in data:
             self._cache = []
-            return []
+            self._index = {}
+            return self._cache
 
         # Parse entries
-        entries = []
-        for entry_data in data["memories"]:
-            # Parse datetime fields
-            if "created_at" in entry_data and isinstance(
-                entry_data["created_at"], str
-            ):
-                entry_data["created_at"] = datetime.fromisoformat(
-                    entry_data["created_at"]
-                )
-            if "updated_at" in entry_data and isinstance(
-                entry_data["updated_at"], str
-            ):
-                entry_data["updated_at"] = datetime.fromisoformat(
-                    entry_data["updated_at"]
-                )
-
-            entries.append(MemoryEntry(**entry_data))
+        entries = [self._entry_from_dict(entry_data) for entry_data in data["memories"]]
 
         # Update cache
         self._cache = entries
@@ -149,6 +180,14 @@ class MemoryStore:
             >>> entry = MemoryEntry(...)
             >>> store.save(entry)
         """
+        if self.storage_mode == "wal":
+            with self._journal.locked():
+                self._load_all_wal()
+                self._journal.append_put(self._entry_to_dict(entry))
+                self._apply_to_cache(entry.id, entry)
+            self._maybe_compact()
+            return
+
         entries = self.load_all()
 
         # Check if entry exists (update) or is new (append)
@@ -184,6 +223,16 @@ class MemoryStore:
             >>> success
             True
         """
+        if self.storage_mode == "wal":
+            with self._journal.locked():
+                self._load_all_wal()
+                if self._index is None or memory_id not in self._index:
+                    return False
+                self._journal.append_delete(memory_id)
+                self._apply_to_cache(memory_id, None)
+            self._maybe_compact()
+            return True
+
         entries = self.load_all()
 
         # Find and remove entry
@@ -224,6 +273,54 @@ class MemoryStore:
         # Update in-memory index
         self._index = index
 
+    def compact(self, background: bool = False) -> None:
+        """
+        Fold the journal into memories.yml and truncate it ("wal" mode).
+
+        Replaying the journal is idempotent, so a crash between writing the
+        snapshot and truncating the journal loses nothing. No-op in "yaml"
+        mode.
+
+        Args:
+            background: Run on a daemon thread and return immediately
+
+        Example:
+            >>> store = MemoryStore(Path("."), storage_mode="wal")
+            >>> store.compact()
+        """
+        if self.storage_mode != "wal":
+            return
+
+        if background:
+            if self._compaction_thread is not None and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self._compact_safely, name="memory-compaction", daemon=True
+            )
+            self._compaction_thread.start()
+            return
+
+        with self._journal.locked():
+            if self._journal.size() == 0:
+                return
+            entries = self._read_wal_state()
+            self._write_snapshot(entries)
+            self._journal.truncate()
+            self._journal_records = 0
+            self._cache = entries
+            self._cache_signature = self._wal_signature()
+            self.rebuild_index()
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until a running background compaction finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+        """
+        if self._compaction_thread is not None:
+            self._compaction_thread.join(timeout)
+
     def create_backup(self) -> Path:
         """
         Create backup of memories.yml.
@@ -260,14 +357,20 @@ class MemoryStore:
         Args:
             entries: List of MemoryEntry objects to save
         """
+        self._write_snapshot(entries)
+
+        # Rebuild index
+        self.rebuild_index()
+
+    def _write_snapshot(self, entries: List[MemoryEntry]) -> None:
+        """
+        Write entries to memories.yml (atomic, with backup).
+
+        Args:
+            entries: List of MemoryEntry objects to write
+        """
         # Convert entries to dict format
-        entries_data = []
-        for entry in entries:
-            entry_dict = entry.model_dump()
-            # Convert datetime to ISO format string
-            entry_dict["created_at"] = entry.created_at.isoformat()
-            entry_dict["updated_at"] = entry.updated_at.isoformat()
-            entries_data.append(entry_dict)
+        entries_data = [self._entry_to_dict(entry) for entry in entries]
 
         # Create data structure
         data = {
@@ -280,9 +383,6 @@ class MemoryStore:
         write_yaml(self.memories_file, data, backup=True)
         set_secure_permissions(self.memories_file)
 
-        # Rebuild index
-        self.rebuild_index()
-
     def _ensure_files_exist(self) -> None:
         """
         Create memory files if they don't exist.
@@ -302,6 +402,122 @@ class MemoryStore:
         """Invalidate in-memory cache."""
         self._cache = None
         self._index = None
+        self._cache_signature = None
+
+    def _configured_storage_mode(self) -> StorageMode:
+        """
+        Read ``memory_storage`` from .clauxton/config.yml.
+
+        Returns:
+            Configured mode, or "yaml" if unset or invalid
+        """
+        config_path = self.clauxton_dir / "config.yml"
+        try:
+            config = read_yaml(config_path)
+        except Exception:
+            return "yaml"
+        if config.get("memory_storage") == "wal":
+            return "wal"
+        return "yaml"
+
+    def _load_all_wal(self) -> List[MemoryEntry]:
+        """
+        Load entries in "wal" mode (snapshot + journal replay).
+
+        The cache is reused while neither the snapshot nor the journal
+        changed on disk, so other processes' writes are picked up.
+        """
+        if self._cache is not None and self._cache_signature == self._wal_signature():
+            return self._cache
+
+        with self._journal.locked():
+            entries = self._read_wal_state()
+            self._cache = entries
+            self._cache_signature = self._wal_signature()
+            self._rebuild_index_cache()
+
+        return entries
+
+    def _read_wal_state(self) -> List[MemoryEntry]:
+        """Replay the journal over the YAML snapshot (caller holds the lock)."""
+        data = read_yaml(self.memories_file)
+        snapshot = (data.get("memories") or []) if data else []
+        records = self._journal.read_records()
+        self._journal_records = len(records)
+        return [self._entry_from_dict(d) for d in apply_records(snapshot, records)]
+
+    def _snapshot_signature(self) -> Tuple[int, int]:
+        """Return (mtime_ns, size) of memories.yml for cache validation."""
+        try:
+            stat = self.memories_file.stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _wal_signature(self) -> Tuple[int, int]:
+        """Return (snapshot mtime_ns, journal size) for cache validation."""
+        try:
+            snapshot_mtime = self.memories_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            snapshot_mtime = 0
+        return (snapshot_mtime, self._journal.size())
+
+    def _apply_to_cache(self, memory_id: str, entry: Optional[MemoryEntry]) -> None:
+        """
+        Apply a just-journaled mutation to the in-memory cache ("wal" mode).
+
+        Caller holds the journal lock and loaded the cache under it, so the
+        cache is current up to the record that was just appended.
+
+        Args:
+            memory_id: Affected memory ID
+            entry: New entry, or None for a delete
+        """
+        self._journal_records += 1
+        if self._cache is None or self._index is None:
+            return
+
+        position = self._index.get(memory_id)
+        if entry is None:
+            if position is not None:
+                del self._cache[position]
+                self._rebuild_index_cache()
+        elif position is not None:
+            self._cache[position] = entry
+        else:
+            self._index[memory_id] = len(self._cache)
+            self._cache.append(entry)
+        self._cache_signature = self._wal_signature()
+
+    def _maybe_compact(self) -> None:
+        """Start background compaction once the journal passes the threshold."""
+        if self._journal_records >= self.compaction_threshold:
+            self.compact(background=True)
+
+    def _compact_safely(self) -> None:
+        """Background compaction target; failures leave the journal intact."""
+        try:
+            self.compact()
+        except Exception:
+            # Journal is still authoritative, retry on next threshold hit
+            pass
+
+    @staticmethod
+    def _entry_to_dict(entry: MemoryEntry) -> Dict[str, Any]:
+        """Serialize entry with ISO format datetimes."""
+        entry_dict = entry.model_dump()
+        entry_dict["created_at"] = entry.created_at.isoformat()
+        entry_dict["updated_at"] = entry.updated_at.isoformat()
+        return entry_dict
+
+    @staticmethod
+    def _entry_from_dict(entry_data: Dict[str, Any]) -> MemoryEntry:
+        """Deserialize entry, parsing ISO format datetimes."""
+        entry_data = dict(entry_data)
+        for field in ("created_at", "updated_at"):
+            if field in entry_data and isinstance(entry_data[field], str):
+                entry_data[field] = datetime.fromisoformat(entry_data[field])
+        return MemoryEntry(**entry_data)
 
     def _rebuild_index_cache(self) -> None:
         """Rebuild in-memory index from cache."""
@@ -0,0 +1,259 @@
+"""
+Directory scanning with gitignore matching for repository indexing.
+
+This module provides:
+- GitignoreMatcher: gitignore rules compiled into a few regular expressions
+- scan_files: single-pass os.scandir walker that prunes ignored directories
+
+Supported gitignore syntax: comments, escaped "#"/"!", negation ("!"),
+directory-only rules (trailing "/"), anchoring (leading or middle "/"),
+"*", "?", "[...]" and "**" wildcards. Rules are read from the root
+.gitignore only.
+
+Example:
+    >>> matcher = GitignoreMatcher(["*.log", "!keep.log", "/build/"])
+    >>> matcher.match("logs/app.log")
+    True
+    >>> matcher.match("keep.log")
+    False
+    >>> for relative_path, path, stat in scan_files(Path("."), matcher):
+    ...     print(relative_path, stat.st_size)
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Pattern, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _translate_segment(segment: str) -> str:
+    """
+    Translate one path segment of a gitignore glob into a regex.
+
+    Args:
+        segment: Glob segment without "/"
+
+    Returns:
+        Regex source matching that segment
+    """
+    result: List[str] = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == "*":
+            # Consecutive stars inside a segment behave like a single star
+            while i < n and segment[i] == "*":
+                i += 1
+            result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "\\" and i < n:
+            result.append(re.escape(segment[i]))
+            i += 1
+        elif char == "[":
+            end = i
+            if end < n and segment[end] in "!^":
+                end += 1
+            if end < n and segment[end] == "]":
+                end += 1
+            while end < n and segment[end] != "]":
+                end += 1
+            if end >= n:
+                # Unterminated class: treat "[" literally
+                result.append(re.escape(char))
+                continue
+            body = segment[i:end]
+            i = end + 1
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            result.append("[" + body.replace("\\", "\\\\") + "]")
+        else:
+            result.append(re.escape(char))
+    return "".join(result)
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate a gitignore pattern into a regex over "/"-separated paths.
+
+    Args:
+        pattern: Pattern without negation prefix or trailing "/"
+
+    Returns:
+        Regex source to use with fullmatch
+    """
+    # A slash at the beginning or middle anchors the pattern to the root
+    anchored = "/" in pattern
+    segments = pattern.lstrip("/").split("/")
+
+    parts: List[str] = []
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:.*/)?")
+        else:
+            parts.append(_translate_segment(segment) + ("" if last else "/"))
+
+    regex = "".join(parts)
+    return regex if anchored else "(?:.*/)?" + regex
+
+
+def _parse_line(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    Parse one .gitignore line.
+
+    Args:
+        line: Raw line
+
+    Returns:
+        (pattern, negated, directory only), or None for blank lines and comments
+    """
+    line = line.rstrip("\r\n")
+    # Trailing spaces are ignored unless escaped with a backslash
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\#") or line.startswith("\\!"):
+        line = line[1:]
+
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    return line, negated, directory_only
+
+
+class GitignoreMatcher:
+    """
+    Compiled set of gitignore rules.
+
+    Rules are grouped into runs of the same polarity (ignore or negate), and
+    each run is compiled into one alternation regex. The last matching rule
+    decides, so runs are checked from last to first and the first run that
+    matches wins. Without negations this is a single regex match per path.
+    """
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        """
+        Compile gitignore patterns.
+
+        Args:
+            patterns: Gitignore lines, in file order
+        """
+        runs: List[Tuple[bool, List[str], List[str]]] = []
+        for raw in patterns:
+            parsed = _parse_line(raw)
+            if parsed is None:
+                continue
+            pattern, negated, directory_only = parsed
+            if not runs or runs[-1][0] != negated:
+                runs.append((negated, [], []))
+            _, any_rules, dir_rules = runs[-1]
+            (dir_rules if directory_only else any_rules).append(_translate(pattern))
+
+        # (negated, regex for any path, regex for directories only)
+        self._groups: List[Tuple[bool, Optional[Pattern[str]], Optional[Pattern[str]]]] = [
+            (negated, self._compile(any_rules), self._compile(dir_rules))
+            for negated, any_rules, dir_rules in reversed(runs)
+        ]
+
+    @staticmethod
+    def _compile(rules: List[str]) -> Optional[Pattern[str]]:
+        """Compile regex sources into one alternation, or None if empty."""
+        if not rules:
+            return None
+        return re.compile("|".join(f"(?:{rule})" for rule in rules))
+
+    def match(self, relative_path: str, is_dir: bool = False) -> bool:
+        """
+        Check a single path against the rules (parents are not checked).
+
+        Args:
+            relative_path: Path relative to the root, "/"-separated
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path is ignored
+        """
+        for negated, any_regex, dir_regex in self._groups:
+            if (any_regex is not None and any_regex.fullmatch(relative_path)) or (
+                is_dir and dir_regex is not None and dir_regex.fullmatch(relative_path)
+            ):
+                return not negated
+        return False
+
+    def is_ignored(self, relative_path: str, is_dir: bool = False) -> bool:
+        """
+        Check a path, including whether any parent directory is ignored.
+
+        As in git, files inside an ignored directory cannot be re-included.
+
+        Args:
+            relative_path: Path relative to the root, "/"-separated
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path or one of its parent directories is ignored
+        """
+        parts = relative_path.split("/")
+        for index in range(1, len(parts)):
+            if self.match("/".join(parts[:index]), is_dir=True):
+                return True
+        return self.match(relative_path, is_dir=is_dir)
+
+
+def scan_files(
+    root: Path, matcher: GitignoreMatcher
+) -> Iterator[Tuple[str, Path, os.stat_result]]:
+    """
+    Walk a directory tree, skipping ignored files and directories.
+
+    Ignored directories are pruned without being listed. Symlinked
+    directories are not followed. Files of a directory are yielded before
+    its subdirectories are entered.
+
+    Args:
+        root: Root directory
+        matcher: Compiled ignore rules
+
+    Yields:
+        (relative path, absolute path, stat result) for each kept file
+    """
+    # Directories to visit as (absolute path, "/"-separated relative prefix)
+    stack: List[Tuple[str, str]] = [(str(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        subdirs: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative = prefix + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not matcher.match(relative, is_dir=True):
+                                subdirs.append((entry.path, relative + "/"))
+                            continue
+                        if not entry.is_file() or matcher.match(relative):
+                            continue
+                        stat = entry.stat()
+                    except OSError as e:
+                        logger.debug(f"Skipping {entry.path}: {e}")
+                        continue
+                    yield relative.replace("/", os.sep), Path(entry.path), stat
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+            continue
+        stack.extend(reversed(subdirs))
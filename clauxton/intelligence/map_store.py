@@ -0,0 +1,328 @@
+"""
+Sharded on-disk storage for RepositoryMap.
+
+The map used to be written as one indented index.json (every file record)
+and one indented symbols.json (every symbol), both built in memory and
+dumped at the end of a run. This module streams them instead:
+- File records go to files.jsonl, one compact JSON object per line
+- Symbols go to one JSON Lines shard per language, one [path, symbols]
+  line per file
+- index.json becomes a small manifest (statistics and shard table)
+
+Each run writes a new generation directory and then swaps the manifest
+into place with an atomic rename, so a crash mid-run leaves the previous
+index readable. Readers load files.jsonl and symbol shards on first use.
+
+Storage format:
+    .clauxton/map/
+        index.json                  # Manifest (points at the generation)
+        shards-<id>/files.jsonl     # File records in walk order
+        shards-<id>/symbols-<language>.jsonl
+
+Example:
+    >>> writer = ShardWriter(map_dir)
+    >>> writer.add_file({"relative_path": "auth.py", ...})
+    >>> writer.add_symbols("python", "auth.py", [{"name": "login", ...}])
+    >>> manifest = writer.commit({"version": "0.11.0", ...})
+    >>> symbols = ShardedSymbols(map_dir, manifest, shard_for)
+    >>> symbols["auth.py"]
+    [{'name': 'login', ...}]
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Manifest "format" value for sharded indexes (legacy index.json has none)
+SHARD_FORMAT = "jsonl-shards/1"
+
+MANIFEST_FILE = "index.json"
+FILES_SHARD = "files.jsonl"
+GENERATION_PREFIX = "shards-"
+LEGACY_SYMBOLS_FILE = "symbols.json"
+
+
+def _dumps(record: Any) -> str:
+    """Serialize a record as one compact JSON line."""
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def _shard_file(shard: str) -> str:
+    """Return the file name of a symbol shard."""
+    return f"symbols-{shard}.jsonl"
+
+
+def is_sharded(manifest: Dict) -> bool:
+    """Check whether an index.json document is a shard manifest."""
+    return manifest.get("format") == SHARD_FORMAT
+
+
+def read_files(map_dir: Path, manifest: Dict) -> List[Dict]:
+    """
+    Read all file records of a sharded index.
+
+    Args:
+        map_dir: Map directory (.clauxton/map/)
+        manifest: Shard manifest
+
+    Returns:
+        File records in walk order
+    """
+    path = map_dir / manifest["generation"] / FILES_SHARD
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class LazyIndex(dict):  # type: ignore[type-arg]
+    """
+    Manifest dictionary whose "files" entry is read on first access.
+
+    Status commands only need statistics, so the file records are not
+    parsed unless index_data["files"] is used.
+    """
+
+    def __init__(self, map_dir: Path, manifest: Dict) -> None:
+        """
+        Wrap a shard manifest.
+
+        Args:
+            map_dir: Map directory (.clauxton/map/)
+            manifest: Shard manifest
+        """
+        super().__init__(manifest)
+        self._map_dir = map_dir
+
+    def __missing__(self, key: str) -> Any:
+        """Load file records when "files" is first requested."""
+        if key != "files":
+            raise KeyError(key)
+        files = read_files(self._map_dir, self)
+        self["files"] = files
+        return files
+
+
+class ShardedSymbols(Mapping):  # type: ignore[type-arg]
+    """
+    Read-only mapping of file path -> symbols backed by language shards.
+
+    A lookup loads only the shard of the file's language. Iteration walks
+    shards in manifest order; iter_items() streams them without caching.
+    """
+
+    def __init__(
+        self,
+        map_dir: Path,
+        manifest: Dict,
+        shard_for: Callable[[str], Optional[str]],
+    ) -> None:
+        """
+        Open the symbol shards of a manifest.
+
+        Args:
+            map_dir: Map directory (.clauxton/map/)
+            manifest: Shard manifest
+            shard_for: Maps a relative path to its shard (language) key
+        """
+        self.directory: Path = map_dir / manifest["generation"]
+        self.shards: Dict[str, Dict[str, int]] = manifest.get("shards", {})
+        self._shard_for = shard_for
+        self._loaded: Dict[str, Dict[str, List[Dict]]] = {}
+
+    def shard_path(self, shard: str) -> Path:
+        """Return the path of a symbol shard."""
+        return self.directory / _shard_file(shard)
+
+    def read_shard(self, shard: str) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Stream (path, symbols) pairs of one shard.
+
+        Args:
+            shard: Shard key
+
+        Yields:
+            (relative path, symbol dicts) in walk order
+        """
+        with open(self.shard_path(shard), encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    path, symbols = json.loads(line)
+                    yield path, symbols
+
+    def iter_items(self) -> Iterator[Tuple[str, List[Dict]]]:
+        """Stream all (path, symbols) pairs without keeping them in memory."""
+        for shard in self.shards:
+            yield from self.read_shard(shard)
+
+    def symbol_count(self) -> int:
+        """Return total number of symbols (from the manifest)."""
+        return sum(stats["symbols"] for stats in self.shards.values())
+
+    def _load(self, shard: str) -> Dict[str, List[Dict]]:
+        """Load and cache one shard."""
+        if shard not in self._loaded:
+            logger.debug(f"Loading symbol shard {shard}")
+            self._loaded[shard] = dict(self.read_shard(shard))
+        return self._loaded[shard]
+
+    def __getitem__(self, path: str) -> List[Dict]:
+        shard = self._shard_for(path)
+        if shard is None or shard not in self.shards:
+            raise KeyError(path)
+        return self._load(shard)[path]
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self.shards:
+            yield from self._load(shard)
+
+    def __len__(self) -> int:
+        return sum(stats["files"] for stats in self.shards.values())
+
+
+def _manifest_generation(manifest_file: Path) -> Optional[str]:
+    """Return the generation an index.json points at, if any."""
+    try:
+        with open(manifest_file, encoding="utf-8") as f:
+            generation = json.load(f).get("generation")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return generation if isinstance(generation, str) else None
+
+
+def _generation_time(name: Optional[str]) -> Optional[int]:
+    """Return the creation time encoded in a generation name, if it is one."""
+    if not name or not name.startswith(GENERATION_PREFIX):
+        return None
+    try:
+        return int(name[len(GENERATION_PREFIX):], 16)
+    except ValueError:
+        return None
+
+
+class ShardWriter:
+    """
+    Streams file records and symbol shards into a new generation.
+
+    Nothing is visible to readers until commit() replaces index.json;
+    abort() discards the partial generation.
+    """
+
+    def __init__(self, map_dir: Path) -> None:
+        """
+        Start a new generation directory.
+
+        Args:
+            map_dir: Map directory (.clauxton/map/)
+        """
+        self.map_dir = map_dir
+        self.created = time.time_ns()
+        self.generation = f"{GENERATION_PREFIX}{self.created:x}"
+        self.directory = map_dir / self.generation
+        self.directory.mkdir(parents=True)
+        self._files: TextIO = open(self.directory / FILES_SHARD, "w", encoding="utf-8")
+        self._handles: Dict[str, TextIO] = {}
+        # Shard key -> {"files": n, "symbols": m}, in order of first use
+        self.shards: Dict[str, Dict[str, int]] = {}
+
+    def add_file(self, file_info: Dict) -> None:
+        """Append one file record."""
+        self._files.write(_dumps(file_info))
+
+    def add_files(self, files: Iterable[Dict]) -> None:
+        """Append file records in order."""
+        for file_info in files:
+            self.add_file(file_info)
+
+    def add_symbols(self, shard: str, path: str, symbols: List[Dict]) -> None:
+        """
+        Append the symbols of one file to a shard.
+
+        Args:
+            shard: Shard key (language)
+            path: Relative file path
+            symbols: Symbol dictionaries
+        """
+        handle = self._handles.get(shard)
+        if handle is None:
+            handle = open(self.directory / _shard_file(shard), "w", encoding="utf-8")
+            self._handles[shard] = handle
+            self.shards[shard] = {"files": 0, "symbols": 0}
+        handle.write(_dumps([path, symbols]))
+        self.shards[shard]["files"] += 1
+        self.shards[shard]["symbols"] += len(symbols)
+
+    def reuse_shard(self, shard: str, source: Path, stats: Dict[str, int]) -> None:
+        """
+        Carry an unchanged shard over from the previous generation.
+
+        Hard-links the file when possible, otherwise copies it.
+
+        Args:
+            shard: Shard key
+            source: Shard file of the previous generation
+            stats: Its manifest entry ({"files": n, "symbols": m})
+        """
+        target = self.directory / _shard_file(shard)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        self.shards[shard] = dict(stats)
+
+    def _close(self) -> None:
+        """Close all open shard files."""
+        self._files.close()
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def commit(self, header: Dict) -> Dict:
+        """
+        Publish the generation by replacing index.json.
+
+        The replaced generation is kept for readers still holding the
+        previous manifest; generations older than it and a legacy
+        symbols.json are removed. Generations newer than this one (from a
+        concurrent run) are never touched.
+
+        Args:
+            header: Manifest fields (version, indexed_at, statistics, ...)
+
+        Returns:
+            The written manifest
+        """
+        self._close()
+        manifest = {
+            **header,
+            "format": SHARD_FORMAT,
+            "generation": self.generation,
+            "shards": self.shards,
+        }
+
+        manifest_file = self.map_dir / MANIFEST_FILE
+        replaced = _generation_time(_manifest_generation(manifest_file))
+        temp_file = manifest_file.with_name(f"{MANIFEST_FILE}.{self.generation}.tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(temp_file, manifest_file)
+
+        keep_after = self.created if replaced is None else min(replaced, self.created)
+        for entry in self.map_dir.iterdir():
+            created = _generation_time(entry.name)
+            if created is not None and created < keep_after:
+                shutil.rmtree(entry, ignore_errors=True)
+        (self.map_dir / LEGACY_SYMBOLS_FILE).unlink(missing_ok=True)
+        return manifest
+
+    def abort(self) -> None:
+        """Discard the partial generation."""
+        self._close()
+        shutil.rmtree(self.directory, ignore_errors=True)
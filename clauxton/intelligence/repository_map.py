@@ -17,14 +17,89 @@ Example:
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from clauxton.core.models import ClauxtonError
+from clauxton.intelligence.file_scanner import GitignoreMatcher, scan_files
+from clauxton.intelligence.map_store import LazyIndex, ShardedSymbols, ShardWriter, is_sharded
+from clauxton.intelligence.symbol_index import SymbolIndex
 
 logger = logging.getLogger(__name__)
 
+# Maximum files per task sent to an extraction worker
+EXTRACT_CHUNK_SIZE = 64
+
+# Language detection by file extension (also the symbol shard key)
+LANGUAGE_BY_SUFFIX = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".go": "go",
+    ".rs": "rust",
+    ".java": "java",
+    ".cs": "csharp",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+}
+
+# Per-process SymbolExtractor used by pool workers (built on first task)
+_worker_extractor: Optional[Any] = None
+
+
+def _extract_chunk(
+    root: str, jobs: List[Tuple[str, str]], extractor: Optional[Any] = None
+) -> List[Tuple[str, Optional[List[Dict]], Optional[str]]]:
+    """
+    Extract symbols for a chunk of files.
+
+    Module-level so it can run in a ProcessPoolExecutor worker. Without an
+    explicit extractor, each worker process builds one on first use and keeps
+    it for later chunks.
+
+    Args:
+        root: Repository root directory
+        jobs: Files to extract, as (relative path, language)
+        extractor: SymbolExtractor to use (default: per-process instance)
+
+    Returns:
+        List of (relative path, symbols or None if parser missing, error or None)
+    """
+    global _worker_extractor
+
+    if extractor is None:
+        if _worker_extractor is None:
+            from clauxton.intelligence.symbol_extractor import SymbolExtractor
+
+            _worker_extractor = SymbolExtractor()
+        extractor = _worker_extractor
+
+    results: List[Tuple[str, Optional[List[Dict]], Optional[str]]] = []
+    for relative_path, language in jobs:
+        try:
+            symbols = extractor.extract(Path(root) / relative_path, language)
+            results.append((relative_path, symbols, None))
+        except Exception as e:
+            results.append((relative_path, None, str(e)))
+    return results
+
 
 class RepositoryMapError(ClauxtonError):
     """Base error for repository map operations."""
@@ -144,6 +219,19 @@ class Symbol:
             "signature": self.signature,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Symbol":
+        """Create symbol from dictionary (as stored in symbols.json)."""
+        return cls(
+            name=data["name"],
+            type=data["type"],
+            file_path=data["file_path"],
+            line_start=data["line_start"],
+            line_end=data["line_end"],
+            docstring=data.get("docstring"),
+            signature=data.get("signature"),
+        )
+
     def __repr__(self) -> str:
         return f"Symbol({self.name}, {self.type}, {self.file_path}:{self.line_start})"
 
@@ -195,14 +283,16 @@ class RepositoryMap:
 
         # Lazy-loaded data
         self._index: Optional[Dict] = None
-        self._symbols: Optional[Dict] = None
+        self._symbols: Optional[Mapping[str, List[Dict]]] = None
+        self._symbol_index: Optional[SymbolIndex] = None
 
         logger.debug(f"RepositoryMap initialized at {self.root_dir}")
 
     def index(
         self,
         incremental: bool = False,
-        progress_callback: Optional[Callable[[int, Optional[int], str], None]] = None
+        progress_callback: Optional[Callable[[int, Optional[int], str], None]] = None,
+        workers: Optional[int] = None,
     ) -> IndexResult:
         """
         Index the codebase.
@@ -210,23 +300,43 @@ class RepositoryMap:
         Scans all files in the repository, extracts symbols from source files,
         and builds an index for fast searching.
 
+        With incremental=True, files whose size and modification time match
+        the previous index are not re-read or re-parsed; their stored file
+        info and symbols are reused. Only added, changed and deleted files
+        update the index, and nothing is written if no file changed.
+
+        Symbol extraction can be fanned out to a process pool with
+        workers > 1. Results are merged in file walk order, so the index is
+        identical regardless of worker count.
+
         Args:
-            incremental: If True, only index changed files (not implemented yet)
-            progress_callback: Optional callback (current, total, status) -> None
+            incremental: If True, only re-index changed, added or deleted files
+            progress_callback: Optional callback (current, total, status) -> None.
+                Called per scanned file (total=None), then per extracted file
+                (total=number of files to extract)
+            workers: Number of extraction processes (None/1 = in-process,
+                0 = one per CPU)
 
         Returns:
-            IndexResult with statistics
+            IndexResult with statistics (missing_parsers only counts files
+            re-parsed in this run)
         """
         import time
 
         logger.info(f"Starting indexing of {self.root_dir}")
         start_time = time.time()
 
+        # Previous state to diff against (incremental mode)
+        previous_files: Dict[str, Dict] = {}
+        previous_symbols: Mapping[str, List[Dict]] = {}
         if incremental:
-            logger.warning("Incremental indexing not yet implemented, doing full index")
+            previous_files = {f["relative_path"]: f for f in self.index_data["files"]}
+            previous_symbols = self.symbols_data
+        changed_files: List[str] = []
 
-        # Load gitignore patterns
+        # Compile gitignore rules once for the whole walk
         gitignore_patterns = self._load_gitignore()
+        matcher = GitignoreMatcher(gitignore_patterns)
         logger.debug(f"Loaded {len(gitignore_patterns)} gitignore patterns")
 
         # Scan all files
@@ -238,21 +348,29 @@ class RepositoryMap:
         by_language: Dict[str, int] = {}
         missing_parsers: Dict[str, int] = {}  # Track missing parsers
 
-        from clauxton.intelligence.symbol_extractor import SymbolExtractor
-        symbol_extractor = SymbolExtractor()
-
-        # Collect all files
-        for file_path in self.root_dir.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            # Check if should ignore
-            if self._should_ignore(file_path, gitignore_patterns):
-                continue
+        # Files that may have symbols (reused or extracted) as (relative
+        # path, shard), in walk order
+        symbol_files: List[Tuple[str, str]] = []
+        extraction_jobs: List[Tuple[str, str]] = []  # (relative path, language)
 
+        # Collect all files (ignored directories are never descended into)
+        for relative_path, file_path, stat in scan_files(self.root_dir, matcher):
             # Categorize file
             try:
-                file_info = self._categorize_file(file_path)
+                previous = previous_files.get(relative_path)
+                if previous is not None and self._is_unchanged(stat, previous):
+                    file_info = previous
+                    # Stored symbols are read later, shard by shard
+                    shard = self._symbol_shard(relative_path)
+                    if shard is not None:
+                        symbol_files.append((relative_path, shard))
+                else:
+                    file_info = self._categorize_file(file_path, stat)
+                    changed_files.append(relative_path)
+                    # Extract symbols from new or changed source files
+                    if file_info["file_type"] == "source" and file_info["language"]:
+                        extraction_jobs.append((relative_path, file_info["language"]))
+                        symbol_files.append((relative_path, file_info["language"]))
                 all_files.append(file_info)
                 files_indexed += 1
 
@@ -263,41 +381,114 @@ class RepositoryMap:
                 if language:
                     by_language[language] = by_language.get(language, 0) + 1
 
-                # Extract symbols from source files
-                if file_info["file_type"] == "source" and file_info["language"]:
-                    try:
-                        symbols = symbol_extractor.extract(
-                            file_path,
-                            file_info["language"]
-                        )
-
-                        # Check if parser is available
-                        if symbols is None:
-                            # Parser not available for this language
-                            lang = file_info["language"]
-                            missing_parsers[lang] = missing_parsers.get(lang, 0) + 1
-                        else:
-                            symbols_found += len(symbols)
-                            # Store symbols
-                            if symbols:
-                                self._store_symbols(file_path, symbols)
-
-                    except Exception as e:
-                        error_msg = f"Error extracting symbols from {file_path}: {e}"
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
-
                 # Progress callback
                 if progress_callback:
-                    progress_callback(files_indexed, None, f"Indexing {file_path.name}")
+                    progress_callback(files_indexed, None, f"Scanning {file_path.name}")
 
             except Exception as e:
                 error_msg = f"Error processing {file_path}: {e}"
                 logger.warning(error_msg)
                 errors.append(error_msg)
 
-        # Save index to disk
-        self._save_index(all_files)
+        seen_files = {f["relative_path"] for f in all_files}
+        removed_files = [path for path in previous_files if path not in seen_files]
+        update_in_place = incremental and bool(previous_files)
+
+        if update_in_place and not changed_files and not removed_files:
+            logger.info("Incremental index: no changes detected")
+            if isinstance(previous_symbols, ShardedSymbols):
+                symbols_found = previous_symbols.symbol_count()
+            else:
+                symbols_found = sum(len(symbols) for symbols in previous_symbols.values())
+        else:
+            if update_in_place:
+                logger.info(
+                    f"Incremental index: {len(changed_files)} changed, "
+                    f"{len(removed_files)} removed"
+                )
+
+            # Shards without changed files are carried over without being read
+            reusable_shards: Dict[str, Dict[str, int]] = {}
+            if update_in_place and isinstance(previous_symbols, ShardedSymbols):
+                touched = {self._symbol_shard(path) for path in changed_files + removed_files}
+                reusable_shards = {
+                    shard: stats
+                    for shard, stats in previous_symbols.shards.items()
+                    if shard not in touched
+                }
+
+            writer = ShardWriter(self.map_dir)
+            try:
+                writer.add_files(all_files)
+
+                # Symbols are written in walk order; extraction results may
+                # arrive out of order when parallel and wait in `pending`
+                job_languages = dict(extraction_jobs)
+                results = self._extract_symbols(extraction_jobs, workers)
+                pending: Dict[str, Tuple[Optional[List[Dict]], Optional[str]]] = {}
+                # Symbols of changed files, kept for the symbol index update
+                extracted: Dict[str, List[Dict]] = {}
+                kept_paths = set(changed_files) if update_in_place else set()
+                done = 0
+                for relative_path, shard in symbol_files:
+                    if relative_path not in job_languages:
+                        if shard in reusable_shards:
+                            if shard not in writer.shards:
+                                writer.reuse_shard(
+                                    shard,
+                                    cast(ShardedSymbols, previous_symbols).shard_path(shard),
+                                    reusable_shards[shard],
+                                )
+                                symbols_found += reusable_shards[shard]["symbols"]
+                            continue
+                        symbols = previous_symbols.get(relative_path)
+                    else:
+                        while relative_path not in pending:
+                            done_path, done_symbols, done_error = next(results)
+                            pending[done_path] = (done_symbols, done_error)
+                            done += 1
+                            # Progress callback
+                            if progress_callback:
+                                progress_callback(
+                                    done,
+                                    len(extraction_jobs),
+                                    f"Indexing {Path(done_path).name}",
+                                )
+                        symbols, error = pending.pop(relative_path)
+                        if error is not None:
+                            error_msg = (
+                                f"Error extracting symbols from "
+                                f"{self.root_dir / relative_path}: {error}"
+                            )
+                            logger.warning(error_msg)
+                            errors.append(error_msg)
+                            continue
+                        if symbols is None:
+                            # Parser not available for this language
+                            lang = job_languages[relative_path]
+                            missing_parsers[lang] = missing_parsers.get(lang, 0) + 1
+                            continue
+                        if relative_path in kept_paths:
+                            extracted[relative_path] = symbols
+
+                    if symbols:
+                        writer.add_symbols(shard, relative_path, symbols)
+                        symbols_found += len(symbols)
+
+                # Save index to disk
+                self._save_index(
+                    writer,
+                    all_files,
+                    changed_symbols=(
+                        {path: extracted.get(path, []) for path in changed_files}
+                        if update_in_place
+                        else None
+                    ),
+                    removed_files=removed_files,
+                )
+            except BaseException:
+                writer.abort()
+                raise
 
         duration = time.time() - start_time
         indexed_at = datetime.now()
@@ -339,88 +530,56 @@ class RepositoryMap:
         """
         logger.info(f"Searching for '{query}' with {search_type} search")
 
-        # Load symbols data
-        symbols_data = self.symbols_data
-        if not symbols_data:
+        symbol_index = self.symbol_index
+        if symbol_index is None:
             logger.debug("No symbols available for search")
             return []
 
-        # Collect all symbols
-        all_symbols: List[Symbol] = []
-        for file_path, file_symbols in symbols_data.items():
-            for symbol_dict in file_symbols:
-                symbol = Symbol(
-                    name=symbol_dict["name"],
-                    type=symbol_dict["type"],
-                    file_path=symbol_dict["file_path"],
-                    line_start=symbol_dict["line_start"],
-                    line_end=symbol_dict["line_end"],
-                    docstring=symbol_dict.get("docstring"),
-                    signature=symbol_dict.get("signature"),
-                )
-                all_symbols.append(symbol)
-
-        logger.debug(f"Searching through {len(all_symbols)} symbols")
-
         # Perform search based on type
         if search_type == "exact":
-            results = self._exact_search(query, all_symbols)
+            results = self._exact_search(query, symbol_index, limit)
         elif search_type == "fuzzy":
-            results = self._fuzzy_search(query, all_symbols)
+            results = self._fuzzy_search(query, symbol_index, limit)
         elif search_type == "semantic":
-            results = self._semantic_search(query, all_symbols)
+            results = self._semantic_search(query, symbol_index, limit)
         else:
             logger.warning(f"Unknown search type: {search_type}, using exact")
-            results = self._exact_search(query, all_symbols)
+            results = self._exact_search(query, symbol_index, limit)
 
-        # Apply limit
-        limited_results = results[:limit]
-        logger.info(f"Found {len(results)} results, returning {len(limited_results)}")
+        logger.info(f"Returning {len(results)} results")
 
-        return limited_results
+        return results
 
-    def _exact_search(self, query: str, symbols: List[Symbol]) -> List[Symbol]:
+    def _exact_search(
+        self, query: str, symbol_index: SymbolIndex, limit: int
+    ) -> List[Symbol]:
         """
         Exact substring search (case-insensitive).
 
+        Ranking: exact name, then name prefix, then name substring, then
+        docstring substring. Each tier is an indexed lookup, so only the
+        returned symbols are read from disk.
+
         Args:
             query: Search query
-            symbols: List of symbols to search
+            symbol_index: Symbol table to search
+            limit: Maximum number of results
 
         Returns:
             Matching symbols, sorted by relevance
         """
-        query_lower = query.lower()
-        results = []
-
-        for symbol in symbols:
-            name_lower = symbol.name.lower()
-
-            # Exact match (highest priority)
-            if name_lower == query_lower:
-                results.append((symbol, 100))
-            # Starts with query (high priority)
-            elif name_lower.startswith(query_lower):
-                results.append((symbol, 90))
-            # Contains query (medium priority)
-            elif query_lower in name_lower:
-                results.append((symbol, 50))
-            # Search in docstring if available
-            elif symbol.docstring and query_lower in symbol.docstring.lower():
-                results.append((symbol, 30))
-
-        # Sort by score (descending)
-        results.sort(key=lambda x: x[1], reverse=True)
-
-        return [symbol for symbol, score in results]
+        return [Symbol.from_dict(d) for d in symbol_index.search_exact(query, limit=limit)]
 
-    def _fuzzy_search(self, query: str, symbols: List[Symbol]) -> List[Symbol]:
+    def _fuzzy_search(
+        self, query: str, symbol_index: SymbolIndex, limit: int
+    ) -> List[Symbol]:
         """
         Fuzzy search using Levenshtein distance.
 
         Args:
             query: Search query
-            symbols: List of symbols to search
+            symbol_index: Symbol table to search
+            limit: Maximum number of results
 
         Returns:
             Matching symbols, sorted by similarity
@@ -428,30 +587,32 @@ class RepositoryMap:
         import difflib
 
         query_lower = query.lower()
-        results = []
-
-        for symbol in symbols:
-            name_lower = symbol.name.lower()
+        results: List[Tuple[int, float]] = []
 
+        for symbol_id, name in symbol_index.iter_names():
             # Calculate similarity ratio (0-1)
-            ratio = difflib.SequenceMatcher(None, query_lower, name_lower).ratio()
+            ratio = difflib.SequenceMatcher(None, query_lower, name.lower()).ratio()
 
             # Only include if similarity > 0.4
             if ratio > 0.4:
-                results.append((symbol, ratio))
+                results.append((symbol_id, ratio))
 
         # Sort by similarity (descending)
         results.sort(key=lambda x: x[1], reverse=True)
 
-        return [symbol for symbol, score in results]
+        top_ids = [symbol_id for symbol_id, _ in results[:limit]]
+        return [Symbol.from_dict(d) for d in symbol_index.get_many(top_ids)]
 
-    def _semantic_search(self, query: str, symbols: List[Symbol]) -> List[Symbol]:
+    def _semantic_search(
+        self, query: str, symbol_index: SymbolIndex, limit: int
+    ) -> List[Symbol]:
         """
         Semantic search using TF-IDF.
 
         Args:
             query: Search query
-            symbols: List of symbols to search
+            symbol_index: Symbol table to search
+            limit: Maximum number of results
 
         Returns:
             Matching symbols, sorted by relevance
@@ -461,11 +622,13 @@ class RepositoryMap:
             from sklearn.metrics.pairwise import cosine_similarity
 
             # Prepare documents (symbol names + docstrings)
+            ids = []
             documents = []
-            for symbol in symbols:
-                doc = symbol.name
-                if symbol.docstring:
-                    doc += " " + symbol.docstring
+            for symbol_id, name, docstring in symbol_index.iter_documents():
+                doc = name
+                if docstring:
+                    doc += " " + docstring
+                ids.append(symbol_id)
                 documents.append(doc)
 
             if not documents:
@@ -482,18 +645,19 @@ class RepositoryMap:
 
             # Create results with scores
             results = []
-            for symbol, score in zip(symbols, similarities):
+            for symbol_id, score in zip(ids, similarities):
                 if score > 0.01:  # Threshold for relevance
-                    results.append((symbol, score))
+                    results.append((symbol_id, score))
 
             # Sort by score (descending)
             results.sort(key=lambda x: x[1], reverse=True)
 
-            return [symbol for symbol, score in results]
+            top_ids = [symbol_id for symbol_id, _ in results[:limit]]
+            return [Symbol.from_dict(d) for d in symbol_index.get_many(top_ids)]
 
         except ImportError:
             logger.warning("scikit-learn not available, falling back to exact search")
-            return self._exact_search(query, symbols)
+            return self._exact_search(query, symbol_index, limit)
 
     @property
     def index_data(self) -> Dict:
@@ -508,7 +672,9 @@ class RepositoryMap:
             if index_file.exists():
                 logger.debug(f"Loading index from {index_file}")
                 with open(index_file) as f:
-                    self._index = json.load(f)
+                    index = json.load(f)
+                # Sharded indexes read file records on first access
+                self._index = LazyIndex(self.map_dir, index) if is_sharded(index) else index
             else:
                 logger.debug("No index file found, returning empty index")
                 self._index = {
@@ -525,16 +691,23 @@ class RepositoryMap:
         return self._index
 
     @property
-    def symbols_data(self) -> Dict:
+    def symbols_data(self) -> Mapping[str, List[Dict]]:
         """
         Lazy load symbols data from disk.
 
+        Symbol shards are read per language on first lookup. Indexes written
+        by earlier versions are read from symbols.json.
+
         Returns:
-            Symbols data dictionary mapping file paths to symbol lists
+            Mapping of file paths to symbol lists
         """
         if self._symbols is None:
             symbols_file = self.map_dir / "symbols.json"
-            if symbols_file.exists():
+            if is_sharded(self.index_data):
+                self._symbols = ShardedSymbols(
+                    self.map_dir, self.index_data, self._symbol_shard
+                )
+            elif symbols_file.exists():
                 logger.debug(f"Loading symbols from {symbols_file}")
                 with open(symbols_file) as f:
                     self._symbols = json.load(f)
@@ -543,10 +716,71 @@ class RepositoryMap:
                 self._symbols = {}
         return self._symbols
 
+    @property
+    def symbol_count(self) -> int:
+        """
+        Total number of indexed symbols.
+
+        Read from the manifest for sharded indexes, without loading symbols.
+
+        Returns:
+            Number of symbols across all files
+        """
+        symbols = self.symbols_data
+        if isinstance(symbols, ShardedSymbols):
+            return symbols.symbol_count()
+        return sum(len(file_symbols) for file_symbols in symbols.values())
+
+    @property
+    def symbol_index(self) -> Optional[SymbolIndex]:
+        """
+        Lazy open the query-ready symbol table.
+
+        The table (symbols.db) is derived from the symbol shards (or a
+        legacy symbols.json). It is rebuilt on first use if missing,
+        outdated, or built from another generation of the map (a legacy
+        symbols.json: if older than it).
+
+        Returns:
+            SymbolIndex, or None if no symbols have been indexed
+        """
+        if self._symbol_index is None:
+            db_file = self.map_dir / "symbols.db"
+            if is_sharded(self.index_data):
+                source_file = self.map_dir / "index.json"
+            else:
+                source_file = self.map_dir / "symbols.json"
+            if not db_file.exists() and not source_file.exists():
+                return None
+
+            symbol_index = SymbolIndex(db_file)
+            generation = self.index_data.get("generation")
+            if not symbol_index.is_valid():
+                stale = True
+            elif generation is not None:
+                stale = symbol_index.source() != generation
+            else:
+                stale = (
+                    source_file.exists()
+                    and source_file.stat().st_mtime_ns > db_file.stat().st_mtime_ns
+                )
+            if stale:
+                logger.debug(f"Building symbol index from {source_file}")
+                symbols = self.symbols_data
+                symbol_index.rebuild(
+                    symbols.iter_items() if isinstance(symbols, ShardedSymbols) else symbols,
+                    source=generation,
+                )
+            self._symbol_index = symbol_index
+        return self._symbol_index
+
     def clear_cache(self) -> None:
         """Clear in-memory cache, forcing reload from disk."""
         self._index = None
         self._symbols = None
+        if self._symbol_index is not None:
+            self._symbol_index.close()
+            self._symbol_index = None
         logger.debug("Cache cleared")
 
     # Helper methods for indexing
@@ -561,31 +795,28 @@ class RepositoryMap:
 
         # Default patterns
         patterns = [
-            ".git", ".git/*",
-            "__pycache__", "__pycache__/*", "*.pyc", "*.pyo",
-            ".venv", ".venv/*", "venv", "venv/*",
-            "node_modules", "node_modules/*",
+            ".git",
+            "__pycache__", "*.pyc", "*.pyo",
+            ".venv", "venv",
+            "node_modules",
             ".DS_Store",
-            "*.egg-info", "*.egg-info/*",
-            ".clauxton", ".clauxton/*",
-            "htmlcov", "htmlcov/*",
+            "*.egg-info",
+            ".clauxton",
+            "htmlcov",
             ".coverage",
-            "dist", "dist/*",
-            "build", "build/*",
+            "dist",
+            "build",
         ]
 
-        # Load from .gitignore
+        # Load from .gitignore (later rules, including negations, win)
         gitignore_file = self.root_dir / ".gitignore"
         if gitignore_file.exists():
             try:
                 with open(gitignore_file) as f:
                     for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#"):
+                        line = line.rstrip("\r\n")
+                        if line.strip() and not line.startswith("#"):
                             patterns.append(line)
-                            # Also add pattern with /*
-                            if not line.endswith("*") and not line.endswith("/"):
-                                patterns.append(f"{line}/*")
             except Exception as e:
                 logger.warning(f"Error reading .gitignore: {e}")
 
@@ -595,6 +826,9 @@ class RepositoryMap:
         """
         Check if file should be ignored based on patterns.
 
+        Compiles the patterns on every call; index() compiles them once and
+        prunes ignored directories instead.
+
         Args:
             file_path: Path to check
             patterns: List of gitignore patterns
@@ -602,35 +836,23 @@ class RepositoryMap:
         Returns:
             True if file should be ignored
         """
-        import fnmatch
-
         try:
             relative = file_path.relative_to(self.root_dir)
-            path_str = str(relative)
         except ValueError:
             # File is not relative to root
             return True
 
-        # Check against patterns
-        for pattern in patterns:
-            # Try direct match
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
+        return GitignoreMatcher(patterns).is_ignored(relative.as_posix(), file_path.is_dir())
 
-            # Try matching any part of the path
-            parts = path_str.split("/")
-            for part in parts:
-                if fnmatch.fnmatch(part, pattern.rstrip("/*")):
-                    return True
-
-        return False
-
-    def _categorize_file(self, file_path: Path) -> Dict:
+    def _categorize_file(
+        self, file_path: Path, stat: Optional[os.stat_result] = None
+    ) -> Dict:
         """
         Categorize file by type and detect language.
 
         Args:
             file_path: Path to file
+            stat: Stat result from the directory scan (default: stat the file)
 
         Returns:
             Dictionary with file information
@@ -638,22 +860,7 @@ class RepositoryMap:
         suffix = file_path.suffix.lower()
 
         # Language detection
-        language_map = {
-            ".py": "python",
-            ".js": "javascript",
-            ".jsx": "javascript",
-            ".ts": "typescript",
-            ".tsx": "typescript",
-            ".go": "go",
-            ".rs": "rust",
-            ".java": "java",
-            ".cs": "csharp",
-            ".c": "c",
-            ".cpp": "cpp",
-            ".h": "c",
-            ".hpp": "cpp",
-        }
-        language = language_map.get(suffix)
+        language = LANGUAGE_BY_SUFFIX.get(suffix)
 
         # File type detection
         # Only consider it a test file if filename contains "test", not just the path
@@ -670,7 +877,8 @@ class RepositoryMap:
             file_type = "other"
 
         # Get file stats
-        stat = file_path.stat()
+        if stat is None:
+            stat = file_path.stat()
         line_count = 0
 
         if file_type in ["source", "test"]:
@@ -691,27 +899,88 @@ class RepositoryMap:
             "last_modified": stat.st_mtime,
         }
 
-    def _store_symbols(self, file_path: Path, symbols: List[Dict]) -> None:
+    def _extract_symbols(
+        self, jobs: List[Tuple[str, str]], workers: Optional[int]
+    ) -> Iterator[Tuple[str, Optional[List[Dict]], Optional[str]]]:
         """
-        Store symbols for a file.
+        Extract symbols for (relative path, language) jobs.
+
+        Runs in-process, or in a process pool when workers > 1. Files are
+        sent to workers in chunks and results are yielded as chunks finish.
 
         Args:
-            file_path: Path to file
-            symbols: List of extracted symbols
+            jobs: Files to extract, as (relative path, language)
+            workers: Number of worker processes (None/1 = in-process, 0 = CPU count)
+
+        Yields:
+            (relative path, symbols or None if parser missing, error or None)
         """
-        # Get or create symbols dict
-        if self._symbols is None:
-            self._symbols = {}
+        if workers is not None and workers <= 0:
+            workers = os.cpu_count() or 1
+        root = str(self.root_dir)
+
+        if workers and workers > 1 and len(jobs) > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            chunk_size = max(1, min(EXTRACT_CHUNK_SIZE, len(jobs) // (workers * 4)))
+            chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+            completed = set()
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                    futures = [pool.submit(_extract_chunk, root, chunk) for chunk in chunks]
+                    for future in as_completed(futures):
+                        for result in future.result():
+                            completed.add(result[0])
+                            yield result
+                return
+            except (OSError, RuntimeError) as e:
+                # e.g. BrokenProcessPool, or process creation not permitted
+                logger.warning(f"Parallel extraction failed ({e}), continuing in-process")
+                jobs = [job for job in jobs if job[0] not in completed]
+
+        from clauxton.intelligence.symbol_extractor import SymbolExtractor
+
+        yield from _extract_chunk(root, jobs, SymbolExtractor())
+
+    @staticmethod
+    def _symbol_shard(relative_path: str) -> Optional[str]:
+        """Return the symbol shard (language) of a file, or None if it has none."""
+        return LANGUAGE_BY_SUFFIX.get(os.path.splitext(relative_path)[1].lower())
+
+    @staticmethod
+    def _is_unchanged(stat: os.stat_result, previous: Dict) -> bool:
+        """
+        Check whether a file matches its entry in the previous index.
+
+        Args:
+            stat: Stat result of the file
+            previous: File info dictionary from index.json
 
-        relative_path = str(file_path.relative_to(self.root_dir))
-        self._symbols[relative_path] = symbols
+        Returns:
+            True if size and modification time are unchanged
+        """
+        return bool(
+            previous.get("size_bytes") == stat.st_size
+            and previous.get("last_modified") == stat.st_mtime
+        )
 
-    def _save_index(self, files: List[Dict]) -> None:
+    def _save_index(
+        self,
+        writer: ShardWriter,
+        files: List[Dict],
+        changed_symbols: Optional[Dict[str, List[Dict]]] = None,
+        removed_files: Optional[List[str]] = None,
+    ) -> None:
         """
-        Save index to disk.
+        Publish a written generation and update the symbol table.
 
         Args:
+            writer: Writer holding this run's file records and symbol shards
             files: List of file information dictionaries
+            changed_symbols: Symbols of files re-indexed incrementally (None =
+                full index, symbol table is rebuilt; it is also rebuilt if
+                not built from the previous generation)
+            removed_files: Relative paths deleted since the previous index
         """
         # Calculate statistics
         by_type: Dict[str, int] = {}
@@ -731,26 +1000,37 @@ class RepositoryMap:
             "by_language": by_language,
         }
 
-        # Create index data
-        index_data = {
+        # Generation this run was diffed against (None: none or legacy index)
+        previous_generation = (
+            self.index_data.get("generation") if changed_symbols is not None else None
+        )
+
+        # Write manifest (atomically replaces the previous index)
+        manifest = writer.commit({
             "version": "0.11.0",
             "indexed_at": datetime.now().isoformat(),
             "root_path": str(self.root_dir),
-            "files": files,
             "statistics": stats,
-        }
-
-        # Write to disk
-        index_file = self.map_dir / "index.json"
-        with open(index_file, "w") as f:
-            json.dump(index_data, f, indent=2)
-
-        self._index = index_data
-        logger.debug(f"Index saved to {index_file}")
-
-        # Save symbols if any
-        if self._symbols:
-            symbols_file = self.map_dir / "symbols.json"
-            with open(symbols_file, "w") as f:
-                json.dump(self._symbols, f, indent=2)
-            logger.debug(f"Symbols saved to {symbols_file}")
+        })
+
+        self._index = LazyIndex(self.map_dir, manifest)
+        self._index["files"] = files
+        symbols = ShardedSymbols(self.map_dir, manifest, self._symbol_shard)
+        self._symbols = symbols
+        logger.debug(f"Index saved to {writer.directory}")
+
+        # Update query-ready symbol table (in place for incremental runs,
+        # if it was built from the generation this run was diffed against)
+        symbol_index = self._symbol_index or SymbolIndex(self.map_dir / "symbols.db")
+        if (
+            changed_symbols is not None
+            and previous_generation is not None
+            and symbol_index.is_valid()
+            and symbol_index.source() == previous_generation
+        ):
+            symbol_index.update_files(
+                changed_symbols, removed=removed_files or [], source=writer.generation
+            )
+        else:
+            symbol_index.rebuild(symbols.iter_items(), source=writer.generation)
+        self._symbol_index = symbol_index
@@ -15,8 +15,10 @@ Example:
 # type: ignore  # tree-sitter has complex types
 
 import logging
+import threading
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from clauxton.intelligence.parser import (
     CppParser,
@@ -30,6 +32,49 @@ from clauxton.intelligence.parser import (
 
 logger = logging.getLogger(__name__)
 
+# Built language extractors, shared by all SymbolExtractor instances in the
+# process (grammar import and Parser construction happen once per language)
+_extractor_cache: Dict[str, Any] = {}
+_extractor_lock = threading.Lock()
+
+
+class LazyExtractors(Mapping):  # type: ignore[type-arg]
+    """
+    Language -> extractor mapping that builds extractors on first access.
+
+    Iteration and membership cover all supported languages without
+    building anything; only indexing (or get()) constructs an extractor.
+    """
+
+    def __getitem__(self, language: str) -> Any:
+        """Get the extractor for language, building it on first use."""
+        extractor_class = _EXTRACTOR_CLASSES[language]
+        extractor = _extractor_cache.get(language)
+        if extractor is None:
+            with _extractor_lock:
+                extractor = _extractor_cache.get(language)
+                if extractor is None:
+                    extractor = extractor_class()
+                    _extractor_cache[language] = extractor
+                    logger.debug(f"Initialized {extractor_class.__name__}")
+        return extractor
+
+    def __contains__(self, language: object) -> bool:
+        """Return True if language is supported (does not build it)."""
+        return language in _EXTRACTOR_CLASSES
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate supported languages."""
+        return iter(_EXTRACTOR_CLASSES)
+
+    def __len__(self) -> int:
+        """Return number of supported languages."""
+        return len(_EXTRACTOR_CLASSES)
+
+    def loaded(self) -> List[str]:
+        """Return languages whose extractor has been built in this process."""
+        return [language for language in _EXTRACTOR_CLASSES if language in _extractor_cache]
+
 
 class SymbolExtractor:
     """
@@ -38,26 +83,23 @@ class SymbolExtractor:
     Dispatches to language-specific extractors based on file extension.
     Supports Python, JavaScript, TypeScript, Go, Rust, C++, Java, C#, PHP, Ruby,
     Swift, and Kotlin (v0.11.0).
+
+    Language extractors (and their tree-sitter grammars) are created on first
+    use of that language and cached for the process, so startup cost scales
+    with the languages actually present.
     """
 
     def __init__(self) -> None:
-        """Initialize symbol extractor with language-specific extractors."""
-        self.extractors: Dict[str, any] = {  # type: ignore
-            "python": PythonSymbolExtractor(),
-            "javascript": JavaScriptSymbolExtractor(),
-            "typescript": TypeScriptSymbolExtractor(),
-            "go": GoSymbolExtractor(),
-            "rust": RustSymbolExtractor(),
-            "cpp": CppSymbolExtractor(),
-            "java": JavaSymbolExtractor(),
-            "csharp": CSharpSymbolExtractor(),
-            "php": PhpSymbolExtractor(),
-            "ruby": RubySymbolExtractor(),
-            "swift": SwiftSymbolExtractor(),
-            "kotlin": KotlinSymbolExtractor(),
-        }
+        """Initialize symbol extractor (language extractors are built lazily)."""
+        self.extractors = LazyExtractors()
         logger.debug(f"SymbolExtractor initialized with {len(self.extractors)} languages")
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached language extractors (rebuilt on next use)."""
+        with _extractor_lock:
+            _extractor_cache.clear()
+
     def extract(self, file_path: Path, language: str) -> List[Dict]:
         """
         Extract symbols from a file.
@@ -76,13 +118,13 @@ class SymbolExtractor:
                 - docstring: Optional docstring
                 - signature: Optional function signature
         """
-        extractor = self.extractors.get(language)
-        if not extractor:
+        if language not in self.extractors:
             logger.debug(f"No extractor available for language: {language}")
             return []
 
         try:
-            return extractor.extract(file_path)
+            symbols: List[Dict] = self.extractors[language].extract(file_path)
+            return symbols
         except Exception as e:
             logger.warning(f"Failed to extract symbols from {file_path}: {e}")
             return []
@@ -2906,3 +2948,20 @@ class KotlinSymbolExtractor:
         except (AttributeError, UnicodeDecodeError) as e:
             logger.debug(f"Failed to extract Kotlin signature: {e}")
             return None
+
+
+# Language -> extractor class, used by LazyExtractors
+_EXTRACTOR_CLASSES: Dict[str, type] = {
+    "python": PythonSymbolExtractor,
+    "javascript": JavaScriptSymbolExtractor,
+    "typescript": TypeScriptSymbolExtractor,
+    "go": GoSymbolExtractor,
+    "rust": RustSymbolExtractor,
+    "cpp": CppSymbolExtractor,
+    "java": JavaSymbolExtractor,
+    "csharp": CSharpSymbolExtractor,
+    "php": PhpSymbolExtractor,
+    "ruby": RubySymbolExtractor,
+    "swift": SwiftSymbolExtractor,
+    "kotlin": KotlinSymbolExtractor,
+}
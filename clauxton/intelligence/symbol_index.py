@@ -0,0 +1,425 @@
+"""
+Query-ready symbol table for RepositoryMap.
+
+The symbol shards have to be parsed in full and turned into Symbol objects
+before every search. SymbolIndex stores the same symbols in a SQLite
+database so lookups touch only matching rows:
+- Exact and prefix matches use a B-tree index on the lowercased name
+  (logarithmic in the number of symbols)
+- Substring matches on names and docstrings use an FTS5 trigram index
+  (when available in the local SQLite build)
+- Fuzzy/semantic rankers read only (id, name[, docstring]) columns and
+  materialize full rows for the final results
+
+Storage format:
+    .clauxton/map/
+        index.json      # Manifest of the symbol shards (source of truth)
+        symbols.db      # Derived SQLite table, rebuilt from the shards
+
+Example:
+    >>> index = SymbolIndex(Path(".clauxton/map/symbols.db"))
+    >>> index.rebuild({"auth.py": [{"name": "login", "type": "function", ...}]})
+    >>> index.search_exact("log", limit=10)
+    [{'name': 'login', 'type': 'function', ...}]
+"""
+
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Symbols per file: a mapping, or a stream of (path, symbols) pairs
+SymbolsByFile = Union[
+    Mapping[str, List[Dict[str, Any]]], Iterable[Tuple[str, List[Dict[str, Any]]]]
+]
+
+SCHEMA_VERSION = "1"
+
+# Trigram queries need at least 3 characters; shorter queries scan
+MIN_TRIGRAM_QUERY = 3
+
+# Upper bound for prefix range scans (largest code point)
+_PREFIX_SENTINEL = "\U0010ffff"
+
+_SYMBOL_COLUMNS = "name, type, file_path, line_start, line_end, docstring, signature"
+
+_INSERT_SQL = (
+    "INSERT INTO symbols (source_file, name, name_lower, type, file_path, "
+    "line_start, line_end, docstring, signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE symbols (
+    id INTEGER PRIMARY KEY,
+    source_file TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    type TEXT,
+    file_path TEXT,
+    line_start INTEGER,
+    line_end INTEGER,
+    docstring TEXT,
+    signature TEXT
+);
+CREATE INDEX idx_symbols_name_lower ON symbols(name_lower);
+CREATE INDEX idx_symbols_source_file ON symbols(source_file);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE symbols_fts USING fts5(
+    name_lower, docstring, content='symbols', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER symbols_ai AFTER INSERT ON symbols BEGIN
+    INSERT INTO symbols_fts(rowid, name_lower, docstring)
+    VALUES (new.id, new.name_lower, new.docstring);
+END;
+CREATE TRIGGER symbols_ad AFTER DELETE ON symbols BEGIN
+    INSERT INTO symbols_fts(symbols_fts, rowid, name_lower, docstring)
+    VALUES ('delete', old.id, old.name_lower, old.docstring);
+END;
+"""
+
+
+class SymbolIndex:
+    """
+    SQLite-backed symbol table with name, prefix and substring lookups.
+
+    The database is opened lazily on first query. Results are returned as
+    symbol dictionaries in the same shape as symbols.json entries.
+
+    Attributes:
+        db_path: Path to symbols.db
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Initialize symbol index (does not open the database).
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._has_fts = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def is_valid(self) -> bool:
+        """
+        Check the database exists and has the current schema.
+
+        Returns:
+            True if the database can be queried as-is
+        """
+        if not self.db_path.exists():
+            return False
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+        except sqlite3.Error:
+            self.close()
+            return False
+        return row is not None and row[0] == SCHEMA_VERSION
+
+    def source(self) -> Optional[str]:
+        """
+        Get the identifier of the data the table was last built from.
+
+        Returns:
+            Identifier given to rebuild()/update_files(), or None
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM meta WHERE key = 'source'"
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row is not None else None
+
+    def rebuild(self, symbols_by_file: SymbolsByFile, source: Optional[str] = None) -> None:
+        """
+        Replace the database with the given symbols.
+
+        Writes to a temporary file and renames it into place, so readers
+        never observe a half-built table.
+
+        Args:
+            symbols_by_file: Mapping of relative file path to symbol dicts,
+                or an iterable of (path, symbols) pairs (consumed once)
+            source: Identifier of the symbol data (e.g., map generation),
+                returned by source()
+        """
+        self.close()
+        temp_path = self.db_path.with_name(self.db_path.name + ".tmp")
+        if temp_path.exists():
+            temp_path.unlink()
+
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.executescript(_SCHEMA)
+            conn.executemany(_INSERT_SQL, self._rows(symbols_by_file))
+            try:
+                # Build FTS in one pass after the bulk insert, then add sync triggers
+                conn.executescript(_FTS_SCHEMA)
+                conn.execute("INSERT INTO symbols_fts(symbols_fts) VALUES ('rebuild')")
+            except sqlite3.OperationalError as e:
+                logger.debug(f"FTS5 trigram unavailable, substring search will scan: {e}")
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                (SCHEMA_VERSION,),
+            )
+            if source is not None:
+                conn.execute("INSERT INTO meta (key, value) VALUES ('source', ?)", (source,))
+            conn.commit()
+        finally:
+            conn.close()
+
+        os.replace(temp_path, self.db_path)
+        logger.debug(f"Symbol index rebuilt at {self.db_path}")
+
+    def update_files(
+        self,
+        symbols_by_file: Dict[str, List[Dict[str, Any]]],
+        removed: Sequence[str] = (),
+        source: Optional[str] = None,
+    ) -> None:
+        """
+        Replace the symbols of some files in place.
+
+        Args:
+            symbols_by_file: New symbols for changed or added files
+                (an empty list clears a file's symbols)
+            removed: Relative paths of deleted files
+            source: Identifier of the updated symbol data, returned by
+                source() (recorded even if no symbol row changes)
+        """
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "DELETE FROM symbols WHERE source_file = ?",
+                [(path,) for path in [*symbols_by_file, *removed]],
+            )
+            conn.executemany(_INSERT_SQL, self._rows(symbols_by_file))
+            if source is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('source', ?)", (source,)
+                )
+        logger.debug(
+            f"Symbol index updated: {len(symbols_by_file)} files, {len(removed)} removed"
+        )
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next query)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return number of symbols."""
+        row = self._connection().execute("SELECT COUNT(*) FROM symbols").fetchone()
+        return int(row[0])
+
+    def lookup(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Find symbols by name (case-insensitive exact match).
+
+        Args:
+            name: Symbol name
+
+        Returns:
+            Matching symbol dicts in index order
+        """
+        return self._fetch(
+            "WHERE name_lower = ? ORDER BY id", (name.lower(),), limit=None
+        )
+
+    def search_exact(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ranked substring search over names and docstrings.
+
+        Tiers, best first (index order within a tier):
+        exact name, name prefix, name substring, docstring substring.
+
+        Args:
+            query: Search query
+            limit: Maximum results (None = all matches)
+
+        Returns:
+            Matching symbol dicts
+        """
+        q = query.lower()
+        results: List[Dict[str, Any]] = []
+
+        def remaining() -> Optional[int]:
+            return None if limit is None else limit - len(results)
+
+        tiers = [self._exact_tier, self._prefix_tier, self._contains_tier, self._docstring_tier]
+        for tier in tiers:
+            if remaining() == 0:
+                break
+            results.extend(tier(q, remaining()))
+        return results
+
+    def iter_names(self) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate (id, name) for all symbols in index order.
+
+        Yields:
+            Tuples of (symbol id, name)
+        """
+        yield from self._connection().execute("SELECT id, name FROM symbols ORDER BY id")
+
+    def iter_documents(self) -> Iterator[Tuple[int, str, Optional[str]]]:
+        """
+        Iterate (id, name, docstring) for all symbols in index order.
+
+        Yields:
+            Tuples of (symbol id, name, docstring)
+        """
+        yield from self._connection().execute(
+            "SELECT id, name, docstring FROM symbols ORDER BY id"
+        )
+
+    def get_many(self, ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        Load symbols by id, preserving the order of ids.
+
+        Args:
+            ids: Symbol ids
+
+        Returns:
+            Symbol dicts in the same order as ids
+        """
+        by_id: Dict[int, Dict[str, Any]] = {}
+        conn = self._connection()
+        # Stay below SQLite's default host parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = list(ids[start:start + 500])
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT id, {_SYMBOL_COLUMNS} FROM symbols WHERE id IN ({placeholders})",
+                chunk,
+            ):
+                by_id[row[0]] = self._to_dict(row[1:])
+        return [by_id[i] for i in ids if i in by_id]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            # Read-mostly; MCP tools may call from worker threads
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._has_fts = (
+                self._conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'symbols_fts'"
+                ).fetchone()
+                is not None
+            )
+        return self._conn
+
+    def _exact_tier(self, q: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        return self._fetch("WHERE name_lower = ? ORDER BY id", (q,), limit)
+
+    def _prefix_tier(self, q: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        return self._fetch(
+            "WHERE name_lower > ? AND name_lower < ? ORDER BY id",
+            (q, q + _PREFIX_SENTINEL),
+            limit,
+        )
+
+    def _contains_tier(self, q: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        if self._use_fts(q):
+            return self._fetch(
+                "WHERE id IN (SELECT rowid FROM symbols_fts WHERE symbols_fts MATCH ?) "
+                "AND instr(name_lower, ?) > 1 ORDER BY id",
+                (self._fts_phrase("name_lower", q), q),
+                limit,
+            )
+        return self._fetch("WHERE instr(name_lower, ?) > 1 ORDER BY id", (q,), limit)
+
+    def _docstring_tier(self, q: str, limit: Optional[int]) -> List[Dict[str, Any]]:
+        if self._use_fts(q):
+            sql = (
+                f"SELECT {_SYMBOL_COLUMNS} FROM symbols WHERE id IN "
+                "(SELECT rowid FROM symbols_fts WHERE symbols_fts MATCH ?) "
+                "AND instr(name_lower, ?) = 0 ORDER BY id"
+            )
+            params: Tuple[Any, ...] = (self._fts_phrase("docstring", q), q)
+        else:
+            sql = (
+                f"SELECT {_SYMBOL_COLUMNS} FROM symbols "
+                "WHERE docstring IS NOT NULL AND instr(name_lower, ?) = 0 ORDER BY id"
+            )
+            params = (q,)
+
+        # Case folding is verified in Python to match str.lower() exactly
+        results = []
+        for row in self._connection().execute(sql, params):
+            if row[5] and q in row[5].lower():
+                results.append(self._to_dict(row))
+                if limit is not None and len(results) >= limit:
+                    break
+        return results
+
+    def _use_fts(self, q: str) -> bool:
+        """Trigram index applies to ASCII queries of 3+ characters."""
+        self._connection()
+        return self._has_fts and len(q) >= MIN_TRIGRAM_QUERY and q.isascii()
+
+    @staticmethod
+    def _fts_phrase(column: str, q: str) -> str:
+        """Build an FTS5 column-filtered phrase query."""
+        return f'{column} : "{q.replace(chr(34), chr(34) * 2)}"'
+
+    def _fetch(
+        self, where: str, params: Tuple[Any, ...], limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        sql = f"SELECT {_SYMBOL_COLUMNS} FROM symbols {where}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [self._to_dict(row) for row in self._connection().execute(sql, params)]
+
+    @staticmethod
+    def _to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+        return {
+            "name": row[0],
+            "type": row[1],
+            "file_path": row[2],
+            "line_start": row[3],
+            "line_end": row[4],
+            "docstring": row[5],
+            "signature": row[6],
+        }
+
+    @staticmethod
+    def _rows(symbols_by_file: SymbolsByFile) -> Iterator[Tuple[Any, ...]]:
+        pairs = (
+            symbols_by_file.items() if isinstance(symbols_by_file, Mapping) else symbols_by_file
+        )
+        for source_file, symbols in pairs:
+            for symbol in symbols:
+                yield (
+                    source_file,
+                    symbol["name"],
+                    symbol["name"].lower(),
+                    symbol["type"],
+                    symbol["file_path"],
+                    symbol["line_start"],
+                    symbol["line_end"],
+                    symbol.get("docstring"),
+                    symbol.get("signature"),
+                )
@@ -9,7 +9,7 @@ import logging
 import warnings
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, List, Optional, TypeVar
 
 from mcp.server.fastmcp import FastMCP
 
@@ -26,10 +26,16 @@ from clauxton.core.models import (
 )
 from clauxton.core.task_manager import TaskManager
 from clauxton.intelligence.repository_map import RepositoryMap
+from clauxton.mcp.state_cache import StateCache
 from clauxton.proactive.config import MonitorConfig
 from clauxton.proactive.event_processor import EventProcessor
 from clauxton.proactive.file_monitor import FileMonitor
 
+if TYPE_CHECKING:
+    from clauxton.semantic.embeddings import EmbeddingEngine
+    from clauxton.semantic.index_service import IndexingService
+    from clauxton.semantic.search import SemanticSearchEngine
+
 logger = logging.getLogger(__name__)
 
 # Type variable for decorator
@@ -42,12 +48,77 @@ mcp = FastMCP("Clauxton")
 _file_monitor: Optional[FileMonitor] = None
 _event_processor: Optional[EventProcessor] = None
 
+# Warm KnowledgeBase/TaskManager/Memory instances, reused across tool calls
+_state_cache = StateCache()
+
+# Shared embedding model for semantic search tools (loaded on first use)
+_embedding_engine: Optional["EmbeddingEngine"] = None
+
+# Background semantic indexer (started by semantic_index_background)
+_index_service: Optional["IndexingService"] = None
+
 
 def _get_project_root() -> Path:
     """Get project root directory."""
     return Path.cwd()
 
 
+def _get_knowledge_base(project_root: Path) -> KnowledgeBase:
+    """Get warm KnowledgeBase (rebuilt when knowledge-base.yml changes)."""
+    return _state_cache.get(KnowledgeBase, project_root, ["knowledge-base.yml"])
+
+
+def _get_task_manager(project_root: Path) -> TaskManager:
+    """Get warm TaskManager (rebuilt when tasks.yml changes)."""
+    return _state_cache.get(TaskManager, project_root, ["tasks.yml"])
+
+
+def _get_memory(project_root: Path) -> Memory:
+    """
+    Get warm Memory (rebuilt when memories.yml or its journal changes).
+
+    While background indexing runs, changes are queued for re-indexing.
+    """
+    memory = _state_cache.get(Memory, project_root, ["memories.yml", "memories.wal"])
+    if _index_service is not None and _index_service.is_running:
+        memory.add_listener(_index_service.on_memory_change)
+    return memory
+
+
+def _get_embedding_engine() -> "EmbeddingEngine":
+    """Get the process-wide EmbeddingEngine (model stays loaded across calls)."""
+    global _embedding_engine
+
+    if _embedding_engine is None:
+        from clauxton.semantic.embeddings import EmbeddingEngine
+
+        _embedding_engine = EmbeddingEngine()
+    return _embedding_engine
+
+
+def _new_semantic_search(project_root: Path) -> "SemanticSearchEngine":
+    """Create a SemanticSearchEngine sharing the process-wide model."""
+    from clauxton.semantic.search import SemanticSearchEngine
+
+    return SemanticSearchEngine(project_root, embedding_engine=_get_embedding_engine())
+
+
+def _get_semantic_search(project_root: Path) -> "SemanticSearchEngine":
+    """Get warm SemanticSearchEngine (it reloads changed indexes itself)."""
+    return _state_cache.get(_new_semantic_search, project_root, [])
+
+
+def _get_index_service() -> "IndexingService":
+    """Get or create the background IndexingService for the project."""
+    global _index_service
+
+    if _index_service is None:
+        from clauxton.semantic.index_service import IndexingService
+
+        _index_service = IndexingService(_get_project_root(), _get_embedding_engine())
+    return _index_service
+
+
 def _get_file_monitor() -> FileMonitor:
     """Get or create FileMonitor instance."""
     global _file_monitor
@@ -192,7 +263,7 @@ def kb_search(
         DeprecationWarning,
         stacklevel=2,
     )
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
     results = kb.search(query, category=category, limit=limit)
     return [
         {
@@ -234,7 +305,7 @@ def kb_add(
         DeprecationWarning,
         stacklevel=2,
     )
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
 
     # Generate entry ID
     now = datetime.now()
@@ -281,7 +352,7 @@ def kb_list(category: Optional[str] = None) -> List[dict[str, Any]]:
         DeprecationWarning,
         stacklevel=2,
     )
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
     entries = kb.list_all()
 
     # Filter by category if specified
@@ -320,7 +391,7 @@ def kb_get(entry_id: str) -> dict[str, Any]:
         DeprecationWarning,
         stacklevel=2,
     )
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
     entry = kb.get(entry_id)
     return {
         "id": entry.id,
@@ -362,7 +433,7 @@ def kb_update(
         DeprecationWarning,
         stacklevel=2,
     )
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
 
     # Prepare updates dictionary
     updates: dict[str, Any] = {}
@@ -414,7 +485,7 @@ def kb_delete(entry_id: str) -> dict[str, str]:
         DeprecationWarning,
         stacklevel=2,
     )
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
 
     # Get entry title for confirmation message
     entry = kb.get(entry_id)
@@ -461,7 +532,7 @@ def task_add(
         DeprecationWarning,
         stacklevel=2,
     )
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
 
     # Generate task ID
     task_id = tm.generate_task_id()
@@ -514,7 +585,7 @@ def task_list(
         DeprecationWarning,
         stacklevel=2,
     )
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     tasks = tm.list_all(
         status=status,  # type: ignore[arg-type]
         priority=priority,  # type: ignore[arg-type]
@@ -558,7 +629,7 @@ def task_get(task_id: str) -> dict[str, Any]:
         DeprecationWarning,
         stacklevel=2,
     )
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     task = tm.get(task_id)
 
     return {
@@ -606,7 +677,7 @@ def task_update(
         DeprecationWarning,
         stacklevel=2,
     )
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
 
     updates: dict[str, Any] = {}
     if status:
@@ -648,7 +719,7 @@ def task_next() -> Optional[dict[str, Any]]:
         DeprecationWarning,
         stacklevel=2,
     )
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     next_task = tm.get_next_task()
 
     if not next_task:
@@ -683,7 +754,7 @@ def task_delete(task_id: str) -> dict[str, str]:
         DeprecationWarning,
         stacklevel=2,
     )
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     tm.delete(task_id)
     return {
         "task_id": task_id,
@@ -766,7 +837,7 @@ def task_import_yaml(
         - Dependencies are validated to exist
         - Use dry_run=True to validate before creating tasks
     """
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     result = tm.import_yaml(
         yaml_content=yaml_content,
         dry_run=dry_run,
@@ -820,7 +891,7 @@ def detect_conflicts(task_id: str) -> dict[str, Any]:
             ]
         }
     """
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     detector = ConflictDetector(tm)
 
     # Get task to include its name in response
@@ -899,7 +970,7 @@ def recommend_safe_order(task_ids: List[str]) -> dict[str, Any]:
             "message": "Execute tasks in the order shown to minimize conflicts"
         }
     """
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     detector = ConflictDetector(tm)
 
     order = detector.recommend_safe_order(task_ids)
@@ -967,7 +1038,7 @@ def check_file_conflicts(files: List[str]) -> dict[str, Any]:
             "message": "2 in_progress task(s) are editing these files"
         }
     """
-    tm = TaskManager(Path.cwd())
+    tm = _get_task_manager(Path.cwd())
     detector = ConflictDetector(tm)
 
     conflicting_tasks = detector.check_file_conflicts(files)
@@ -1165,7 +1236,7 @@ def kb_export_docs(
         - Existing files will be overwritten
         - Entries are sorted by creation date within each file
     """
-    kb = KnowledgeBase(Path.cwd())
+    kb = _get_knowledge_base(Path.cwd())
     output_path = Path(output_dir)
 
     try:
@@ -1558,9 +1629,7 @@ def search_knowledge_semantic(
         - Scores >0.7 indicate strong relevance
     """
     try:
-        from clauxton.semantic.search import SemanticSearchEngine
-
-        engine = SemanticSearchEngine(Path.cwd())
+        engine = _get_semantic_search(Path.cwd())
         results = engine.search_kb(query, limit=limit, category=category)
 
         return {
@@ -1657,9 +1726,7 @@ def search_tasks_semantic(
         - Can combine semantic search with status/priority filters
     """
     try:
-        from clauxton.semantic.search import SemanticSearchEngine
-
-        engine = SemanticSearchEngine(Path.cwd())
+        engine = _get_semantic_search(Path.cwd())
         results = engine.search_tasks(
             query,
             limit=limit,
@@ -1760,9 +1827,7 @@ def search_files_semantic(
         - Can filter by glob pattern (e.g., "**/*.py" for Python only)
     """
     try:
-        from clauxton.semantic.search import SemanticSearchEngine
-
-        engine = SemanticSearchEngine(Path.cwd())
+        engine = _get_semantic_search(Path.cwd())
         results = engine.search_files(query, limit=limit, pattern=pattern)
 
         return {
@@ -1787,6 +1852,105 @@ def search_files_semantic(
         }
 
 
+@mcp.tool()
+def semantic_index_background(
+    enabled: bool, file_patterns: Optional[List[str]] = None
+) -> dict[str, Any]:
+    """
+    Enable or disable background semantic indexing.
+
+    When enabled, a worker thread re-indexes KB entries, tasks, memories
+    and code files without blocking tool calls: all sources are rescanned
+    incrementally once, then memory_add/memory_update changes and file
+    changes seen by watch_project_changes are queued as they happen.
+    Semantic searches keep using the saved indexes meanwhile; use
+    get_semantic_index_status to see pending work.
+
+    Args:
+        enabled: True to start the worker, False to stop it
+        file_patterns: Glob patterns of code files to index
+            (default: ["**/*.py"])
+
+    Returns:
+        Dictionary with status and the indexing progress
+    """
+    try:
+        if not enabled:
+            if _index_service is None or not _index_service.is_running:
+                return {
+                    "status": "already_disabled",
+                    "message": "Background indexing not running",
+                }
+            _index_service.stop()
+            _get_file_monitor().remove_listener(_index_service.on_file_change)
+            _get_memory(_get_project_root()).remove_listener(_index_service.on_memory_change)
+            return {
+                "status": "disabled",
+                "message": "Background indexing stopped",
+                "index": _index_service.status(),
+            }
+
+        service = _get_index_service()
+        if file_patterns:
+            service.file_patterns = file_patterns
+        if service.is_running:
+            return {
+                "status": "already_enabled",
+                "message": "Background indexing already running",
+                "index": service.status(),
+            }
+
+        service.start()
+        service.enqueue_all()
+        _get_file_monitor().add_listener(service.on_file_change)
+        # Registers the memory listener
+        _get_memory(_get_project_root())
+        return {
+            "status": "enabled",
+            "message": "Background indexing started",
+            "file_patterns": service.file_patterns,
+            "index": service.status(),
+        }
+    except ImportError as e:
+        return {
+            "status": "error",
+            "message": "Semantic search dependencies not installed",
+            "error": str(e),
+            "hint": "Install with: pip install clauxton[semantic]",
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e),
+        }
+
+
+@mcp.tool()
+def get_semantic_index_status() -> dict[str, Any]:
+    """
+    Get progress and staleness of background semantic indexing.
+
+    Returns:
+        Dictionary with:
+        - status: "success", or "not_started" if semantic_index_background
+          was never enabled
+        - index: running, indexing, stale (jobs pending, failed and awaiting
+          a retry, or in progress, so searches may miss recent edits),
+          pending, pending_by_source,
+          processed, indexed, failed, last_error, last_indexed_at
+    """
+    if _index_service is None:
+        return {
+            "status": "not_started",
+            "message": "Background indexing was not enabled",
+            "hint": "Enable with: semantic_index_background(enabled=True)",
+        }
+    return {
+        "status": "success",
+        "index": _index_service.status(),
+    }
+
+
 @mcp.tool()
 def analyze_recent_commits(
     since_days: int = 7,
@@ -1835,7 +1999,7 @@ def analyze_recent_commits(
         from clauxton.analysis.pattern_extractor import PatternExtractor
 
         analyzer = GitAnalyzer(Path.cwd())
-        extractor = PatternExtractor()
+        extractor = PatternExtractor(cache=analyzer.cache)
 
         # Get recent commits
         commits = analyzer.get_recent_commits(since_days=since_days, max_count=max_count)
@@ -2123,8 +2287,8 @@ def get_project_context(
     """
     try:
         project_root = Path.cwd()
-        kb = KnowledgeBase(project_root)
-        tm = TaskManager(project_root)
+        kb = _get_knowledge_base(project_root)
+        tm = _get_task_manager(project_root)
 
         context: dict[str, Any] = {
             "status": "success",
@@ -2220,7 +2384,9 @@ def get_project_context(
                 from clauxton.analysis.git_analyzer import GitAnalyzer
 
                 git_analyzer = GitAnalyzer(project_root)
-                recent_commits = git_analyzer.get_recent_commits(since_days=7)
+                recent_commits = git_analyzer.get_recent_commits(
+                    since_days=7, include_patch=False
+                )
 
                 context["recent_activity"] = {
                     "commit_count_7days": len(recent_commits),
@@ -2480,8 +2646,8 @@ def get_knowledge_graph() -> dict[str, Any]:
     """
     try:
         project_root = Path.cwd()
-        kb = KnowledgeBase(project_root)
-        tm = TaskManager(project_root)
+        kb = _get_knowledge_base(project_root)
+        tm = _get_task_manager(project_root)
 
         all_entries = kb.list_all()
         all_tasks = tm.list_all()
@@ -2655,8 +2821,8 @@ def find_related_entries(
     """
     try:
         project_root = Path.cwd()
-        kb = KnowledgeBase(project_root)
-        tm = TaskManager(project_root)
+        kb = _get_knowledge_base(project_root)
+        tm = _get_task_manager(project_root)
 
         # Get the reference entry/task
         reference_entry = None
@@ -3755,7 +3921,7 @@ def memory_add(
     """
     try:
         project_root = _get_project_root()
-        memory = Memory(project_root)
+        memory = _get_memory(project_root)
 
         # Generate memory ID
         now = datetime.now()
@@ -3795,14 +3961,18 @@ def memory_search(
     query: str,
     type_filter: Optional[List[str]] = None,
     limit: int = 10,
+    category_filter: Optional[str] = None,
+    tag_filter: Optional[List[str]] = None,
 ) -> List[dict[str, Any]]:
     """
-    Search memories using TF-IDF ranking.
+    Search memories using BM25 ranking.
 
     Args:
         query: Search query
         type_filter: Optional filter by types (knowledge, decision, etc.)
         limit: Maximum results (default: 10)
+        category_filter: Optional filter by category
+        tag_filter: Optional filter by tags (any match)
 
     Returns:
         List of matching memory entries with relevance ranking
@@ -3813,9 +3983,15 @@ def memory_search(
     """
     try:
         project_root = _get_project_root()
-        memory = Memory(project_root)
+        memory = _get_memory(project_root)
 
-        results = memory.search(query, type_filter=type_filter, limit=limit)
+        results = memory.search(
+            query,
+            type_filter=type_filter,
+            limit=limit,
+            category_filter=category_filter,
+            tag_filter=tag_filter,
+        )
 
         return [
             {
@@ -3855,7 +4031,7 @@ def memory_get(memory_id: str) -> dict[str, Any]:
     """
     try:
         project_root = _get_project_root()
-        memory = Memory(project_root)
+        memory = _get_memory(project_root)
 
         entry = memory.get(memory_id)
 
@@ -3914,7 +4090,7 @@ def memory_list(
     """
     try:
         project_root = _get_project_root()
-        memory = Memory(project_root)
+        memory = _get_memory(project_root)
 
         memories = memory.list_all(
             type_filter=type_filter,
@@ -3967,7 +4143,7 @@ def memory_update(
     """
     try:
         project_root = _get_project_root()
-        memory = Memory(project_root)
+        memory = _get_memory(project_root)
 
         # Prepare updates dictionary
         kwargs: dict[str, Any] = {}
@@ -4030,7 +4206,7 @@ def memory_find_related(memory_id: str, limit: int = 5) -> List[dict[str, Any]]:
     """
     try:
         project_root = _get_project_root()
-        memory = Memory(project_root)
+        memory = _get_memory(project_root)
 
         related = memory.find_related(memory_id, limit=limit)
 
@@ -0,0 +1,111 @@
+"""
+Process-wide cache of warm Clauxton instances for the MCP server.
+
+MCP tools used to construct a fresh KnowledgeBase, TaskManager or Memory on
+every call, re-parsing YAML and rebuilding search indexes each time. The MCP
+server is a long-lived process, so instances are kept per project root and
+reused until one of the files they were built from changes on disk.
+
+Invalidation is stat-based: each cached instance records
+(inode, mtime_ns, size) of its watched files in .clauxton/. Any change,
+including writes made through the instance itself, causes the next lookup
+to build a fresh instance, so external edits (CLI, git checkout, another
+MCP process) are never served stale.
+
+Example:
+    >>> cache = StateCache()
+    >>> kb = cache.get(KnowledgeBase, Path("."), ["knowledge-base.yml"])
+    >>> kb is cache.get(KnowledgeBase, Path("."), ["knowledge-base.yml"])
+    True
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (file name, inode, mtime_ns, size); inode/mtime/size are None if missing
+FileStamp = Tuple[str, Optional[int], Optional[int], Optional[int]]
+Signature = Tuple[FileStamp, ...]
+
+
+def file_signature(clauxton_dir: Path, watched: Sequence[str]) -> Signature:
+    """
+    Stat watched files in .clauxton/.
+
+    Args:
+        clauxton_dir: Path to .clauxton/
+        watched: File names relative to clauxton_dir
+
+    Returns:
+        Tuple of (name, inode, mtime_ns, size) per watched file
+    """
+    stamps: List[FileStamp] = []
+    for name in watched:
+        try:
+            stat = (clauxton_dir / name).stat()
+        except OSError:
+            stamps.append((name, None, None, None))
+            continue
+        stamps.append((name, stat.st_ino, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+class StateCache:
+    """
+    Registry of warm instances keyed by (factory, project root).
+
+    Thread-safe; lookups and rebuilds happen under one lock so concurrent
+    tool calls share a single instance per key.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[Any, Path], Tuple[Any, Signature]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, factory: Callable[[Path], T], root: Path, watched: Sequence[str]) -> T:
+        """
+        Get a warm instance, rebuilding it if its files changed.
+
+        Args:
+            factory: Class or callable taking the project root
+            root: Project root directory
+            watched: File names in .clauxton/ the instance is built from
+
+        Returns:
+            Cached or freshly built instance
+        """
+        key = (factory, Path(root).resolve())
+        clauxton_dir = key[1] / ".clauxton"
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] == file_signature(clauxton_dir, watched):
+                instance: T = cached[0]
+                return instance
+
+            instance = factory(root)
+            # Stamp after construction: factories may create missing files
+            self._entries[key] = (instance, file_signature(clauxton_dir, watched))
+            return instance
+
+    def invalidate(self, root: Optional[Path] = None) -> None:
+        """
+        Drop cached instances.
+
+        Args:
+            root: Only drop instances for this project root (default: all)
+        """
+        with self._lock:
+            if root is None:
+                self._entries.clear()
+                return
+            resolved = Path(root).resolve()
+            for key in [key for key in self._entries if key[1] == resolved]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        """Return number of cached instances."""
+        return len(self._entries)
@@ -1,11 +1,12 @@
 """Real-time file monitoring using watchdog."""
 
+import logging
 import threading
 import time
 from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from watchdog.events import (
     DirCreatedEvent,
@@ -24,6 +25,8 @@ from watchdog.observers import Observer
 from clauxton.proactive.config import MonitorConfig
 from clauxton.proactive.models import ChangeType, FileChange
 
+logger = logging.getLogger(__name__)
+
 
 class IgnorePatternMatcher:
     """Match file paths against ignore patterns."""
@@ -77,6 +80,8 @@ class ChangeEventHandler(FileSystemEventHandler):
         self.debounce_cleanup_hours = debounce_cleanup_hours
         self.last_event_time: Dict[str, float] = {}
         self.lock = threading.Lock()
+        # Called with each queued change, on the watchdog thread
+        self.listeners: List[Callable[[FileChange], None]] = []
 
     def _should_process(self, path: Path) -> bool:
         """Check if event should be processed."""
@@ -124,6 +129,13 @@ class ChangeEventHandler(FileSystemEventHandler):
 
         with self.lock:
             self.change_queue.append(change)
+            listeners = list(self.listeners)
+
+        for listener in listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                logger.warning(f"File change listener failed for {path}: {e}")
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file/directory creation."""
@@ -215,6 +227,28 @@ class FileMonitor:
 
         self.is_running = False
 
+    def add_listener(self, listener: Callable[[FileChange], None]) -> None:
+        """
+        Register a callback for file changes.
+
+        The callback receives each change after it is queued. It runs on the
+        watchdog thread, so it should only queue work (e.g.
+        IndexingService.on_file_change). Adding a registered callback again
+        has no effect.
+
+        Args:
+            listener: Callable taking a FileChange
+        """
+        with self.event_handler.lock:
+            if listener not in self.event_handler.listeners:
+                self.event_handler.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[FileChange], None]) -> None:
+        """Unregister a callback added by add_listener() (no-op if absent)."""
+        with self.event_handler.lock:
+            if listener in self.event_handler.listeners:
+                self.event_handler.listeners.remove(listener)
+
     def get_recent_changes(self, minutes: int = 10) -> List[FileChange]:
         """
         Get file changes from last N minutes.
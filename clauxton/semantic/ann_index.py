@@ -0,0 +1,320 @@
+"""
+FAISS index types for VectorStore.
+
+VectorStore searches an exact IndexFlatIP by default. Large stores (code
+chunks) can use an approximate nearest neighbour (ANN) index instead:
+- "flat": exact brute-force scan (IndexIDMap2 over IndexFlatIP)
+- "hnsw": graph index (IndexIDMap2 over IndexHNSWFlat); no training,
+  fast and accurate, but deletions require a rebuild
+- "ivfpq": inverted lists with product quantization (IndexIVFPQ); needs
+  training and compresses vectors to pq_m * pq_nbits bits
+
+All indexes use inner product on normalized vectors (cosine similarity)
+and store VectorStore ids directly.
+
+"flat" and "hnsw" can store vectors with scalar quantization
+(IndexScalarQuantizer / IndexHNSWSQ) instead of float32:
+- "fp16": 2 bytes per dimension, no training
+- "int8": 1 byte per dimension, trained per dimension (min/max) once the
+  store holds min_train_size() vectors; smaller stores use fp16
+VectorStore re-ranks the top candidates of a quantized index with the
+float32 vectors (rerank_factor), which it keeps memory-mapped on disk.
+
+Example:
+    >>> config = IndexConfig(index_type="hnsw", ef_search=128)
+    >>> store = VectorStore(dimension=384, config=config)
+    >>> compact = IndexConfig(quantization="int8", rerank_factor=4)
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+try:
+    import faiss
+except ImportError:
+    if TYPE_CHECKING:
+        import faiss
+
+IndexType = Literal["flat", "hnsw", "ivfpq"]
+Quantization = Literal["none", "fp16", "int8"]
+
+# Vectors needed before an int8 index is trained (default)
+DEFAULT_SQ_TRAIN_SIZE = 1000
+
+
+class IndexConfig(BaseModel):
+    """Index type and parameters of a VectorStore (saved with the store)."""
+
+    index_type: IndexType = Field(
+        default="flat",
+        description="Index type: flat (exact), hnsw or ivfpq",
+    )
+
+    hnsw_m: int = Field(
+        default=32,
+        ge=4,
+        le=128,
+        description="HNSW: neighbours per graph node",
+    )
+
+    ef_construction: int = Field(
+        default=200,
+        ge=8,
+        description="HNSW: candidate list size while building",
+    )
+
+    ef_search: int = Field(
+        default=64,
+        ge=1,
+        description="HNSW: candidate list size while searching",
+    )
+
+    nlist: int = Field(
+        default=1024,
+        ge=1,
+        description="IVF-PQ: number of inverted lists (coarse clusters)",
+    )
+
+    nprobe: int = Field(
+        default=16,
+        ge=1,
+        description="IVF-PQ: lists visited per query",
+    )
+
+    pq_m: int = Field(
+        default=16,
+        ge=1,
+        description="IVF-PQ: sub-quantizers (must divide the dimension)",
+    )
+
+    pq_nbits: int = Field(
+        default=8,
+        ge=1,
+        le=16,
+        description="IVF-PQ: bits per sub-quantizer code",
+    )
+
+    train_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description=(
+            "IVF-PQ / int8: vectors needed before the index is trained and "
+            "built (default: 39 per list for IVF-PQ, 1000 for int8); smaller "
+            "stores stay flat (IVF-PQ) or fp16 (int8)"
+        ),
+    )
+
+    quantization: Quantization = Field(
+        default="none",
+        description="flat/hnsw: vector encoding, none (float32), fp16 or int8",
+    )
+
+    rerank_factor: int = Field(
+        default=4,
+        ge=0,
+        description=(
+            "Quantized stores: candidates per requested result re-scored with "
+            "float32 vectors (0 disables re-ranking and the vector sidecar)"
+        ),
+    )
+
+    @field_validator("quantization")
+    @classmethod
+    def check_quantization(cls, v: str, info: ValidationInfo) -> str:
+        """Reject quantization for IVF-PQ, whose vectors are already encoded."""
+        if v != "none" and info.data.get("index_type") == "ivfpq":
+            raise ValueError("quantization applies to flat and hnsw indexes only")
+        return v
+
+    def min_train_size(self) -> int:
+        """
+        Number of vectors needed to train an IVF-PQ or int8 index.
+
+        Returns:
+            train_size (default 39 * nlist for IVF-PQ, never below what
+            k-means needs; DEFAULT_SQ_TRAIN_SIZE for int8)
+        """
+        if self.index_type != "ivfpq":
+            return self.train_size if self.train_size is not None else DEFAULT_SQ_TRAIN_SIZE
+        requested = self.train_size if self.train_size is not None else 39 * self.nlist
+        return max(requested, self.nlist, 1 << self.pq_nbits)
+
+    def reranks(self) -> bool:
+        """Whether stores with this config re-rank with float32 vectors."""
+        return self.quantization != "none" and self.rerank_factor > 0
+
+
+def _sq_types() -> Dict[str, int]:
+    """Map quantization names to faiss ScalarQuantizer types."""
+    return {"fp16": faiss.ScalarQuantizer.QT_fp16, "int8": faiss.ScalarQuantizer.QT_8bit}
+
+
+def build_index(
+    config: IndexConfig, dimension: int, index_type: str, quantization: str = "none"
+) -> Any:
+    """
+    Create an empty index.
+
+    Args:
+        config: Index parameters
+        dimension: Vector dimension
+        index_type: Type to build ("flat", "hnsw" or "ivfpq")
+        quantization: Vector encoding for flat/hnsw ("none", "fp16", "int8")
+
+    Returns:
+        Empty FAISS index accepting add_with_ids (ivfpq and int8 are untrained)
+    """
+    if index_type == "hnsw":
+        hnsw: Any
+        if quantization != "none":
+            hnsw = faiss.IndexHNSWSQ(
+                dimension,
+                _sq_types()[quantization],  # type: ignore[arg-type]
+                config.hnsw_m,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+        else:
+            hnsw = faiss.IndexHNSWFlat(dimension, config.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        hnsw.hnsw.efConstruction = config.ef_construction
+        hnsw.hnsw.efSearch = config.ef_search
+        return faiss.IndexIDMap2(hnsw)
+
+    if index_type == "ivfpq":
+        quantizer = faiss.IndexFlatIP(dimension)
+        ivf = faiss.IndexIVFPQ(
+            quantizer,
+            dimension,
+            config.nlist,
+            config.pq_m,
+            config.pq_nbits,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        ivf.nprobe = config.nprobe
+        # Allows reconstruct() by id (rebuilds, evaluation) and remove_ids()
+        ivf.set_direct_map_type(faiss.DirectMap.Hashtable)  # type: ignore[attr-defined]
+        return ivf
+
+    if quantization != "none":
+        return faiss.IndexIDMap2(
+            faiss.IndexScalarQuantizer(
+                dimension, _sq_types()[quantization], faiss.METRIC_INNER_PRODUCT
+            )
+        )
+
+    # Use IndexFlatIP for cosine similarity (requires normalized vectors)
+    # Note: Inner product on normalized vectors = cosine similarity
+    return faiss.IndexIDMap2(faiss.IndexFlatIP(dimension))
+
+
+def index_type_of(index: Any) -> str:
+    """
+    Detect the type of a loaded index.
+
+    Args:
+        index: FAISS index read from disk
+
+    Returns:
+        "flat", "hnsw" or "ivfpq"; "legacy" for a bare IndexFlat without ids
+    """
+    if isinstance(index, faiss.IndexIDMap2):
+        inner = faiss.downcast_index(index.index)
+        return "hnsw" if isinstance(inner, faiss.IndexHNSW) else "flat"
+    if isinstance(index, faiss.IndexIVF):
+        return "ivfpq"
+    return "legacy"
+
+
+def quantization_of(index: Any) -> str:
+    """
+    Detect the vector encoding of a loaded index.
+
+    Args:
+        index: FAISS index read from disk
+
+    Returns:
+        "fp16" or "int8" for scalar-quantized flat/hnsw indexes, else "none"
+    """
+    if not isinstance(index, faiss.IndexIDMap2):
+        return "none"
+    inner = faiss.downcast_index(index.index)
+    if isinstance(inner, faiss.IndexHNSW):
+        inner = faiss.downcast_index(inner.storage)
+    if isinstance(inner, faiss.IndexScalarQuantizer):
+        for name, qtype in _sq_types().items():
+            if inner.sq.qtype == qtype:
+                return name
+    return "none"
+
+
+def index_bytes(index: Any) -> int:
+    """Get the serialized size of an index (about its resident size)."""
+    return int(faiss.serialize_index(index).nbytes)
+
+
+def stored_ids(index: Any) -> np.ndarray:
+    """
+    Get the ids of all vectors in an index, ascending.
+
+    Args:
+        index: IndexIDMap2 or IndexIVF
+
+    Returns:
+        int64 array of ids
+    """
+    if isinstance(index, faiss.IndexIDMap2):
+        ids = faiss.vector_to_array(index.id_map)
+    else:
+        invlists: Any = faiss.extract_index_ivf(index).invlists
+        parts = [
+            faiss.rev_swig_ptr(invlists.get_ids(list_no), invlists.list_size(list_no)).copy()
+            for list_no in range(invlists.nlist)
+            if invlists.list_size(list_no)
+        ]
+        ids = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    return np.sort(ids.astype(np.int64))
+
+
+def configure_search(index: Any, config: IndexConfig) -> None:
+    """
+    Apply search-time parameters (ef_search, nprobe) to an index.
+
+    Args:
+        index: FAISS index built by build_index()
+        config: Index parameters
+    """
+    if isinstance(index, faiss.IndexIDMap2):
+        inner = faiss.downcast_index(index.index)
+        if isinstance(inner, faiss.IndexHNSW):
+            inner.hnsw.efSearch = config.ef_search
+    elif isinstance(index, faiss.IndexIVF):
+        index.nprobe = config.nprobe
+
+
+def search_params(index: Any, config: IndexConfig, ids: np.ndarray, k: int) -> Any:
+    """
+    Build search parameters restricting a search to the given ids.
+
+    Args:
+        index: FAISS index built by build_index()
+        config: Index parameters
+        ids: Vector ids to consider
+        k: Number of neighbours requested (HNSW explores at least k)
+
+    Returns:
+        faiss.SearchParameters (HNSW/IVF variant) with an IDSelectorBatch
+    """
+    # The faiss stubs lack the SearchParameters keyword arguments
+    selector = faiss.IDSelectorBatch(ids)
+    if isinstance(index, faiss.IndexIVF):
+        return faiss.SearchParametersIVF(  # type: ignore[call-arg]
+            sel=selector, nprobe=config.nprobe
+        )
+    if isinstance(index, faiss.IndexIDMap2) and isinstance(
+        faiss.downcast_index(index.index), faiss.IndexHNSW
+    ):
+        return faiss.SearchParametersHNSW(  # type: ignore[attr-defined]
+            sel=selector, efSearch=max(config.ef_search, k)
+        )
+    return faiss.SearchParameters(sel=selector)  # type: ignore[call-arg]
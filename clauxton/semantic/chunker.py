@@ -0,0 +1,177 @@
+"""
+Chunking of code files for semantic indexing.
+
+Embedding models truncate long inputs (all-MiniLM-L6-v2 at 256 tokens), so
+embedding a whole file makes everything past its first screen unsearchable.
+Files are split into chunks instead:
+- With symbols (from RepositoryMap), chunks follow top-level symbol
+  boundaries; small neighbouring symbols are merged up to max_lines
+- Without symbols, or for a symbol longer than max_lines, sliding windows
+  of max_lines with overlap lines are used
+
+Example:
+    >>> chunks = chunk_code(text, symbols=repo_map.symbols_data["auth.py"])
+    >>> for chunk in chunks:
+    ...     print(chunk["line_start"], chunk["line_end"], chunk["symbols"])
+    1 42 ['login']
+    43 80 ['logout', 'TokenValidator']
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+# Lines per chunk; roughly what fits in 256 tokens of typical code
+DEFAULT_MAX_LINES = 40
+
+# Lines shared by consecutive sliding windows
+DEFAULT_OVERLAP = 8
+
+
+class CodeChunk(TypedDict):
+    """
+    A contiguous range of lines of a file.
+
+    Attributes:
+        text: Chunk text
+        line_start: First line (1-based)
+        line_end: Last line (inclusive)
+        symbols: Names of top-level symbols starting in the chunk
+    """
+
+    text: str
+    line_start: int
+    line_end: int
+    symbols: List[str]
+
+
+# (first line, last line, symbol names), 1-based and inclusive
+_Region = Tuple[int, int, List[str]]
+
+
+def _top_level_spans(
+    symbols: Sequence[Dict[str, Any]], line_count: int
+) -> List[Tuple[int, int, str]]:
+    """
+    Get line spans of symbols not nested in another symbol.
+
+    Args:
+        symbols: Symbol dicts with line_start, line_end and name
+        line_count: Number of lines in the file (spans are clamped to it)
+
+    Returns:
+        (line_start, line_end, name) sorted by line_start
+    """
+    spans: List[Tuple[int, int, str]] = []
+    for symbol in symbols:
+        start = symbol.get("line_start")
+        if not isinstance(start, int) or not 1 <= start <= line_count:
+            continue
+        end = symbol.get("line_end")
+        end = min(end if isinstance(end, int) and end >= start else start, line_count)
+        spans.append((start, end, str(symbol.get("name", ""))))
+
+    top_level: List[Tuple[int, int, str]] = []
+    for start, end, name in sorted(spans, key=lambda span: (span[0], -span[1])):
+        if top_level and start <= top_level[-1][1]:
+            # Nested (method in class) or overlapping a previous symbol
+            continue
+        top_level.append((start, end, name))
+    return top_level
+
+
+def _symbol_regions(spans: List[Tuple[int, int, str]], line_count: int) -> List[_Region]:
+    """
+    Cover the file with one region per top-level symbol.
+
+    Lines before a symbol (imports, comments, decorators) belong to it;
+    lines after the last symbol form a final region.
+    """
+    regions: List[_Region] = []
+    cursor = 1
+    for _, end, name in spans:
+        regions.append((cursor, end, [name]))
+        cursor = end + 1
+    if cursor <= line_count:
+        regions.append((cursor, line_count, []))
+    return regions
+
+
+def _merge_regions(regions: List[_Region], max_lines: int) -> List[_Region]:
+    """Merge neighbouring regions while they fit in max_lines."""
+    merged: List[_Region] = []
+    for start, end, names in regions:
+        if merged and end - merged[-1][0] + 1 <= max_lines:
+            previous_start, _, previous_names = merged[-1]
+            merged[-1] = (previous_start, end, previous_names + names)
+        else:
+            merged.append((start, end, list(names)))
+    return merged
+
+
+def _windows(start: int, end: int, max_lines: int, overlap: int) -> List[Tuple[int, int]]:
+    """Split lines start..end into sliding windows of at most max_lines."""
+    step = max(max_lines - overlap, 1)
+    windows: List[Tuple[int, int]] = []
+    window_start = start
+    while True:
+        window_end = min(window_start + max_lines - 1, end)
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            return windows
+        window_start += step
+
+
+def chunk_code(
+    text: str,
+    symbols: Optional[Sequence[Dict[str, Any]]] = None,
+    max_lines: int = DEFAULT_MAX_LINES,
+    overlap: int = DEFAULT_OVERLAP,
+) -> List[CodeChunk]:
+    """
+    Split a code file into chunks.
+
+    Files of at most max_lines lines are returned as a single chunk.
+    Chunks containing only whitespace are dropped.
+
+    Args:
+        text: File content
+        symbols: Optional symbol dicts (line_start, line_end, name)
+        max_lines: Maximum lines per chunk
+        overlap: Lines shared by consecutive sliding windows
+
+    Returns:
+        Chunks in file order
+
+    Raises:
+        ValueError: If max_lines < 1 or overlap is not in [0, max_lines)
+    """
+    if max_lines < 1:
+        raise ValueError(f"max_lines must be at least 1, got {max_lines}")
+    if not 0 <= overlap < max_lines:
+        raise ValueError(f"overlap must be in [0, {max_lines}), got {overlap}")
+
+    lines = text.splitlines()
+    spans = _top_level_spans(symbols or [], len(lines))
+
+    if len(lines) <= max_lines:
+        regions: List[_Region] = [(1, len(lines), [name for _, _, name in spans])]
+    elif spans:
+        regions = _merge_regions(_symbol_regions(spans, len(lines)), max_lines)
+    else:
+        regions = [(1, len(lines), [])]
+
+    chunks: List[CodeChunk] = []
+    for start, end, names in regions:
+        for window_start, window_end in _windows(start, end, max_lines, overlap):
+            chunk_text = "\n".join(lines[window_start - 1 : window_end])
+            if not chunk_text.strip():
+                continue
+            chunks.append(
+                {
+                    "text": chunk_text,
+                    "line_start": window_start,
+                    "line_end": window_end,
+                    # A split symbol is named in each of its windows
+                    "symbols": names,
+                }
+            )
+    return chunks
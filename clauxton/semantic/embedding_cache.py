@@ -0,0 +1,301 @@
+"""
+On-disk embedding cache keyed by content hash.
+
+The Indexer skips items whose content_hash is unchanged, but identical
+text indexed elsewhere (another worktree, a branch switched back to, a KB
+entry copied into a memory) is encoded again. EmbeddingCache keeps the
+embeddings of encoded texts per model, keyed by the SHA-256 of the text:
+- vectors.f16: memory-mapped rows of (key prefix, float16 vector); the
+  key prefix detects slots overwritten by a crashed or concurrent writer
+- entries.db: SQLite table of key -> (slot, last use), used for lookups
+  and least-recently-used eviction once max_entries is reached
+
+Storage format:
+    ~/.cache/clauxton/embeddings/
+        all-MiniLM-L6-v2/
+            entries.db
+            vectors.f16
+
+Example:
+    >>> cache = EmbeddingCache(Path("~/.cache/clauxton/embeddings/all-MiniLM-L6-v2"))
+    >>> keys = [content_key("def login(): ...")]
+    >>> cache.get(keys)
+    [None]
+    >>> cache.put(keys, model.encode(["def login(): ..."]))
+    >>> cache.get(keys)[0].shape
+    (384,)
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+# ~77MB of float16 vectors at 384 dimensions
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Rows added to vectors.f16 at least per growth step
+_GROW_ROWS = 1024
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    slot INTEGER NOT NULL UNIQUE,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_used ON entries(used);
+"""
+
+
+def content_key(text: str) -> bytes:
+    """Get the cache key (SHA-256 digest) of a text."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _key_tag(key: bytes) -> int:
+    """Get the 64-bit key prefix stored next to a vector."""
+    return int.from_bytes(key[:8], "little")
+
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache for one model with an LRU size cap.
+
+    Files are created on the first put(). Safe to share between threads;
+    processes sharing a directory serialize writes through SQLite.
+
+    Attributes:
+        directory: Cache directory of the model
+        max_entries: Maximum number of cached embeddings
+    """
+
+    def __init__(self, directory: Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize cache (does not open any file).
+
+        Args:
+            directory: Cache directory of the model
+            max_entries: Maximum number of cached embeddings
+
+        Raises:
+            ValueError: If max_entries < 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.directory = directory
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._rows: Optional[np.memmap] = None
+        self._dimension: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / "vectors.f16"
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the entry table, creating it if needed."""
+        if self._conn is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.directory / "entries.db"),
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _row_dtype(self, dimension: int) -> np.dtype:
+        return np.dtype([("tag", "<u8"), ("vector", "<f2", (dimension,))])
+
+    def _read_dimension(self, conn: sqlite3.Connection) -> Optional[int]:
+        """Get the dimension recorded by the first put(), if any."""
+        if self._dimension is None:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'dimension'").fetchone()
+            if row is not None:
+                self._dimension = int(row[0])
+        return self._dimension
+
+    def _map(self, min_rows: int) -> Optional[np.memmap]:
+        """Map vectors.f16, remapping if it has grown past the current map."""
+        if self._rows is not None and len(self._rows) >= min_rows:
+            return self._rows
+        if self._dimension is None or not self._vectors_path.exists():
+            return None
+        dtype = self._row_dtype(self._dimension)
+        rows = self._vectors_path.stat().st_size // dtype.itemsize
+        if rows == 0:
+            return None
+        self._rows = np.memmap(self._vectors_path, dtype=dtype, mode="r+", shape=(rows,))
+        return self._rows
+
+    def _grow(self, min_rows: int) -> np.memmap:
+        """Extend vectors.f16 to hold at least min_rows rows."""
+        assert self._dimension is not None
+        dtype = self._row_dtype(self._dimension)
+        size = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+        rows = size // dtype.itemsize
+        if rows < min_rows:
+            rows = max(min(max(rows * 2, _GROW_ROWS), self.max_entries), min_rows)
+            with open(self._vectors_path, "ab") as f:
+                f.truncate(rows * dtype.itemsize)
+        self._rows = None
+        mapped = self._map(min_rows)
+        assert mapped is not None
+        return mapped
+
+    def get(self, keys: Sequence[bytes]) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings and mark the hits as recently used.
+
+        Args:
+            keys: Cache keys (see content_key())
+
+        Returns:
+            float32 embedding per key, or None for a miss
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+        with self._lock:
+            conn = self._connection()
+            if self._read_dimension(conn) is None:
+                return results
+
+            slots: Dict[bytes, int] = {}
+            unique = list(dict.fromkeys(keys))
+            for start in range(0, len(unique), _QUERY_CHUNK):
+                chunk = unique[start : start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                slots.update(
+                    conn.execute(
+                        f"SELECT key, slot FROM entries WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+            if not slots:
+                return results
+
+            rows = self._map(max(slots.values()) + 1)
+            hits: List[bytes] = []
+            for position, key in enumerate(keys):
+                slot = slots.get(key)
+                if slot is None or rows is None or slot >= len(rows):
+                    continue
+                row = rows[slot]
+                if int(row["tag"]) != _key_tag(key):
+                    # Slot reused by a write that did not commit
+                    continue
+                results[position] = np.asarray(row["vector"], dtype=np.float32)
+                hits.append(key)
+
+            if hits:
+                used = time.time_ns()
+                conn.executemany(
+                    "UPDATE entries SET used = ? WHERE key = ?",
+                    [(used, key) for key in dict.fromkeys(hits)],
+                )
+        return results
+
+    def put(self, keys: Sequence[bytes], embeddings: np.ndarray) -> None:
+        """
+        Store embeddings, evicting the least recently used beyond max_entries.
+
+        Keys already cached are left as they are.
+
+        Args:
+            keys: Cache keys (see content_key())
+            embeddings: Array of shape (len(keys), dimension)
+
+        Raises:
+            ValueError: If the dimension differs from the cached embeddings
+        """
+        if len(keys) == 0:
+            return
+        embeddings = np.asarray(embeddings)
+        dimension = int(embeddings.shape[1])
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cached = self._read_dimension(conn)
+                if cached is None:
+                    conn.execute(
+                        "INSERT INTO meta (key, value) VALUES ('dimension', ?)", (str(dimension),)
+                    )
+                    self._dimension = dimension
+                elif cached != dimension:
+                    raise ValueError(
+                        f"Embedding dimension mismatch: cache has {cached}, got {dimension}"
+                    )
+
+                # Last occurrence of each new key, at most max_entries of them
+                new: Dict[bytes, int] = {}
+                for position, key in enumerate(keys):
+                    new.pop(key, None)
+                    new[key] = position
+                existing: Set[bytes] = set()
+                unique = list(new)
+                for start in range(0, len(unique), _QUERY_CHUNK):
+                    chunk = unique[start : start + _QUERY_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    existing.update(
+                        key
+                        for (key,) in conn.execute(
+                            f"SELECT key FROM entries WHERE key IN ({placeholders})", chunk
+                        )
+                    )
+                pending = [(key, new[key]) for key in unique if key not in existing]
+                pending = pending[-self.max_entries :]
+                if not pending:
+                    conn.execute("COMMIT")
+                    return
+
+                # Slots stay dense: fill up to max_entries, then reuse evicted slots
+                (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+                fresh = max(min(len(pending), self.max_entries - count), 0)
+                slots = list(range(count, count + fresh))
+                evicted = conn.execute(
+                    "SELECT key, slot FROM entries ORDER BY used LIMIT ?",
+                    (len(pending) - fresh,),
+                ).fetchall()
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k, _ in evicted])
+                slots.extend(slot for _, slot in evicted)
+
+                rows = self._grow(max(slots) + 1)
+                for (key, position), slot in zip(pending, slots):
+                    rows[slot] = (_key_tag(key), embeddings[position])
+                rows.flush()
+
+                used = time.time_ns()
+                conn.executemany(
+                    "INSERT INTO entries (key, slot, used) VALUES (?, ?, ?)",
+                    [(key, slot, used) for (key, _), slot in zip(pending, slots)],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close the entry table and unmap the vectors."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._rows = None
@@ -5,12 +5,16 @@ This module provides text embedding capabilities using local models,
 with no external API calls. All processing happens on the user's machine.
 """
 
+import logging
 import os
+import sqlite3
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import numpy as np
 
+from clauxton.semantic.embedding_cache import DEFAULT_MAX_ENTRIES, EmbeddingCache, content_key
+
 # Optional import - graceful degradation if not installed
 try:
     from sentence_transformers import SentenceTransformer
@@ -21,6 +25,8 @@ except ImportError:
     if TYPE_CHECKING:
         from sentence_transformers import SentenceTransformer
 
+logger = logging.getLogger(__name__)
+
 
 class UserConsentError(Exception):
     """Raised when user declines model download."""
@@ -44,6 +50,9 @@ class EmbeddingEngine:
     - CPU-first: Optimized for systems without GPU
     - Caching: Model cached locally to avoid re-downloads
     - Batch processing: Efficient encoding of multiple texts
+    - Embedding cache: embeddings are cached on disk by text hash (see
+      clauxton.semantic.embedding_cache), so identical text is encoded once
+      across indexes and runs
 
     Example:
         >>> engine = EmbeddingEngine()
@@ -60,6 +69,8 @@ class EmbeddingEngine:
         model_name: str = DEFAULT_MODEL,
         cache_dir: Optional[Path] = None,
         device: str = "cpu",
+        embedding_cache_dir: Optional[Path] = None,
+        embedding_cache_size: int = DEFAULT_MAX_ENTRIES,
     ):
         """
         Initialize embedding engine.
@@ -68,6 +79,10 @@ class EmbeddingEngine:
             model_name: HuggingFace model identifier
             cache_dir: Where to cache the model (~/.cache/clauxton/models/)
             device: "cpu" or "cuda" for GPU
+            embedding_cache_dir: Where to cache embeddings (default: an
+                "embeddings" directory next to cache_dir)
+            embedding_cache_size: Maximum cached embeddings per model
+                (0 disables the embedding cache)
 
         Note: First run downloads ~90MB model (with user consent)
         """
@@ -82,6 +97,13 @@ class EmbeddingEngine:
         self.device = device
         self._model: Optional["SentenceTransformer"] = None
 
+        self.embedding_cache: Optional[EmbeddingCache] = None
+        if embedding_cache_size > 0:
+            embeddings_dir = embedding_cache_dir or self.cache_dir.parent / "embeddings"
+            self.embedding_cache = EmbeddingCache(
+                embeddings_dir / model_name.replace("/", "_"), max_entries=embedding_cache_size
+            )
+
     @property
     def model(self) -> "SentenceTransformer":
         """
@@ -198,6 +220,9 @@ class EmbeddingEngine:
         """
         Generate embeddings for texts.
 
+        Texts found in the embedding cache are not encoded again; cached
+        embeddings are stored as float16.
+
         Args:
             texts: List of text strings to embed
             batch_size: Process in batches for efficiency
@@ -218,6 +243,45 @@ class EmbeddingEngine:
             # Return empty array with correct shape
             return np.array([]).reshape(0, 384)
 
+        if self.embedding_cache is None:
+            return self._encode_model(texts, batch_size, show_progress, normalize_embeddings)
+
+        keys = [content_key(text) for text in texts]
+        try:
+            rows = self.embedding_cache.get(keys)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"Embedding cache unavailable: {e}")
+            return self._encode_model(texts, batch_size, show_progress, normalize_embeddings)
+
+        # Encode each missing text once, even if it occurs several times
+        missing: Dict[bytes, str] = {}
+        for key, text, row in zip(keys, texts, rows):
+            if row is None:
+                missing[key] = text
+        fresh: Dict[bytes, np.ndarray] = {}
+        if missing:
+            encoded = self._encode_model(list(missing.values()), batch_size, show_progress, False)
+            try:
+                self.embedding_cache.put(list(missing), encoded)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.warning(f"Failed to update embedding cache: {e}")
+            fresh = dict(zip(missing, encoded))
+
+        vectors = [fresh[key] if row is None else row for key, row in zip(keys, rows)]
+        result: np.ndarray = np.stack(vectors).astype(np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(result, axis=1, keepdims=True)
+            result = result / np.where(norms == 0, 1, norms)
+        return result
+
+    def _encode_model(
+        self,
+        texts: List[str],
+        batch_size: int,
+        show_progress: bool,
+        normalize_embeddings: bool,
+    ) -> np.ndarray:
+        """Encode texts with the model (no cache)."""
         result: np.ndarray = self.model.encode(
             texts,
             batch_size=batch_size,
@@ -0,0 +1,429 @@
+"""
+Background indexing service for semantic search.
+
+Indexer.index_all() encodes every changed item before it returns, which
+blocks the caller for minutes on a first build. IndexingService instead
+queues (source_type, source_id) jobs and drains them on a worker thread:
+- Jobs are deduplicated while pending; enqueue_all() queues an
+  incremental rescan of a whole source
+- Each drain groups jobs by source type, re-indexes them with batched
+  encodes (see Indexer.index_sources()) and saves the source's index
+- Memory and FileMonitor listeners (on_memory_change, on_file_change)
+  turn edits into jobs
+- Jobs of a source that fails are kept and retried with the next drain,
+  or after retry_delay if nothing else is queued
+
+Searches read the saved indexes, which SemanticSearchEngine reloads when
+their files change, so they never wait for the worker; status() reports
+pending jobs and when the indexes were last updated.
+
+Example:
+    >>> service = IndexingService(Path("."), engine)
+    >>> service.start()
+    >>> service.enqueue_all()
+    >>> memory.add_listener(service.on_memory_change)
+    >>> monitor.add_listener(service.on_file_change)
+    >>> service.status()["pending"]
+    4
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, TypedDict
+
+from clauxton.proactive.models import ChangeType, FileChange
+from clauxton.semantic.embeddings import EmbeddingEngine
+from clauxton.semantic.indexer import DEFAULT_BATCH_SIZE, INDEX_NAMES, Indexer
+from clauxton.semantic.vector_store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait after the first queued job, so bursts drain together
+DEFAULT_DELAY = 0.5
+
+# Seconds before failed jobs are retried when no other job is queued
+DEFAULT_RETRY_DELAY = 30.0
+
+# .clauxton files whose change requires rescanning a source
+_SOURCE_FILES = {
+    "knowledge-base.yml": "kb",
+    "tasks.yml": "task",
+    "memories.yml": "memory",
+    "memories.wal": "memory",
+}
+
+
+class IndexStatus(TypedDict):
+    """Progress of an IndexingService (see IndexingService.status())."""
+
+    running: bool
+    indexing: bool
+    stale: bool
+    pending: int
+    pending_by_source: Dict[str, int]
+    processed: int
+    indexed: int
+    failed: int
+    last_error: Optional[str]
+    last_indexed_at: Optional[str]
+
+
+class IndexingService:
+    """
+    Queue of indexing jobs drained by a worker thread.
+
+    One Indexer and VectorStore is kept per source type, each saved to its
+    own index under .clauxton/semantic/ (kb_index, task_index, file_index,
+    memory_index). A job that fails is counted, logged and kept for a retry;
+    the worker keeps running.
+
+    Attributes:
+        project_root: Project root directory
+        embedding_engine: Engine for generating embeddings
+        file_patterns: Glob patterns of code files to index
+        batch_size: Number of texts per encode call
+        delay: Seconds to collect jobs before a drain starts
+        retry_delay: Seconds before failed jobs are retried on their own
+        is_running: Whether the worker thread is running
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        embedding_engine: EmbeddingEngine,
+        file_patterns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        delay: float = DEFAULT_DELAY,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        """
+        Initialize service (the worker is started by start()).
+
+        Args:
+            project_root: Project root directory
+            embedding_engine: Engine for generating embeddings
+            file_patterns: Patterns for files to index (default: ["**/*.py"])
+            batch_size: Number of texts per encode call
+            delay: Seconds to collect jobs before a drain starts
+            retry_delay: Seconds before failed jobs are retried on their own
+        """
+        self.project_root = Path(project_root).resolve()
+        self.embedding_engine = embedding_engine
+        self.file_patterns = file_patterns if file_patterns is not None else ["**/*.py"]
+        self.batch_size = batch_size
+        self.delay = delay
+        self.retry_delay = retry_delay
+        self.is_running = False
+
+        self._semantic_dir = self.project_root / ".clauxton" / "semantic"
+        self._indexers: Dict[str, Indexer] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._cond = threading.Condition()
+        self._stopping = False
+
+        # Guarded by _cond
+        self._pending: Dict[str, Set[str]] = {}
+        self._rescans: Set[str] = set()
+        # Failed jobs, queued again with the next drain or at _retry_at
+        self._retry: Dict[str, Set[str]] = {}
+        self._retry_rescans: Set[str] = set()
+        self._retry_at = 0.0
+        self._indexing = False
+        self._processed = 0
+        self._indexed = 0
+        self._failed = 0
+        self._last_error: Optional[str] = None
+        self._last_indexed_at: Optional[datetime] = None
+
+    def start(self) -> None:
+        """
+        Start the worker thread.
+
+        Raises:
+            RuntimeError: If the service is already running
+        """
+        if self.is_running:
+            raise RuntimeError("IndexingService is already running")
+
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="clauxton-indexing", daemon=True
+        )
+        self._thread.start()
+        self.is_running = True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker after the drain in progress; pending jobs are kept.
+
+        Args:
+            timeout: Seconds to wait for the worker (None: until it exits)
+        """
+        if not self.is_running:
+            return
+
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.is_running = False
+
+    def enqueue(self, source_type: str, source_id: str) -> None:
+        """
+        Queue one item for re-indexing.
+
+        Args:
+            source_type: Type of the item ("kb", "task", "file", "memory")
+            source_id: Item id (file path relative to the project root)
+
+        Raises:
+            ValueError: If source_type is unknown
+        """
+        self._check_source_type(source_type)
+        with self._cond:
+            self._queue(self._pending, self._rescans, source_type, {source_id})
+            self._cond.notify_all()
+
+    def enqueue_all(self, source_type: Optional[str] = None) -> None:
+        """
+        Queue an incremental rescan of one source type, or of all of them.
+
+        Args:
+            source_type: Type to rescan, or None for all types
+
+        Raises:
+            ValueError: If source_type is unknown
+        """
+        source_types = list(INDEX_NAMES) if source_type is None else [source_type]
+        for name in source_types:
+            self._check_source_type(name)
+        with self._cond:
+            for name in source_types:
+                self._queue(self._pending, self._rescans, name, rescan=True)
+            self._cond.notify_all()
+
+    def on_memory_change(self, memory_id: str) -> None:
+        """Memory listener: queue an added, updated or deleted memory."""
+        self.enqueue("memory", memory_id)
+
+    def on_file_change(self, change: FileChange) -> None:
+        """
+        FileMonitor listener: queue a changed code file.
+
+        Changes to knowledge-base.yml, tasks.yml or the memory store queue
+        a rescan of their source; other files are queued if they match
+        file_patterns.
+        """
+        paths = [change.path]
+        if change.change_type == ChangeType.MOVED and change.src_path is not None:
+            paths.append(change.src_path)
+
+        for path in paths:
+            try:
+                relative = path.resolve().relative_to(self.project_root)
+            except ValueError:
+                continue
+
+            if relative.parts and relative.parts[0] == ".clauxton":
+                source_type = _SOURCE_FILES.get(relative.name)
+                if source_type is not None and len(relative.parts) == 2:
+                    self.enqueue_all(source_type)
+                continue
+
+            file_path = relative.as_posix()
+            if any(_matches(file_path, pattern) for pattern in self.file_patterns):
+                self.enqueue("file", file_path)
+
+    def status(self) -> IndexStatus:
+        """
+        Get queue and progress counters.
+
+        Returns:
+            IndexStatus. stale is True while jobs are pending (including
+            failed jobs awaiting a retry) or being indexed, so searches may
+            miss recent edits; processed, indexed and failed count indexed
+            jobs, re-encoded items and failed job attempts.
+        """
+        with self._cond:
+            pending_by_source: Dict[str, int] = {}
+            for queued, rescans in (
+                (self._pending, self._rescans),
+                (self._retry, self._retry_rescans),
+            ):
+                for source_type, ids in queued.items():
+                    if ids:
+                        pending_by_source[source_type] = (
+                            pending_by_source.get(source_type, 0) + len(ids)
+                        )
+                for source_type in rescans:
+                    pending_by_source[source_type] = pending_by_source.get(source_type, 0) + 1
+            pending = sum(pending_by_source.values())
+            return {
+                "running": self.is_running,
+                "indexing": self._indexing,
+                "stale": self._indexing or pending > 0,
+                "pending": pending,
+                "pending_by_source": pending_by_source,
+                "processed": self._processed,
+                "indexed": self._indexed,
+                "failed": self._failed,
+                "last_error": self._last_error,
+                "last_indexed_at": (
+                    self._last_indexed_at.isoformat() if self._last_indexed_at else None
+                ),
+            }
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no job is pending or being indexed.
+
+        Failed jobs awaiting their retry do not count as pending here.
+
+        Args:
+            timeout: Seconds to wait (None: no limit)
+
+        Returns:
+            True if the queue is drained, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._indexing and not self._has_pending(), timeout
+            )
+
+    # ========================================================================
+    # Worker
+    # ========================================================================
+
+    def _run(self) -> None:
+        """Drain queued jobs until stop() is called."""
+        while True:
+            with self._cond:
+                while not self._stopping and not self._has_pending():
+                    if self._has_retry():
+                        remaining = self._retry_at - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._stopping:
+                    return
+                # Let a burst of edits (a save touching many files) queue up
+                if self.delay > 0:
+                    self._cond.wait_for(lambda: self._stopping, self.delay)
+                    if self._stopping:
+                        return
+                # Failed jobs are retried with every drain
+                for source_type, ids in self._retry.items():
+                    self._queue(self._pending, self._rescans, source_type, ids)
+                for source_type in self._retry_rescans:
+                    self._queue(self._pending, self._rescans, source_type, rescan=True)
+                self._retry, self._retry_rescans = {}, set()
+                pending, rescans = self._pending, self._rescans
+                self._pending, self._rescans = {}, set()
+                self._indexing = True
+
+            try:
+                self._drain(pending, rescans)
+            finally:
+                with self._cond:
+                    self._indexing = False
+                    self._cond.notify_all()
+
+    def _drain(self, pending: Dict[str, Set[str]], rescans: Set[str]) -> None:
+        """Index one batch of jobs, source by source."""
+        for source_type in INDEX_NAMES:
+            ids = pending.get(source_type, set())
+            rescan = source_type in rescans
+            jobs = len(ids) + int(rescan)
+            if not jobs:
+                continue
+
+            try:
+                indexer = self._indexer(source_type)
+                if rescan:
+                    indexed = self._rescan(indexer, source_type)
+                else:
+                    indexed = indexer.index_sources(source_type, ids)
+            except Exception as e:
+                logger.error(f"Background indexing of {source_type} failed: {e}", exc_info=True)
+                # Reload the store from disk on the next job
+                self._indexers.pop(source_type, None)
+                with self._cond:
+                    self._queue(self._retry, self._retry_rescans, source_type, ids, rescan)
+                    self._retry_at = time.monotonic() + self.retry_delay
+                    self._failed += jobs
+                    self._last_error = f"{source_type}: {e}"
+                continue
+
+            with self._cond:
+                self._processed += jobs
+                self._indexed += indexed
+                self._last_indexed_at = datetime.now()
+
+    def _rescan(self, indexer: Indexer, source_type: str) -> int:
+        """Incrementally re-index a whole source."""
+        if source_type == "kb":
+            return indexer.index_knowledge_base()
+        if source_type == "task":
+            return indexer.index_tasks()
+        if source_type == "memory":
+            return indexer.index_memories()
+        return indexer.index_files(self.file_patterns)
+
+    def _indexer(self, source_type: str) -> Indexer:
+        """Get the Indexer of a source type, loading its saved index."""
+        indexer = self._indexers.get(source_type)
+        if indexer is None:
+            path = self._semantic_dir / INDEX_NAMES[source_type]
+            dimension = self.embedding_engine.get_dimension()
+            if Path(str(path) + ".index").exists():
+                store = VectorStore.load(path, dimension=dimension)
+            else:
+                store = VectorStore(dimension=dimension)
+            indexer = Indexer(
+                self.project_root, self.embedding_engine, store, batch_size=self.batch_size
+            )
+            self._indexers[source_type] = indexer
+        return indexer
+
+    def _has_pending(self) -> bool:
+        return bool(self._rescans) or any(self._pending.values())
+
+    def _has_retry(self) -> bool:
+        return bool(self._retry_rescans) or any(self._retry.values())
+
+    @staticmethod
+    def _queue(
+        pending: Dict[str, Set[str]],
+        rescans: Set[str],
+        source_type: str,
+        ids: Iterable[str] = (),
+        rescan: bool = False,
+    ) -> None:
+        """Add jobs to a queue (a rescan covers the single items of its source)."""
+        if rescan:
+            pending.pop(source_type, None)
+            rescans.add(source_type)
+        elif source_type not in rescans:
+            pending.setdefault(source_type, set()).update(ids)
+
+    @staticmethod
+    def _check_source_type(source_type: str) -> None:
+        if source_type not in INDEX_NAMES:
+            raise ValueError(
+                f"Unknown source_type: {source_type} (expected one of {list(INDEX_NAMES)})"
+            )
+
+
+def _matches(file_path: str, pattern: str) -> bool:
+    """Match a relative path like Path.glob() ("**/" also matches no directory)."""
+    if fnmatch(file_path, pattern):
+        return True
+    return pattern.startswith("**/") and fnmatch(file_path, pattern[3:])
@@ -4,9 +4,10 @@ Indexer for embedding KB entries, tasks, and code files.
 This module provides indexing functionality for semantic search:
 - Index Knowledge Base entries (title + content + tags)
 - Index tasks (name + description)
-- Index code files (file content)
+- Index memories (title + content + tags)
+- Index code files (chunks split on symbol boundaries or sliding windows)
 - Incremental updates (only reindex changed items)
-- Batch processing with progress tracking
+- Batched encoding with a single bulk add per source
 
 Example:
     >>> from pathlib import Path
@@ -22,16 +23,46 @@ Example:
     >>> print(counts)  # {"kb": 10, "tasks": 5, "files": 50}
 """
 
+import glob
 import hashlib
+import logging
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
 
 from clauxton.core.knowledge_base import KnowledgeBase
+from clauxton.core.memory_store import MemoryStore
 from clauxton.core.task_manager import TaskManager
+from clauxton.semantic.chunker import chunk_code
 from clauxton.semantic.embeddings import EmbeddingEngine
 from clauxton.semantic.vector_store import VectorStore
 
+logger = logging.getLogger(__name__)
+
+# Texts per EmbeddingEngine.encode call (sentence-transformers default)
+DEFAULT_BATCH_SIZE = 32
+
+# Index file name under .clauxton/semantic/ per source type
+INDEX_NAMES = {
+    "kb": "kb_index",
+    "task": "task_index",
+    "file": "file_index",
+    "memory": "memory_index",
+}
+
 
 class Indexer:
     """
@@ -42,14 +73,20 @@ class Indexer:
 
     Features:
     - Incremental updates (only reindex changed items)
-    - Batch processing for efficiency
+    - Batched encoding: changed items are encoded batch_size at a time and
+      bulk-added to the vector store in one call
     - Content hashing for change detection
     - Metadata tracking for each indexed item
+    - Code files are embedded as chunks (see clauxton.semantic.chunker),
+      each with its line range in metadata. A file that fits in one chunk
+      keeps its path as source_id; chunks of longer files use
+      "<path>#L<start>-L<end>".
 
     Attributes:
         project_root: Project root directory
         embedding_engine: Engine for generating embeddings
         vector_store: Store for embeddings and metadata
+        batch_size: Number of texts per encode call
         kb: KnowledgeBase instance
         task_manager: TaskManager instance
 
@@ -64,6 +101,7 @@ class Indexer:
         project_root: Path,
         embedding_engine: EmbeddingEngine,
         vector_store: VectorStore,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> None:
         """
         Initialize Indexer.
@@ -72,14 +110,23 @@ class Indexer:
             project_root: Project root directory
             embedding_engine: Engine for generating embeddings
             vector_store: Store for embeddings and metadata
+            batch_size: Number of texts per encode call. Only one batch of
+                texts is held in memory at a time.
+
+        Raises:
+            ValueError: If batch_size is less than 1
 
         Example:
             >>> from pathlib import Path
             >>> indexer = Indexer(Path("."), engine, store)
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
         self.project_root = Path(project_root)
         self.embedding_engine = embedding_engine
         self.vector_store = vector_store
+        self.batch_size = batch_size
         self.kb = KnowledgeBase(self.project_root)
         self.task_manager = TaskManager(self.project_root)
 
@@ -98,10 +145,288 @@ class Indexer:
             >>> print(f"Indexed {count} entries")
             Indexed 10 entries
         """
+        return self._add_in_batches(self._changed_kb_items(force), "kb_index")
+
+    def index_tasks(self, force: bool = False) -> int:
+        """
+        Index all tasks.
+
+        Args:
+            force: If True, reindex all tasks regardless of change status
+
+        Returns:
+            Number of tasks indexed (new or updated)
+
+        Example:
+            >>> count = indexer.index_tasks()
+            >>> print(f"Indexed {count} tasks")
+            Indexed 5 tasks
+        """
+        return self._add_in_batches(self._changed_task_items(force), "task_index")
+
+    def index_memories(self, force: bool = False) -> int:
+        """
+        Index all Memory entries.
+
+        Args:
+            force: If True, reindex all memories regardless of change status
+
+        Returns:
+            Number of memories indexed (new or updated)
+
+        Example:
+            >>> count = indexer.index_memories()
+            >>> print(f"Indexed {count} memories")
+            Indexed 12 memories
+        """
+        return self._add_in_batches(self._changed_memory_items(force), "memory_index")
+
+    def index_files(
+        self, file_patterns: List[str], force: bool = False
+    ) -> int:
+        """
+        Index code files matching patterns.
+
+        Files are split into chunks on symbol boundaries when the repository
+        map (.clauxton/map/) has symbols for them, otherwise into sliding
+        windows. All previous chunks of a re-indexed file are replaced.
+
+        Args:
+            file_patterns: List of glob patterns (e.g., ["**/*.py", "**/*.ts"])
+            force: If True, reindex all files regardless of change status
+
+        Returns:
+            Number of files indexed (new or updated)
+
+        Example:
+            >>> count = indexer.index_files(["**/*.py"])
+            >>> print(f"Indexed {count} Python files")
+            Indexed 50 Python files
+        """
+        replaced: List[str] = []
+        return self._add_in_batches(
+            self._changed_file_items(file_patterns, force, replaced),
+            "file_index",
+            replaced,
+        )
+
+    def index_all(
+        self,
+        file_patterns: Optional[List[str]] = None,
+        force: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Index all sources (KB, tasks, files).
+
+        Args:
+            file_patterns: Patterns for files to index (default: ["**/*.py"])
+            force: If True, reindex all items regardless of change status
+
+        Returns:
+            Dictionary with counts by source type
+
+        Example:
+            >>> counts = indexer.index_all()
+            >>> print(counts)
+            {'kb': 10, 'tasks': 5, 'files': 50}
+        """
+        if file_patterns is None:
+            file_patterns = ["**/*.py"]
+
+        kb_count = self.index_knowledge_base(force=force)
+        task_count = self.index_tasks(force=force)
+        file_count = self.index_files(file_patterns, force=force)
+
+        return {
+            "kb": kb_count,
+            "tasks": task_count,
+            "files": file_count,
+        }
+
+    def index_sources(self, source_type: str, source_ids: Iterable[str]) -> int:
+        """
+        Re-index specific items of one source type.
+
+        Items that no longer exist are removed from the index; the others
+        are re-encoded if their content changed. For files, source ids are
+        paths relative to the project root, and all chunks of a file are
+        replaced.
+
+        Args:
+            source_type: Type of the items ("kb", "task", "file", "memory")
+            source_ids: Ids of the items (KB/task/memory ids or file paths)
+
+        Returns:
+            Number of items indexed (new or updated)
+
+        Raises:
+            ValueError: If source_type is unknown
+
+        Example:
+            >>> indexer.index_sources("file", ["src/auth.py"])
+            1
+        """
+        if source_type not in INDEX_NAMES:
+            raise ValueError(
+                f"Unknown source_type: {source_type} (expected one of {list(INDEX_NAMES)})"
+            )
+        only = set(source_ids)
+        if not only:
+            return 0
+
+        replaced: List[str] = []
+        items: Iterable[Tuple[str, Dict[str, Any]]]
+        if source_type == "file":
+            existing = [
+                meta
+                for meta in self.vector_store.metadata
+                if meta.get("source_type") == "file"
+                and (meta.get("file_path") or meta.get("source_id")) in only
+            ]
+            # Chunks of deleted files; changed files add theirs while indexing
+            replaced.extend(
+                meta["source_id"]
+                for meta in existing
+                if not (self.project_root / (meta.get("file_path") or meta["source_id"])).is_file()
+            )
+            patterns = [glob.escape(path) for path in sorted(only)]
+            items = self._changed_file_items(patterns, False, replaced)
+        else:
+            changed = {
+                "kb": self._changed_kb_items,
+                "task": self._changed_task_items,
+                "memory": self._changed_memory_items,
+            }[source_type]
+            items = changed(False, only)
+            indexed = self._get_existing_metadata(source_type)
+            current = self._current_ids(source_type)
+            replaced.extend(
+                source_id for source_id in only if source_id in indexed and source_id not in current
+            )
+
+        return self._add_in_batches(items, INDEX_NAMES[source_type], replaced)
+
+    def clear_index(self, source_type: Optional[str] = None) -> int:
+        """
+        Clear index for a specific source type or all sources.
+
+        Args:
+            source_type: Type to clear ("kb", "task", "file"), or None for all
+
+        Returns:
+            Number of items removed
+
+        Example:
+            >>> count = indexer.clear_index("kb")
+            >>> print(f"Removed {count} KB entries from index")
+        """
+        if source_type is None:
+            # Clear all
+            initial_size = self.vector_store.size()
+            self.vector_store.clear()
+            path = self.project_root / ".clauxton" / "semantic" / "index"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.vector_store.save(path)
+            return initial_size
+
+        # Clear specific source type
+        removed = self.vector_store.remove(
+            meta["source_id"]
+            for meta in self.vector_store.metadata
+            if meta.get("source_type") == source_type
+        )
+
+        if removed > 0:
+            path = self.project_root / ".clauxton" / "semantic" / "index"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.vector_store.save(path)
+
+        return removed
+
+    # ========================================================================
+    # Helper Methods
+    # ========================================================================
+
+    def _add_in_batches(
+        self,
+        items: Iterable[Tuple[str, Dict[str, Any]]],
+        index_name: str,
+        replaced: Sequence[str] = (),
+    ) -> int:
+        """
+        Encode changed items in batches and bulk-upsert them into the store.
+
+        Texts are encoded batch_size at a time and released after each
+        batch; only the embeddings are kept until the single upsert call,
+        which replaces the previous vectors of re-indexed items.
+
+        Args:
+            items: (text, metadata) pairs to index
+            index_name: File name under .clauxton/semantic/ to save to
+            replaced: Source ids to remove before the upsert. May be filled
+                while items is consumed (previous chunks of changed files).
+
+        Returns:
+            Number of items indexed (a chunked file counts once)
+        """
+        chunks: List[np.ndarray] = []
+        metadata: List[Dict[str, Any]] = []
+        batch: List[str] = []
+
+        for text, meta in items:
+            batch.append(text)
+            metadata.append(meta)
+            if len(batch) >= self.batch_size:
+                chunks.append(self._encode_batch(batch))
+                batch = []
+        if batch:
+            chunks.append(self._encode_batch(batch))
+
+        removed = self.vector_store.remove(replaced)
+        if not metadata and not removed:
+            return 0
+
+        if metadata:
+            embeddings = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+            self.vector_store.upsert(embeddings, metadata)
+
+        path = self.project_root / ".clauxton" / "semantic" / index_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.vector_store.save(path)
+
+        return sum(1 for meta in metadata if meta.get("chunk_index", 0) == 0)
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode one batch of texts as float32.
+
+        Args:
+            texts: Texts to encode (at most batch_size)
+
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        embeddings = self.embedding_engine.encode(texts, batch_size=self.batch_size)
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _changed_kb_items(
+        self, force: bool, only: Optional[AbstractSet[str]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield KB entries that need (re)indexing.
+
+        Args:
+            force: If True, yield all entries regardless of change status
+            only: If given, consider only the entries with these ids
+
+        Yields:
+            (text, metadata) per entry
+        """
         # Invalidate cache to ensure we get latest entries from disk
         self.kb._invalidate_cache()
         entries = self.kb.list_all()
-        indexed_count = 0
+        if only is not None:
+            entries = [entry for entry in entries if entry.id in only]
 
         # Build existing metadata map for quick lookup
         existing = self._get_existing_metadata("kb")
@@ -127,9 +452,6 @@ class Indexer:
                 if existing_meta and existing_meta.get("content_hash") == content_hash:
                     continue
 
-            # Generate embedding
-            embedding = self.embedding_engine.encode([text])[0]
-
             # Create metadata
             metadata = {
                 "source_type": "kb",
@@ -142,62 +464,43 @@ class Indexer:
                 "content_hash": content_hash,
             }
 
-            # Add to vector store (metadata as list)
-            self.vector_store.add(embedding, [metadata])
-            indexed_count += 1
-
-        # Save vector store if any updates
-        if indexed_count > 0:
-            path = self.project_root / ".clauxton" / "semantic" / "kb_index"
-            path.parent.mkdir(parents=True, exist_ok=True)
-            self.vector_store.save(path)
-
-        return indexed_count
+            yield text, metadata
 
-    def index_tasks(self, force: bool = False) -> int:
+    def _changed_task_items(
+        self, force: bool, only: Optional[AbstractSet[str]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        Index all tasks.
+        Yield tasks that need (re)indexing.
 
         Args:
-            force: If True, reindex all tasks regardless of change status
+            force: If True, yield all tasks regardless of change status
+            only: If given, consider only the tasks with these ids
 
-        Returns:
-            Number of tasks indexed (new or updated)
-
-        Example:
-            >>> count = indexer.index_tasks()
-            >>> print(f"Indexed {count} tasks")
-            Indexed 5 tasks
+        Yields:
+            (text, metadata) per task
         """
         # Invalidate cache to ensure we get latest tasks from disk
         self.task_manager._invalidate_cache()
         tasks = self.task_manager.list_all()
-        indexed_count = 0
+        if only is not None:
+            tasks = [task for task in tasks if task.id in only]
 
         # Build existing metadata map
         existing = self._get_existing_metadata("task")
 
         for task in tasks:
-            # Check if needs reindexing
-            if not force:
-                # For tasks, we use created_at as the timestamp (tasks don't have updated_at)
-                # So we check if the task already exists in the index
-                existing_meta = existing.get(task.id)
-                if existing_meta:
-                    # Check content hash instead of timestamp
-                    text = self._extract_task_text(task)
-                    content_hash = self._hash_content(text)
-                    if existing_meta.get("content_hash") == content_hash:
-                        continue
-
             # Extract text for embedding
             text = self._extract_task_text(task)
 
             # Generate content hash
             content_hash = self._hash_content(text)
 
-            # Generate embedding
-            embedding = self.embedding_engine.encode([text])[0]
+            # Check if needs reindexing
+            if not force:
+                # Tasks don't have updated_at, so compare content hashes
+                existing_meta = existing.get(task.id)
+                if existing_meta and existing_meta.get("content_hash") == content_hash:
+                    continue
 
             # Create metadata
             metadata = {
@@ -211,46 +514,102 @@ class Indexer:
                 "content_hash": content_hash,
             }
 
-            # Add to vector store (metadata as list)
-            self.vector_store.add(embedding, [metadata])
-            indexed_count += 1
+            yield text, metadata
 
-        # Save vector store if any updates
-        if indexed_count > 0:
-            path = self.project_root / ".clauxton" / "semantic" / "task_index"
-            path.parent.mkdir(parents=True, exist_ok=True)
-            self.vector_store.save(path)
+    def _changed_memory_items(
+        self, force: bool, only: Optional[AbstractSet[str]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield Memory entries that need (re)indexing.
 
-        return indexed_count
+        Args:
+            force: If True, yield all memories regardless of change status
+            only: If given, consider only the memories with these ids
 
-    def index_files(
-        self, file_patterns: List[str], force: bool = False
-    ) -> int:
+        Yields:
+            (text, metadata) per memory
         """
-        Index code files matching patterns.
+        entries = self._load_memories()
+        if only is not None:
+            entries = [entry for entry in entries if entry.id in only]
+
+        existing = self._get_existing_metadata("memory")
+
+        for entry in entries:
+            text = self._extract_memory_text(entry)
+            content_hash = self._hash_content(text)
+
+            if not force:
+                existing_meta = existing.get(entry.id)
+                if existing_meta and existing_meta.get("content_hash") == content_hash:
+                    continue
+
+            metadata = {
+                "source_type": "memory",
+                "source_id": entry.id,
+                "title": entry.title,
+                "memory_type": entry.type,
+                "category": entry.category,
+                "tags": entry.tags,
+                "updated_at": entry.updated_at.isoformat(),
+                "indexed_at": datetime.now().isoformat(),
+                "content_hash": content_hash,
+            }
+
+            yield text, metadata
+
+    def _load_memories(self) -> List[Any]:
+        """Load Memory entries from disk (none if no memory was ever saved)."""
+        clauxton_dir = self.project_root / ".clauxton"
+        if not any((clauxton_dir / name).exists() for name in ("memories.yml", "memories.wal")):
+            return []
+        return MemoryStore(self.project_root).load_all()
+
+    def _current_ids(self, source_type: str) -> AbstractSet[str]:
+        """
+        Get the ids of the KB entries, tasks or memories that exist now.
 
         Args:
-            file_patterns: List of glob patterns (e.g., ["**/*.py", "**/*.ts"])
-            force: If True, reindex all files regardless of change status
+            source_type: Type of source ("kb", "task", "memory")
 
         Returns:
-            Number of files indexed (new or updated)
+            Set of item ids
+        """
+        if source_type == "kb":
+            self.kb._invalidate_cache()
+            return {entry.id for entry in self.kb.list_all()}
+        if source_type == "task":
+            self.task_manager._invalidate_cache()
+            return {task.id for task in self.task_manager.list_all()}
+        return {entry.id for entry in self._load_memories()}
+
+    def _changed_file_items(
+        self, file_patterns: List[str], force: bool, replaced: List[str]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield chunks of code files that need (re)indexing.
 
-        Example:
-            >>> count = indexer.index_files(["**/*.py"])
-            >>> print(f"Indexed {count} Python files")
-            Indexed 50 Python files
+        Args:
+            file_patterns: List of glob patterns
+            force: If True, yield all files regardless of change status
+            replaced: Receives the source ids of the previous chunks of
+                each yielded file
+
+        Yields:
+            (chunk text, metadata) per chunk
         """
-        indexed_count = 0
+        # Build existing chunk map (file path -> chunk metadata)
+        existing: Dict[str, List[Dict[str, Any]]] = {}
+        for meta in self.vector_store.metadata:
+            if meta.get("source_type") == "file" and meta.get("source_id"):
+                file_key = meta.get("file_path") or meta["source_id"]
+                existing.setdefault(file_key, []).append(meta)
 
-        # Build existing metadata map
-        existing = self._get_existing_metadata("file")
+        symbols = self._load_file_symbols()
 
         for pattern in file_patterns:
             # Find matching files
-            files = list(self.project_root.glob(pattern))
-
-            for file_path in files:
+            for file_path in self.project_root.glob(pattern):
                 # Skip non-files
                 if not file_path.is_file():
                     continue
@@ -268,25 +627,9 @@ class Indexer:
 
                 source_id = str(rel_path)
 
-                # Check if needs reindexing
-                if not force:
-                    existing_meta = existing.get(source_id)
-                    if existing_meta:
-                        # Check file modification time
-                        mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        if not self._needs_reindex(existing_meta, mtime):
-                            # Also check content hash for extra safety
-                            try:
-                                text = file_path.read_text(encoding="utf-8")
-                                content_hash = self._hash_content(text)
-                                if existing_meta.get("content_hash") == content_hash:
-                                    continue
-                            except (UnicodeDecodeError, OSError):
-                                # Skip files that can't be read
-                                continue
-
                 # Read file content
                 try:
+                    mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
                     text = file_path.read_text(encoding="utf-8")
                 except (UnicodeDecodeError, OSError):
                     # Skip files that can't be read as text
@@ -299,120 +642,62 @@ class Indexer:
                 # Generate content hash
                 content_hash = self._hash_content(text)
 
-                # Generate embedding
-                embedding = self.embedding_engine.encode([text])[0]
-
-                # Create metadata
-                metadata = {
-                    "source_type": "file",
-                    "source_id": source_id,
-                    "file_path": str(rel_path),
-                    "extension": file_path.suffix,
-                    "updated_at": datetime.fromtimestamp(
-                        file_path.stat().st_mtime
-                    ).isoformat(),
-                    "indexed_at": datetime.now().isoformat(),
-                    "content_hash": content_hash,
-                }
-
-                # Add to vector store (metadata as list)
-                self.vector_store.add(embedding, [metadata])
-                indexed_count += 1
-
-        # Save vector store if any updates
-        if indexed_count > 0:
-            path = self.project_root / ".clauxton" / "semantic" / "file_index"
-            path.parent.mkdir(parents=True, exist_ok=True)
-            self.vector_store.save(path)
-
-        return indexed_count
-
-    def index_all(
-        self,
-        file_patterns: Optional[List[str]] = None,
-        force: bool = False,
-    ) -> Dict[str, int]:
-        """
-        Index all sources (KB, tasks, files).
-
-        Args:
-            file_patterns: Patterns for files to index (default: ["**/*.py"])
-            force: If True, reindex all items regardless of change status
-
-        Returns:
-            Dictionary with counts by source type
-
-        Example:
-            >>> counts = indexer.index_all()
-            >>> print(counts)
-            {'kb': 10, 'tasks': 5, 'files': 50}
-        """
-        if file_patterns is None:
-            file_patterns = ["**/*.py"]
-
-        kb_count = self.index_knowledge_base(force=force)
-        task_count = self.index_tasks(force=force)
-        file_count = self.index_files(file_patterns, force=force)
-
-        return {
-            "kb": kb_count,
-            "tasks": task_count,
-            "files": file_count,
-        }
+                # Check if needs reindexing (all chunks share file metadata)
+                previous = existing.get(source_id, [])
+                if not force and previous:
+                    existing_meta = previous[0]
+                    if (
+                        not self._needs_reindex(existing_meta, mtime)
+                        and existing_meta.get("content_hash") == content_hash
+                    ):
+                        continue
 
-    def clear_index(self, source_type: Optional[str] = None) -> int:
+                replaced.extend(meta["source_id"] for meta in previous)
+                chunks = chunk_code(text, symbols.get(source_id))
+                indexed_at = datetime.now().isoformat()
+
+                for chunk_index, chunk in enumerate(chunks):
+                    chunk_id = (
+                        source_id
+                        if len(chunks) == 1
+                        else f"{source_id}#L{chunk['line_start']}-L{chunk['line_end']}"
+                    )
+                    metadata = {
+                        "source_type": "file",
+                        "source_id": chunk_id,
+                        "file_path": str(rel_path),
+                        "extension": file_path.suffix,
+                        "updated_at": mtime.isoformat(),
+                        "indexed_at": indexed_at,
+                        "content_hash": content_hash,
+                        "chunk_index": chunk_index,
+                        "chunk_count": len(chunks),
+                        "line_start": chunk["line_start"],
+                        "line_end": chunk["line_end"],
+                        "symbols": chunk["symbols"],
+                    }
+
+                    # Prefix the path so chunks keep their file context
+                    yield f"{rel_path}\n{chunk['text']}", metadata
+
+    def _load_file_symbols(self) -> Mapping[str, List[Dict[str, Any]]]:
         """
-        Clear index for a specific source type or all sources.
-
-        Args:
-            source_type: Type to clear ("kb", "task", "file"), or None for all
+        Load symbols from the repository map, if one has been built.
 
         Returns:
-            Number of items removed
-
-        Example:
-            >>> count = indexer.clear_index("kb")
-            >>> print(f"Removed {count} KB entries from index")
+            Mapping of relative file path to symbol dicts (empty if the
+            repository has not been indexed)
         """
-        if source_type is None:
-            # Clear all
-            initial_size = self.vector_store.size()
-            self.vector_store.clear()
-            path = self.project_root / ".clauxton" / "semantic" / "index"
-            path.parent.mkdir(parents=True, exist_ok=True)
-            self.vector_store.save(path)
-            return initial_size
-
-        # Clear specific source type
-        removed = 0
-        all_metadata = self.vector_store.metadata
-
-        for i, meta in enumerate(all_metadata):
-            if meta.get("source_type") == source_type:
-                # Mark for removal (we'll rebuild the store)
-                removed += 1
-
-        if removed > 0:
-            # Rebuild store without the removed items
-            new_store = VectorStore(dimension=self.vector_store.dimension)
-
-            for i, meta in enumerate(all_metadata):
-                if meta.get("source_type") != source_type:
-                    # Keep this item
-                    vectors = self.vector_store.index.reconstruct_n(i, 1)
-                    new_store.add(vectors[0], [meta])
+        if not (self.project_root / ".clauxton" / "map" / "index.json").exists():
+            return {}
 
-            # Replace store
-            self.vector_store = new_store
-            path = self.project_root / ".clauxton" / "semantic" / "index"
-            path.parent.mkdir(parents=True, exist_ok=True)
-            self.vector_store.save(path)
-
-        return removed
+        from clauxton.intelligence.repository_map import RepositoryMap
 
-    # ========================================================================
-    # Helper Methods
-    # ========================================================================
+        try:
+            return RepositoryMap(self.project_root).symbols_data
+        except Exception as e:
+            logger.warning(f"Cannot read repository map symbols, using line windows: {e}")
+            return {}
 
     def _get_existing_metadata(self, source_type: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -498,3 +783,16 @@ class Indexer:
         """
         description = task.description or ""
         return f"{task.name}\n{description}".strip()
+
+    def _extract_memory_text(self, entry: Any) -> str:
+        """
+        Extract text from Memory entry for embedding.
+
+        Args:
+            entry: MemoryEntry
+
+        Returns:
+            Combined text (title + content + tags)
+        """
+        tags_text = " ".join(entry.tags) if entry.tags else ""
+        return f"{entry.title}\n{entry.content}\n{tags_text}".strip()
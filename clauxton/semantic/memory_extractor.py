@@ -10,6 +10,7 @@ Key Features:
 - Confidence scoring for auto-extracted memories
 - Auto-add to Memory system
 - Handle edge cases (merge commits, initial commits, empty diffs)
+- Analyze commits in worker processes for long histories (workers=)
 
 Example:
     >>> from pathlib import Path
@@ -21,13 +22,22 @@ Example:
     >>> extractor.extract_from_recent_commits(since_days=7, auto_add=True)
 """
 
+import os
 import re
 from pathlib import Path
-from typing import Any, List, Optional, Set
+from typing import Any, List, Optional
 
 from clauxton.analysis.git_analyzer import CommitInfo, GitAnalyzer
+from clauxton.analysis.parallel import map_commits
+from clauxton.analysis.pattern_bank import PatternBank, keywords
 from clauxton.core.memory import Memory, MemoryEntry
 
+# ID of analyzed memories until _assign_ids() numbers them in commit order
+PENDING_MEMORY_ID = "MEM-00000000-000"
+
+# Per-process MemoryExtractor used by pool workers (built on first task)
+_worker_extractor: Optional["MemoryExtractor"] = None
+
 # Conventional commit patterns
 DECISION_PATTERNS = {
     # Migration/refactoring (high confidence: 0.9)
@@ -84,6 +94,46 @@ PATTERN_THRESHOLDS: dict[str, Any] = {
     },
 }
 
+# Keywords extracted as tags from commit messages
+TAG_KEYWORDS = [
+    "api", "authentication", "auth", "jwt", "oauth", "database", "db",
+    "cache", "redis", "postgres", "postgresql", "mysql", "mongodb", "ui",
+    "frontend", "backend", "rest", "graphql", "websocket", "docker",
+    "kubernetes", "k8s", "ci", "cd", "test", "testing", "security",
+    "performance", "optimization", "migration", "refactor", "bug", "fix",
+]
+
+# Compiled rules (see clauxton.analysis.pattern_bank)
+_DECISION_BANK = PatternBank(DECISION_PATTERNS)
+_API_PATH_BANK = PatternBank(
+    {"api": keywords(["api", "endpoint", "route", "handler", "controller"])},
+    flags=re.IGNORECASE,
+)
+_DATABASE_PATH_BANK = PatternBank({"database": PATTERN_THRESHOLDS["database"]["patterns"]})
+_TEST_PATH_BANK = PatternBank({"test": PATTERN_THRESHOLDS["test"]["patterns"]})
+_TAG_BANK = PatternBank({tag: keywords([tag]) for tag in TAG_KEYWORDS}, flags=re.IGNORECASE)
+_MESSAGE_CATEGORY_BANK = PatternBank(
+    {
+        "architecture": keywords(["architect", "design", "pattern"]),
+        "api": keywords(["api", "endpoint", "route"]),
+        "database": keywords(["database", "migration", "schema"]),
+        "ui": keywords(["ui", "frontend", "component"]),
+        "test": keywords(["test", "testing"]),
+        "security": keywords(["security", "auth"]),
+        "performance": keywords(["performance", "optimize"]),
+    },
+    flags=re.IGNORECASE,
+)
+_FILE_CATEGORY_BANK = PatternBank(
+    {
+        "api": keywords(["api"]),
+        "test": keywords(["test"]),
+        "ui": keywords(["ui", "frontend"]),
+        "database": keywords(["migration", "schema"]),
+    },
+    flags=re.IGNORECASE,
+)
+
 
 class MemoryExtractorError(Exception):
     """Base exception for MemoryExtractor errors."""
@@ -135,7 +185,7 @@ class MemoryExtractor:
         """
         Extract memories from a single commit.
 
-        Analyzes commit message for decisions and diff for patterns.
+        Analyzes commit message for decisions and changed files for patterns.
 
         Args:
             commit_sha: Commit SHA hash
@@ -151,9 +201,22 @@ class MemoryExtractor:
             >>> memories[0].type
             'decision'
         """
-        # Get commit info
-        commit_info = self.git_analyzer.analyze_commit(commit_sha)
+        # Patterns are detected from file paths, so the patch is not needed
+        commit_info = self.git_analyzer.analyze_commit(commit_sha, include_patch=False)
+        return self._extract_from_commit_info(commit_info, auto_add)
 
+    def _extract_from_commit_info(
+        self, commit_info: CommitInfo, auto_add: bool
+    ) -> List[MemoryEntry]:
+        """Extract memories from an analyzed commit (see extract_from_commit())."""
+        memories = self._analyze_commit(commit_info)
+        self._assign_ids(memories)
+        if auto_add:
+            self._add_memories(memories)
+        return memories
+
+    def _analyze_commit(self, commit_info: CommitInfo) -> List[MemoryEntry]:
+        """Extract memories of one commit, with PENDING_MEMORY_ID as ID."""
         memories: List[MemoryEntry] = []
 
         # Extract decision from commit message
@@ -165,26 +228,40 @@ class MemoryExtractor:
         patterns = self._detect_patterns(commit_info.diff, commit_info)
         memories.extend(patterns)
 
-        # Auto-add if requested
-        if auto_add:
-            for memory in memories:
-                try:
-                    self.memory.add(memory)
-                except Exception:
-                    # Skip if already exists or validation fails
-                    pass
-
         return memories
 
+    def _assign_ids(self, memories: List[MemoryEntry]) -> None:
+        """Number memories after the last stored ID of today, in list order."""
+        if not memories:
+            return
+        prefix, number = self._generate_memory_id().rsplit("-", 1)
+        for offset, memory in enumerate(memories):
+            memory.id = f"{prefix}-{int(number) + offset:03d}"
+
+    def _add_memories(self, memories: List[MemoryEntry]) -> None:
+        """Add memories to the Memory system."""
+        for memory in memories:
+            try:
+                self.memory.add(memory)
+            except Exception:
+                # Skip if already exists or validation fails
+                pass
+
     def extract_from_recent_commits(
-        self, since_days: int = 7, auto_add: bool = False
+        self, since_days: int = 7, auto_add: bool = False, workers: Optional[int] = None
     ) -> List[MemoryEntry]:
         """
         Extract memories from recent commits.
 
+        Commits are analyzed in worker processes when workers > 1; results
+        are merged in commit order (newest first), so memories and their
+        IDs are the same in any mode.
+
         Args:
             since_days: Number of days to look back (default: 7)
             auto_add: If True, automatically add to Memory system
+            workers: Number of analysis processes (None/1 = in-process,
+                0 = CPU count)
 
         Returns:
             List of extracted MemoryEntry objects
@@ -194,13 +271,17 @@ class MemoryExtractor:
             >>> len(memories)
             10
         """
-        commits = self.git_analyzer.get_recent_commits(since_days=since_days)
-
-        all_memories: List[MemoryEntry] = []
+        commits = self.git_analyzer.get_recent_commits(
+            since_days=since_days, include_patch=False
+        )
 
-        for commit_info in commits:
-            memories = self.extract_from_commit(commit_info.sha, auto_add=auto_add)
-            all_memories.extend(memories)
+        results = map_commits(
+            self._analyze_commit, _analyze_chunk, self.project_root, commits, workers
+        )
+        all_memories = [memory for memories in results for memory in memories]
+        self._assign_ids(all_memories)
+        if auto_add:
+            self._add_memories(all_memories)
 
         return all_memories
 
@@ -236,35 +317,29 @@ class MemoryExtractor:
         # Get body (if exists)
         body = "\n".join(lines[1:]).strip() if len(lines) > 1 else ""
 
-        decision_type: Optional[str] = None
         confidence = 0.5
         extracted_content: Optional[str] = None
 
-        # Try to match decision patterns
-        for pattern_type, patterns in DECISION_PATTERNS.items():
-            for pattern in patterns:
+        # Try to match decision patterns (first type in DECISION_PATTERNS order)
+        decision_type = _DECISION_BANK.first(subject)
+        if decision_type:
+            for pattern in DECISION_PATTERNS[decision_type]:
                 match = re.search(pattern, subject)
                 if match:
-                    decision_type = pattern_type
                     extracted_content = match.group(1) if match.groups() else subject
-                    # Set confidence based on pattern type
-                    if pattern_type == "migration":
-                        confidence = 0.9
-                    elif pattern_type in ["feature", "architecture"]:
-                        confidence = 0.8
-                    else:
-                        confidence = 0.7
                     break
-            if decision_type:
-                break
+            # Set confidence based on pattern type
+            if decision_type == "migration":
+                confidence = 0.9
+            elif decision_type in ["feature", "architecture"]:
+                confidence = 0.8
+            else:
+                confidence = 0.7
 
         # No decision pattern matched
         if not decision_type or not extracted_content:
             return None
 
-        # Generate memory ID
-        memory_id = self._generate_memory_id()
-
         # Extract tags from commit message
         tags = self._extract_tags(commit_message)
 
@@ -281,7 +356,7 @@ class MemoryExtractor:
 
         # Create MemoryEntry
         return MemoryEntry(
-            id=memory_id,
+            id=PENDING_MEMORY_ID,
             type="decision",
             title=extracted_content[:200],  # Limit to 200 chars
             content=content,
@@ -332,11 +407,7 @@ class MemoryExtractor:
         api_files = [
             f
             for f in commit.files
-            if Path(f).suffix in api_extensions
-            and any(
-                keyword in f.lower()
-                for keyword in ["api", "endpoint", "route", "handler", "controller"]
-            )
+            if os.path.splitext(f)[1] in api_extensions and _API_PATH_BANK.search(f)
         ]
         if len(api_files) >= api_files_threshold:
             pattern = self._create_pattern_memory(
@@ -355,7 +426,7 @@ class MemoryExtractor:
         ui_files = [
             f
             for f in commit.files
-            if Path(f).suffix in ui_extensions
+            if os.path.splitext(f)[1] in ui_extensions
         ]
         if len(ui_files) >= ui_files_threshold:
             pattern = self._create_pattern_memory(
@@ -369,13 +440,8 @@ class MemoryExtractor:
 
         # Check database pattern
         db_threshold = PATTERN_THRESHOLDS["database"]
-        db_patterns: list[str] = db_threshold["patterns"]
         db_files_threshold: int = db_threshold["files"]
-        db_files = [
-            f
-            for f in file_paths
-            if any(re.search(p, f) for p in db_patterns)
-        ]
+        db_files = [f for f in file_paths if _DATABASE_PATH_BANK.search(f)]
         if len(db_files) >= db_files_threshold:
             pattern = self._create_pattern_memory(
                 pattern_type="database",
@@ -388,13 +454,8 @@ class MemoryExtractor:
 
         # Check test pattern
         test_threshold = PATTERN_THRESHOLDS["test"]
-        test_patterns: list[str] = test_threshold["patterns"]
         test_files_threshold: int = test_threshold["files"]
-        test_files = [
-            f
-            for f in file_paths
-            if any(re.search(p, f) for p in test_patterns)
-        ]
+        test_files = [f for f in file_paths if _TEST_PATH_BANK.search(f)]
         if len(test_files) >= test_files_threshold:
             pattern = self._create_pattern_memory(
                 pattern_type="test",
@@ -428,8 +489,6 @@ class MemoryExtractor:
         Returns:
             MemoryEntry object
         """
-        memory_id = self._generate_memory_id()
-
         # Build content
         content_parts = [
             f"Pattern detected: {pattern_type}",
@@ -448,7 +507,7 @@ class MemoryExtractor:
         tags = [pattern_type, "auto-detected"]
 
         return MemoryEntry(
-            id=memory_id,
+            id=PENDING_MEMORY_ID,
             type="pattern",
             title=title,
             content=content,
@@ -476,51 +535,7 @@ class MemoryExtractor:
             >>> tags
             ['authentication', 'jwt']
         """
-        # Common keywords to extract as tags
-        keywords = [
-            "api",
-            "authentication",
-            "auth",
-            "jwt",
-            "oauth",
-            "database",
-            "db",
-            "cache",
-            "redis",
-            "postgres",
-            "postgresql",
-            "mysql",
-            "mongodb",
-            "ui",
-            "frontend",
-            "backend",
-            "rest",
-            "graphql",
-            "websocket",
-            "docker",
-            "kubernetes",
-            "k8s",
-            "ci",
-            "cd",
-            "test",
-            "testing",
-            "security",
-            "performance",
-            "optimization",
-            "migration",
-            "refactor",
-            "bug",
-            "fix",
-        ]
-
-        text_lower = text.lower()
-        tags: Set[str] = set()
-
-        for keyword in keywords:
-            if keyword in text_lower:
-                tags.add(keyword)
-
-        return sorted(list(tags))
+        return sorted(_TAG_BANK.scan(text))
 
     def _determine_category(self, commit_message: str, files: List[str]) -> str:
         """
@@ -538,37 +553,13 @@ class MemoryExtractor:
             >>> category
             'api'
         """
-        message_lower = commit_message.lower()
-
-        # Check for explicit categories in message
-        if any(word in message_lower for word in ["architect", "design", "pattern"]):
-            return "architecture"
-        if any(word in message_lower for word in ["api", "endpoint", "route"]):
-            return "api"
-        if any(word in message_lower for word in ["database", "migration", "schema"]):
-            return "database"
-        if any(word in message_lower for word in ["ui", "frontend", "component"]):
-            return "ui"
-        if any(word in message_lower for word in ["test", "testing"]):
-            return "test"
-        if any(word in message_lower for word in ["security", "auth"]):
-            return "security"
-        if any(word in message_lower for word in ["performance", "optimize"]):
-            return "performance"
-
-        # Check files for category hints
-        file_paths = [f.lower() for f in files]
-        if any("api" in f for f in file_paths):
-            return "api"
-        if any("test" in f for f in file_paths):
-            return "test"
-        if any("ui" in f or "frontend" in f for f in file_paths):
-            return "ui"
-        if any("migration" in f or "schema" in f for f in file_paths):
-            return "database"
+        # Check for explicit categories in message, then files for hints
+        category = _MESSAGE_CATEGORY_BANK.first(commit_message)
+        if category is None:
+            category = _FILE_CATEGORY_BANK.first("\n".join(files))
 
         # Default category
-        return "general"
+        return category or "general"
 
     def _generate_memory_id(self) -> str:
         """
@@ -583,3 +574,24 @@ class MemoryExtractor:
             'MEM-20251103-001'
         """
         return self.memory._generate_memory_id()
+
+
+def _analyze_chunk(project_root: str, commits: List[CommitInfo]) -> List[List[MemoryEntry]]:
+    """
+    Extract memories of a chunk of commits (IDs are PENDING_MEMORY_ID).
+
+    Module-level so it can run in a ProcessPoolExecutor worker; each worker
+    process builds one MemoryExtractor on first use.
+
+    Args:
+        project_root: Project root directory
+        commits: Commits to analyze
+
+    Returns:
+        Memories per commit
+    """
+    global _worker_extractor
+
+    if _worker_extractor is None:
+        _worker_extractor = MemoryExtractor(Path(project_root))
+    return [_worker_extractor._analyze_commit(commit) for commit in commits]
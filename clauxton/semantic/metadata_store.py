@@ -0,0 +1,209 @@
+"""
+Binary metadata sidecar for VectorStore.
+
+Metadata used to be saved as one indented JSON list and parsed in full on
+every load, although a query only reads its top-k rows. The sidecar keeps
+each row as a compact JSON record and adds a fixed-width table to find it:
+
+    header   8s magic, uint64 row count
+    table    count x (int64 id, uint64 offset, uint64 length), ascending ids
+    blob     UTF-8 JSON records
+
+The file is memory-mapped on load; a row is decoded on first access, so
+opening a store costs O(1) in the amount of metadata.
+
+Example:
+    >>> write_metadata(Path("kb.metadata.bin"), [(0, b'{"source_id":"KB-1"}')])
+    >>> rows = MetadataFile(Path("kb.metadata.bin"))
+    >>> rows[0]
+    {'source_id': 'KB-1'}
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+MAGIC = b"CLXMETA1"
+_HEADER = struct.Struct("<8sQ")
+_ROW = np.dtype([("id", "<i8"), ("offset", "<u8"), ("length", "<u8")])
+
+
+def encode_row(metadata: Dict[str, Any]) -> bytes:
+    """Serialize one metadata row as compact JSON."""
+    return json.dumps(metadata, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_metadata(path: Path, rows: Iterable[Tuple[int, bytes]]) -> None:
+    """
+    Write a metadata sidecar atomically.
+
+    Args:
+        path: Target file
+        rows: (vector id, encoded row) pairs in ascending id order
+    """
+    ids: List[int] = []
+    records: List[bytes] = []
+    for vector_id, record in rows:
+        ids.append(vector_id)
+        records.append(record)
+
+    table = np.zeros(len(ids), dtype=_ROW)
+    table["id"] = ids
+    table["length"] = [len(record) for record in records]
+    if ids:
+        table["offset"][1:] = np.cumsum(table["length"][:-1])
+
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(ids)))
+        f.write(table.tobytes())
+        f.writelines(records)
+    os.replace(temp_path, path)
+
+
+class MetadataFile:
+    """
+    Read-only, memory-mapped metadata sidecar.
+
+    Decoded rows are cached, so repeated lookups of a row are cheap.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open a sidecar.
+
+        Args:
+            path: Sidecar file
+
+        Raises:
+            ValueError: If the file is not a metadata sidecar
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"Not a metadata file: {path}")
+        magic, count = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"Not a metadata file: {path}")
+
+        self._table = np.frombuffer(self._mmap, dtype=_ROW, count=count, offset=_HEADER.size)
+        self._blob_start = _HEADER.size + _ROW.itemsize * count
+        self._rows: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Ids of all rows, ascending."""
+        return self._table["id"]
+
+    def _position(self, vector_id: int) -> Optional[int]:
+        """Find the table position of an id."""
+        position = int(np.searchsorted(self.ids, vector_id))
+        if position < len(self.ids) and self.ids[position] == vector_id:
+            return position
+        return None
+
+    def __contains__(self, vector_id: object) -> bool:
+        return isinstance(vector_id, int) and self._position(vector_id) is not None
+
+    def raw(self, vector_id: int) -> bytes:
+        """
+        Get the encoded row of an id.
+
+        Raises:
+            KeyError: If the id is not in the file
+        """
+        position = self._position(vector_id)
+        if position is None:
+            raise KeyError(vector_id)
+        start = self._blob_start + int(self._table["offset"][position])
+        return self._mmap[start : start + int(self._table["length"][position])]
+
+    def __getitem__(self, vector_id: int) -> Dict[str, Any]:
+        row = self._rows.get(vector_id)
+        if row is None:
+            row = json.loads(self.raw(vector_id))
+            self._rows[vector_id] = row
+        return row
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+class MetadataTable(MutableMapping):  # type: ignore[type-arg]
+    """
+    Vector id -> metadata of a VectorStore.
+
+    Rows of a loaded sidecar are read on demand; rows added or removed
+    since are kept in memory. Iteration yields sidecar ids (ascending),
+    then added ids in insertion order.
+    """
+
+    def __init__(self, base: Optional[MetadataFile] = None) -> None:
+        """
+        Create a table.
+
+        Args:
+            base: Loaded sidecar, or None for an empty table
+        """
+        self._base = base
+        self._deleted: Set[int] = set()
+        self._added: Dict[int, Dict[str, Any]] = {}
+
+    def _in_base(self, vector_id: int) -> bool:
+        return (
+            self._base is not None
+            and vector_id not in self._deleted
+            and vector_id in self._base
+        )
+
+    def __getitem__(self, vector_id: int) -> Dict[str, Any]:
+        if vector_id in self._added:
+            return self._added[vector_id]
+        if self._base is not None and self._in_base(vector_id):
+            return self._base[vector_id]
+        raise KeyError(vector_id)
+
+    def __setitem__(self, vector_id: int, metadata: Dict[str, Any]) -> None:
+        if self._in_base(vector_id):
+            self._deleted.add(vector_id)
+        self._added[vector_id] = metadata
+
+    def __delitem__(self, vector_id: int) -> None:
+        if vector_id in self._added:
+            del self._added[vector_id]
+        elif self._in_base(vector_id):
+            self._deleted.add(vector_id)
+        else:
+            raise KeyError(vector_id)
+
+    def __contains__(self, vector_id: object) -> bool:
+        return isinstance(vector_id, int) and (
+            vector_id in self._added or self._in_base(vector_id)
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        if self._base is not None:
+            for vector_id in self._base.ids.tolist():
+                if vector_id not in self._deleted and vector_id not in self._added:
+                    yield vector_id
+        yield from self._added
+
+    def __len__(self) -> int:
+        base = len(self._base) - len(self._deleted) if self._base is not None else 0
+        return base + len(self._added)
+
+    def raw_items(self) -> Iterator[Tuple[int, bytes]]:
+        """Yield (id, encoded row) by ascending id, reusing unchanged rows' bytes."""
+        for vector_id in sorted(self):
+            if vector_id in self._added:
+                yield vector_id, encode_row(self._added[vector_id])
+            else:
+                assert self._base is not None
+                yield vector_id, self._base.raw(vector_id)
@@ -0,0 +1,163 @@
+"""
+Full-precision vector sidecar for quantized VectorStores.
+
+A quantized index (float16/int8, see IndexConfig.quantization) keeps only
+compressed vectors in memory. To re-rank its top candidates exactly, the
+float32 vectors are saved next to the index and memory-mapped on load, so
+they are read from disk for the few candidates of each query instead of
+being resident:
+
+    header   8s magic, uint64 row count, uint64 dimension
+    ids      count x int64, ascending
+    vectors  count x dimension x float32, in id order
+
+Example:
+    >>> raw = RawVectors(dimension=384)
+    >>> raw.add(np.array([0, 1]), embeddings)
+    >>> raw.write(Path("files.vectors.f32"), np.array([0, 1]))
+    >>> RawVectors.open(Path("files.vectors.f32"), 384).get(np.array([1]))
+"""
+
+import os
+import struct
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+MAGIC = b"CLXVEC01"
+_HEADER = struct.Struct("<8sQQ")
+
+# Rows written per chunk by write()
+_WRITE_CHUNK = 4096
+
+
+class RawVectors:
+    """
+    Float32 vectors by id: a memory-mapped file plus vectors added since.
+
+    Vectors are never dropped individually; write() saves only the ids it
+    is given, which drops removed vectors.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        """
+        Create an empty table.
+
+        Args:
+            dimension: Vector dimension
+        """
+        self.dimension = dimension
+        self._base_ids = np.empty(0, dtype=np.int64)
+        self._base = np.empty((0, dimension), dtype=np.float32)
+        # Added blocks (ids ascend across blocks), concatenated on lookup
+        self._blocks: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._added_ids = np.empty(0, dtype=np.int64)
+        self._added = np.empty((0, dimension), dtype=np.float32)
+
+    @classmethod
+    def open(cls, path: Path, dimension: int) -> "RawVectors":
+        """
+        Memory-map a sidecar written by write().
+
+        Args:
+            path: Sidecar file
+            dimension: Expected vector dimension
+
+        Returns:
+            RawVectors backed by the file
+
+        Raises:
+            ValueError: If the file is not a vector sidecar of this dimension
+        """
+        raw = cls(dimension)
+        mapped = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(mapped) < _HEADER.size:
+            raise ValueError(f"Not a vector file: {path}")
+        magic, count, stored_dimension = _HEADER.unpack(mapped[: _HEADER.size].tobytes())
+        if magic != MAGIC:
+            raise ValueError(f"Not a vector file: {path}")
+        if stored_dimension != dimension:
+            raise ValueError(
+                f"Vector file dimension mismatch: expected {dimension}, got {stored_dimension}"
+            )
+
+        raw._base_ids = np.frombuffer(mapped, dtype="<i8", count=count, offset=_HEADER.size)
+        raw._base = np.frombuffer(
+            mapped, dtype="<f4", count=count * dimension, offset=_HEADER.size + 8 * count
+        ).reshape(count, dimension)
+        return raw
+
+    def add(self, ids: np.ndarray, vectors: np.ndarray) -> None:
+        """
+        Add vectors under new ids (larger than every id stored so far).
+
+        Args:
+            ids: int64 ids, ascending
+            vectors: Array of shape (len(ids), dimension)
+        """
+        if len(ids):
+            self._blocks.append(
+                (np.array(ids, dtype=np.int64), np.array(vectors, dtype=np.float32))
+            )
+
+    def _consolidate(self) -> None:
+        """Merge added blocks into one array."""
+        if self._blocks:
+            block_ids, block_vectors = zip(*self._blocks)
+            self._added_ids = np.concatenate([self._added_ids, *block_ids])
+            self._added = np.concatenate([self._added, *block_vectors])
+            self._blocks.clear()
+
+    def ids(self) -> np.ndarray:
+        """Get the ids of all stored vectors, ascending."""
+        self._consolidate()
+        return np.sort(np.concatenate([self._base_ids, self._added_ids]))
+
+    def get(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Read the vectors of the given ids.
+
+        Args:
+            ids: int64 ids
+
+        Returns:
+            float32 array of shape (len(ids), dimension)
+
+        Raises:
+            KeyError: If an id is not stored
+        """
+        self._consolidate()
+        ids = np.asarray(ids, dtype=np.int64)
+        result = np.empty((len(ids), self.dimension), dtype=np.float32)
+        found = np.zeros(len(ids), dtype=bool)
+        for table_ids, vectors in ((self._base_ids, self._base), (self._added_ids, self._added)):
+            if len(table_ids) == 0:
+                continue
+            positions = np.minimum(np.searchsorted(table_ids, ids), len(table_ids) - 1)
+            hit = ~found & (table_ids[positions] == ids)
+            result[hit] = vectors[positions[hit]]
+            found |= hit
+        if not found.all():
+            raise KeyError(int(ids[~found][0]))
+        return result
+
+    def write(self, path: Path, ids: np.ndarray) -> None:
+        """
+        Write the vectors of the given ids atomically.
+
+        Args:
+            path: Target file
+            ids: int64 ids to keep, ascending
+        """
+        ids = np.asarray(ids, dtype="<i8")
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(ids), self.dimension))
+            f.write(ids.tobytes())
+            for start in range(0, len(ids), _WRITE_CHUNK):
+                f.write(self.get(ids[start : start + _WRITE_CHUNK]).astype("<f4").tobytes())
+        os.replace(temp_path, path)
+
+    def __len__(self) -> int:
+        return len(self._base_ids) + len(self._added_ids) + sum(len(i) for i, _ in self._blocks)
@@ -4,7 +4,8 @@ Semantic search engine for KB, tasks, and code files.
 This module provides semantic search capabilities using embeddings and vector similarity:
 - Search Knowledge Base entries by semantic meaning
 - Search tasks by description similarity
-- Search code files by content relevance
+- Search code files by content relevance (chunk hits merged per file)
+- Search Memory entries by semantic meaning
 - Unified search across all sources
 - Filtering by metadata (category, status, priority, etc.)
 - Ranking by relevance score
@@ -30,12 +31,46 @@ Example:
     >>> results = engine.search_all("user authentication", limit=10)
 """
 
+import threading
+import time
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 from clauxton.semantic.embeddings import EmbeddingEngine
 from clauxton.semantic.vector_store import VectorStore
 
+# Chunk hits fetched per requested file result (files have several chunks)
+FILE_CHUNK_FANOUT = 4
+
+# Loads of a store caught mid-save (files renamed one by one) before giving up
+STORE_LOAD_ATTEMPTS = 3
+STORE_LOAD_RETRY_DELAY = 0.05
+
+# (mtime_ns, size) of a store's index, metadata and config files; None if missing
+StoreStamp = Tuple[Optional[Tuple[int, int]], ...]
+
+
+def _store_stamp(base_path: Path) -> StoreStamp:
+    """
+    Stat the files of a saved VectorStore.
+
+    Args:
+        base_path: Store path without extension
+
+    Returns:
+        (mtime_ns, size) per store file
+    """
+    stamps: List[Optional[Tuple[int, int]]] = []
+    for suffix in (".index", ".metadata.bin", ".metadata.json", ".config.json", ".vectors.f32"):
+        try:
+            stat = base_path.with_suffix(suffix).stat()
+        except OSError:
+            stamps.append(None)
+            continue
+        stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
 
 class SearchResult(TypedDict):
     """
@@ -67,10 +102,13 @@ class SemanticSearchEngine:
 
     Features:
     - Multi-source search (KB, tasks, files)
-    - Metadata filtering (category, status, priority)
+    - Metadata filtering (category, status, priority, file pattern), pushed
+      down into the vector search so filtered queries still return limit hits
     - Relevance ranking
     - Configurable result limits
     - Content truncation for large results
+    - Warm store cache: loaded indexes are kept per path and reloaded only
+      when their files change on disk (mtime/size)
 
     Attributes:
         project_root: Project root directory
@@ -112,6 +150,9 @@ class SemanticSearchEngine:
             vector_store if vector_store is not None
             else VectorStore(dimension=384)
         )
+        # Loaded stores by base path, with the stamp they were loaded at
+        self._stores: Dict[Path, Tuple[StoreStamp, VectorStore]] = {}
+        self._stores_lock = threading.Lock()
 
     def search_kb(
         self,
@@ -140,13 +181,11 @@ class SemanticSearchEngine:
         """
         index_path = self.semantic_dir / "kb_index.index"
 
-        def filter_func(metadata: Dict[str, Any]) -> bool:
-            """Filter by category if specified."""
-            if category is None:
-                return True
-            return metadata.get("category") == category
+        where: Dict[str, Any] = {}
+        if category is not None:
+            where["category"] = category
 
-        return self._search_index(query, index_path, limit, filter_func)
+        return self._search_index(query, index_path, limit, where)
 
     def search_tasks(
         self,
@@ -179,15 +218,13 @@ class SemanticSearchEngine:
         """
         index_path = self.semantic_dir / "task_index.index"
 
-        def filter_func(metadata: Dict[str, Any]) -> bool:
-            """Filter by status and priority if specified."""
-            if status is not None and metadata.get("status") != status:
-                return False
-            if priority is not None and metadata.get("priority") != priority:
-                return False
-            return True
+        where: Dict[str, Any] = {}
+        if status is not None:
+            where["status"] = status
+        if priority is not None:
+            where["priority"] = priority
 
-        return self._search_index(query, index_path, limit, filter_func)
+        return self._search_index(query, index_path, limit, where)
 
     def search_files(
         self,
@@ -198,6 +235,10 @@ class SemanticSearchEngine:
         """
         Search code files by semantic similarity.
 
+        Files are indexed as chunks. Chunk hits are merged per file: a file
+        is scored by its best chunk, and metadata["matches"] lists its
+        matching chunks (line_start, line_end, score, symbols), best first.
+
         Args:
             query: Search query
             limit: Maximum number of results (default: 10)
@@ -214,21 +255,63 @@ class SemanticSearchEngine:
         """
         index_path = self.semantic_dir / "file_index.index"
 
-        def filter_func(metadata: Dict[str, Any]) -> bool:
-            """Filter by file pattern if specified."""
-            if pattern is None:
-                return True
+        where: Dict[str, Any] = {}
+        if pattern is not None:
+            # Simple pattern matching (supports * wildcard), once per file path
+            where["file_path"] = lambda file_path: bool(file_path) and fnmatch(
+                file_path, pattern
+            )
 
-            # Get file path from metadata
-            file_path = metadata.get("file_path", "")
-            if not file_path:
-                return False
+        store = self._open_index(index_path)
+        if store is None:
+            return []
+        query_embedding = self.embedding_engine.encode([query])[0]
 
-            # Simple pattern matching (supports * wildcard)
-            from fnmatch import fnmatch
-            return fnmatch(file_path, pattern)
+        # A large file can own most of the top chunks: widen the search
+        # until enough files are found or every matching chunk is fetched
+        k = min(limit * FILE_CHUNK_FANOUT, store.size())
+        while True:
+            hits = self._search_store(store, query_embedding, k, where)
+            files = self._merge_file_chunks(hits)
+            if len(files) >= limit or len(hits) < k or k >= store.size():
+                return files[:limit]
+            k = min(k * FILE_CHUNK_FANOUT, store.size())
+
+    def search_memories(
+        self,
+        query: str,
+        limit: int = 5,
+        memory_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[SearchResult]:
+        """
+        Search Memory entries by semantic similarity.
 
-        return self._search_index(query, index_path, limit, filter_func)
+        The memory index is built by Indexer.index_memories() (or in the
+        background by IndexingService).
+
+        Args:
+            query: Search query
+            limit: Maximum number of results (default: 5)
+            memory_type: Optional type filter ("knowledge", "decision", "code",
+                "task", "pattern")
+            category: Optional category filter
+
+        Returns:
+            List of SearchResult dictionaries, sorted by relevance
+
+        Example:
+            >>> results = engine.search_memories("retry policy", memory_type="decision")
+        """
+        index_path = self.semantic_dir / "memory_index.index"
+
+        where: Dict[str, Any] = {}
+        if memory_type is not None:
+            where["memory_type"] = memory_type
+        if category is not None:
+            where["category"] = category
+
+        return self._search_index(query, index_path, limit, where)
 
     def search_all(
         self,
@@ -242,7 +325,8 @@ class SemanticSearchEngine:
         Args:
             query: Search query
             limit: Maximum number of results across all sources (default: 10)
-            sources: Optional list of sources to search (default: ["kb", "task", "file"])
+            sources: Optional list of sources to search (default: ["kb", "task", "file"];
+                "memory" is also accepted)
 
         Returns:
             List of SearchResult dictionaries from all sources, sorted by relevance
@@ -275,6 +359,10 @@ class SemanticSearchEngine:
             file_results = self.search_files(query, limit=limit)
             all_results.extend(file_results)
 
+        if "memory" in sources:
+            memory_results = self.search_memories(query, limit=limit)
+            all_results.extend(memory_results)
+
         # Rank and limit results
         ranked = self._rank_results(all_results)
         return ranked[:limit]
@@ -284,7 +372,7 @@ class SemanticSearchEngine:
         query: str,
         index_path: Path,
         limit: int,
-        filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        where: Optional[Dict[str, Any]] = None,
     ) -> List[SearchResult]:
         """
         Search a specific index with optional filtering.
@@ -293,7 +381,8 @@ class SemanticSearchEngine:
             query: Search query
             index_path: Path to FAISS index file (without .index extension)
             limit: Maximum number of results
-            filter_func: Optional filter function for metadata
+            where: Optional metadata conditions (see VectorStore.match()),
+                applied inside the vector search
 
         Returns:
             List of SearchResult dictionaries
@@ -301,31 +390,60 @@ class SemanticSearchEngine:
         Raises:
             FileNotFoundError: If index file doesn't exist
         """
+        store = self._open_index(index_path)
+        if store is None:
+            return []
+
+        # Encode query
+        query_embedding = self.embedding_engine.encode([query])[0]
+        return self._search_store(store, query_embedding, limit, where)
+
+    def _open_index(self, index_path: Path) -> Optional[VectorStore]:
+        """
+        Load a saved index.
+
+        Args:
+            index_path: Path to FAISS index file
+
+        Returns:
+            VectorStore, or None if the index is missing or empty
+        """
         # Check if index exists
         if not index_path.exists():
-            return []
+            return None
 
-        # Load index (VectorStore.load() is a classmethod)
         # Remove .index extension from path if present
-        base_path = Path(str(index_path).replace(".index", ""))
-        # Use dimension from vector_store (default: 384)
-        store = VectorStore.load(base_path, dimension=self.vector_store.dimension)
+        store = self._load_store(Path(str(index_path).replace(".index", "")))
 
         # Check if index is empty
-        if store.index.ntotal == 0:
-            return []
+        if store.size() == 0:
+            return None
+        return store
 
-        # Encode query
-        query_embedding = self.embedding_engine.encode([query])[0]
+    def _search_store(
+        self,
+        store: VectorStore,
+        query_embedding: Any,
+        limit: int,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """
+        Search a loaded store with an encoded query.
 
-        # Search with higher limit to account for filtering
-        search_limit = limit * 3 if filter_func else limit
+        Args:
+            store: Loaded VectorStore
+            query_embedding: Query vector
+            limit: Maximum number of results
+            where: Optional metadata conditions (see VectorStore.match())
 
+        Returns:
+            List of SearchResult dictionaries
+        """
         # VectorStore.search() returns List[Dict] with "distance", "metadata", "index"
         raw_results = store.search(
             query_embedding,
-            k=min(search_limit, store.index.ntotal),
-            filter_fn=filter_func,
+            k=min(limit, store.size()),
+            where=where,
         )
 
         # Build SearchResult objects
@@ -353,12 +471,82 @@ class SemanticSearchEngine:
             }
             results.append(result)
 
-            # Stop if we have enough filtered results
-            if len(results) >= limit:
-                break
-
         return results
 
+    def _load_store(self, base_path: Path) -> VectorStore:
+        """
+        Get a loaded store, reusing it while its files are unchanged.
+
+        Args:
+            base_path: Store path without extension
+
+        Returns:
+            VectorStore loaded from base_path
+
+        Raises:
+            FileNotFoundError: If index or metadata file is missing
+        """
+        stamp = _store_stamp(base_path)
+        with self._stores_lock:
+            cached = self._stores.get(base_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            attempt = 1
+            while True:
+                try:
+                    # Use dimension from vector_store (default: 384)
+                    store = VectorStore.load(base_path, dimension=self.vector_store.dimension)
+                    break
+                except Exception as e:
+                    # Files being rewritten (e.g. by IndexingService): keep
+                    # serving the previous load, retried on the next search
+                    if cached is not None:
+                        return cached[1]
+                    # Saves replace files, so a missing store is not mid-save
+                    if isinstance(e, FileNotFoundError) or attempt >= STORE_LOAD_ATTEMPTS:
+                        raise
+                # Nothing to serve yet: wait for the save to finish
+                time.sleep(STORE_LOAD_RETRY_DELAY * attempt)
+                attempt += 1
+                stamp = _store_stamp(base_path)
+            self._stores[base_path] = (stamp, store)
+            return store
+
+    def _merge_file_chunks(self, hits: List[SearchResult]) -> List[SearchResult]:
+        """
+        Merge chunk-level hits into one result per file.
+
+        Args:
+            hits: Chunk results sorted by score (descending)
+
+        Returns:
+            File results sorted by their best chunk score
+        """
+        files: Dict[str, SearchResult] = {}
+        for hit in hits:
+            metadata = hit["metadata"]
+            file_path = metadata.get("file_path") or hit["source_id"]
+            match = {
+                "line_start": metadata.get("line_start"),
+                "line_end": metadata.get("line_end"),
+                "score": hit["score"],
+                "symbols": metadata.get("symbols", []),
+            }
+
+            result = files.get(file_path)
+            if result is None:
+                files[file_path] = {
+                    **hit,
+                    "source_id": file_path,
+                    "title": file_path,
+                    "metadata": {**metadata, "matches": [match]},
+                }
+            else:
+                result["metadata"]["matches"].append(match)
+
+        return list(files.values())
+
     def _rank_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """
         Rank results by score (descending).
@@ -6,11 +6,38 @@ All data is stored locally with no external dependencies.
 """
 
 import json
+import os
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
+from clauxton.semantic.ann_index import (
+    IndexConfig,
+    build_index,
+    configure_search,
+    index_bytes,
+    index_type_of,
+    quantization_of,
+    search_params,
+    stored_ids,
+)
+from clauxton.semantic.metadata_store import MetadataFile, MetadataTable, write_metadata
+from clauxton.semantic.raw_vectors import RawVectors
+
 # Optional import - graceful degradation if not installed
 try:
     import faiss
@@ -21,21 +48,56 @@ except ImportError:
     if TYPE_CHECKING:
         import faiss
 
+# Compact once removed vectors exceed this fraction of the FAISS index
+COMPACT_RATIO = 0.25
+
+# Filtered searches selecting at most this many vectors score them directly
+EXACT_FILTER_SIZE = 1024
+
+# Metadata value types that can be matched by search(where=...)
+_FILTERABLE = (str, int, float, bool)
+
 
 class VectorStore:
     """
     FAISS-based vector storage with metadata support.
 
     Features:
-    - Fast similarity search using FAISS IndexFlatIP (cosine similarity)
+    - Fast similarity search using FAISS IndexFlatIP (cosine similarity),
+      or an ANN index (HNSW, IVF-PQ) selected by IndexConfig
     - Metadata storage for each vector
     - Persistent storage (save/load to disk)
     - Incremental indexing (add vectors one by one or in batches)
-    - Filtering support (metadata-based filtering)
+    - Upsert/remove by metadata "source_id" (no stale duplicates)
+    - Filtering support: attribute filters (where=) are resolved to id
+      sets and pushed down into FAISS; filter_fn post-filters hits
+
+    Every vector has a stable id (ids grow with insertion order). A
+    source_id -> id table lets upsert() and remove() drop the previous
+    vector of an item. Removed vectors are hidden from search at once and
+    physically deleted by compact(), which runs when they exceed
+    COMPACT_RATIO of the index and before every save.
+
+    An "ivfpq" store keeps a flat index until it holds
+    config.min_train_size() vectors; it is then trained on them and rebuilt.
+    An "hnsw" store cannot delete single vectors, so compact() rebuilds it.
+    With config.quantization, vectors are stored as float16/int8 (an int8
+    store stays fp16 until min_train_size()); the float32 vectors are kept
+    in a memory-mapped sidecar to re-rank the top k * rerank_factor
+    candidates. evaluate() reports recall, latency and index size against
+    an exact search.
+
+    Attribute filters use per-field postings (value -> ids), built from the
+    metadata the first time a field is filtered on and kept up to date by
+    add() and remove().
 
     Storage Structure:
-    - Vectors: FAISS index (binary format)
-    - Metadata: JSON file (human-readable)
+    - Vectors: FAISS index with ids (binary format)
+    - Metadata: binary sidecar (id/offset table + JSON records), read
+      lazily on load; see clauxton.semantic.metadata_store
+    - Config: JSON file with the IndexConfig
+    - Float32 vectors (quantized stores with re-ranking): memory-mapped
+      sidecar; see clauxton.semantic.raw_vectors
 
     Example:
         >>> store = VectorStore(dimension=384)
@@ -47,15 +109,17 @@ class VectorStore:
         >>> print(results[0]["distance"], results[0]["metadata"])
     """
 
-    def __init__(self, dimension: int = 384):
+    def __init__(self, dimension: int = 384, config: Optional[IndexConfig] = None):
         """
         Initialize vector store.
 
         Args:
             dimension: Embedding dimension (default: 384 for all-MiniLM-L6-v2)
+            config: Index type and parameters (default: exact flat index)
 
         Raises:
             ImportError: If faiss-cpu is not installed
+            ValueError: If config.pq_m does not divide dimension (ivfpq)
         """
         if not FAISS_AVAILABLE:
             raise ImportError(
@@ -63,11 +127,43 @@ class VectorStore:
                 "Install with: pip install clauxton[semantic]"
             )
 
+        self.config = config if config is not None else IndexConfig()
+        if self.config.index_type == "ivfpq" and dimension % self.config.pq_m != 0:
+            raise ValueError(
+                f"pq_m ({self.config.pq_m}) must divide the dimension ({dimension})"
+            )
+
         self.dimension = dimension
-        # Use IndexFlatIP for cosine similarity (requires normalized vectors)
-        # Note: Inner product on normalized vectors = cosine similarity
-        self.index: "faiss.IndexFlatIP" = faiss.IndexFlatIP(dimension)
-        self.metadata: List[Dict[str, Any]] = []
+        # Type and encoding of the current FAISS index (ivfpq stores start
+        # out flat, int8 stores fp16)
+        self.index_type, self.quantization = self._target_layout(0)
+        self.index: Any = build_index(self.config, dimension, self.index_type, self.quantization)
+        # Float32 vectors of all live ids, for re-ranking a quantized index
+        self._raw: Optional[RawVectors] = RawVectors(dimension) if self.config.reranks() else None
+        # Live metadata by vector id, in insertion (= ascending id) order
+        self._metadata = MetadataTable()
+        # source_id -> vector id of its current vector (None until needed
+        # after load, as building it reads every metadata row)
+        self._ids_by_source: Optional[Dict[str, int]] = {}
+        # Ids removed from _metadata but still stored in the FAISS index
+        self._removed: Set[int] = set()
+        # field -> value -> ids of live vectors, for fields filtered on so far
+        self._postings: Dict[str, Dict[Any, Set[int]]] = {}
+        self._next_id = 0
+
+    def _target_layout(self, size: int) -> Tuple[str, str]:
+        """Get the (index type, quantization) to use for a store of the given size."""
+        config = self.config
+        if config.index_type == "ivfpq" and size < config.min_train_size():
+            return "flat", "none"
+        if config.quantization == "int8" and size < config.min_train_size():
+            return config.index_type, "fp16"
+        return config.index_type, config.quantization
+
+    @property
+    def metadata(self) -> List[Dict[str, Any]]:
+        """Metadata of live vectors, in insertion order (read-only copy)."""
+        return list(self._metadata.values())
 
     def add(
         self,
@@ -77,6 +173,9 @@ class VectorStore:
         """
         Add embeddings to the vector store.
 
+        Existing vectors are kept; use upsert() to replace the vector of an
+        item that is already stored.
+
         Args:
             embeddings: numpy array of shape (n, dimension) or (dimension,)
             metadata: Optional list of metadata dicts (one per embedding)
@@ -117,31 +216,306 @@ class VectorStore:
         # (IndexFlatIP with normalized vectors = cosine similarity)
         normalized_embeddings = self._normalize(embeddings)
 
-        # Add to FAISS index
-        self.index.add(normalized_embeddings.astype(np.float32))
+        # Add to FAISS index under fresh ids
+        ids = np.arange(self._next_id, self._next_id + len(embeddings), dtype=np.int64)
+        self.index.add_with_ids(normalized_embeddings.astype(np.float32), ids)
+        if self._raw is not None:
+            self._raw.add(ids, normalized_embeddings)
+        self._next_id += len(embeddings)
 
         # Store metadata
-        self.metadata.extend(metadata)
+        sources = self._ids_by_source
+        for vector_id, meta in zip(ids.tolist(), metadata):
+            self._metadata[vector_id] = meta
+            source_id = meta.get("source_id")
+            if sources is not None and source_id is not None:
+                sources[source_id] = vector_id
+            self._post(vector_id, meta)
+
+        # First build of an ivfpq/int8 store: train once there is enough data
+        if (self.index_type, self.quantization) != self._target_layout(self.size()):
+            self._rebuild()
+
+    def upsert(
+        self,
+        embeddings: np.ndarray,
+        metadata: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Add embeddings, replacing stored vectors with the same source_id.
+
+        Args:
+            embeddings: numpy array of shape (n, dimension) or (dimension,)
+            metadata: List of metadata dicts (one per embedding). Items are
+                matched on their "source_id" key.
+
+        Raises:
+            ValueError: If embedding dimension mismatch
+            ValueError: If metadata length doesn't match embeddings
+
+        Example:
+            >>> store.upsert(embedding, [{"source_id": "KB-20251026-001"}])
+            >>> store.upsert(new_embedding, [{"source_id": "KB-20251026-001"}])
+            >>> store.size()
+            1
+        """
+        count = 1 if embeddings.ndim == 1 else len(embeddings)
+        if len(metadata) != count:
+            raise ValueError(
+                f"Metadata length ({len(metadata)}) must match "
+                f"embeddings count ({count})"
+            )
+
+        self.remove(
+            meta["source_id"] for meta in metadata if meta.get("source_id") is not None
+        )
+        self.add(embeddings, metadata)
+
+    def remove(self, source_ids: Iterable[str]) -> int:
+        """
+        Remove the vectors of the given source ids.
+
+        Removed vectors are excluded from search immediately; they are
+        deleted from the FAISS index on the next compaction.
+
+        Args:
+            source_ids: Source ids to remove (unknown ids are ignored)
+
+        Returns:
+            Number of vectors removed
+
+        Example:
+            >>> store.remove(["KB-20251026-001"])
+            1
+        """
+        removed = 0
+        sources = self._sources()
+        for source_id in source_ids:
+            vector_id = sources.pop(source_id, None)
+            if vector_id is None:
+                continue
+            self._unpost(vector_id, self._metadata.pop(vector_id))
+            self._removed.add(vector_id)
+            removed += 1
+
+        if len(self._removed) > COMPACT_RATIO * self.index.ntotal:
+            self.compact()
+        return removed
+
+    def _sources(self) -> Dict[str, int]:
+        """Get the source_id -> vector id table, building it if needed."""
+        if self._ids_by_source is None:
+            self._ids_by_source = {}
+            for vector_id, meta in self._metadata.items():
+                source_id = meta.get("source_id")
+                if source_id is not None:
+                    self._ids_by_source[source_id] = vector_id
+        return self._ids_by_source
+
+    def _posting(self, field: str) -> Dict[Any, Set[int]]:
+        """Get the value -> ids postings of a field, building them if needed."""
+        postings = self._postings.get(field)
+        if postings is None:
+            postings = {}
+            for vector_id, meta in self._metadata.items():
+                value = meta.get(field)
+                if isinstance(value, _FILTERABLE):
+                    postings.setdefault(value, set()).add(vector_id)
+            self._postings[field] = postings
+        return postings
+
+    def _post(self, vector_id: int, meta: Dict[str, Any]) -> None:
+        """Add a vector to the built postings."""
+        for field, postings in self._postings.items():
+            value = meta.get(field)
+            if isinstance(value, _FILTERABLE):
+                postings.setdefault(value, set()).add(vector_id)
+
+    def _unpost(self, vector_id: int, meta: Dict[str, Any]) -> None:
+        """Remove a vector from the built postings."""
+        for field, postings in self._postings.items():
+            value = meta.get(field)
+            ids = postings.get(value) if isinstance(value, _FILTERABLE) else None
+            if ids is not None:
+                ids.discard(vector_id)
+                if not ids:
+                    del postings[value]
+
+    def match(self, where: Mapping[str, Any]) -> np.ndarray:
+        """
+        Find live vectors whose metadata matches all conditions.
+
+        Only str, int, float and bool values can be matched.
+
+        Args:
+            where: field -> condition, where a condition is a value (equal),
+                a set/list/tuple of values (any of) or a callable taking a
+                value and returning bool (evaluated once per distinct value)
+
+        Returns:
+            Matching vector ids (int64, ascending)
+
+        Example:
+            >>> store.match({"source_type": "task", "status": "pending"})
+            array([ 3, 17, 42])
+        """
+        selected: Optional[Set[int]] = None
+        for field, condition in where.items():
+            postings = self._posting(field)
+            if callable(condition):
+                values = [value for value in postings if condition(value)]
+            elif isinstance(condition, (set, frozenset, list, tuple)):
+                values = list(condition)
+            else:
+                values = [condition]
+
+            ids: Set[int] = set()
+            for value in values:
+                ids.update(postings.get(value, ()))
+            selected = ids if selected is None else selected & ids
+            if not selected:
+                break
+
+        if selected is None:
+            return np.fromiter(self._metadata, dtype=np.int64, count=len(self._metadata))
+        return np.sort(np.fromiter(selected, dtype=np.int64, count=len(selected)))
+
+    def _exact_search(
+        self, query: np.ndarray, ids: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score the given vectors against a query directly (index.search layout)."""
+        if self._raw is not None:
+            vectors = self._raw.get(ids)
+        else:
+            vectors = self.index.reconstruct_batch(ids)
+        scores = vectors @ query[0]
+        top = np.argsort(-scores, kind="stable")[:k]
+        return scores[top][np.newaxis], ids[top][np.newaxis]
+
+    def _knn(
+        self, query: np.ndarray, k: int, selected: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest vectors of one query.
+
+        Args:
+            query: Normalized float32 query of shape (1, dimension)
+            k: Number of live neighbours wanted
+            selected: Ids to restrict the search to (live ids only)
+
+        Returns:
+            (scores, ids) of shape (1, n) as index.search() returns them;
+            without selected, removed ids may be included
+        """
+        # Quantized index: fetch more candidates, then score them exactly
+        fetch = k * self.config.rerank_factor if self._raw is not None else k
+        if selected is None:
+            # Over-fetch to skip removed, uncompacted vectors
+            # For IndexFlatIP, distance is inner product (cosine similarity if normalized)
+            distances, indices = self.index.search(
+                query, min(fetch + len(self._removed), self.index.ntotal)
+            )
+        elif len(selected) <= EXACT_FILTER_SIZE:
+            return self._exact_search(query, selected, k)
+        else:
+            # Selected ids are live, so no over-fetch is needed
+            distances, indices = self.index.search(
+                query,
+                min(fetch, len(selected)),
+                params=search_params(self.index, self.config, selected, fetch),
+            )
+            if np.count_nonzero(indices[0] >= 0) < min(k, len(selected)):
+                # ANN search ran out of matching candidates (IVF lists not probed)
+                return self._exact_search(query, selected, k)
+
+        if self._raw is None:
+            return distances, indices
+        candidates = np.array(
+            [i for i in indices[0].tolist() if i >= 0 and i in self._metadata], dtype=np.int64
+        )
+        return self._exact_search(query, candidates, len(candidates))
+
+    def compact(self) -> None:
+        """
+        Delete removed vectors from the FAISS index.
+
+        Example:
+            >>> store.remove(["old.py"])
+            >>> store.compact()
+            >>> store.index.ntotal == store.size()
+            True
+        """
+        if not self._removed:
+            return
+        if self.index_type == "hnsw":
+            # HNSW graphs do not support deletion
+            self._rebuild()
+            return
+        self.index.remove_ids(np.fromiter(self._removed, dtype=np.int64))
+        self._removed.clear()
+
+    def _live_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read the stored vectors of all live ids.
+
+        Returns:
+            (ids ascending, float32 vectors of shape (n, dimension)). For
+            ivfpq, and quantized stores without re-ranking, these are the
+            quantized (decoded) vectors.
+        """
+        ids = np.fromiter(self._metadata, dtype=np.int64, count=len(self._metadata))
+        if len(ids) == 0:
+            return ids, np.empty((0, self.dimension), dtype=np.float32)
+        if self._raw is not None:
+            return ids, self._raw.get(ids)
+        if isinstance(self.index, faiss.IndexIDMap2):
+            positions = faiss.vector_to_array(self.index.id_map)
+            vectors = self.index.index.reconstruct_n(0, self.index.ntotal)
+            return ids, vectors[np.searchsorted(positions, ids)]
+        return ids, self.index.reconstruct_batch(ids)
+
+    def _rebuild(self) -> None:
+        """Rebuild the index with live vectors only, as the target type."""
+        ids, vectors = self._live_vectors()
+        index_type, quantization = self._target_layout(len(ids))
+        index = build_index(self.config, self.dimension, index_type, quantization)
+        if not index.is_trained:
+            index.train(vectors)
+        if len(ids):
+            index.add_with_ids(vectors, ids)
+
+        self.index = index
+        self.index_type = index_type
+        self.quantization = quantization
+        self._removed.clear()
 
     def search(
         self,
         query_embedding: np.ndarray,
         k: int = 5,
         filter_fn: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        where: Optional[Mapping[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for similar vectors.
 
+        where conditions are resolved to vector ids (see match()) before
+        the search: FAISS only considers matching vectors, and a selection
+        of at most EXACT_FILTER_SIZE vectors is scored directly. Up to k
+        matching vectors are returned however selective the filter is.
+        filter_fn is applied to the k hits afterwards.
+
         Args:
             query_embedding: Query vector (1D array of shape (dimension,))
             k: Number of results to return
             filter_fn: Optional filter function (takes metadata dict, returns bool)
+            where: Optional attribute conditions (see match())
 
         Returns:
             List of result dicts with keys:
                 - distance: Cosine similarity (0-1, higher = more similar)
                 - metadata: Metadata dict
-                - index: Index in the store
+                - index: Vector id in the store (stable across removals)
 
         Example:
             >>> query = np.random.rand(384)
@@ -149,9 +523,16 @@ class VectorStore:
             >>> top_result = results[0]
             >>> print(f"Similarity: {top_result['distance']:.3f}")
             >>> print(f"Metadata: {top_result['metadata']}")
+            >>>
+            >>> # Pending tasks only
+            >>> results = store.search(query, k=5, where={"status": "pending"})
         """
         # Handle empty index
-        if self.index.ntotal == 0:
+        if self.size() == 0:
+            return []
+
+        selected = self.match(where) if where else None
+        if selected is not None and len(selected) == 0:
             return []
 
         # Ensure query is 2D
@@ -168,11 +549,7 @@ class VectorStore:
         # Normalize query for cosine similarity
         normalized_query = self._normalize(query_embedding)
 
-        # Search FAISS index
-        # For IndexFlatIP, distance is inner product (cosine similarity if normalized)
-        distances, indices = self.index.search(
-            normalized_query.astype(np.float32), min(k, self.index.ntotal)
-        )
+        distances, indices = self._knn(normalized_query.astype(np.float32), k, selected)
 
         # Build results
         results: List[Dict[str, Any]] = []
@@ -181,7 +558,10 @@ class VectorStore:
             if idx < 0:
                 continue
 
-            metadata = self.metadata[idx]
+            metadata = self._metadata.get(int(idx))
+            if metadata is None:
+                # Removed, awaiting compaction
+                continue
 
             # Apply filter if provided
             if filter_fn is not None and not filter_fn(metadata):
@@ -205,9 +585,16 @@ class VectorStore:
         """
         Save vector store to disk.
 
-        Saves two files:
-        - {path}.index: FAISS index (binary)
-        - {path}.metadata.json: Metadata (JSON)
+        Removed vectors are compacted first. Saves three files:
+        - {path}.index: FAISS index with ids (binary)
+        - {path}.metadata.bin: Metadata sidecar, by ascending vector id
+        - {path}.config.json: IndexConfig (JSON)
+
+        Quantized stores with re-ranking also save {path}.vectors.f32
+        (float32 vectors by ascending id), which the store then memory-maps
+        instead of keeping the vectors in memory.
+
+        A metadata.json written by earlier versions is removed.
 
         Args:
             path: Base path for saving (without extension)
@@ -216,28 +603,66 @@ class VectorStore:
             >>> store.save(Path(".clauxton/vectors/kb"))
             # Creates:
             # - .clauxton/vectors/kb.index
-            # - .clauxton/vectors/kb.metadata.json
+            # - .clauxton/vectors/kb.metadata.bin
+            # - .clauxton/vectors/kb.config.json
         """
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save FAISS index
-        index_path = str(path) + ".index"
-        faiss.write_index(self.index, index_path)
+        # Sidecar and index must hold the same vectors
+        self.compact()
+
+        # Every file is written to a temporary file and renamed into place,
+        # the index last: a concurrent load() never reads a partial file,
+        # and sees the new index only once its sidecars are in place
+
+        # Save index parameters
+        config_path = Path(str(path) + ".config.json")
+        temp_config = config_path.with_name(config_path.name + ".tmp")
+        with open(temp_config, "w", encoding="utf-8") as f:
+            json.dump(self.config.model_dump(), f, indent=2)
+        os.replace(temp_config, config_path)
+
+        # Save float32 vectors for re-ranking
+        vectors_path = Path(str(path) + ".vectors.f32")
+        if self._raw is not None:
+            ids = np.fromiter(self._metadata, dtype=np.int64, count=len(self._metadata))
+            self._raw.write(vectors_path, np.sort(ids))
+            # Serve from the file: drops in-memory copies and replaced vectors
+            self._raw = RawVectors.open(vectors_path, self.dimension)
+        else:
+            vectors_path.unlink(missing_ok=True)
 
-        # Save metadata as JSON
-        metadata_path = str(path) + ".metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(self.metadata, f, indent=2, ensure_ascii=False)
+        # Save metadata (rows loaded from disk are copied without decoding)
+        write_metadata(Path(str(path) + ".metadata.bin"), self._metadata.raw_items())
+        Path(str(path) + ".metadata.json").unlink(missing_ok=True)
+
+        # Save FAISS index
+        index_path = Path(str(path) + ".index")
+        temp_index = index_path.with_name(index_path.name + ".tmp")
+        faiss.write_index(self.index, str(temp_index))
+        os.replace(temp_index, index_path)
 
     @classmethod
-    def load(cls, path: Path, dimension: int = 384) -> "VectorStore":
+    def load(
+        cls, path: Path, dimension: int = 384, config: Optional[IndexConfig] = None
+    ) -> "VectorStore":
         """
         Load vector store from disk.
 
+        Metadata rows are decoded on first access, and float32 vectors of
+        quantized stores are memory-mapped, so loading does not read either
+        as a whole.
+
+        Stores saved by earlier versions (plain IndexFlatIP, metadata.json)
+        are converted to an id-mapped index; duplicate vectors of one
+        source_id are dropped, keeping the most recently added.
+
         Args:
             path: Base path (without extension)
             dimension: Expected embedding dimension
+            config: Index config to use instead of the saved one. If its
+                index type or quantization differs, the index is rebuilt.
 
         Returns:
             Loaded VectorStore instance
@@ -245,6 +670,8 @@ class VectorStore:
         Raises:
             FileNotFoundError: If index or metadata file is missing
             ValueError: If loaded index dimension doesn't match
+            ValueError: If index, metadata and vectors do not hold the same
+                vector ids (e.g. read while another process saves)
 
         Example:
             >>> store = VectorStore.load(Path(".clauxton/vectors/kb"))
@@ -262,21 +689,182 @@ class VectorStore:
                 f"Index dimension mismatch: expected {dimension}, got {index.d}"
             )
 
-        # Load metadata
-        metadata_path = str(path) + ".metadata.json"
-        if not Path(metadata_path).exists():
-            raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
+        # Load metadata (sidecar, or metadata.json from earlier versions)
+        sidecar_path = Path(str(path) + ".metadata.bin")
+        legacy_path = Path(str(path) + ".metadata.json")
+        metadata: Union[MetadataFile, List[Dict[str, Any]]]
+        if sidecar_path.exists():
+            metadata = MetadataFile(sidecar_path)
+        elif legacy_path.exists():
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        else:
+            raise FileNotFoundError(f"Metadata file not found: {sidecar_path}")
 
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
+        if index.ntotal != len(metadata):
+            raise ValueError(
+                f"Index and metadata out of sync: {index.ntotal} vectors, "
+                f"{len(metadata)} metadata entries"
+            )
+        # Same count but other ids: files of two saves (load during a save)
+        if (
+            isinstance(metadata, MetadataFile)
+            and index_type_of(index) != "legacy"
+            and not np.array_equal(stored_ids(index), metadata.ids)
+        ):
+            raise ValueError("Index and metadata out of sync: vector ids differ")
+
+        # Load index parameters (stores saved before configs existed are flat)
+        config_path = Path(str(path) + ".config.json")
+        if config is None and config_path.exists():
+            with open(config_path, "r", encoding="utf-8") as f:
+                config = IndexConfig(**json.load(f))
 
         # Create instance
-        store = cls(dimension=dimension)
-        store.index = index
-        store.metadata = metadata
+        store = cls(dimension=dimension, config=config)
+        index_type = index_type_of(index)
+        store.quantization = quantization_of(index)
+        if isinstance(metadata, MetadataFile):
+            store.index = index
+            store.index_type = index_type
+            configure_search(store.index, store.config)
+            store._metadata = MetadataTable(metadata)
+            store._ids_by_source = None
+            store._next_id = int(metadata.ids[-1]) + 1 if len(metadata) else 0
+        elif index_type == "legacy":
+            # Legacy flat index: ids are positions
+            ids = list(range(index.ntotal))
+            store.index = build_index(store.config, dimension, "flat")
+            store.index_type = "flat"
+            store.quantization = "none"
+            if ids:
+                store.index.add_with_ids(
+                    index.reconstruct_n(0, index.ntotal), np.asarray(ids, dtype=np.int64)
+                )
+        else:
+            # Ids ascend in insertion order, which is the metadata order
+            ids = stored_ids(index).tolist()
+            store.index = index
+            store.index_type = index_type
+            configure_search(store.index, store.config)
+
+        if not isinstance(metadata, MetadataFile):
+            store._next_id = max(ids) + 1 if ids else 0
+            sources = store._sources()
+            for vector_id, meta in zip(ids, metadata):
+                source_id = meta.get("source_id")
+                if source_id is not None and source_id in sources:
+                    # Stale duplicate from before upsert(): keep the newer vector
+                    stale_id = sources[source_id]
+                    del store._metadata[stale_id]
+                    store._removed.add(stale_id)
+                store._metadata[vector_id] = meta
+                if source_id is not None:
+                    sources[source_id] = vector_id
+            store.compact()
+
+        # Float32 vectors: needed to re-rank, and the best source for a rebuild
+        rebuild = (store.index_type, store.quantization) != store._target_layout(store.size())
+        vectors_path = Path(str(path) + ".vectors.f32")
+        if vectors_path.exists() and (store._raw is not None or rebuild):
+            store._raw = RawVectors.open(vectors_path, dimension)
+            if len(store._raw) != store.size() or (
+                isinstance(metadata, MetadataFile)
+                and not np.array_equal(store._raw.ids(), metadata.ids)
+            ):
+                raise ValueError(
+                    f"Index and vectors out of sync: {store.size()} metadata "
+                    f"entries, {len(store._raw)} vectors"
+                )
+        elif store._raw is not None:
+            # Saved without float32 vectors: start from the stored ones
+            raw, store._raw = store._raw, None
+            raw.add(*store._live_vectors())
+            store._raw = raw
+
+        if rebuild:
+            store._rebuild()
+        if not store.config.reranks():
+            store._raw = None
 
         return store
 
+    def evaluate(
+        self,
+        k: int = 10,
+        queries: Optional[np.ndarray] = None,
+        sample: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Report recall and latency of the index against an exact search.
+
+        The exact search scans the vectors with numpy. Quantized stores
+        with re-ranking use their float32 vectors, so recall includes the
+        quantization error; for ivfpq (and quantized stores without
+        re-ranking) the stored, quantized vectors are used, so recall
+        measures the ANN search only. Queries run one at a time through
+        the same path as search(), re-ranking included.
+
+        Args:
+            k: Number of neighbours per query
+            queries: Query vectors of shape (n, dimension) (default: a
+                sample of stored vectors)
+            sample: Number of stored vectors to sample as queries
+
+        Returns:
+            Dict with index_type, quantization, size, index_bytes (size of
+            the in-memory index), k, queries, recall (mean recall@k), ann_ms
+            and exact_ms (mean milliseconds per query)
+
+        Example:
+            >>> store.evaluate(k=10)
+            {'index_type': 'hnsw', 'quantization': 'int8', 'size': 50000,
+             'index_bytes': 32400000, 'k': 10, 'queries': 100,
+             'recall': 0.98, 'ann_ms': 0.21, 'exact_ms': 4.7}
+        """
+        ids, vectors = self._live_vectors()
+        report: Dict[str, Any] = {
+            "index_type": self.index_type,
+            "quantization": self.quantization,
+            "size": len(ids),
+            "index_bytes": index_bytes(self.index),
+            "k": k,
+            "queries": 0,
+            "recall": 1.0,
+            "ann_ms": 0.0,
+            "exact_ms": 0.0,
+        }
+        if len(ids) == 0:
+            return report
+
+        if queries is None:
+            rng = np.random.default_rng(0)
+            queries = vectors[rng.choice(len(ids), size=min(sample, len(ids)), replace=False)]
+        queries = self._normalize(np.atleast_2d(queries)).astype(np.float32)
+        k = min(k, len(ids))
+
+        started = time.perf_counter()
+        scores = queries @ vectors.T
+        exact = ids[np.argsort(-scores, axis=1)[:, :k]]
+        exact_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        found = [self._knn(query[np.newaxis], k)[1][0] for query in queries]
+        ann_seconds = time.perf_counter() - started
+
+        hits = 0
+        for expected, row in zip(exact, found):
+            live = [int(i) for i in row if i >= 0 and int(i) in self._metadata][:k]
+            hits += len(set(expected.tolist()) & set(live))
+
+        report.update(
+            queries=len(queries),
+            recall=hits / (k * len(queries)),
+            ann_ms=ann_seconds * 1000 / len(queries),
+            exact_ms=exact_seconds * 1000 / len(queries),
+        )
+        return report
+
     def clear(self) -> None:
         """
         Clear all vectors and metadata.
@@ -286,21 +874,27 @@ class VectorStore:
             >>> store.size()
             0
         """
-        self.index = faiss.IndexFlatIP(self.dimension)
-        self.metadata = []
+        self.index_type, self.quantization = self._target_layout(0)
+        self.index = build_index(self.config, self.dimension, self.index_type, self.quantization)
+        self._raw = RawVectors(self.dimension) if self.config.reranks() else None
+        self._metadata = MetadataTable()
+        self._ids_by_source = {}
+        self._removed = set()
+        self._postings = {}
+        self._next_id = 0
 
     def size(self) -> int:
         """
         Get number of vectors in the store.
 
         Returns:
-            Number of stored vectors
+            Number of live vectors (removed vectors are not counted)
 
         Example:
             >>> store.size()
             100
         """
-        return int(self.index.ntotal)
+        return len(self._metadata)
 
     def _normalize(self, embeddings: np.ndarray) -> np.ndarray:
         """
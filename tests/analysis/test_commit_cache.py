@@ -0,0 +1,111 @@
+"""Tests for CommitCache."""
+
+import json
+from datetime import datetime
+
+from clauxton.analysis.commit_cache import CommitCache
+from clauxton.analysis.git_analyzer import CommitInfo
+from clauxton.analysis.pattern_extractor import PatternExtractor
+
+
+def _commit_info(diff: str = "+def login():\n") -> CommitInfo:
+    return CommitInfo(
+        sha="a" * 40,
+        message="feat(auth): add login",
+        author="Test User",
+        date=datetime(2025, 10, 26, 12, 0),
+        files=["src/auth/login.py"],
+        diff=diff,
+        stats={"insertions": 1, "deletions": 0, "files_changed": 1},
+    )
+
+
+class TestCommitCache:
+    """Tests for the JSON Lines records."""
+
+    def test_put_merges_and_persists(self, tmp_path):
+        """Test fields are merged per SHA and reloaded by a new cache."""
+        directory = tmp_path / "cache" / "commits"
+        cache = CommitCache(directory)
+        assert cache.get("abc") is None
+
+        cache.put("abc", {"files": ["a.py"], "stats": {"insertions": 1}})
+        cache.put("abc", {"patterns": {"category": "feature"}})
+
+        reloaded = CommitCache(directory)
+        assert reloaded.get("abc") == {
+            "files": ["a.py"],
+            "stats": {"insertions": 1},
+            "patterns": {"category": "feature"},
+        }
+        assert len(reloaded) == 1
+        assert (tmp_path / "cache" / ".gitignore").read_text() == "*\n"
+
+    def test_torn_lines_are_skipped(self, tmp_path):
+        """Test a partially written line does not lose the other records."""
+        cache = CommitCache(tmp_path)
+        cache.put("abc", {"files": ["a.py"]})
+        with open(cache.path, "a", encoding="utf-8") as f:
+            f.write('{"sha": "def", "fil')
+
+        assert CommitCache(tmp_path).get("abc") == {"files": ["a.py"]}
+        assert CommitCache(tmp_path).get("def") is None
+
+    def test_new_version_drops_old_records(self, tmp_path):
+        """Test records of another analyzer version are neither read nor kept."""
+        CommitCache(tmp_path, version=1).put("abc", {"files": ["a.py"]})
+
+        cache = CommitCache(tmp_path, version=2)
+        assert cache.get("abc") is None
+        cache.put("def", {"files": ["b.py"]})
+
+        assert sorted(p.name for p in tmp_path.glob("v*.jsonl")) == ["v2.jsonl"]
+
+    def test_superseded_lines_are_compacted(self, tmp_path):
+        """Test the file is rewritten once most lines are superseded."""
+        cache = CommitCache(tmp_path)
+        for i in range(150):
+            cache.put("abc", {"count": i})
+
+        lines = cache.path.read_text().splitlines()
+        assert len(lines) < 150
+        assert CommitCache(tmp_path).get("abc") == {"count": 149}
+        assert json.loads(lines[0])["sha"] == "abc"
+
+
+    def test_patches_are_read_on_demand(self, tmp_path):
+        """Test patch text stays in the file and survives compaction."""
+        cache = CommitCache(tmp_path)
+        cache.put("abc", {"files": ["a.py"], "diff": "+patch\n"})
+        for i in range(150):
+            cache.put("abc", {"count": i})
+
+        assert cache._records == {"abc": {"files": ["a.py"], "count": 149}}
+        assert cache.has("abc", "diff")
+        assert not cache.has("abc", "patterns")
+        assert cache.get("abc", large_fields=False) == {"files": ["a.py"], "count": 149}
+        assert cache.get("abc")["diff"] == "+patch\n"
+        assert len(cache.path.read_text().splitlines()) < 150
+        assert CommitCache(tmp_path).get("abc")["diff"] == "+patch\n"
+
+class TestCachedPatterns:
+    """Tests for detect_patterns() results reused from the cache."""
+
+    def test_patterns_are_computed_once(self, tmp_path, monkeypatch):
+        """Test a cached result is returned without running the extractors."""
+        cache = CommitCache(tmp_path)
+        expected = PatternExtractor().detect_patterns(_commit_info())
+        assert PatternExtractor(cache=cache).detect_patterns(_commit_info()) == expected
+
+        extractor = PatternExtractor(cache=CommitCache(tmp_path))
+        monkeypatch.setattr(extractor, "_detect_patterns", None)
+        assert extractor.detect_patterns(_commit_info()) == expected
+
+    def test_results_without_diff_are_kept_apart(self, tmp_path):
+        """Test patterns of a commit without patch text do not replace full ones."""
+        extractor = PatternExtractor(cache=CommitCache(tmp_path))
+        light = extractor.detect_patterns(_commit_info(diff=""))
+        full = extractor.detect_patterns(_commit_info())
+
+        assert full == PatternExtractor().detect_patterns(_commit_info())
+        assert light == PatternExtractor().detect_patterns(_commit_info(diff=""))
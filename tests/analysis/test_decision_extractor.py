@@ -558,6 +558,25 @@ class TestExtractDecisions:
         assert isinstance(candidates, list)
         # May or may not find candidates depending on confidence threshold
 
+    def test_parallel_matches_sequential(self, extractor, tmp_project):
+        """Test worker processes give the same candidates."""
+        for i in range(6):
+            (tmp_project / f"service{i}").mkdir()
+            (tmp_project / f"service{i}" / "requirements.txt").write_text(f"lib{i}==1.0\n")
+            subprocess.run(["git", "add", "."], cwd=tmp_project, check=True, capture_output=True)
+            subprocess.run(
+                ["git", "commit", "-m", f"chore: adopt library {i}"],
+                cwd=tmp_project,
+                check=True,
+                capture_output=True,
+            )
+
+        sequential = extractor.extract_decisions(since_days=1, max_candidates=20)
+        parallel = extractor.extract_decisions(since_days=1, max_candidates=20, workers=2)
+
+        assert [c.to_dict() for c in parallel] == [c.to_dict() for c in sequential]
+        assert len(parallel) == 6
+
     def test_extract_with_max_limit(self, extractor, tmp_project):
         """Test candidate limit enforcement."""
         import subprocess
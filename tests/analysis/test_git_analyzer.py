@@ -9,6 +9,7 @@ from clauxton.analysis.git_analyzer import (
     GitAnalyzer,
     GitAnalyzerError,
     NotAGitRepositoryError,
+    parse_git_log,
 )
 
 
@@ -301,6 +302,248 @@ class TestGetCommitStats:
         assert stats["files_changed"] >= 1
 
 
+def _commit_changes(project_root):
+    """Commit a rename with edits, a binary file and a deletion."""
+    import subprocess
+
+    (project_root / "app.py").write_text("a\nb\nc\n")
+    subprocess.run(["git", "add", "."], cwd=project_root, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add app"], cwd=project_root, check=True, capture_output=True
+    )
+    subprocess.run(
+        ["git", "mv", "app.py", "main.py"], cwd=project_root, check=True, capture_output=True
+    )
+    (project_root / "main.py").write_text("a\nB\nc\nd\n")
+    (project_root / "data.bin").write_bytes(b"\x00\x01")
+    subprocess.run(["git", "rm", "-q", "README.md"], cwd=project_root, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=project_root, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Rework app"], cwd=project_root, check=True, capture_output=True
+    )
+
+
+class TestSingleDiff:
+    """Tests for files, patch and stats taken from one diff."""
+
+    def test_stats_count_commit_additions(self, analyzer, project_root):
+        """Test line counts follow the commit's direction (parent -> commit)."""
+        _commit_changes(project_root)
+
+        info = analyzer.get_recent_commits(max_count=1)[0]
+
+        assert sorted(info.files) == ["README.md", "data.bin", "main.py"]
+        assert info.stats == {"insertions": 2, "deletions": 2, "files_changed": 3}
+        assert "+d" in info.diff and "-b" in info.diff
+
+    def test_without_patch_matches_patch_mode(self, analyzer, project_root):
+        """Test include_patch=False keeps files and stats but skips the patch."""
+        _commit_changes(project_root)
+
+        with_patch = analyzer.get_recent_commits(since_days=365)
+        without_patch = analyzer.get_recent_commits(since_days=365, include_patch=False)
+
+        assert [c.sha for c in without_patch] == [c.sha for c in with_patch]
+        for full, light in zip(with_patch, without_patch):
+            assert sorted(light.files) == sorted(full.files)
+            assert light.stats == full.stats
+            assert light.diff == ""
+        assert analyzer.get_modified_files(with_patch[0].sha) == without_patch[0].files
+
+    def test_first_commit_is_all_additions(self, analyzer):
+        """Test the root commit is diffed against the empty tree."""
+        first = analyzer.get_recent_commits(since_days=365)[-1]
+        light = analyzer.analyze_commit(first.sha, include_patch=False)
+
+        assert first.files == ["README.md"]
+        assert first.stats == {"insertions": 1, "deletions": 0, "files_changed": 1}
+        assert "+# Test Project" in first.diff
+        assert light.stats == first.stats
+
+    def test_analyze_commit_diffs_once(self, analyzer, monkeypatch):
+        """Test one commit analysis runs a single diff."""
+        from git import Commit
+
+        calls = []
+        original = Commit.diff
+
+        def counting_diff(self, *args, **kwargs):
+            calls.append(kwargs.get("create_patch", False))
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Commit, "diff", counting_diff)
+        commit = analyzer.get_recent_commits(max_count=1, include_patch=False)[0]
+        analyzer.analyze_commit(commit.sha)
+
+        assert calls == [True]
+
+
+class TestLogBackend:
+    """Tests for commits streamed from one git log process."""
+
+    def test_matches_gitpython_backend(self, project_root):
+        """Test both backends produce the same CommitInfo objects."""
+        _commit_changes(project_root)
+        gitpython = GitAnalyzer(project_root, use_cache=False)
+        log = GitAnalyzer(project_root, use_cache=False, backend="log")
+
+        for include_patch in (True, False):
+            expected = gitpython.get_recent_commits(since_days=365, include_patch=include_patch)
+            commits = log.get_recent_commits(since_days=365, include_patch=include_patch)
+            assert [c.to_dict() for c in commits] == [c.to_dict() for c in expected]
+
+    def test_quoted_non_ascii_paths(self, project_root):
+        """Test C-quoted paths with characters beyond latin-1 are unquoted."""
+        import subprocess
+
+        (project_root / '日本"x".txt').write_text("quoted\n")
+        (project_root / "tab\there.txt").write_text("tab\n")
+        subprocess.run(["git", "add", "."], cwd=project_root, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add quoted paths"],
+            cwd=project_root,
+            check=True,
+            capture_output=True,
+        )
+
+        commit = GitAnalyzer(project_root, use_cache=False, backend="log").get_recent_commits(
+            max_count=1
+        )[0]
+        expected = GitAnalyzer(project_root, use_cache=False).get_recent_commits(max_count=1)[0]
+
+        assert sorted(commit.files) == ['tab\there.txt', '日本"x".txt']
+        assert commit.files == expected.files
+
+    def test_iter_commits_can_stop_early(self, project_root):
+        """Test closing the generator stops git and max_count is applied."""
+        _commit_changes(project_root)
+        analyzer = GitAnalyzer(project_root, backend="log")
+
+        commits = analyzer.iter_commits()
+        assert next(commits).message == "Rework app"
+        commits.close()
+        assert len(list(analyzer.iter_commits(max_count=2))) == 2
+        assert analyzer.cache is not None and len(analyzer.cache) == 2
+
+    def test_unknown_branch(self, project_root):
+        """Test git errors are raised as GitAnalyzerError."""
+        analyzer = GitAnalyzer(project_root, backend="log")
+
+        with pytest.raises(GitAnalyzerError, match="git log failed"):
+            list(analyzer.iter_commits(branch="no-such-branch"))
+
+    def test_unknown_backend(self, project_root):
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            GitAnalyzer(project_root, backend="libgit2")
+
+    def test_parse_renames_and_multiline_messages(self):
+        """Test numstat rename forms and messages spanning lines."""
+        output = [
+            "\x1e" + "a" * 40 + "\x1fTest User\x1f1761480000\x1fRework\n",
+            "\n",
+            "Longer body\n",
+            "\x1d\n",
+            "\n",
+            "1\t1\tsrc/{old => new}/app.py\n",
+            "0\t0\tsrc/{ => lib}/util.py\n",
+            "-\t-\tlogo.png => assets/logo.png\n",
+            "\x1e" + "b" * 40 + "\x1f\x1f1761400000\x1fInitial\x1d\n",
+        ]
+
+        first, second = parse_git_log(output)
+
+        assert first.message == "Rework\n\nLonger body"
+        assert first.files == ["src/new/app.py", "src/lib/util.py", "assets/logo.png"]
+        assert first.stats == {"insertions": 1, "deletions": 1, "files_changed": 3}
+        assert second.author == "Unknown"
+        assert second.files == []
+
+
+class TestAnalysisCache:
+    """Tests for commit analyses cached by SHA."""
+
+    def _count_diffs(self, analyzer, monkeypatch):
+        calls = []
+        original = analyzer._diff_commit
+
+        def counting_diff_commit(commit, include_patch):
+            calls.append((commit.hexsha, include_patch))
+            return original(commit, include_patch)
+
+        monkeypatch.setattr(analyzer, "_diff_commit", counting_diff_commit)
+        return calls
+
+    def test_cached_commits_are_not_diffed_again(self, project_root, monkeypatch):
+        """Test a new analyzer only diffs commits newer than the cached ones."""
+        import subprocess
+
+        first = GitAnalyzer(project_root).get_recent_commits(since_days=365)
+        (project_root / "app.py").write_text("print(1)\n")
+        subprocess.run(["git", "add", "."], cwd=project_root, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add app"], cwd=project_root, check=True, capture_output=True
+        )
+
+        analyzer = GitAnalyzer(project_root)
+        calls = self._count_diffs(analyzer, monkeypatch)
+        commits = analyzer.get_recent_commits(since_days=365)
+
+        assert [c.sha for c in commits[1:]] == [c.sha for c in first]
+        assert calls == [(commits[0].sha, True)]
+        assert commits[1].to_dict() == first[0].to_dict()
+        # The cache directory is ignored by Git
+        assert not subprocess.run(
+            ["git", "status", "--porcelain"], cwd=project_root, capture_output=True, text=True
+        ).stdout
+
+    def test_patch_is_computed_when_cached_without_it(self, analyzer, monkeypatch):
+        """Test a record cached without patch text is re-diffed for the patch once."""
+        calls = self._count_diffs(analyzer, monkeypatch)
+        sha = analyzer.get_recent_commits(include_patch=False)[0].sha
+
+        assert analyzer.analyze_commit(sha).diff
+        assert analyzer.analyze_commit(sha, include_patch=False).diff == ""
+        assert analyzer.analyze_commit(sha).diff
+        assert calls == [(sha, False), (sha, True)]
+
+    @pytest.mark.parametrize("backend", ["gitpython", "log"])
+    def test_long_patches_are_never_served_cut(self, project_root, backend):
+        """Test a patch over MAX_CACHED_DIFF is the same on a cache hit."""
+        import subprocess
+
+        from clauxton.analysis.commit_cache import MAX_CACHED_DIFF
+
+        (project_root / "big.txt").write_text(
+            "".join(f"line {i}\n" for i in range(MAX_CACHED_DIFF // 5))
+        )
+        subprocess.run(["git", "add", "."], cwd=project_root, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add big file"],
+            cwd=project_root,
+            check=True,
+            capture_output=True,
+        )
+
+        first = GitAnalyzer(project_root, backend=backend).get_recent_commits(max_count=1)[0]
+        analyzer = GitAnalyzer(project_root, backend=backend)
+        second = analyzer.get_recent_commits(max_count=1)[0]
+
+        assert len(first.diff) > MAX_CACHED_DIFF
+        assert second.to_dict() == first.to_dict()
+        assert analyzer.analyze_commit(first.sha).diff == first.diff
+        record = analyzer.cache.get(first.sha)
+        assert record["diff_truncated"] and "diff" not in record
+
+    def test_cache_disabled(self, project_root):
+        """Test use_cache=False writes nothing."""
+        analyzer = GitAnalyzer(project_root, use_cache=False)
+        analyzer.get_recent_commits()
+
+        assert analyzer.cache is None
+        assert not (project_root / ".clauxton").exists()
+
+
 class TestGetCommitCount:
     """Tests for get_commit_count."""
 
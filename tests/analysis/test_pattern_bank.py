@@ -0,0 +1,98 @@
+"""Tests for PatternBank."""
+
+import re
+
+import pytest
+
+from clauxton.analysis.pattern_bank import PatternBank, keywords
+
+
+class TestPatternBank:
+    """Tests for scanning labelled rules."""
+
+    def test_scan_returns_evidence_in_label_order(self):
+        """Test every found label is reported with its matched text."""
+        bank = PatternBank(
+            {
+                "bugfix": keywords(["fix", "bug"]),
+                "feature": keywords(["add"]),
+                "docs": keywords(["readme"]),
+            },
+            flags=re.IGNORECASE,
+        )
+
+        assert bank.scan("Add retry and FIX crash") == {"bugfix": "FIX", "feature": "Add"}
+        assert bank.scan("bump version") == {}
+
+    def test_first_uses_label_priority(self):
+        """Test first() prefers earlier labels over earlier matches."""
+        bank = PatternBank(
+            {"test": keywords(["testing"]), "feature": keywords(["add"])},
+            flags=re.IGNORECASE,
+        )
+
+        assert bank.first("add testing helpers") == "test"
+        assert bank.first("add helpers") == "feature"
+        assert bank.first("bump version") is None
+        assert bank.search("add helpers")
+        assert not bank.search("bump version")
+
+    def test_regex_rules_are_verified_at_anchor(self):
+        """Test anchored regex rules need their full match, not just the literal."""
+        bank = PatternBank(
+            {
+                "class_def": [r"\bclass\s+\w+"],
+                "comments": [r"#.*$|//.*$|/\*.*\*/"],
+                "models": [r"models?\.py"],
+            },
+            flags=re.MULTILINE,
+        )
+
+        assert bank.scan("subclass Foo\nclass Bar:") == {"class_def": "class Bar"}
+        assert bank.scan("x = 1  // note") == {"comments": "// note"}
+        assert bank.scan("src/model.py") == {"models": "model.py"}
+        assert bank.scan("src/models.py") == {"models": "models.py"}
+
+    def test_inline_flags_apply_to_their_rule_only(self):
+        """Test a leading (?i) does not make other rules case-insensitive."""
+        bank = PatternBank({"adr": ["(?i)adr", "Decision"]})
+
+        assert bank.scan("docs/ADR/0001.md") == {"adr": "ADR"}
+        assert bank.scan("docs/decision.md") == {}
+        assert bank.scan("docs/Decision.md") == {"adr": "Decision"}
+
+    def test_case_changing_length_falls_back_to_regex(self):
+        """Test texts whose lowercase differs in length are still matched."""
+        bank = PatternBank({"fix": keywords(["fix"])}, flags=re.IGNORECASE)
+
+        assert bank.scan("İstanbul FIX") == {"fix": "FIX"}
+
+    def test_label_without_rules_raises(self):
+        """Test labels need at least one rule."""
+        with pytest.raises(ValueError, match="no rules"):
+            PatternBank({"empty": []})
+
+    def test_matches_per_rule_search(self):
+        """Test scan() agrees with searching each rule separately."""
+        rules = {
+            "imports": keywords(["import ", "from "]),
+            "class_def": [r"\bclass\s+\w+"],
+            "python_def": [r"\bdef\s+\w+\("],
+            "javascript_function": [r"\bfunction\s+\w+\("],
+            "comments": [r"#.*$|//.*$|/\*.*\*/"],
+        }
+        bank = PatternBank(rules, flags=re.MULTILINE)
+        diffs = [
+            "+import os\n+class Foo:\n+    def bar(self):\n+        # comment",
+            "+function render(props) {\n+  // todo",
+            "+from typing import List\n-  /* old */",
+            "+x = 1",
+        ]
+
+        for diff in diffs:
+            expected = {
+                label: match.group(0)
+                for label, patterns in rules.items()
+                if (match := re.search(patterns[0], diff, re.MULTILINE))
+            }
+            assert bank.scan(diff) == expected
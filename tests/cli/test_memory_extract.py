@@ -92,6 +92,30 @@ def test_extract_from_recent_commits(runner: CliRunner, initialized_project: Pat
     assert "Extracted" in result.output
 
 
+def test_extract_with_jobs(runner: CliRunner, initialized_project: Path) -> None:
+    """Test extract command with parallel commit analysis."""
+    for i in range(3):
+        (initialized_project / f"api_{i}.py").write_text(f"# API endpoint {i}\n")
+        subprocess.run(
+            ["git", "add", "."], cwd=initialized_project, check=True, capture_output=True
+        )
+        subprocess.run(
+            ["git", "commit", "-m", f"feat: Add endpoint {i}"],
+            cwd=initialized_project,
+            check=True,
+            capture_output=True,
+        )
+
+    result = runner.invoke(
+        cli,
+        ["memory", "extract", "--since", "7d", "--no-preview", "--jobs", "2"],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0
+    assert "Decisions: 3" in result.output
+
+
 def test_extract_from_specific_commit(runner: CliRunner, initialized_project: Path) -> None:
     """Test extract command with --commit option."""
     # Create a commit
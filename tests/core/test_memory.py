@@ -412,6 +412,38 @@ def test_memory_delete_nonexistent_entry_returns_false(tmp_path):
     assert success is False
 
 
+def test_memory_listeners_notified_on_changes(tmp_path):
+    """Test listeners receive the ID of added, updated and deleted entries."""
+    memory = Memory(tmp_path)
+    changed = []
+    memory.add_listener(changed.append)
+    memory.add_listener(changed.append)
+
+    def failing(memory_id):
+        raise RuntimeError("listener error")
+
+    memory.add_listener(failing)
+    now = datetime.now()
+    entry = MemoryEntry(
+        id="MEM-20260127-001",
+        type="knowledge",
+        title="Test Memory",
+        content="Test content",
+        category="test",
+        created_at=now,
+        updated_at=now,
+        source="manual",
+    )
+    memory.add(entry)
+    memory.update("MEM-20260127-001", content="Updated")
+    memory.delete("MEM-20260127-001")
+    memory.delete("MEM-20260127-001")
+    memory.remove_listener(changed.append)
+    memory.add(entry)
+
+    assert changed == ["MEM-20260127-001"] * 3
+
+
 def test_memory_list_all_empty_database(tmp_path):
     """Test listing all entries in empty database."""
     memory = Memory(tmp_path)
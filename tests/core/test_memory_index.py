@@ -0,0 +1,255 @@
+"""
+Tests for the incremental BM25 index behind MemorySearchEngine.
+
+Test Coverage:
+- Tokenization
+- Incremental add/remove/replace
+- Persistence (mmapped base + journal replay) and merging
+- Facet filters (type/category/tag masks)
+- MemorySearchEngine sync with persisted index
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from clauxton.core import memory_index
+from clauxton.core.memory import Memory, MemoryEntry, MemorySearchEngine
+from clauxton.core.memory_index import InvertedIndex, tokenize
+
+
+def _entry(num: int, title: str, content: str = "Content", mem_type: str = "knowledge"):
+    now = datetime.now()
+    return MemoryEntry(
+        id=f"MEM-20260127-{num:03d}",
+        type=mem_type,  # type: ignore[arg-type]
+        title=title,
+        content=content,
+        category="test",
+        created_at=now,
+        updated_at=now,
+        source="manual",
+    )
+
+
+# ============================================================================
+# InvertedIndex Tests
+# ============================================================================
+
+
+def test_tokenize_unigrams_bigrams_and_stop_words():
+    """Test tokenization drops stop words and adds bigrams."""
+    assert tokenize("Use the REST API") == ["use", "rest", "api", "use rest", "rest api"]
+    assert tokenize("a the of") == []
+
+
+def test_index_add_and_search():
+    """Test BM25 ranks the better match first."""
+    index = InvertedIndex()
+    index.add("a", "database migration with postgres")
+    index.add("b", "api design rest api versioning")
+    index.add("c", "frontend components")
+
+    results = index.search("api")
+
+    assert [doc_id for doc_id, _ in results] == ["b"]
+    assert results[0][1] > 0
+    assert index.search("nothing here") == []
+
+
+def test_index_remove_and_replace():
+    """Test removed and replaced documents do not leave stale postings."""
+    index = InvertedIndex()
+    index.add("a", "old api text")
+    index.add("b", "unrelated")
+
+    index.add("a", "new database text")
+    assert index.search("api") == []
+    assert [d for d, _ in index.search("database")] == ["a"]
+
+    assert index.remove("a") is True
+    assert index.remove("a") is False
+    assert index.search("database") == []
+    assert len(index) == 1
+
+
+def test_index_limit_and_ties_are_deterministic():
+    """Test limit and insertion-order tie breaking."""
+    index = InvertedIndex()
+    for i in range(10):
+        index.add(f"doc{i}", "same text")
+
+    results = index.search("text", limit=3)
+
+    assert [d for d, _ in results] == ["doc0", "doc1", "doc2"]
+
+
+def test_index_persist_and_replay_journal(tmp_path):
+    """Test mutations after save are replayed from the journal on load."""
+    index_dir = tmp_path / "memory_index"
+    index = InvertedIndex(index_dir=index_dir)
+    index.add("a", "api design", fingerprint="fa")
+    index.add("b", "database schema", fingerprint="fb")
+    index.save()
+
+    index.add("c", "api gateway", fingerprint="fc")
+    index.remove("b")
+
+    loaded = InvertedIndex.load(index_dir)
+
+    assert loaded is not None
+    assert isinstance(loaded._base_docs, np.memmap)
+    assert loaded.fingerprints() == {"a": "fa", "c": "fc"}
+    assert {d for d, _ in loaded.search("api")} == {"a", "c"}
+    assert loaded.search("database") == []
+
+
+def test_index_load_rejects_inconsistent_files(tmp_path):
+    """Test a corrupt or outdated index is ignored."""
+    index_dir = tmp_path / "memory_index"
+    index = InvertedIndex(index_dir=index_dir)
+    index.add("a", "api design")
+    index.save()
+
+    (index_dir / "meta.json").write_text("{not json")
+
+    assert InvertedIndex.load(index_dir) is None
+    assert InvertedIndex.load(tmp_path / "missing") is None
+
+
+def test_index_merge_threshold(monkeypatch):
+    """Test merge folds delta postings and tombstones into the base."""
+    monkeypatch.setattr(memory_index, "MERGE_MIN_DOCS", 2)
+    index = InvertedIndex()
+    index.add("a", "api alpha")
+    index.add("b", "api beta")
+    assert not index.needs_merge()
+    index.add("c", "api gamma")
+    assert index.needs_merge()
+
+    index.merge()
+    index.remove("b")
+
+    assert not index.needs_merge()
+    assert index._delta == {}
+    assert [d for d, _ in index.search("api gamma")] == ["c", "a"]
+
+
+def test_index_facet_filters():
+    """Test facet groups are OR'ed within and AND'ed across groups."""
+    index = InvertedIndex()
+    index.add("a", "api alpha", facets=["type:knowledge", "tag:rest"])
+    index.add("b", "api beta", facets=["type:decision", "tag:rest"])
+    index.add("c", "api gamma", facets=["type:decision", "tag:grpc"])
+
+    def ids(filters):
+        return {d for d, _ in index.search("api", filters=filters)}
+
+    assert ids([["type:decision"]]) == {"b", "c"}
+    assert ids([["type:decision", "type:knowledge"], ["tag:rest"]]) == {"a", "b"}
+    assert ids([["type:task"]]) == set()
+    assert ids([]) == {"a", "b", "c"}
+
+
+def test_index_filtered_scores_use_full_corpus_statistics():
+    """Test filtering masks results without changing scores."""
+    index = InvertedIndex()
+    index.add("a", "api design", facets=["type:knowledge"])
+    index.add("b", "api versioning api", facets=["type:decision"])
+
+    unfiltered = dict(index.search("api design"))
+    filtered = dict(index.search("api design", filters=[["type:decision"]]))
+
+    assert filtered == {"b": unfiltered["b"]}
+
+
+def test_index_facets_survive_merge_and_reload(tmp_path):
+    """Test facet bitmaps are remapped on merge and restored on load."""
+    index_dir = tmp_path / "memory_index"
+    index = InvertedIndex(index_dir=index_dir)
+    index.add("a", "api alpha", facets=["type:knowledge"])
+    index.add("b", "api beta", facets=["type:decision"])
+    index.remove("a")
+    index.save()
+    index.add("c", "api gamma", facets=["type:decision"])
+
+    loaded = InvertedIndex.load(index_dir)
+
+    assert loaded is not None
+    assert {d for d, _ in loaded.search("api", filters=[["type:decision"]])} == {"b", "c"}
+    assert loaded.search("api", filters=[["type:knowledge"]]) == []
+
+
+# ============================================================================
+# MemorySearchEngine / Memory Integration Tests
+# ============================================================================
+
+
+def test_engine_sync_reindexes_only_changed_entries(tmp_path, monkeypatch):
+    """Test a new engine on a persisted index only re-indexes changes."""
+    index_dir = tmp_path / "memory_index"
+    entries = [_entry(i, f"Entry {i}", "api design") for i in range(1, 6)]
+    MemorySearchEngine(entries, index_dir=index_dir)
+
+    added = []
+    original_add = InvertedIndex.add
+
+    def tracking_add(self, doc_id, text, fingerprint=None, facets=None):
+        added.append(doc_id)
+        original_add(self, doc_id, text, fingerprint, facets)
+
+    monkeypatch.setattr(InvertedIndex, "add", tracking_add)
+
+    entries[2] = _entry(3, "Entry 3", "database schema")
+    engine = MemorySearchEngine(entries, index_dir=index_dir)
+
+    assert added == ["MEM-20260127-003"]
+    assert [e.id for e, _ in engine.search("database")] == ["MEM-20260127-003"]
+
+
+def test_memory_index_persisted_across_instances(tmp_path):
+    """Test Memory persists the index and keeps it in sync on mutations."""
+    memory = Memory(tmp_path)
+    memory.add(_entry(1, "API Design", "Use REST"))
+    memory.add(_entry(2, "Database", "Use PostgreSQL"))
+    memory.update("MEM-20260127-002", content="Use SQLite")
+    memory.delete("MEM-20260127-001")
+
+    assert (tmp_path / ".clauxton" / "memory_index" / "meta.json").exists()
+
+    reopened = Memory(tmp_path)
+    assert reopened.search("rest") == []
+    assert [e.id for e in reopened.search("sqlite")] == ["MEM-20260127-002"]
+    assert reopened.search("postgresql") == []
+
+
+def test_memory_search_type_filter_respects_limit(tmp_path):
+    """Test type-filtered search returns up to limit matching entries."""
+    memory = Memory(tmp_path)
+    for i in range(1, 7):
+        memory.add(
+            _entry(i, f"API note {i}", mem_type="decision" if i % 2 else "knowledge")
+        )
+
+    results = memory.search("api", type_filter=["decision"], limit=2)
+
+    assert len(results) == 2
+    assert all(e.type == "decision" for e in results)
+
+
+def test_memory_search_category_and_tag_filters(tmp_path):
+    """Test category and tag filters are pushed down into the index."""
+    memory = Memory(tmp_path)
+    first = _entry(1, "API auth")
+    first.tags = ["rest"]
+    second = _entry(2, "API cache")
+    second.category = "architecture"
+    second.tags = ["grpc"]
+    memory.add(first)
+    memory.add(second)
+
+    assert [e.id for e in memory.search("api", category_filter="architecture")] == [
+        "MEM-20260127-002"
+    ]
+    assert [e.id for e in memory.search("api", tag_filter=["rest"])] == ["MEM-20260127-001"]
+    assert memory.search("api", category_filter="test", tag_filter=["grpc"]) == []
@@ -0,0 +1,203 @@
+"""
+Tests for the write-ahead log storage mode of MemoryStore.
+
+Test Coverage:
+- MemoryJournal append/replay and torn-write tolerance
+- MemoryStore "wal" mode CRUD, replay and compaction
+- Storage mode selection via config.yml
+- Memory API on top of "wal" mode
+"""
+
+from datetime import datetime
+
+from clauxton.core.memory import Memory, MemoryEntry
+from clauxton.core.memory_journal import MemoryJournal, apply_records
+from clauxton.core.memory_store import MemoryStore
+from clauxton.utils.yaml_utils import read_yaml, write_yaml
+
+
+def _entry(num: int, title: str = "Entry") -> MemoryEntry:
+    now = datetime.now()
+    return MemoryEntry(
+        id=f"MEM-20260127-{num:03d}",
+        type="knowledge",
+        title=f"{title} {num}",
+        content="Content",
+        category="test",
+        created_at=now,
+        updated_at=now,
+        source="manual",
+    )
+
+
+# ============================================================================
+# MemoryJournal Tests
+# ============================================================================
+
+
+def test_journal_append_and_read(tmp_path):
+    """Test records are read back in append order."""
+    journal = MemoryJournal(tmp_path / "memories.wal")
+
+    journal.append_put({"id": "MEM-20260127-001", "title": "A"})
+    journal.append_delete("MEM-20260127-001")
+
+    records = journal.read_records()
+    assert [r["op"] for r in records] == ["put", "delete"]
+    assert records[1]["id"] == "MEM-20260127-001"
+
+
+def test_journal_skips_torn_write(tmp_path):
+    """Test a torn trailing line is ignored and later appends still parse."""
+    journal = MemoryJournal(tmp_path / "memories.wal")
+    journal.append_put({"id": "MEM-20260127-001"})
+
+    # Simulate a crash mid-append
+    with open(journal.journal_file, "ab") as f:
+        f.write(b'{"op": "put", "entry": {"id": "MEM-2026')
+
+    journal.append_put({"id": "MEM-20260127-002"})
+
+    ids = [r["entry"]["id"] for r in journal.read_records()]
+    assert ids == ["MEM-20260127-001", "MEM-20260127-002"]
+
+
+def test_apply_records_is_idempotent():
+    """Test replaying records over a snapshot that already contains them."""
+    snapshot = [{"id": "A", "v": 1}, {"id": "B", "v": 1}]
+    records = [
+        {"op": "put", "entry": {"id": "A", "v": 2}},
+        {"op": "delete", "id": "B"},
+        {"op": "put", "entry": {"id": "C", "v": 1}},
+    ]
+
+    once = apply_records(snapshot, records)
+    twice = apply_records(once, records)
+
+    assert once == [{"id": "A", "v": 2}, {"id": "C", "v": 1}]
+    assert twice == once
+
+
+# ============================================================================
+# MemoryStore "wal" Mode Tests
+# ============================================================================
+
+
+def test_wal_save_does_not_rewrite_snapshot(tmp_path):
+    """Test save appends to the journal and leaves memories.yml untouched."""
+    store = MemoryStore(tmp_path, storage_mode="wal")
+    before = store.memories_file.read_bytes()
+
+    store.save(_entry(1))
+
+    assert store.memories_file.read_bytes() == before
+    assert store.journal_file.exists()
+    assert [e.id for e in store.load_all()] == ["MEM-20260127-001"]
+
+
+def test_wal_replay_in_new_store(tmp_path):
+    """Test a fresh store replays the journal over the snapshot."""
+    store = MemoryStore(tmp_path, storage_mode="wal")
+    store.save(_entry(1))
+    store.save(_entry(2))
+    store.save(_entry(1, title="Updated"))
+    store.delete("MEM-20260127-002")
+
+    reopened = MemoryStore(tmp_path, storage_mode="wal")
+    entries = reopened.load_all()
+
+    assert [e.id for e in entries] == ["MEM-20260127-001"]
+    assert entries[0].title == "Updated 1"
+    assert isinstance(entries[0].created_at, datetime)
+
+
+def test_wal_delete_nonexistent(tmp_path):
+    """Test deleting a missing entry does not journal anything."""
+    store = MemoryStore(tmp_path, storage_mode="wal")
+
+    assert store.delete("MEM-20260127-999") is False
+    assert store.journal_file.exists() is False
+
+
+def test_wal_sees_writes_from_other_instance(tmp_path):
+    """Test cached entries are refreshed when another writer appends."""
+    reader = MemoryStore(tmp_path, storage_mode="wal")
+    writer = MemoryStore(tmp_path, storage_mode="wal")
+    assert reader.load_all() == []
+
+    writer.save(_entry(1))
+
+    assert [e.id for e in reader.load_all()] == ["MEM-20260127-001"]
+
+
+def test_wal_compact_folds_journal(tmp_path):
+    """Test compaction writes the snapshot and truncates the journal."""
+    store = MemoryStore(tmp_path, storage_mode="wal")
+    for i in range(1, 4):
+        store.save(_entry(i))
+    store.delete("MEM-20260127-003")
+
+    store.compact()
+
+    assert store.journal_file.stat().st_size == 0
+    data = read_yaml(store.memories_file)
+    assert [m["id"] for m in data["memories"]] == [
+        "MEM-20260127-001",
+        "MEM-20260127-002",
+    ]
+    assert len(MemoryStore(tmp_path, storage_mode="wal").load_all()) == 2
+
+
+def test_wal_background_compaction_threshold(tmp_path):
+    """Test compaction starts automatically past the threshold."""
+    store = MemoryStore(tmp_path, storage_mode="wal", compaction_threshold=3)
+    for i in range(1, 4):
+        store.save(_entry(i))
+
+    store.wait_for_compaction(timeout=10)
+
+    assert store.journal_file.stat().st_size == 0
+    assert len(read_yaml(store.memories_file)["memories"]) == 3
+    assert len(store.load_all()) == 3
+
+
+def test_yaml_mode_compact_is_noop(tmp_path):
+    """Test compact() does nothing in the default mode."""
+    store = MemoryStore(tmp_path)
+    store.save(_entry(1))
+
+    store.compact()
+
+    assert store.storage_mode == "yaml"
+    assert not store.journal_file.exists()
+
+
+def test_storage_mode_from_config(tmp_path):
+    """Test memory_storage in config.yml selects the mode."""
+    clauxton_dir = tmp_path / ".clauxton"
+    clauxton_dir.mkdir()
+    write_yaml(clauxton_dir / "config.yml", {"memory_storage": "wal"}, backup=False)
+
+    assert MemoryStore(tmp_path).storage_mode == "wal"
+
+    write_yaml(clauxton_dir / "config.yml", {"memory_storage": "bogus"}, backup=False)
+    assert MemoryStore(tmp_path).storage_mode == "yaml"
+
+
+def test_memory_api_on_wal_mode(tmp_path):
+    """Test Memory works unchanged on top of "wal" mode."""
+    clauxton_dir = tmp_path / ".clauxton"
+    clauxton_dir.mkdir()
+    write_yaml(clauxton_dir / "config.yml", {"memory_storage": "wal"}, backup=False)
+
+    memory = Memory(tmp_path)
+    memory.add(_entry(1, title="Database migration"))
+    memory.add(_entry(2, title="API design"))
+    assert memory.update("MEM-20260127-002", content="Use REST")
+    assert memory.delete("MEM-20260127-001")
+
+    reopened = Memory(tmp_path)
+    entries = reopened.list_all()
+    assert [e.id for e in entries] == ["MEM-20260127-002"]
+    assert entries[0].content == "Use REST"
+    assert reopened.store.storage_mode == "wal"
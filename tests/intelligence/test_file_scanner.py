@@ -0,0 +1,96 @@
+"""Tests for clauxton.intelligence.file_scanner module."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from clauxton.intelligence.file_scanner import GitignoreMatcher, scan_files
+from clauxton.intelligence.repository_map import RepositoryMap
+
+
+@pytest.mark.parametrize(
+    "patterns, path, is_dir, expected",
+    [
+        (["*.log"], "logs/app.log", False, True),
+        (["*.log", "!keep.log"], "logs/keep.log", False, False),
+        (["!keep.log", "*.log"], "keep.log", False, True),
+        (["/build"], "build", True, True),
+        (["/build"], "src/build", True, False),
+        (["docs/*.md"], "docs/a.md", False, True),
+        (["docs/*.md"], "docs/sub/a.md", False, False),
+        (["docs/**/*.md"], "docs/sub/deep/a.md", False, True),
+        (["**/tmp"], "a/b/tmp", True, True),
+        (["out/"], "out", True, True),
+        (["out/"], "out", False, False),
+        (["# comment", "", "\\#hash"], "#hash", False, True),
+        (["file[0-9].txt"], "file7.txt", False, True),
+        (["file[!0-9].txt"], "file7.txt", False, False),
+    ],
+)
+def test_matcher_rules(patterns, path, is_dir, expected):
+    """Test gitignore negation, anchoring and wildcard semantics."""
+    assert GitignoreMatcher(patterns).match(path, is_dir=is_dir) is expected
+
+
+def test_is_ignored_checks_parent_directories():
+    """Test files under an ignored directory cannot be re-included."""
+    matcher = GitignoreMatcher(["vendor/", "!vendor/keep.py"])
+
+    assert matcher.is_ignored("vendor/keep.py")
+    assert not matcher.is_ignored("src/keep.py")
+
+
+def test_scan_files_prunes_ignored_directories(tmp_path, monkeypatch):
+    """Test ignored directories are never listed."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("x = 1\n")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(Path(path).name)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+    results = list(scan_files(tmp_path, GitignoreMatcher(["node_modules"])))
+
+    assert [relative for relative, _, _ in results] == [os.path.join("src", "main.py")]
+    assert results[0][2].st_size == 6
+    assert "node_modules" not in scanned
+
+
+def test_index_applies_negated_gitignore_rules(tmp_path):
+    """Test RepositoryMap.index honours negation in .gitignore."""
+    (tmp_path / ".gitignore").write_text("*.log\n!keep.log\n")
+    (tmp_path / "drop.log").write_text("")
+    (tmp_path / "keep.log").write_text("")
+
+    repo_map = RepositoryMap(tmp_path)
+    repo_map.index()
+
+    paths = {f["relative_path"] for f in repo_map.index_data["files"]}
+    assert paths == {".gitignore", "keep.log"}
+
+
+def test_index_reuses_scan_stat(tmp_path, monkeypatch):
+    """Test indexing passes the scan's stat result to _categorize_file."""
+    (tmp_path / "main.py").write_text("def main(): pass\n")
+
+    repo_map = RepositoryMap(tmp_path)
+    categorize = repo_map._categorize_file
+    stats = []
+
+    def tracking_categorize(file_path, stat=None):
+        stats.append(stat)
+        return categorize(file_path, stat)
+
+    monkeypatch.setattr(repo_map, "_categorize_file", tracking_categorize)
+    result = repo_map.index()
+
+    assert result.files_indexed == 1
+    assert stats[0] is not None
+    assert repo_map.index_data["files"][0]["size_bytes"] == stats[0].st_size
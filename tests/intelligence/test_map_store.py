@@ -0,0 +1,145 @@
+"""Tests for clauxton.intelligence.map_store module."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from clauxton.intelligence.map_store import LazyIndex, ShardedSymbols, ShardWriter
+from clauxton.intelligence.repository_map import RepositoryMap
+
+
+def _symbol(name: str, file_path: str) -> dict:
+    return {
+        "name": name,
+        "type": "function",
+        "file_path": file_path,
+        "line_start": 1,
+        "line_end": 1,
+        "docstring": None,
+        "signature": None,
+    }
+
+
+def _shard_for(path: str):
+    return {".py": "python", ".go": "go"}.get(os.path.splitext(path)[1])
+
+
+def _write(map_dir: Path) -> dict:
+    writer = ShardWriter(map_dir)
+    writer.add_files([{"relative_path": "a.py"}, {"relative_path": "b.go"}])
+    writer.add_symbols("python", "a.py", [_symbol("alpha", "a.py")])
+    writer.add_symbols("go", "b.go", [_symbol("beta", "b.go"), _symbol("gamma", "b.go")])
+    return writer.commit({"version": "0.11.0"})
+
+
+def test_commit_writes_compact_manifest(tmp_path):
+    """Test manifest lists shards with counts and no file records."""
+    manifest = _write(tmp_path)
+
+    on_disk = json.loads((tmp_path / "index.json").read_text())
+    assert on_disk == manifest
+    assert "files" not in on_disk
+    assert on_disk["shards"] == {
+        "python": {"files": 1, "symbols": 1},
+        "go": {"files": 1, "symbols": 2},
+    }
+
+
+def test_sharded_symbols_loads_only_needed_shard(tmp_path):
+    """Test a lookup reads only the shard of the file's language."""
+    symbols = ShardedSymbols(tmp_path, _write(tmp_path), _shard_for)
+
+    assert [s["name"] for s in symbols["b.go"]] == ["beta", "gamma"]
+    assert list(symbols._loaded) == ["go"]
+    assert "missing.py" not in symbols
+    assert len(symbols) == 2
+    assert symbols.symbol_count() == 3
+    assert list(symbols) == ["a.py", "b.go"]
+
+
+def test_lazy_index_reads_files_on_access(tmp_path):
+    """Test file records are parsed only when "files" is requested."""
+    index = LazyIndex(tmp_path, _write(tmp_path))
+
+    assert "files" not in index
+    assert [f["relative_path"] for f in index["files"]] == ["a.py", "b.go"]
+
+
+def test_abort_keeps_previous_generation(tmp_path):
+    """Test an aborted run leaves the published index readable."""
+    manifest = _write(tmp_path)
+
+    writer = ShardWriter(tmp_path)
+    writer.add_symbols("python", "a.py", [])
+    writer.abort()
+
+    assert not writer.directory.exists()
+    symbols = ShardedSymbols(tmp_path, manifest, _shard_for)
+    assert [s["name"] for s in symbols["a.py"]] == ["alpha"]
+
+
+def test_commit_keeps_replaced_generation(tmp_path):
+    """Test the replaced generation stays readable and older ones are removed."""
+    (tmp_path / "symbols.json").write_text("{}")
+    first = _write(tmp_path)
+    second = _write(tmp_path)
+    third = _write(tmp_path)
+
+    assert len({first["generation"], second["generation"], third["generation"]}) == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        ["index.json", second["generation"], third["generation"]]
+    )
+    symbols = ShardedSymbols(tmp_path, second, _shard_for)
+    assert [s["name"] for s in symbols["a.py"]] == ["alpha"]
+
+
+def test_commit_keeps_concurrent_generation(tmp_path):
+    """Test a run in progress keeps its generation when another run publishes."""
+    _write(tmp_path)
+    slow = ShardWriter(tmp_path)
+    _write(tmp_path)
+
+    assert slow.directory.exists()
+    slow.add_files([{"relative_path": "a.py"}])
+    slow.add_symbols("python", "a.py", [_symbol("alpha", "a.py")])
+    manifest = slow.commit({"version": "0.11.0"})
+
+    symbols = ShardedSymbols(tmp_path, manifest, _shard_for)
+    assert [s["name"] for s in symbols["a.py"]] == ["alpha"]
+
+
+def test_incremental_index_reuses_untouched_shards(tmp_path):
+    """Test shards of languages without changes are carried over unread."""
+    (tmp_path / "a.py").write_text("def alpha(): pass\n")
+    (tmp_path / "b.py").write_text("def beta(): pass\n")
+    (tmp_path / "notes.md").write_text("# Notes\n")
+    RepositoryMap(tmp_path).index()
+
+    (tmp_path / "notes.md").write_text("# Notes\n\nMore.\n")
+    repo_map = RepositoryMap(tmp_path)
+    result = repo_map.index(incremental=True)
+
+    assert result.symbols_found == 2
+    assert repo_map.symbols_data._loaded == {}
+    assert [s.name for s in RepositoryMap(tmp_path).search("beta")] == ["beta"]
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_index_matches_legacy_symbols(tmp_path, incremental):
+    """Test legacy index.json/symbols.json are read and replaced by shards."""
+    (tmp_path / "a.py").write_text("def alpha(): pass\n")
+    map_dir = tmp_path / ".clauxton" / "map"
+    map_dir.mkdir(parents=True)
+    (map_dir / "index.json").write_text(json.dumps({"version": "0.11.0", "files": []}))
+    (map_dir / "symbols.json").write_text(json.dumps({"old.py": [_symbol("old", "old.py")]}))
+
+    repo_map = RepositoryMap(tmp_path)
+    assert list(repo_map.symbols_data) == ["old.py"]
+
+    repo_map.clear_cache()
+    repo_map.index(incremental=incremental)
+
+    assert not (map_dir / "symbols.json").exists()
+    assert list(RepositoryMap(tmp_path).symbols_data) == ["a.py"]
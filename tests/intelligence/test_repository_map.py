@@ -1,5 +1,7 @@
 """Tests for clauxton.intelligence.repository_map module."""
 
+import json
+from collections.abc import Mapping
 from pathlib import Path
 
 import pytest
@@ -566,11 +568,13 @@ class TestRepositoryMapFileIndexing:
         repo_map = RepositoryMap(tmp_path)
         repo_map.index()
 
-        # Check that index file was created
-        assert (tmp_path / ".clauxton" / "map" / "index.json").exists()
-        # symbols.json is only created if symbols were found
-        # Since we have a source file with a function, symbols should exist
-        assert (tmp_path / ".clauxton" / "map" / "symbols.json").exists()
+        # Check that the manifest was created
+        map_dir = tmp_path / ".clauxton" / "map"
+        manifest = json.loads((map_dir / "index.json").read_text())
+        # Symbol shards are only created for languages with symbols
+        assert list(manifest["shards"]) == ["python"]
+        assert (map_dir / manifest["generation"] / "symbols-python.jsonl").exists()
+        assert (map_dir / manifest["generation"] / "files.jsonl").exists()
 
     def test_index_data_after_indexing(self, tmp_path):
         """Test that index_data property works after indexing."""
@@ -593,7 +597,7 @@ class TestRepositoryMapFileIndexing:
         repo_map.index()
 
         symbols = repo_map.symbols_data
-        assert isinstance(symbols, dict)
+        assert isinstance(symbols, Mapping)
         # Should have symbols for module.py
         assert len(symbols) >= 1
 
@@ -671,6 +675,164 @@ class TestRepositoryMapFileIndexing:
         assert result.files_indexed == 1
 
 
+class TestRepositoryMapIncrementalIndex:
+    """Test RepositoryMap.index(incremental=True)."""
+
+    def test_incremental_noop_does_not_reparse(self, tmp_path, monkeypatch):
+        """Test unchanged files are neither re-read nor written."""
+        (tmp_path / "a.py").write_text("def alpha(): pass")
+        (tmp_path / "b.py").write_text("def beta(): pass")
+        RepositoryMap(tmp_path).index()
+        index_file = tmp_path / ".clauxton" / "map" / "index.json"
+        mtime_before = index_file.stat().st_mtime_ns
+
+        repo_map = RepositoryMap(tmp_path)
+        monkeypatch.setattr(
+            repo_map, "_categorize_file", lambda path: pytest.fail(f"re-read {path}")
+        )
+        result = repo_map.index(incremental=True)
+
+        assert result.files_indexed == 2
+        assert result.symbols_found == 2
+        assert index_file.stat().st_mtime_ns == mtime_before
+        assert [s.name for s in repo_map.search("alpha")] == ["alpha"]
+
+    def test_incremental_updates_changed_added_and_deleted(self, tmp_path):
+        """Test only changed, added and deleted files update the index."""
+        import os
+
+        (tmp_path / "a.py").write_text("def alpha(): pass")
+        (tmp_path / "b.py").write_text("def beta(): pass")
+        RepositoryMap(tmp_path).index()
+
+        changed = tmp_path / "a.py"
+        changed.write_text("def alpha_v2(): pass\ndef extra(): pass")
+        os.utime(changed, ns=(1, 1))
+        (tmp_path / "b.py").unlink()
+        (tmp_path / "c.py").write_text("def gamma(): pass")
+
+        repo_map = RepositoryMap(tmp_path)
+        result = repo_map.index(incremental=True)
+
+        assert result.files_indexed == 2
+        assert set(repo_map.symbols_data) == {"a.py", "c.py"}
+        assert repo_map.search("beta") == []
+        assert [s.name for s in repo_map.search("alpha")] == ["alpha_v2"]
+
+        reloaded = RepositoryMap(tmp_path)
+        assert [s.name for s in reloaded.search("gamma")] == ["gamma"]
+        assert {f["relative_path"] for f in reloaded.index_data["files"]} == {"a.py", "c.py"}
+
+    def test_incremental_without_symbol_changes_keeps_symbol_index(
+        self, tmp_path, monkeypatch
+    ):
+        """Test a run changing only symbol-less files does not stale symbols.db."""
+        import os
+
+        from clauxton.intelligence.symbol_index import SymbolIndex
+
+        (tmp_path / "a.py").write_text("def alpha(): pass")
+        (tmp_path / "README.md").write_text("# Project")
+        RepositoryMap(tmp_path).index()
+
+        readme = tmp_path / "README.md"
+        readme.write_text("# Project\n\nMore.")
+        os.utime(readme, ns=(1, 1))
+        RepositoryMap(tmp_path).index(incremental=True)
+
+        monkeypatch.setattr(
+            SymbolIndex, "rebuild", lambda *args, **kwargs: pytest.fail("rebuilt symbols.db")
+        )
+        assert [s.name for s in RepositoryMap(tmp_path).search("alpha")] == ["alpha"]
+
+    def test_incremental_rebuilds_lagging_symbol_index(self, tmp_path):
+        """Test a symbols.db older than the previous generation is rebuilt, not patched."""
+        import os
+        import shutil
+
+        (tmp_path / "a.py").write_text("def alpha(): pass")
+        (tmp_path / "b.py").write_text("def beta(): pass")
+        RepositoryMap(tmp_path).index()
+        db_file = tmp_path / ".clauxton" / "map" / "symbols.db"
+        shutil.copyfile(db_file, tmp_path / "symbols.db.bak")
+
+        changed = tmp_path / "a.py"
+        changed.write_text("def alpha_renamed(): pass")
+        os.utime(changed, ns=(1, 1))
+        RepositoryMap(tmp_path).index(incremental=True)
+
+        # symbols.db left behind by a crash after the manifest was written
+        shutil.copyfile(tmp_path / "symbols.db.bak", db_file)
+        changed = tmp_path / "b.py"
+        changed.write_text("def beta_renamed(): pass")
+        os.utime(changed, ns=(2, 2))
+        RepositoryMap(tmp_path).index(incremental=True)
+
+        repo_map = RepositoryMap(tmp_path)
+        assert [s.name for s in repo_map.search("alpha_renamed")] == ["alpha_renamed"]
+        assert [s.name for s in repo_map.search("beta_renamed")] == ["beta_renamed"]
+        assert [s.name for s in repo_map.search("alpha")] == ["alpha_renamed"]
+
+    def test_incremental_without_previous_index(self, tmp_path):
+        """Test incremental indexing falls back to a full index."""
+        (tmp_path / "a.py").write_text("def alpha(): pass")
+
+        repo_map = RepositoryMap(tmp_path)
+        result = repo_map.index(incremental=True)
+
+        assert result.symbols_found == 1
+        assert (tmp_path / ".clauxton" / "map" / "index.json").exists()
+
+
+class TestRepositoryMapParallelIndex:
+    """Test RepositoryMap.index(workers=N)."""
+
+    def _make_repo(self, root):
+        for d in range(3):
+            pkg = root / f"pkg{d}"
+            pkg.mkdir()
+            for i in range(6):
+                (pkg / f"mod{i}.py").write_text(f"def func_{d}_{i}(): pass\nclass C{d}{i}: pass\n")
+
+    def test_parallel_output_matches_serial(self, tmp_path):
+        """Test symbols and file order do not depend on worker count."""
+        serial_root = tmp_path / "serial"
+        parallel_root = tmp_path / "parallel"
+        serial_root.mkdir()
+        parallel_root.mkdir()
+        self._make_repo(serial_root)
+        self._make_repo(parallel_root)
+
+        serial = RepositoryMap(serial_root)
+        serial_result = serial.index()
+        parallel = RepositoryMap(parallel_root)
+        parallel_result = parallel.index(workers=2)
+
+        assert parallel_result.symbols_found == serial_result.symbols_found == 36
+        assert list(parallel.symbols_data) == list(serial.symbols_data)
+        assert parallel.symbols_data == {
+            path: [
+                {**sym, "file_path": sym["file_path"].replace(str(serial_root), str(parallel_root))}
+                for sym in syms
+            ]
+            for path, syms in serial.symbols_data.items()
+        }
+
+    def test_parallel_progress_reports_total(self, tmp_path):
+        """Test extraction progress includes the number of files to extract."""
+        self._make_repo(tmp_path)
+        calls = []
+
+        RepositoryMap(tmp_path).index(
+            progress_callback=lambda current, total, status: calls.append((current, total)),
+            workers=2,
+        )
+
+        extraction = [call for call in calls if call[1] is not None]
+        assert [current for current, _ in extraction] == list(range(1, 19))
+        assert {total for _, total in extraction} == {18}
+
+
 class TestRepositoryMapHelperMethods:
     """Test helper methods."""
 
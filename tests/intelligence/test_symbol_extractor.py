@@ -103,6 +103,32 @@ class TestSymbolExtractorIntegration:
         assert symbols == []
 
 
+    def test_extractors_built_lazily(self, tmp_path):
+        """Test only languages actually used are initialized."""
+        SymbolExtractor.clear_cache()
+        extractor = SymbolExtractor()
+
+        assert extractor.extractors.loaded() == []
+        assert "go" in extractor.extractors
+        assert extractor.extractors.loaded() == []
+
+        test_file = tmp_path / "test.py"
+        test_file.write_text("def hello(): pass")
+        extractor.extract(test_file, "python")
+
+        assert extractor.extractors.loaded() == ["python"]
+
+    def test_extractors_cached_per_process(self):
+        """Test extractors are shared across SymbolExtractor instances."""
+        first = SymbolExtractor().extractors["python"]
+        second = SymbolExtractor().extractors["python"]
+
+        assert first is second
+
+        SymbolExtractor.clear_cache()
+        assert SymbolExtractor().extractors["python"] is not first
+
+
 class TestPythonSymbolExtractor:
     """Test PythonSymbolExtractor class."""
 
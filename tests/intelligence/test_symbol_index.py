@@ -0,0 +1,131 @@
+"""Tests for clauxton.intelligence.symbol_index module."""
+
+import json
+from pathlib import Path
+
+from clauxton.intelligence.repository_map import RepositoryMap
+from clauxton.intelligence.symbol_index import SymbolIndex
+
+
+def _symbol(name: str, line: int, docstring: str | None = None) -> dict:
+    return {
+        "name": name,
+        "type": "function",
+        "file_path": "module.py",
+        "line_start": line,
+        "line_end": line,
+        "docstring": docstring,
+        "signature": f"def {name}()",
+    }
+
+
+def _build(tmp_path: Path) -> SymbolIndex:
+    index = SymbolIndex(tmp_path / "symbols.db")
+    index.rebuild(
+        {
+            "module.py": [
+                _symbol("get_user", 1),
+                _symbol("User", 2, "A user account."),
+                _symbol("user", 3),
+                _symbol("load_users", 4),
+                _symbol("login", 5, "Authenticate a USER session."),
+            ]
+        }
+    )
+    return index
+
+
+class TestSymbolIndex:
+    """Test SymbolIndex lookups."""
+
+    def test_rebuild_and_len(self, tmp_path):
+        """Test rebuild creates a valid database."""
+        index = _build(tmp_path)
+
+        assert index.is_valid()
+        assert len(index) == 5
+
+    def test_source_is_recorded_by_rebuild_and_update(self, tmp_path):
+        """Test the source identifier changes even if no symbol row does."""
+        index = _build(tmp_path)
+        assert index.source() is None
+
+        index.rebuild({"module.py": [_symbol("login", 1)]}, source="shards-1")
+        assert index.source() == "shards-1"
+
+        index.update_files({"README.md": []}, source="shards-2")
+        assert SymbolIndex(tmp_path / "symbols.db").source() == "shards-2"
+        assert len(index) == 1
+
+    def test_is_valid_false_for_missing_or_corrupt_db(self, tmp_path):
+        """Test invalid databases are detected."""
+        assert not SymbolIndex(tmp_path / "missing.db").is_valid()
+
+        corrupt = tmp_path / "corrupt.db"
+        corrupt.write_bytes(b"not a database")
+        assert not SymbolIndex(corrupt).is_valid()
+
+    def test_lookup_is_case_insensitive(self, tmp_path):
+        """Test exact name lookup."""
+        index = _build(tmp_path)
+
+        assert [s["line_start"] for s in index.lookup("USER")] == [2, 3]
+        assert index.lookup("missing") == []
+
+    def test_search_exact_tiers(self, tmp_path):
+        """Test exact, prefix, substring, docstring ranking order."""
+        index = _build(tmp_path)
+
+        names = [s["name"] for s in index.search_exact("user")]
+
+        assert names == ["User", "user", "get_user", "load_users", "login"]
+
+    def test_search_exact_limit_and_short_query(self, tmp_path):
+        """Test limit and queries too short for the trigram index."""
+        index = _build(tmp_path)
+
+        assert [s["name"] for s in index.search_exact("user", limit=2)] == ["User", "user"]
+        assert [s["name"] for s in index.search_exact("lo")] == ["load_users", "login"]
+
+    def test_get_many_preserves_order(self, tmp_path):
+        """Test get_many returns symbols in requested order."""
+        index = _build(tmp_path)
+        ids = [symbol_id for symbol_id, _ in index.iter_names()]
+
+        names = [s["name"] for s in index.get_many([ids[4], ids[0]])]
+
+        assert names == ["login", "get_user"]
+
+
+class TestRepositoryMapSymbolIndex:
+    """Test RepositoryMap integration with SymbolIndex."""
+
+    def test_index_writes_symbol_db(self, tmp_path):
+        """Test indexing builds symbols.db next to symbols.json."""
+        (tmp_path / "module.py").write_text("def hello(): pass\n")
+
+        RepositoryMap(tmp_path).index()
+
+        assert (tmp_path / ".clauxton" / "map" / "symbols.db").exists()
+
+    def test_search_builds_db_from_legacy_symbols_json(self, tmp_path):
+        """Test a symbols.json without symbols.db is migrated on first search."""
+        repo_map = RepositoryMap(tmp_path)
+        (repo_map.map_dir / "symbols.json").write_text(
+            json.dumps({"module.py": [_symbol("legacy_func", 1)]})
+        )
+
+        results = RepositoryMap(tmp_path).search("legacy")
+
+        assert [s.name for s in results] == ["legacy_func"]
+        assert (repo_map.map_dir / "symbols.db").exists()
+
+    def test_search_without_fts_falls_back_to_scan(self, tmp_path):
+        """Test substring tiers work without the FTS table."""
+        index = _build(tmp_path)
+        index._connection().execute("DROP TABLE symbols_fts")
+        index.close()
+
+        names = [s["name"] for s in SymbolIndex(tmp_path / "symbols.db").search_exact("user")]
+
+        assert names == ["User", "user", "get_user", "load_users", "login"]
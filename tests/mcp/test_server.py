@@ -1226,3 +1226,51 @@ def test_index_repository_statistics_accuracy(
 
     # Verify timestamp
     assert result["indexed_at"] == "2025-10-23T14:30:00"
+
+
+# ============================================================================
+# Background Semantic Indexing Tests
+# ============================================================================
+
+
+def test_semantic_index_background_queues_memory_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test enabling background indexing feeds memory_add into the queue."""
+    from clauxton.mcp import server
+
+    pytest.importorskip("faiss")
+    import numpy as np
+
+    from clauxton.semantic.vector_store import VectorStore
+
+    engine = MagicMock()
+    engine.get_dimension.return_value = 8
+    engine.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 8), dtype=np.float32)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(server, "_get_embedding_engine", lambda: engine)
+    monkeypatch.setattr(server, "_index_service", None)
+    monkeypatch.setattr(server, "_file_monitor", None)
+
+    assert server.get_semantic_index_status()["status"] == "not_started"
+    result = server.semantic_index_background(enabled=True)
+    try:
+        assert result["status"] == "enabled"
+        assert server.semantic_index_background(enabled=True)["status"] == "already_enabled"
+
+        added = server.memory_add(
+            type="decision", title="Retry policy", content="Retry three times", category="api"
+        )
+        assert server._index_service is not None
+        assert server._index_service.wait_idle(timeout=10)
+        status = server.get_semantic_index_status()
+    finally:
+        disabled = server.semantic_index_background(enabled=False)
+
+    assert status["status"] == "success"
+    assert status["index"]["failed"] == 0
+    assert not status["index"]["stale"]
+    assert disabled["status"] == "disabled"
+    # Indexed by the initial rescan or by the queued memory job
+    store = VectorStore.load(tmp_path / ".clauxton" / "semantic" / "memory_index", dimension=8)
+    assert [meta["source_id"] for meta in store.metadata] == [added["id"]]
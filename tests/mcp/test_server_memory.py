@@ -192,7 +192,11 @@ def test_memory_search_with_type_filter(mock_memory_class: MagicMock, tmp_path:
 
     assert results == []
     mock_memory.search.assert_called_once_with(
-        "test", type_filter=["knowledge", "decision"], limit=10
+        "test",
+        type_filter=["knowledge", "decision"],
+        limit=10,
+        category_filter=None,
+        tag_filter=None,
     )
 
 
@@ -219,7 +223,9 @@ def test_memory_search_with_limit(mock_memory_class: MagicMock, tmp_path: Path)
     with patch("clauxton.mcp.server._get_project_root", return_value=tmp_path):
         _results = memory_search("test", limit=5)
 
-    mock_memory.search.assert_called_once_with("test", type_filter=None, limit=5)
+    mock_memory.search.assert_called_once_with(
+        "test", type_filter=None, limit=5, category_filter=None, tag_filter=None
+    )
 
 
 @patch("clauxton.mcp.server.Memory")
@@ -0,0 +1,126 @@
+"""
+Tests for the MCP server's warm instance cache.
+
+Tests cover:
+- Reuse of instances while watched files are unchanged
+- Rebuild on external file changes
+- Per-root invalidation
+- Integration with MCP tools
+"""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from clauxton.core.knowledge_base import KnowledgeBase
+from clauxton.core.models import KnowledgeBaseEntry
+from clauxton.mcp import server
+from clauxton.mcp.server import kb_search
+from clauxton.mcp.state_cache import StateCache, file_signature
+
+
+def test_get_reuses_instance_until_file_changes(tmp_path: Path) -> None:
+    """Test instance is reused until a watched file changes."""
+    (tmp_path / ".clauxton").mkdir()
+    data = tmp_path / ".clauxton" / "data.yml"
+    data.write_text("a: 1\n")
+    factory = MagicMock(side_effect=lambda root: object())
+    cache = StateCache()
+
+    first = cache.get(factory, tmp_path, ["data.yml"])
+    assert cache.get(factory, tmp_path, ["data.yml"]) is first
+    assert factory.call_count == 1
+
+    data.write_text("a: 1\nb: 2\n")
+
+    assert cache.get(factory, tmp_path, ["data.yml"]) is not first
+    assert factory.call_count == 2
+
+
+def test_get_rebuilds_when_file_created_or_removed(tmp_path: Path) -> None:
+    """Test creating or deleting a watched file invalidates the instance."""
+    (tmp_path / ".clauxton").mkdir()
+    factory = MagicMock(side_effect=lambda root: object())
+    cache = StateCache()
+
+    first = cache.get(factory, tmp_path, ["data.yml"])
+    (tmp_path / ".clauxton" / "data.yml").write_text("x\n")
+    second = cache.get(factory, tmp_path, ["data.yml"])
+    (tmp_path / ".clauxton" / "data.yml").unlink()
+    third = cache.get(factory, tmp_path, ["data.yml"])
+
+    assert first is not second
+    assert second is not third
+
+
+def test_invalidate_by_root(tmp_path: Path) -> None:
+    """Test invalidate drops only the given project's instances."""
+    root_a = tmp_path / "a"
+    root_b = tmp_path / "b"
+    root_a.mkdir()
+    root_b.mkdir()
+    factory = MagicMock(side_effect=lambda root: object())
+    cache = StateCache()
+    cache.get(factory, root_a, ["data.yml"])
+    cache.get(factory, root_b, ["data.yml"])
+
+    cache.invalidate(root_a)
+
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_file_signature_missing_file(tmp_path: Path) -> None:
+    """Test missing files are stamped with None."""
+    assert file_signature(tmp_path, ["missing.yml"]) == (("missing.yml", None, None, None),)
+
+
+def test_kb_search_uses_warm_instance(tmp_path: Path) -> None:
+    """Test repeated kb_search calls reuse one KnowledgeBase."""
+    cache = StateCache()
+    KnowledgeBase(tmp_path)
+
+    with patch.object(server, "_state_cache", cache), patch(
+        "clauxton.mcp.server.Path.cwd", return_value=tmp_path
+    ), patch("clauxton.mcp.server.KnowledgeBase", wraps=KnowledgeBase) as kb_class:
+        kb_search("api")
+        kb_search("api")
+        assert kb_class.call_count == 1
+
+        # External write (e.g., CLI) is picked up on the next call
+        KnowledgeBase(tmp_path).add(
+            KnowledgeBaseEntry(
+                id="KB-20251019-001",
+                title="API Design",
+                category="architecture",
+                content="Use REST API",
+                tags=["api"],
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+        )
+        results = kb_search("api")
+
+    assert kb_class.call_count == 2
+    assert [r["id"] for r in results] == ["KB-20251019-001"]
+
+
+def test_semantic_search_engine_is_reused(tmp_path: Path) -> None:
+    """Test semantic tools share one engine per root and one model."""
+    pytest.importorskip("faiss")
+    cache = StateCache()
+    model = MagicMock()
+
+    with patch.object(server, "_state_cache", cache), patch.object(
+        server, "_get_embedding_engine", return_value=model
+    ):
+        engine = server._get_semantic_search(tmp_path)
+        assert server._get_semantic_search(tmp_path) is engine
+        other = server._get_semantic_search(tmp_path / "other")
+
+    assert other is not engine
+    assert engine.embedding_engine is model
+    assert other.embedding_engine is model
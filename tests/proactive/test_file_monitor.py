@@ -238,6 +238,21 @@ class TestFileMonitor:
         assert len(changes) == 1
         assert "recent.txt" in str(changes[0].path)
 
+    def test_listeners_receive_changes(self, tmp_path: Path) -> None:
+        """Test listeners are called with queued changes only."""
+        monitor = FileMonitor(tmp_path)
+        received: list[FileChange] = []
+        monitor.add_listener(received.append)
+        monitor.add_listener(received.append)
+
+        monitor.event_handler._add_change(tmp_path / "app.py", ChangeType.MODIFIED)
+        monitor.event_handler._add_change(tmp_path / "app.pyc", ChangeType.MODIFIED)
+        monitor.remove_listener(received.append)
+        monitor.event_handler._add_change(tmp_path / "other.py", ChangeType.CREATED)
+
+        assert [change.path.name for change in received] == ["app.py"]
+        assert len(monitor.change_queue) == 2
+
     def test_clear_history(self, tmp_path: Path) -> None:
         """Test clearing change history."""
         monitor = FileMonitor(tmp_path)
@@ -0,0 +1,81 @@
+"""Tests for code chunking used by semantic file indexing."""
+
+import pytest
+
+from clauxton.semantic.chunker import chunk_code
+
+
+def _lines(count: int) -> str:
+    return "\n".join(f"line_{i} = {i}" for i in range(1, count + 1))
+
+
+def test_short_file_is_single_chunk() -> None:
+    """Test files within max_lines are not split."""
+    text = "def login():\n    return True\n"
+    symbols = [{"name": "login", "line_start": 1, "line_end": 2}]
+
+    chunks = chunk_code(text, symbols, max_lines=10)
+
+    assert chunks == [
+        {"text": "def login():\n    return True", "line_start": 1, "line_end": 2,
+         "symbols": ["login"]}
+    ]
+
+
+def test_sliding_windows_without_symbols() -> None:
+    """Test long files without symbols are split into overlapping windows."""
+    chunks = chunk_code(_lines(25), max_lines=10, overlap=2)
+
+    assert [(c["line_start"], c["line_end"]) for c in chunks] == [
+        (1, 10), (9, 18), (17, 25)
+    ]
+    assert chunks[1]["text"].splitlines()[0] == "line_9 = 9"
+
+
+def test_symbol_boundaries_and_merging() -> None:
+    """Test chunks follow top-level symbols and merge small neighbours."""
+    text = _lines(30)
+    symbols = [
+        {"name": "first", "line_start": 3, "line_end": 6},
+        {"name": "second", "line_start": 8, "line_end": 12},
+        {"name": "method", "line_start": 9, "line_end": 10},  # nested, ignored
+        {"name": "third", "line_start": 14, "line_end": 25},
+    ]
+
+    chunks = chunk_code(text, symbols, max_lines=12, overlap=2)
+
+    assert [(c["line_start"], c["line_end"], c["symbols"]) for c in chunks] == [
+        (1, 12, ["first", "second"]),
+        (13, 24, ["third"]),
+        (23, 25, ["third"]),
+        (26, 30, []),
+    ]
+
+
+def test_out_of_range_symbols_are_clamped() -> None:
+    """Test stale symbols past the end of the file do not break chunking."""
+    symbols = [
+        {"name": "tail", "line_start": 15, "line_end": 400},
+        {"name": "gone", "line_start": 500, "line_end": 510},
+    ]
+
+    chunks = chunk_code(_lines(20), symbols, max_lines=15, overlap=0)
+
+    assert [(c["line_start"], c["line_end"]) for c in chunks] == [(1, 15), (16, 20)]
+    assert chunks[-1]["line_end"] == 20
+
+
+def test_whitespace_chunks_are_dropped() -> None:
+    """Test windows that only contain blank lines are skipped."""
+    text = "x = 1\n" + "\n" * 12 + "y = 2"
+
+    chunks = chunk_code(text, max_lines=5, overlap=0)
+
+    assert [(c["line_start"], c["line_end"]) for c in chunks] == [(1, 5), (11, 14)]
+
+
+@pytest.mark.parametrize("max_lines, overlap", [(0, 0), (10, 10), (10, -1)])
+def test_invalid_window_settings(max_lines: int, overlap: int) -> None:
+    """Test invalid max_lines/overlap are rejected."""
+    with pytest.raises(ValueError):
+        chunk_code("x = 1", max_lines=max_lines, overlap=overlap)
@@ -0,0 +1,113 @@
+"""Tests for clauxton.semantic.embedding_cache module."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from clauxton.semantic.embedding_cache import EmbeddingCache, content_key
+
+
+def _vectors(count: int, dimension: int = 8) -> np.ndarray:
+    return np.random.default_rng(count).normal(size=(count, dimension)).astype(np.float32)
+
+
+def test_put_and_get(tmp_path: Path) -> None:
+    """Test cached embeddings are returned as float32, misses as None."""
+    cache = EmbeddingCache(tmp_path / "model")
+    keys = [content_key("a"), content_key("b")]
+    assert cache.get(keys) == [None, None]
+
+    vectors = _vectors(2)
+    cache.put(keys, vectors)
+
+    found = cache.get([keys[1], content_key("c"), keys[0]])
+    assert found[1] is None
+    assert found[0].dtype == np.float32
+    np.testing.assert_allclose(found[0], vectors[1], rtol=1e-3)
+    np.testing.assert_allclose(found[2], vectors[0], rtol=1e-3)
+    assert len(cache) == 2
+
+
+def test_persists_across_instances(tmp_path: Path) -> None:
+    """Test a new cache on the same directory sees earlier entries."""
+    vectors = _vectors(3)
+    keys = [content_key(text) for text in "xyz"]
+    EmbeddingCache(tmp_path).put(keys, vectors)
+
+    found = EmbeddingCache(tmp_path).get(keys)
+
+    np.testing.assert_allclose(np.stack(found), vectors, rtol=1e-3)
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test the size cap evicts entries not read recently."""
+    cache = EmbeddingCache(tmp_path, max_entries=3)
+    keys = [content_key(str(i)) for i in range(5)]
+    cache.put(keys[:3], _vectors(3))
+    cache.get([keys[0]])
+
+    cache.put(keys[3:], _vectors(2))
+
+    assert len(cache) == 3
+    hits = [row is not None for row in cache.get(keys)]
+    assert hits == [True, False, False, True, True]
+    assert (tmp_path / "vectors.f16").stat().st_size == 3 * (8 + 8 * 2)
+
+
+def test_put_keeps_existing_and_dedupes(tmp_path: Path) -> None:
+    """Test cached keys are not rewritten and duplicates store once."""
+    cache = EmbeddingCache(tmp_path)
+    key = content_key("same")
+    cache.put([key], np.ones((1, 8)))
+    cache.put([key, key, content_key("other")], _vectors(3))
+
+    assert len(cache) == 2
+    np.testing.assert_array_equal(cache.get([key])[0], np.ones(8))
+
+
+def test_overwritten_slot_is_a_miss(tmp_path: Path) -> None:
+    """Test a slot whose key prefix does not match is not returned."""
+    cache = EmbeddingCache(tmp_path)
+    key = content_key("a")
+    cache.put([key], _vectors(1))
+
+    rows = cache._map(1)
+    rows[0] = (0, np.zeros(8))
+    rows.flush()
+
+    assert cache.get([key]) == [None]
+
+
+def test_dimension_mismatch(tmp_path: Path) -> None:
+    """Test storing embeddings of another dimension raises ValueError."""
+    cache = EmbeddingCache(tmp_path)
+    cache.put([content_key("a")], _vectors(1, dimension=8))
+
+    with pytest.raises(ValueError, match="dimension mismatch"):
+        cache.put([content_key("b")], _vectors(1, dimension=4))
+    assert len(cache) == 1
+
+
+def test_engine_encodes_cached_text_once(tmp_path: Path) -> None:
+    """Test EmbeddingEngine.encode only sends uncached texts to the model."""
+    from clauxton.semantic import embeddings
+
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.stack(
+        [np.full(4, float(len(text))) for text in texts]
+    )
+    with patch.object(embeddings, "SENTENCE_TRANSFORMERS_AVAILABLE", True):
+        engine = embeddings.EmbeddingEngine(
+            cache_dir=tmp_path / "models", embedding_cache_dir=tmp_path / "embeddings"
+        )
+        engine._model = model
+
+        first = engine.encode(["a", "bb", "a"])
+        second = engine.encode(["bb", "ccc"], normalize_embeddings=True)
+
+    assert [call.args[0] for call in model.encode.call_args_list] == [["a", "bb"], ["ccc"]]
+    np.testing.assert_array_equal(first[:, 0], [1.0, 2.0, 1.0])
+    np.testing.assert_allclose(second, np.full((2, 4), 0.5))
+    assert (tmp_path / "embeddings" / "all-MiniLM-L6-v2" / "entries.db").exists()
@@ -0,0 +1,254 @@
+"""Tests for clauxton.semantic.index_service module."""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from clauxton.core.knowledge_base import KnowledgeBase
+from clauxton.core.memory import Memory, MemoryEntry
+from clauxton.core.models import KnowledgeBaseEntry
+from clauxton.proactive.models import ChangeType, FileChange
+from clauxton.semantic.index_service import IndexingService
+from clauxton.semantic.vector_store import VectorStore
+
+pytest.importorskip("faiss")
+
+
+class FakeEngine:
+    """Deterministic 8-dimensional encoder recording its calls."""
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        self.gate.wait(5)
+        self.calls.append(list(texts))
+        return np.stack(
+            [np.random.default_rng(len(text)).normal(size=8) for text in texts]
+        ).astype(np.float32)
+
+    def get_dimension(self) -> int:
+        return 8
+
+
+def _memory_entry(memory_id: str, title: str) -> MemoryEntry:
+    now = datetime.now()
+    return MemoryEntry(
+        id=memory_id,
+        type="decision",
+        title=title,
+        content=f"{title} details",
+        category="architecture",
+        created_at=now,
+        updated_at=now,
+        source="manual",
+    )
+
+
+def _indexed_ids(tmp_path: Path, index_name: str) -> List[str]:
+    store = VectorStore.load(tmp_path / ".clauxton" / "semantic" / index_name, dimension=8)
+    return sorted(meta["source_id"] for meta in store.metadata)
+
+
+@pytest.fixture
+def engine() -> FakeEngine:
+    return FakeEngine()
+
+
+@pytest.fixture
+def service(tmp_path: Path, engine: FakeEngine):
+    service = IndexingService(tmp_path, engine, delay=0)  # type: ignore[arg-type]
+    service.start()
+    yield service
+    service.stop(timeout=5)
+
+
+def test_enqueue_all_indexes_every_source(tmp_path: Path, service: IndexingService) -> None:
+    """Test a full rescan saves one index per source type."""
+    now = datetime.now()
+    KnowledgeBase(tmp_path).add(
+        KnowledgeBaseEntry(
+            id="KB-20251026-001",
+            title="FastAPI",
+            category="architecture",
+            content="Use FastAPI",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    Memory(tmp_path).add(_memory_entry("MEM-20251026-001", "Retry policy"))
+    (tmp_path / "app.py").write_text("def main():\n    pass\n")
+
+    service.enqueue_all()
+    assert service.wait_idle(timeout=10)
+
+    assert _indexed_ids(tmp_path, "kb_index") == ["KB-20251026-001"]
+    assert _indexed_ids(tmp_path, "memory_index") == ["MEM-20251026-001"]
+    assert _indexed_ids(tmp_path, "file_index") == ["app.py"]
+    status = service.status()
+    assert status["processed"] == 4
+    assert status["indexed"] == 3
+    assert status["failed"] == 0
+    assert not status["stale"]
+    assert status["last_indexed_at"] is not None
+
+
+def test_memory_listener_updates_and_removes(
+    tmp_path: Path, engine: FakeEngine, service: IndexingService
+) -> None:
+    """Test Memory changes are re-indexed, deletions removed."""
+    memory = Memory(tmp_path)
+    memory.add_listener(service.on_memory_change)
+    memory.add(_memory_entry("MEM-20251026-001", "Retry policy"))
+    memory.add(_memory_entry("MEM-20251026-002", "Cache policy"))
+    assert service.wait_idle(timeout=10)
+    assert _indexed_ids(tmp_path, "memory_index") == ["MEM-20251026-001", "MEM-20251026-002"]
+
+    engine.calls.clear()
+    memory.update("MEM-20251026-001", content="Retry three times")
+    memory.delete("MEM-20251026-002")
+    assert service.wait_idle(timeout=10)
+
+    assert _indexed_ids(tmp_path, "memory_index") == ["MEM-20251026-001"]
+    assert engine.calls == [["Retry policy\nRetry three times"]]
+
+
+def test_file_changes_are_queued_by_pattern(tmp_path: Path, service: IndexingService) -> None:
+    """Test matching files are indexed, renamed and deleted files removed."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("def a():\n    pass\n")
+    (tmp_path / "setup.py").write_text("setup()\n")
+    (tmp_path / "notes.txt").write_text("not code\n")
+    for name in ("src/a.py", "setup.py", "notes.txt"):
+        service.on_file_change(FileChange(path=tmp_path / name, change_type=ChangeType.CREATED))
+    assert service.wait_idle(timeout=10)
+    assert _indexed_ids(tmp_path, "file_index") == ["setup.py", "src/a.py"]
+
+    (tmp_path / "src" / "a.py").rename(tmp_path / "src" / "b.py")
+    service.on_file_change(
+        FileChange(
+            path=tmp_path / "src" / "b.py",
+            change_type=ChangeType.MOVED,
+            src_path=tmp_path / "src" / "a.py",
+        )
+    )
+    assert service.wait_idle(timeout=10)
+
+    assert _indexed_ids(tmp_path, "file_index") == ["setup.py", "src/b.py"]
+
+
+def test_store_file_change_queues_rescan(tmp_path: Path, engine: FakeEngine) -> None:
+    """Test a change to tasks.yml queues a rescan of tasks only."""
+    service = IndexingService(tmp_path, engine)  # type: ignore[arg-type]
+    service.on_file_change(
+        FileChange(path=tmp_path / ".clauxton" / "tasks.yml", change_type=ChangeType.MODIFIED)
+    )
+    service.on_file_change(
+        FileChange(path=tmp_path / ".clauxton" / "semantic" / "x", change_type=ChangeType.CREATED)
+    )
+
+    assert service.status()["pending_by_source"] == {"task": 1}
+
+
+def test_status_reports_pending_while_indexing(
+    tmp_path: Path, engine: FakeEngine, service: IndexingService
+) -> None:
+    """Test jobs queued during a drain stay pending and searches see the saved index."""
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 2\n")
+    service.enqueue("file", "a.py")
+    assert service.wait_idle(timeout=10)
+
+    engine.gate.clear()
+    service.enqueue("file", "b.py")
+    for _ in range(100):
+        if service.status()["indexing"]:
+            break
+        threading.Event().wait(0.01)
+    service.enqueue("file", "b.py")
+
+    status = service.status()
+    assert status["stale"]
+    assert status["pending_by_source"] == {"file": 1}
+    assert _indexed_ids(tmp_path, "file_index") == ["a.py"]
+
+    engine.gate.set()
+    assert service.wait_idle(timeout=10)
+    assert _indexed_ids(tmp_path, "file_index") == ["a.py", "b.py"]
+
+
+def test_failed_job_is_reported(tmp_path: Path, engine: FakeEngine) -> None:
+    """Test a failing source is counted and the worker keeps running."""
+    service = IndexingService(tmp_path, engine, delay=0)  # type: ignore[arg-type]
+    semantic_dir = tmp_path / ".clauxton" / "semantic"
+    semantic_dir.mkdir(parents=True)
+    (semantic_dir / "file_index.index").write_bytes(b"broken")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    Memory(tmp_path).add(_memory_entry("MEM-20251026-001", "Retry policy"))
+
+    service.start()
+    try:
+        service.enqueue("file", "a.py")
+        service.enqueue("memory", "MEM-20251026-001")
+        assert service.wait_idle(timeout=10)
+        status = service.status()
+    finally:
+        service.stop(timeout=5)
+
+    assert status["failed"] == 1
+    assert status["processed"] == 1
+    assert status["last_error"] is not None and status["last_error"].startswith("file:")
+    assert status["stale"]
+    assert status["pending_by_source"] == {"file": 1}
+    assert _indexed_ids(tmp_path, "memory_index") == ["MEM-20251026-001"]
+
+
+def test_failed_jobs_are_retried(tmp_path: Path, engine: FakeEngine) -> None:
+    """Test failed jobs stay stale until a later drain indexes them."""
+    service = IndexingService(  # type: ignore[arg-type]
+        tmp_path, engine, delay=0, retry_delay=0.2
+    )
+    semantic_dir = tmp_path / ".clauxton" / "semantic"
+    semantic_dir.mkdir(parents=True)
+    broken = semantic_dir / "file_index.index"
+    broken.write_bytes(b"broken")
+    (tmp_path / "a.py").write_text("a = 1\n")
+
+    service.start()
+    try:
+        service.enqueue("file", "a.py")
+        for _ in range(100):
+            if service.status()["failed"]:
+                break
+            threading.Event().wait(0.01)
+        assert service.status()["stale"]
+        broken.unlink()
+
+        for _ in range(200):
+            if not service.status()["stale"]:
+                break
+            threading.Event().wait(0.01)
+        status = service.status()
+    finally:
+        service.stop(timeout=5)
+
+    assert not status["stale"]
+    assert status["failed"] == 1
+    assert status["processed"] == 1
+    assert _indexed_ids(tmp_path, "file_index") == ["a.py"]
+
+
+def test_unknown_source_type(tmp_path: Path, engine: FakeEngine) -> None:
+    """Test unknown source types are rejected."""
+    service = IndexingService(tmp_path, engine)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="Unknown source_type"):
+        service.enqueue("commit", "abc")
+    with pytest.raises(ValueError, match="Unknown source_type"):
+        service.enqueue_all("commit")
@@ -5,7 +5,9 @@ This module tests the Indexer class for KB/Tasks/Files indexing.
 """
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from clauxton.core.knowledge_base import KnowledgeBase
@@ -204,6 +206,11 @@ class TestIndexerInitialization:
         assert indexer.embedding_engine is embedding_engine
         assert indexer.vector_store is vector_store
 
+    def test_init_rejects_invalid_batch_size(self, tmp_path, embedding_engine, vector_store):
+        """Test that batch_size must be positive."""
+        with pytest.raises(ValueError, match="batch_size"):
+            Indexer(tmp_path, embedding_engine, vector_store, batch_size=0)
+
 
 # ============================================================================
 # Test Knowledge Base Indexing
@@ -490,6 +497,39 @@ class TestIndexFiles:
         count3 = indexer.index_files(["**/*.py"])
         assert count3 == 1
 
+    def test_index_files_chunks_long_files(self, tmp_path, embedding_engine, vector_store):
+        """Test long files are indexed as chunks with line ranges."""
+        (tmp_path / "long.py").write_text(
+            "\n".join(f"def function_{i}():\n    return {i}\n" for i in range(40))
+        )
+
+        indexer = Indexer(tmp_path, embedding_engine, vector_store)
+        count = indexer.index_files(["*.py"])
+
+        assert count == 1
+        chunks = vector_store.metadata
+        assert len(chunks) > 1
+        assert all(meta["file_path"] == "long.py" for meta in chunks)
+        assert chunks[0]["line_start"] == 1
+        assert chunks[-1]["line_end"] == 119
+        assert chunks[1]["source_id"] == (
+            f"long.py#L{chunks[1]['line_start']}-L{chunks[1]['line_end']}"
+        )
+
+    def test_index_files_replaces_all_chunks(self, tmp_path, embedding_engine, vector_store):
+        """Test a changed file leaves no chunks of its previous version."""
+        file_path = tmp_path / "module.py"
+        file_path.write_text("\n".join(f"value_{i} = {i}" for i in range(200)))
+
+        indexer = Indexer(tmp_path, embedding_engine, vector_store)
+        indexer.index_files(["*.py"])
+        assert vector_store.size() > 1
+
+        file_path.write_text("value = 1\n")
+        assert indexer.index_files(["*.py"], force=True) == 1
+
+        assert [meta["source_id"] for meta in vector_store.metadata] == ["module.py"]
+
 
 # ============================================================================
 # Test Index All
@@ -651,6 +691,145 @@ class TestClearIndex:
         assert indexer.vector_store.size() == 0
 
 
+# ============================================================================
+# Test Targeted Indexing
+# ============================================================================
+
+
+class TestIndexSources:
+    """Test index_sources and index_memories methods."""
+
+    def test_index_sources_updates_and_removes_kb(self, tmp_path, embedding_engine, vector_store):
+        """Test only the given entries are re-indexed; deleted ones removed."""
+        kb = KnowledgeBase(tmp_path)
+        now = datetime.now()
+        for number in (1, 2):
+            kb.add(
+                KnowledgeBaseEntry(
+                    id=f"KB-20251026-00{number}",
+                    title=f"Entry {number}",
+                    category="architecture",
+                    content="Content",
+                    tags=[],
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        indexer = Indexer(tmp_path, embedding_engine, vector_store)
+        indexer.index_knowledge_base()
+
+        kb.delete("KB-20251026-001")
+        count = indexer.index_sources("kb", ["KB-20251026-001", "KB-20251026-002"])
+
+        assert count == 0
+        ids = [meta["source_id"] for meta in indexer.vector_store.metadata]
+        assert ids == ["KB-20251026-002"]
+        assert (tmp_path / ".clauxton" / "semantic" / "kb_index.index").exists()
+
+    def test_index_sources_files(self, tmp_path, embedding_engine, vector_store):
+        """Test changed files are re-indexed and deleted files removed."""
+        (tmp_path / "a.py").write_text("def a():\n    pass\n")
+        (tmp_path / "b.py").write_text("def b():\n    pass\n")
+        indexer = Indexer(tmp_path, embedding_engine, vector_store)
+        indexer.index_files(["*.py"])
+
+        (tmp_path / "a.py").write_text("def a():\n    return 1\n")
+        (tmp_path / "b.py").unlink()
+        (tmp_path / "c.py").write_text("def c():\n    pass\n")
+
+        with patch.object(embedding_engine, "encode", wraps=embedding_engine.encode) as encode:
+            count = indexer.index_sources("file", ["a.py", "b.py"])
+
+        assert count == 1
+        assert encode.call_count == 1
+        ids = sorted(meta["source_id"] for meta in indexer.vector_store.metadata)
+        assert ids == ["a.py"]
+
+    def test_index_sources_unknown_type(self, indexer):
+        """Test unknown source types are rejected."""
+        with pytest.raises(ValueError, match="Unknown source_type"):
+            indexer.index_sources("commit", ["abc"])
+
+    def test_index_memories(self, tmp_path, embedding_engine, vector_store):
+        """Test memories are indexed with their type and skipped when unchanged."""
+        from clauxton.core.memory import Memory, MemoryEntry
+
+        now = datetime.now()
+        Memory(tmp_path).add(
+            MemoryEntry(
+                id="MEM-20251026-001",
+                type="decision",
+                title="Retry policy",
+                content="Retry three times",
+                category="api",
+                created_at=now,
+                updated_at=now,
+                source="manual",
+            )
+        )
+        indexer = Indexer(tmp_path, embedding_engine, vector_store)
+
+        assert indexer.index_memories() == 1
+        assert indexer.index_memories() == 0
+        meta = indexer.vector_store.metadata[0]
+        assert meta["source_type"] == "memory"
+        assert meta["memory_type"] == "decision"
+
+
+# ============================================================================
+# Test Batched Encoding
+# ============================================================================
+
+
+class TestBatchedEncoding:
+    """Test batched encoding and bulk adds."""
+
+    def test_index_files_encodes_in_batches(self, tmp_path, embedding_engine, vector_store):
+        """Test files are encoded batch_size at a time and added in one call."""
+        for i in range(7):
+            (tmp_path / f"module_{i}.py").write_text(f"def function_{i}(): pass")
+
+        indexer = Indexer(tmp_path, embedding_engine, vector_store, batch_size=3)
+
+        with patch.object(
+            embedding_engine, "encode", wraps=embedding_engine.encode
+        ) as encode, patch.object(vector_store, "add", wraps=vector_store.add) as add:
+            count = indexer.index_files(["*.py"])
+
+        assert count == 7
+        assert [len(call.args[0]) for call in encode.call_args_list] == [3, 3, 1]
+        assert add.call_count == 1
+        assert vector_store.size() == 7
+
+    def test_batched_embeddings_match_single_encoding(
+        self, tmp_path, embedding_engine, vector_store, kb_with_entries
+    ):
+        """Test batching does not change the stored vectors."""
+        indexer = Indexer(tmp_path, embedding_engine, vector_store, batch_size=2)
+        indexer.index_knowledge_base()
+
+        entry = indexer.kb.get(vector_store.metadata[0]["source_id"])
+        expected = embedding_engine.encode([indexer._extract_kb_text(entry)])[0]
+        expected = expected / np.linalg.norm(expected)
+
+        np.testing.assert_allclose(vector_store.index.reconstruct(0), expected, atol=1e-5)
+
+    def test_no_changes_skips_encode_and_save(
+        self, tmp_path, embedding_engine, vector_store, kb_with_entries
+    ):
+        """Test nothing is encoded or saved when no item changed."""
+        indexer = Indexer(tmp_path, embedding_engine, vector_store)
+        indexer.index_knowledge_base()
+
+        with patch.object(embedding_engine, "encode") as encode, patch.object(
+            vector_store, "save"
+        ) as save:
+            assert indexer.index_knowledge_base() == 0
+
+        encode.assert_not_called()
+        save.assert_not_called()
+
+
 # ============================================================================
 # Test Helper Methods
 # ============================================================================
@@ -305,6 +305,46 @@ def test_extract_from_recent_commits_with_auto_add(
     assert stored.id == decision.id
 
 
+def test_extract_from_recent_commits_in_parallel(
+    git_repo: Path, extractor: MemoryExtractor
+) -> None:
+    """Test worker processes give the same memories, in commit order."""
+    repo = Repo(git_repo)
+    for i in range(6):
+        (git_repo / f"api_handler_{i}.py").write_text(f"# Handler {i}\n")
+        (git_repo / f"api_route_{i}.py").write_text(f"# Route {i}\n")
+        repo.index.add([f"api_handler_{i}.py", f"api_route_{i}.py"])
+        repo.index.commit(f"feat: Add endpoint {i}")
+
+    sequential = extractor.extract_from_recent_commits(since_days=7)
+    parallel = extractor.extract_from_recent_commits(since_days=7, workers=2, auto_add=True)
+
+    assert [m.model_dump() for m in parallel] == [m.model_dump() for m in sequential]
+    assert len({m.id for m in parallel}) == len(parallel) == 12
+    assert len(extractor.memory.list_all()) == 12
+
+
+def test_parallel_falls_back_in_process(
+    git_repo: Path, extractor: MemoryExtractor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test extraction continues in-process if worker processes cannot start."""
+    import concurrent.futures
+
+    def broken_pool(*args: object, **kwargs: object) -> None:
+        raise OSError("process creation not permitted")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", broken_pool)
+    repo = Repo(git_repo)
+    for i in range(3):
+        (git_repo / f"file_{i}.py").write_text(f"# File {i}\n")
+        repo.index.add([f"file_{i}.py"])
+        repo.index.commit(f"feat: Add feature {i}")
+
+    memories = extractor.extract_from_recent_commits(since_days=7, workers=2)
+
+    assert [m.title for m in memories] == ["Add feature 2", "Add feature 1", "Add feature 0"]
+
+
 # ============================================================================
 # Test: Edge Cases
 # ============================================================================
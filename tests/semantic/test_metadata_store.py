@@ -0,0 +1,70 @@
+"""Tests for clauxton.semantic.metadata_store module."""
+
+from pathlib import Path
+
+import pytest
+
+from clauxton.semantic.metadata_store import (
+    MetadataFile,
+    MetadataTable,
+    encode_row,
+    write_metadata,
+)
+
+
+def _write(path: Path) -> MetadataFile:
+    rows = [(0, {"source_id": "a"}), (3, {"source_id": "b", "text": "ü"}), (7, {})]
+    write_metadata(path, [(vector_id, encode_row(meta)) for vector_id, meta in rows])
+    return MetadataFile(path)
+
+
+def test_file_reads_rows_by_id(tmp_path):
+    """Test rows are found by id and decoded."""
+    rows = _write(tmp_path / "kb.metadata.bin")
+
+    assert len(rows) == 3
+    assert rows.ids.tolist() == [0, 3, 7]
+    assert rows[3] == {"source_id": "b", "text": "ü"}
+    assert rows[7] == {}
+    assert 3 in rows and 4 not in rows
+    with pytest.raises(KeyError):
+        rows[4]
+
+
+def test_file_rejects_other_files(tmp_path):
+    """Test a file without the header is rejected."""
+    path = tmp_path / "kb.metadata.bin"
+    path.write_bytes(b"[]")
+
+    with pytest.raises(ValueError, match="Not a metadata file"):
+        MetadataFile(path)
+
+
+def test_empty_file(tmp_path):
+    """Test an empty sidecar round-trips."""
+    path = tmp_path / "kb.metadata.bin"
+    write_metadata(path, [])
+
+    assert len(MetadataFile(path)) == 0
+    assert list(MetadataTable(MetadataFile(path))) == []
+
+
+def test_table_overlays_changes(tmp_path):
+    """Test edits are kept over the file and written back in id order."""
+    table = MetadataTable(_write(tmp_path / "kb.metadata.bin"))
+    del table[3]
+    table[9] = {"source_id": "c"}
+    table[0] = {"source_id": "a", "version": 2}
+
+    assert len(table) == 3
+    assert list(table) == [7, 9, 0]
+    assert 3 not in table
+    with pytest.raises(KeyError):
+        del table[3]
+
+    path = tmp_path / "next.metadata.bin"
+    write_metadata(path, table.raw_items())
+    rows = MetadataFile(path)
+    assert rows.ids.tolist() == [0, 7, 9]
+    assert rows[0] == {"source_id": "a", "version": 2}
+    assert rows[9] == {"source_id": "c"}
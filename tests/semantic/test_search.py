@@ -6,6 +6,7 @@ This module tests the SemanticSearchEngine class for KB/Tasks/Files searching.
 
 import os
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -402,6 +403,39 @@ class TestSearchFiles:
         # Should return empty (no TypeScript files)
         assert len(results) == 0
 
+    def test_search_files_widens_past_large_file(self, tmp_path):
+        """Test a file owning all top chunks does not hide other matching files."""
+        import numpy as np
+
+        class QueryEngine:
+            def encode(self, texts):
+                return np.ones((len(texts), 8), dtype=np.float32)
+
+        def chunk(path: str, line: int) -> dict:
+            return {
+                "source_type": "file",
+                "source_id": f"{path}#L{line}",
+                "file_path": path,
+                "line_start": line,
+                "line_end": line,
+            }
+
+        # 60 chunks of big.py match best, then small0.py, small1.py, ...
+        vectors = [np.ones(8) for _ in range(60)]
+        metadata = [chunk("big.py", line) for line in range(60)]
+        for i in range(5):
+            vectors.append(np.ones(8) + np.eye(8)[0] * (i + 1) * 0.5)
+            metadata.append(chunk(f"small{i}.py", 1))
+        store = VectorStore(dimension=8)
+        store.add(np.array(vectors, dtype=np.float32), metadata)
+        store.save(tmp_path / ".clauxton" / "semantic" / "file_index")
+
+        engine = SemanticSearchEngine(tmp_path, QueryEngine(), VectorStore(dimension=8))
+        results = engine.search_files("anything", limit=3)
+
+        assert [r["source_id"] for r in results] == ["big.py", "small0.py", "small1.py"]
+        assert len(engine.search_files("anything", limit=10)) == 6
+
 
 # ============================================================================
 # Test: Unified Search
@@ -451,6 +485,56 @@ class TestSearchAll:
         assert scores == sorted(scores, reverse=True)
 
 
+# ============================================================================
+# Test: Warm Store Cache
+# ============================================================================
+
+
+class TestStoreCache:
+    """Test loaded stores are reused until their files change."""
+
+    def test_store_loaded_once(self, search_engine, indexed_kb):
+        """Test repeated searches do not reload an unchanged index."""
+        with patch.object(VectorStore, "load", wraps=VectorStore.load) as load:
+            first = search_engine.search_kb("database", limit=3)
+            second = search_engine.search_kb("database", limit=3)
+
+        assert load.call_count == 1
+        assert first == second
+
+    def test_store_reloaded_after_reindex(
+        self, tmp_path, search_engine, indexed_kb, embedding_engine, vector_store
+    ):
+        """Test a re-saved index is picked up by the next search."""
+        search_engine.search_kb("frontend", limit=1)
+
+        indexed_kb.update("KB-20251026-005", {"title": "Vue Frontend"})
+        Indexer(tmp_path, embedding_engine, vector_store).index_knowledge_base()
+
+        with patch.object(VectorStore, "load", wraps=VectorStore.load) as load:
+            results = search_engine.search_kb("frontend", limit=1)
+
+        assert load.call_count == 1
+        assert results[0]["title"] == "Vue Frontend"
+
+
+    def test_first_load_retries_store_being_saved(self, search_engine, indexed_kb):
+        """Test a load failing mid-save is retried when no store is cached."""
+        original = VectorStore.load
+        calls = []
+
+        def load_after_save(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise ValueError("Index and metadata out of sync")
+            return original(*args, **kwargs)
+
+        with patch.object(VectorStore, "load", side_effect=load_after_save):
+            results = search_engine.search_kb("database", limit=3)
+
+        assert len(calls) == 2
+        assert results
+
 # ============================================================================
 # Test: Helper Methods
 # ============================================================================
@@ -494,6 +578,29 @@ class TestHelperMethods:
         assert ranked[1]["score"] == 0.7
         assert ranked[2]["score"] == 0.5
 
+    def test_merge_file_chunks(self, search_engine):
+        """Test chunk hits are merged into one result per file."""
+
+        def hit(score: float, path: str, start: int, end: int) -> SearchResult:
+            return {
+                "score": score,
+                "source_type": "file",
+                "source_id": f"{path}#L{start}-L{end}",
+                "title": path,
+                "content": "",
+                "metadata": {"file_path": path, "line_start": start, "line_end": end},
+            }
+
+        merged = search_engine._merge_file_chunks(
+            [hit(0.9, "a.py", 41, 80), hit(0.8, "b.py", 1, 40), hit(0.7, "a.py", 1, 40)]
+        )
+
+        assert [r["source_id"] for r in merged] == ["a.py", "b.py"]
+        assert merged[0]["score"] == 0.9
+        assert [
+            (m["line_start"], m["score"]) for m in merged[0]["metadata"]["matches"]
+        ] == [(41, 0.9), (1, 0.7)]
+
     def test_truncate_content_short(self, search_engine):
         """Test truncate with short content."""
         content = "Short content"
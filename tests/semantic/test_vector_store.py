@@ -8,6 +8,7 @@ import pytest
 
 # Import with graceful degradation
 try:
+    from clauxton.semantic.ann_index import IndexConfig
     from clauxton.semantic.vector_store import FAISS_AVAILABLE, VectorStore
 
     DEPENDENCIES_AVAILABLE = FAISS_AVAILABLE
@@ -222,7 +223,7 @@ class TestVectorStorePersistence:
 
         # Verify files exist
         assert (tmp_path / "test_store.index").exists()
-        assert (tmp_path / "test_store.metadata.json").exists()
+        assert (tmp_path / "test_store.metadata.bin").exists()
 
         # Load
         loaded_store = VectorStore.load(save_path, dimension=384)
@@ -278,24 +279,474 @@ class TestVectorStorePersistence:
         with pytest.raises(ValueError, match="Index dimension mismatch"):
             VectorStore.load(save_path, dimension=512)
 
-    def test_metadata_json_format(self, tmp_path: Path) -> None:
-        """Test that metadata is saved in readable JSON format."""
+    def test_metadata_sidecar_round_trip(self, tmp_path: Path) -> None:
+        """Test that metadata survives save/load and further edits."""
         store = VectorStore(dimension=384)
         metadata = [
-            {"id": "test-1", "text": "Hello", "tags": ["greeting"]},
-            {"id": "test-2", "text": "World", "tags": ["noun"]},
+            {"source_id": "test-1", "text": "Hello", "tags": ["greeting"]},
+            {"source_id": "test-2", "text": "Wörld", "tags": ["noun"]},
         ]
         store.add(np.random.rand(2, 384), metadata)
 
         save_path = tmp_path / "store"
         store.save(save_path)
+        loaded = VectorStore.load(save_path)
+        assert loaded.metadata == metadata
+
+        # Edits after load are saved with the unchanged rows
+        loaded.upsert(np.random.rand(1, 384), [{"source_id": "test-1", "text": "Hi"}])
+        loaded.save(save_path)
+        reloaded = VectorStore.load(save_path)
+        assert reloaded.metadata == [metadata[1], {"source_id": "test-1", "text": "Hi"}]
+        assert reloaded.remove(["test-2"]) == 1
+        assert reloaded.metadata == [{"source_id": "test-1", "text": "Hi"}]
+
+    def test_load_legacy_metadata_json(self, tmp_path: Path) -> None:
+        """Test that a metadata.json store loads and is converted on save."""
+        store = VectorStore(dimension=384)
+        metadata = [{"source_id": "a"}, {"source_id": "b"}]
+        store.add(np.random.rand(2, 384), metadata)
+        save_path = tmp_path / "store"
+        store.save(save_path)
+
+        # Replace the sidecar with the JSON file earlier versions wrote
+        (tmp_path / "store.metadata.bin").unlink()
+        (tmp_path / "store.metadata.json").write_text(json.dumps(metadata, indent=2))
+
+        loaded = VectorStore.load(save_path)
+        assert loaded.metadata == metadata
+
+        loaded.save(save_path)
+        assert (tmp_path / "store.metadata.bin").exists()
+        assert not (tmp_path / "store.metadata.json").exists()
+
+
+class TestVectorStoreUpsert:
+    """Test replacing and removing vectors by source_id."""
+
+    def test_upsert_replaces_existing_vector(self) -> None:
+        """Test upsert keeps one vector per source_id."""
+        store = VectorStore(dimension=8)
+        store.upsert(np.eye(8)[0], [{"source_id": "a", "version": 1}])
+        store.upsert(np.eye(8)[1], [{"source_id": "b", "version": 1}])
+        store.upsert(np.eye(8)[2], [{"source_id": "a", "version": 2}])
+
+        assert store.size() == 2
+        results = store.search(np.eye(8)[2], k=5)
+        assert [r["metadata"]["source_id"] for r in results].count("a") == 1
+        assert results[0]["metadata"] == {"source_id": "a", "version": 2}
+
+        # The old vector of "a" is gone, so its direction scores zero
+        assert store.search(np.eye(8)[0], k=1)[0]["distance"] == pytest.approx(0.0)
+
+    def test_remove(self) -> None:
+        """Test remove hides vectors and ignores unknown ids."""
+        store = VectorStore(dimension=8)
+        store.add(np.eye(8)[:4], [{"source_id": f"s{i}"} for i in range(4)])
 
-        # Read and verify JSON
-        metadata_path = tmp_path / "store.metadata.json"
-        with open(metadata_path, "r") as f:
-            loaded_metadata = json.load(f)
+        assert store.remove(["s1", "missing"]) == 1
+
+        assert store.size() == 3
+        assert [m["source_id"] for m in store.metadata] == ["s0", "s2", "s3"]
+        results = store.search(np.eye(8)[1], k=4)
+        assert "s1" not in [r["metadata"]["source_id"] for r in results]
+        assert len(results) == 3
+
+    def test_remove_compacts_index(self) -> None:
+        """Test enough removals shrink the FAISS index to live vectors."""
+        store = VectorStore(dimension=8)
+        store.add(np.eye(8), [{"source_id": f"s{i}"} for i in range(8)])
+
+        store.remove(["s0"])
+        assert store.index.ntotal == 8
+
+        store.remove(["s1", "s2"])
+        assert store.index.ntotal == store.size() == 5
+
+    def test_search_ids_stable_after_compaction(self) -> None:
+        """Test result indexes stay valid after vectors are deleted."""
+        store = VectorStore(dimension=8)
+        store.add(np.eye(8), [{"source_id": f"s{i}"} for i in range(8)])
+        store.remove(["s0", "s1", "s2"])
+        store.compact()
+
+        result = store.search(np.eye(8)[5], k=1)[0]
+        assert result["metadata"]["source_id"] == "s5"
+        assert result["index"] == 5
+
+    def test_upsert_metadata_length_mismatch(self) -> None:
+        """Test upsert validates metadata length before removing."""
+        store = VectorStore(dimension=8)
+        store.upsert(np.eye(8)[0], [{"source_id": "a"}])
+
+        with pytest.raises(ValueError, match="Metadata length"):
+            store.upsert(np.eye(8)[:2], [{"source_id": "a"}])
+        assert store.size() == 1
+
+    def test_save_and_load_after_remove(self, tmp_path: Path) -> None:
+        """Test saved stores keep ids and the source_id table."""
+        store = VectorStore(dimension=8)
+        store.add(np.eye(8)[:3], [{"source_id": f"s{i}"} for i in range(3)])
+        store.remove(["s0"])
+        path = tmp_path / "index"
+        store.save(path)
+
+        loaded = VectorStore.load(path, dimension=8)
+
+        assert loaded.size() == 2
+        assert loaded.metadata == store.metadata
+        loaded.upsert(np.eye(8)[3], [{"source_id": "s4"}])
+        loaded.upsert(np.eye(8)[4], [{"source_id": "s1"}])
+        assert [m["source_id"] for m in loaded.metadata] == ["s2", "s4", "s1"]
+        assert loaded.search(np.eye(8)[4], k=1)[0]["metadata"]["source_id"] == "s1"
+
+    def test_save_replaces_index_last(self, tmp_path: Path, monkeypatch) -> None:
+        """Test every file is renamed into place, the index after its sidecars."""
+        import os
+
+        replaced = []
+        original = os.replace
+
+        def recording_replace(src, dst):
+            replaced.append(Path(dst).name)
+            original(src, dst)
+
+        monkeypatch.setattr(os, "replace", recording_replace)
+        store = VectorStore(dimension=8)
+        store.add(np.eye(8)[:2], [{"source_id": "a"}, {"source_id": "b"}])
+        store.save(tmp_path / "kb")
+
+        assert replaced[-1] == "kb.index"
+        assert {"kb.config.json", "kb.metadata.bin"} <= set(replaced)
+        assert not list(tmp_path.glob("*.tmp"))
+        assert VectorStore.load(tmp_path / "kb", dimension=8).size() == 2
+
+    @pytest.mark.parametrize("quantization", ["none", "fp16"])
+    def test_load_during_save_never_mixes_files(
+        self, tmp_path: Path, monkeypatch, quantization: str
+    ) -> None:
+        """Test a load between the renames of a save raises instead of mixing ids."""
+        import os
+
+        config = IndexConfig(quantization=quantization)
+        store = VectorStore(dimension=8, config=config)
+        store.add(np.eye(8)[:2], [{"source_id": "a"}, {"source_id": "b"}])
+        store.save(tmp_path / "kb")
+        # Same count, other ids
+        store.upsert(np.eye(8)[2], [{"source_id": "a", "v": 2}])
+
+        outcomes = []
+        original = os.replace
+
+        def replace_then_load(src, dst):
+            original(src, dst)
+            try:
+                loaded = VectorStore.load(tmp_path / "kb", dimension=8)
+            except ValueError:
+                outcomes.append((Path(dst).name, "error"))
+                return
+            found = {hit["metadata"]["source_id"] for hit in loaded.search(np.eye(8)[0], k=2)}
+            assert found == {"a", "b"}
+            outcomes.append((Path(dst).name, "ok"))
+
+        monkeypatch.setattr(os, "replace", replace_then_load)
+        store.save(tmp_path / "kb")
+
+        assert ("kb.metadata.bin", "error") in outcomes
+        assert outcomes[-1] == ("kb.index", "ok")
+
+    def test_load_legacy_flat_index(self, tmp_path: Path) -> None:
+        """Test stores saved as plain IndexFlatIP load and drop duplicates."""
+        import faiss
 
-        assert loaded_metadata == metadata
+        path = tmp_path / "index"
+        index = faiss.IndexFlatIP(8)
+        index.add(np.eye(8, dtype=np.float32)[:3])
+        faiss.write_index(index, str(path.with_suffix(".index")))
+        metadata = [{"source_id": "a", "v": 1}, {"source_id": "b"}, {"source_id": "a", "v": 2}]
+        path.with_suffix(".metadata.json").write_text(json.dumps(metadata))
+
+        store = VectorStore.load(path, dimension=8)
+
+        assert store.size() == 2
+        assert store.index.ntotal == 2
+        assert store.search(np.eye(8)[2], k=1)[0]["metadata"] == {"source_id": "a", "v": 2}
+        store.upsert(np.eye(8)[5], [{"source_id": "c"}])
+        assert store.search(np.eye(8)[5], k=1)[0]["metadata"]["source_id"] == "c"
+
+
+class TestVectorStoreIndexTypes:
+    """Test ANN index types (HNSW, IVF-PQ)."""
+
+    @staticmethod
+    def _vectors(count: int, dimension: int = 16) -> np.ndarray:
+        return np.random.default_rng(0).normal(size=(count, dimension)).astype(np.float32)
+
+    def test_hnsw_search_and_remove(self) -> None:
+        """Test HNSW stores search, upsert and compact like flat stores."""
+        vectors = self._vectors(200)
+        store = VectorStore(dimension=16, config=IndexConfig(index_type="hnsw"))
+        store.add(vectors, [{"source_id": f"s{i}"} for i in range(200)])
+
+        assert store.index_type == "hnsw"
+        assert store.search(vectors[42], k=1)[0]["metadata"]["source_id"] == "s42"
+
+        store.remove([f"s{i}" for i in range(100)])
+        assert store.index.ntotal == store.size() == 100
+        assert store.search(vectors[42], k=1)[0]["metadata"]["source_id"] != "s42"
+        assert store.search(vectors[142], k=1)[0]["metadata"]["source_id"] == "s142"
+
+    def test_ivfpq_trains_on_first_build(self) -> None:
+        """Test IVF-PQ stores stay flat until enough vectors for training."""
+        config = IndexConfig(index_type="ivfpq", nlist=4, pq_m=4, pq_nbits=4, train_size=100)
+        vectors = self._vectors(300)
+        store = VectorStore(dimension=16, config=config)
+
+        store.add(vectors[:50], [{"source_id": f"s{i}"} for i in range(50)])
+        assert store.index_type == "flat"
+
+        store.add(vectors[50:], [{"source_id": f"s{i}"} for i in range(50, 300)])
+        assert store.index_type == "ivfpq"
+        assert store.index.is_trained
+        assert store.size() == 300
+
+        store.upsert(vectors[7], [{"source_id": "s7", "updated": True}])
+        store.remove(["s8"])
+        assert store.size() == 299
+        assert store.search(vectors[7], k=1)[0]["metadata"] == {"source_id": "s7", "updated": True}
+
+    def test_ivfpq_requires_divisible_dimension(self) -> None:
+        """Test pq_m must divide the dimension."""
+        with pytest.raises(ValueError, match="pq_m"):
+            VectorStore(dimension=10, config=IndexConfig(index_type="ivfpq", pq_m=4))
+
+    def test_save_and_load_keeps_config(self, tmp_path: Path) -> None:
+        """Test index type and parameters are persisted."""
+        vectors = self._vectors(50)
+        store = VectorStore(dimension=16, config=IndexConfig(index_type="hnsw", ef_search=99))
+        store.add(vectors, [{"source_id": f"s{i}"} for i in range(50)])
+        store.save(tmp_path / "index")
+
+        loaded = VectorStore.load(tmp_path / "index", dimension=16)
+
+        assert loaded.index_type == "hnsw"
+        assert loaded.config.ef_search == 99
+        assert loaded.search(vectors[3], k=1)[0]["metadata"]["source_id"] == "s3"
+
+    def test_load_with_new_config_rebuilds(self, tmp_path: Path) -> None:
+        """Test loading a flat store with an HNSW config converts it."""
+        vectors = self._vectors(50)
+        store = VectorStore(dimension=16)
+        store.add(vectors, [{"source_id": f"s{i}"} for i in range(50)])
+        store.save(tmp_path / "index")
+
+        loaded = VectorStore.load(
+            tmp_path / "index", dimension=16, config=IndexConfig(index_type="hnsw")
+        )
+
+        assert loaded.index_type == "hnsw"
+        assert loaded.size() == 50
+        assert loaded.search(vectors[9], k=1)[0]["metadata"]["source_id"] == "s9"
+
+    def test_evaluate_reports_recall_and_latency(self) -> None:
+        """Test evaluate() compares the index with an exact search."""
+        store = VectorStore(dimension=16)
+        store.add(self._vectors(100))
+
+        report = store.evaluate(k=5, sample=20)
+
+        assert report["index_type"] == "flat"
+        assert report["size"] == 100
+        assert report["queries"] == 20
+        assert report["recall"] == pytest.approx(1.0)
+        assert report["ann_ms"] >= 0
+        assert report["exact_ms"] >= 0
+
+
+class TestVectorStoreQuantization:
+    """Test scalar-quantized stores with float32 re-ranking."""
+
+    @staticmethod
+    def _vectors(count: int, dimension: int = 16) -> np.ndarray:
+        return np.random.default_rng(0).normal(size=(count, dimension)).astype(np.float32)
+
+    @pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+    @pytest.mark.parametrize("quantization", ["fp16", "int8"])
+    def test_quantized_search(self, index_type: str, quantization: str) -> None:
+        """Test quantized stores shrink the index and find exact neighbours."""
+        vectors = self._vectors(300)
+        config = IndexConfig(index_type=index_type, quantization=quantization, train_size=100)
+        store = VectorStore(dimension=16, config=config)
+        store.add(vectors, [{"source_id": f"s{i}"} for i in range(300)])
+
+        assert store.quantization == quantization
+        result = store.search(vectors[42], k=1)[0]
+        assert result["metadata"]["source_id"] == "s42"
+        # Re-ranked with float32 vectors, so the score is exact
+        assert result["distance"] == pytest.approx(1.0, abs=1e-6)
+
+        report = store.evaluate(k=5, sample=50)
+        assert report["quantization"] == quantization
+        assert report["recall"] >= 0.9
+        full = VectorStore(dimension=16, config=IndexConfig(index_type=index_type))
+        full.add(vectors)
+        assert report["index_bytes"] < full.evaluate(k=5, sample=1)["index_bytes"]
+
+    def test_int8_stays_fp16_until_trained(self) -> None:
+        """Test int8 stores start as fp16 and train once large enough."""
+        vectors = self._vectors(150)
+        store = VectorStore(
+            dimension=16, config=IndexConfig(quantization="int8", train_size=100)
+        )
+
+        store.add(vectors[:50])
+        assert store.quantization == "fp16"
+        store.add(vectors[50:])
+        assert store.quantization == "int8"
+        assert store.index.is_trained
+
+    def test_save_and_load_memory_maps_vectors(self, tmp_path: Path) -> None:
+        """Test the float32 sidecar is saved, reloaded and kept in sync."""
+        vectors = self._vectors(200)
+        config = IndexConfig(quantization="int8", train_size=100)
+        store = VectorStore(dimension=16, config=config)
+        store.add(vectors, [{"source_id": f"s{i}"} for i in range(200)])
+        store.remove(["s0"])
+        store.save(tmp_path / "index")
+        assert (tmp_path / "index.vectors.f32").exists()
+
+        loaded = VectorStore.load(tmp_path / "index", dimension=16)
+        assert loaded.quantization == "int8"
+        loaded.upsert(vectors[0], [{"source_id": "s0"}])
+        result = loaded.search(vectors[0], k=1)[0]
+        assert result["metadata"]["source_id"] == "s0"
+        assert result["distance"] == pytest.approx(1.0, abs=1e-6)
+
+        # Dropping quantization rebuilds from the float32 vectors
+        loaded.save(tmp_path / "index")
+        plain = VectorStore.load(tmp_path / "index", dimension=16, config=IndexConfig())
+        assert plain.quantization == "none"
+        assert plain.search(vectors[5], k=1)[0]["distance"] == pytest.approx(1.0, abs=1e-6)
+        plain.save(tmp_path / "index")
+        assert not (tmp_path / "index.vectors.f32").exists()
+
+    def test_save_memory_maps_vectors_of_built_store(self, tmp_path: Path) -> None:
+        """Test save() drops the in-memory float32 copies, including replaced ones."""
+        vectors = self._vectors(50)
+        store = VectorStore(dimension=16, config=IndexConfig(quantization="fp16"))
+        store.add(vectors[:40], [{"source_id": f"s{i}"} for i in range(40)])
+        store.upsert(vectors[40:], [{"source_id": f"s{i}"} for i in range(10)])
+        store.save(tmp_path / "index")
+
+        assert store._raw is not None
+        assert store._raw._blocks == [] and len(store._raw._added) == 0
+        assert len(store._raw) == store.size() == 40
+        result = store.search(vectors[45], k=1)[0]
+        assert result["metadata"]["source_id"] == "s5"
+        assert result["distance"] == pytest.approx(1.0, abs=1e-6)
+
+        store.upsert(vectors[0], [{"source_id": "s5"}])
+        store.save(tmp_path / "index")
+        assert store.search(vectors[0], k=1)[0]["metadata"]["source_id"] == "s5"
+
+    def test_without_rerank_keeps_no_vectors(self, tmp_path: Path) -> None:
+        """Test rerank_factor=0 stores only the quantized index."""
+        config = IndexConfig(quantization="fp16", rerank_factor=0)
+        store = VectorStore(dimension=16, config=config)
+        store.add(self._vectors(20))
+        store.save(tmp_path / "index")
+
+        assert not (tmp_path / "index.vectors.f32").exists()
+        assert VectorStore.load(tmp_path / "index", dimension=16).quantization == "fp16"
+
+    def test_ivfpq_rejects_quantization(self) -> None:
+        """Test quantization cannot be combined with IVF-PQ."""
+        with pytest.raises(ValueError, match="flat and hnsw"):
+            IndexConfig(index_type="ivfpq", quantization="int8")
+
+
+class TestVectorStoreWhere:
+    """Test attribute filters pushed down into the search."""
+
+    @staticmethod
+    def _store(count: int, config: IndexConfig = None) -> VectorStore:
+        vectors = np.random.default_rng(0).normal(size=(count, 16)).astype(np.float32)
+        store = VectorStore(dimension=16, config=config)
+        store.add(
+            vectors,
+            [
+                {
+                    "source_id": f"s{i}",
+                    "status": "pending" if i % 100 == 0 else "completed",
+                    "priority": ["low", "high"][i % 2],
+                    "tags": ["x"],
+                }
+                for i in range(count)
+            ],
+        )
+        return store
+
+    def test_match_conditions(self) -> None:
+        """Test equality, any-of and predicate conditions."""
+        store = self._store(400)
+
+        assert store.match({"status": "pending"}).tolist() == [0, 100, 200, 300]
+        assert store.match({"status": "pending", "priority": "high"}).tolist() == []
+        assert store.match({"source_id": ["s1", "s3", "missing"]}).tolist() == [1, 3]
+        ends_99 = store.match({"source_id": lambda v: v.endswith("99")})
+        assert ends_99.tolist() == [99, 199, 299, 399]
+        assert len(store.match({"tags": "x"})) == 0
+
+    def test_selective_filter_returns_k(self) -> None:
+        """Test a filter matching 1% of vectors still fills k results."""
+        store = self._store(2000)
+
+        results = store.search(np.ones(16), k=5, where={"status": "pending"})
+
+        assert len(results) == 5
+        assert all(r["metadata"]["status"] == "pending" for r in results)
+        distances = [r["distance"] for r in results]
+        assert distances == sorted(distances, reverse=True)
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            IndexConfig(),
+            IndexConfig(index_type="hnsw"),
+            IndexConfig(index_type="ivfpq", nlist=16, pq_m=4, pq_nbits=4, nprobe=1),
+        ],
+        ids=["flat", "hnsw", "ivfpq"],
+    )
+    def test_large_selection_uses_index(self, config: IndexConfig) -> None:
+        """Test filters selecting many vectors search the index with a selector."""
+        store = self._store(3000, config)
+        query = np.random.default_rng(1).normal(size=16)
+
+        results = store.search(query, k=20, where={"priority": "high"})
+
+        assert len(results) == 20
+        assert all(r["index"] % 2 == 1 for r in results)
+
+    def test_postings_follow_upsert_and_remove(self, tmp_path: Path) -> None:
+        """Test filters see updates made after the postings were built."""
+        store = self._store(200)
+        assert store.match({"status": "pending"}).tolist() == [0, 100]
+
+        store.upsert(np.ones(16), [{"source_id": "s100", "status": "completed"}])
+        store.upsert(np.ones(16), [{"source_id": "s7", "status": "pending"}])
+        store.remove(["s0"])
+        assert store.match({"status": "pending"}).tolist() == [201]
+
+        store.save(tmp_path / "store")
+        loaded = VectorStore.load(tmp_path / "store", dimension=16)
+        results = loaded.search(np.ones(16), k=5, where={"status": "pending"})
+        assert [r["metadata"]["source_id"] for r in results] == ["s7"]
+
+    def test_filter_without_matches(self) -> None:
+        """Test a filter matching nothing returns no results."""
+        store = self._store(10)
+
+        assert store.search(np.ones(16), k=5, where={"status": "archived"}) == []
 
 
 class TestVectorStoreUtilities: